@@ -0,0 +1,46 @@
+"""compress caption segments
+
+video_captions / recent_video_captions 저장 포맷 변경.
+cue 객체 JSONB 대신 미리 이어붙인 텍스트 + zstd 압축 cue 배열을 저장한다.
+
+- plain_text: 이어붙인 자막 텍스트
+- char_count: plain_text 길이
+- cues_zstd: zstd 압축 cue 배열 (app/services/caption_storage.py 포맷)
+- segments_json: nullable 전환 (기존 행은 scripts/backfill_caption_storage.py로 이전 후 NULL)
+
+Revision ID: l3m4n5o6p7q8
+Revises: 0a1cfcc735f5, 20bf0c0774c6 (기존 두 head 병합)
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = 'l3m4n5o6p7q8'
+down_revision: Union[str, None] = ('0a1cfcc735f5', '20bf0c0774c6')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("video_captions", "recent_video_captions")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.add_column(table, sa.Column('plain_text', sa.Text(), nullable=True))
+        op.add_column(table, sa.Column('char_count', sa.Integer(), nullable=True))
+        op.add_column(table, sa.Column('cues_zstd', sa.LargeBinary(), nullable=True))
+        op.alter_column(table, 'segments_json', existing_type=JSONB(), nullable=True)
+
+
+def downgrade() -> None:
+    # backfill된 행은 segments_json이 NULL이므로 downgrade 전에 복원이 필요하다
+    # (scripts/backfill_caption_storage.py --restore)
+    for table in _TABLES:
+        op.alter_column(table, 'segments_json', existing_type=JSONB(), nullable=False)
+        op.drop_column(table, 'cues_zstd')
+        op.drop_column(table, 'char_count')
+        op.drop_column(table, 'plain_text')
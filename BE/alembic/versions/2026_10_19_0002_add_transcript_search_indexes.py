@@ -0,0 +1,54 @@
+"""add transcript search indexes
+
+저장된 자막 / 영상 분석 요약 전문 검색용 인덱스 (app/services/transcript_search_service.py).
+
+- pg_trgm 확장 활성화
+- tsvector GIN 표현식 인덱스: to_tsvector('simple', coalesce(col, ''))
+  (한국어 형태소 사전이 없으므로 'simple' 설정 — 공백 단위 토큰 일치)
+- trigram GIN 인덱스: 조사가 붙은 단어 등 부분 문자열 ILIKE 검색용
+
+인덱스 표현식은 검색 쿼리의 표현식과 정확히 같아야 사용된다.
+
+Revision ID: m4n5o6p7q8r9
+Revises: l3m4n5o6p7q8
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'm4n5o6p7q8r9'
+down_revision: Union[str, None] = 'l3m4n5o6p7q8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, index name prefix)
+_SEARCH_COLUMNS = (
+    ("video_captions", "plain_text", "ix_video_captions_plain_text"),
+    ("recent_video_captions", "plain_text", "ix_recent_video_captions_plain_text"),
+    ("video_content_analyses", "summary", "ix_video_content_analyses_summary"),
+    ("competitor_recent_videos", "analysis_summary", "ix_competitor_recent_videos_analysis_summary"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, column, prefix in _SEARCH_COLUMNS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {prefix}_tsv ON {table} "
+            f"USING gin (to_tsvector('simple', coalesce({column}, '')))"
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {prefix}_trgm ON {table} "
+            f"USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    for _, _, prefix in _SEARCH_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS {prefix}_trgm")
+        op.execute(f"DROP INDEX IF EXISTS {prefix}_tsv")
+    # pg_trgm 확장은 다른 곳에서 사용할 수 있으므로 남겨둔다
@@ -0,0 +1,29 @@
+"""add generation_stats to channel_personas
+
+페르소나 생성 단계별 소요 시간 기록 (회귀 추적용):
+- generation_stats: {"step_timings": {단계: 초}, "video_analysis_batches": [...], "generated_at": ...}
+
+Revision ID: n5o6p7q8r9s0
+Revises: m4n5o6p7q8r9
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'n5o6p7q8r9s0'
+down_revision: Union[str, None] = 'm4n5o6p7q8r9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('channel_personas', sa.Column('generation_stats', postgresql.JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('channel_personas', 'generation_stats')
@@ -0,0 +1,29 @@
+"""add source_snapshot to channel_personas
+
+증분 페르소나 재생성용 스냅샷:
+- source_snapshot: {"videos": {video_id: {reason, view_count, ...}}, "patterns": {...}, "tone_candidates": [...]}
+
+Revision ID: o6p7q8r9s0t1
+Revises: n5o6p7q8r9s0
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'o6p7q8r9s0t1'
+down_revision: Union[str, None] = 'n5o6p7q8r9s0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('channel_personas', sa.Column('source_snapshot', postgresql.JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('channel_personas', 'source_snapshot')
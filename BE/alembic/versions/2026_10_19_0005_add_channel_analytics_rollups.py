@@ -0,0 +1,77 @@
+"""add channel analytics rollup tables
+
+대시보드/페르소나용 채널 집계 롤업 (app/services/analytics_rollup_service.py):
+- yt_channel_period_rollups:   채널 × 기간(7d/28d/90d/all) 조회수/구독자 증가, 업로드 수
+- yt_channel_audience_rollups: 최신 보고서 기준 연령/성별 구성
+- yt_channel_geo_rollups:      최신 보고서 기준 국가별 조회수 비중 + 순위
+
+동기화 직후 해당 채널 행만 다시 계산하며, 기존 데이터는 다음 동기화 때 채워진다
+(즉시 채우려면 scripts/check_analytics_rollups.py --fix).
+
+Revision ID: p7q8r9s0t1u2
+Revises: o6p7q8r9s0t1
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'p7q8r9s0t1u2'
+down_revision: Union[str, None] = 'o6p7q8r9s0t1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _channel_fk() -> sa.Column:
+    return sa.Column(
+        'channel_id', sa.String(),
+        sa.ForeignKey('youtube_channels.channel_id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        'yt_channel_period_rollups',
+        _channel_fk(),
+        sa.Column('period', sa.String(), primary_key=True),
+        sa.Column('period_start', sa.Date(), nullable=True),
+        sa.Column('period_end', sa.Date(), nullable=False),
+        sa.Column('views_gained', sa.BigInteger(), nullable=False),
+        sa.Column('subscribers_gained', sa.Integer(), nullable=False),
+        sa.Column('total_views', sa.BigInteger(), nullable=True),
+        sa.Column('subscriber_count', sa.Integer(), nullable=True),
+        sa.Column('videos_published', sa.Integer(), nullable=False),
+        sa.Column('total_duration_seconds', sa.BigInteger(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    )
+    op.create_table(
+        'yt_channel_audience_rollups',
+        _channel_fk(),
+        sa.Column('age_group', sa.String(), primary_key=True),
+        sa.Column('gender', sa.String(), primary_key=True),
+        sa.Column('share', sa.Float(), nullable=False),
+        sa.Column('report_date', sa.Date(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    )
+    op.create_table(
+        'yt_channel_geo_rollups',
+        _channel_fk(),
+        sa.Column('country', sa.String(), primary_key=True),
+        sa.Column('views', sa.BigInteger(), nullable=False),
+        sa.Column('share', sa.Float(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('report_date', sa.Date(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_geo_rollups_channel_rank', 'yt_channel_geo_rollups', ['channel_id', 'rank'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_geo_rollups_channel_rank', table_name='yt_channel_geo_rollups')
+    op.drop_table('yt_channel_geo_rollups')
+    op.drop_table('yt_channel_audience_rollups')
+    op.drop_table('yt_channel_period_rollups')
@@ -0,0 +1,35 @@
+"""add keyset pagination index on topic_requests
+
+스크립트 목록(/script-gen/scripts/list) keyset 페이지네이션용 복합 인덱스
+(app/services/script_list_service.py):
+- ix_topic_requests_user_created (user_id, created_at DESC, id DESC)
+  사용자 행을 최신순으로 바로 이어 읽으므로 페이지 깊이와 무관하게 page_size만큼만 스캔
+- ix_topic_requests_user_id는 새 인덱스의 선두 컬럼과 겹치므로 제거
+
+Revision ID: q8r9s0t1u2v3
+Revises: p7q8r9s0t1u2
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'q8r9s0t1u2v3'
+down_revision: Union[str, None] = 'p7q8r9s0t1u2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_topic_requests_user_created "
+        "ON topic_requests (user_id, created_at DESC, id DESC)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_topic_requests_user_id")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS ix_topic_requests_user_id ON topic_requests (user_id)")
+    op.execute("DROP INDEX IF EXISTS ix_topic_requests_user_created")
@@ -22,6 +22,7 @@ from app.schemas.competitor_channel import (
     RecentVideoAnalyzeResponse,
     CompetitorTopicsGenerateResponse,
 )
+from app.services.analytics_rollup_service import AnalyticsRollupService
 from app.services.channel_service import ChannelService
 from app.services.channel_video_service import sync_channel_videos
 from app.services.competitor_channel_service import CompetitorChannelService
@@ -58,14 +59,18 @@ async def get_channel_status(
     except Exception:
         pass  # API 실패해도 기존 DB 데이터로 판단
 
-    # 3. 영상 수 + 총 duration 합산 쿼리
-    stats_stmt = select(
-        func.count(YTChannelVideo.id),
-        func.coalesce(func.sum(YTChannelVideo.duration_seconds), 0),
-    ).where(YTChannelVideo.channel_id == channel.channel_id)
-
-    stats_result = await db.execute(stats_stmt)
-    video_count, total_seconds = stats_result.one()
+    # 3. 영상 수 + 총 duration (동기화 때 갱신된 롤업, 없으면 직접 합산)
+    rollup = (await AnalyticsRollupService.get_periods(db, channel.channel_id)).get("all")
+    if rollup is not None:
+        video_count, total_seconds = rollup.videos_published, rollup.total_duration_seconds
+    else:
+        stats_stmt = select(
+            func.count(YTChannelVideo.id),
+            func.coalesce(func.sum(YTChannelVideo.duration_seconds), 0),
+        ).where(YTChannelVideo.channel_id == channel.channel_id)
+
+        stats_result = await db.execute(stats_stmt)
+        video_count, total_seconds = stats_result.one()
 
     total_minutes = total_seconds / 60.0
     has_enough = video_count >= 15 and total_minutes >= 90
@@ -1,6 +1,9 @@
 """
 채널 페르소나 API 라우터
 """
+import uuid
+
+from celery.result import AsyncResult
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,15 +15,18 @@ from app.schemas.persona import (
     PersonaResponse,
     PersonaUpdateRequest,
     PersonaGenerateResponse,
+    PersonaGenerateTaskResponse,
     ManualPersonaRequest,
 )
 from app.services.persona_service import (
-    generate_persona,
+    claim_generation_task,
     get_persona,
+    release_generation_task,
+    run_persona_generation,
     update_persona,
 )
-from app.services.channel_video_service import sync_channel_videos
 from app.services.shared_state_service import SharedStateService
+from app.worker import task_generate_persona
 from sqlalchemy import select
 
 
@@ -98,29 +104,104 @@ async def get_my_persona(
     )
 
 
-@router.post("/generate", response_model=PersonaGenerateResponse)
+@router.post("/generate", response_model=PersonaGenerateTaskResponse)
 async def generate_my_persona(
+    force_full: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    [비동기] 내 채널 페르소나 생성/재생성 요청.
+
+    1. 작업을 백그라운드 큐(Celery)에 등록하고 즉시 task_id를 반환합니다.
+    2. 클라이언트는 /personas/generate/status/{task_id}를 폴링합니다.
+
+    유저당 한 번에 하나의 작업만 실행됩니다. 진행 중인 작업이 있으면
+    새로 등록하지 않고 그 작업의 task_id를 반환합니다 (deduplicated=true).
+    재생성 시 영상 자막 분석은 신규/변경 영상만 다시 수행합니다 (force_full=true면 전체).
+    """
+    channel_id = await _get_user_channel_id(db, current_user)
+    user_id = str(current_user.id)
+
+    task_id = str(uuid.uuid4())
+    active_task_id = await claim_generation_task(user_id, task_id)
+    if active_task_id != task_id and AsyncResult(active_task_id).ready():
+        # 이전 작업이 끝났는데 점유가 남아 있음 (워커 비정상 종료 등) → 다시 점유
+        await release_generation_task(user_id, active_task_id)
+        active_task_id = await claim_generation_task(user_id, task_id)
+
+    if active_task_id != task_id:
+        return PersonaGenerateTaskResponse(
+            task_id=active_task_id,
+            status=AsyncResult(active_task_id).status,
+            deduplicated=True,
+        )
+
+    try:
+        task_generate_persona.apply_async(
+            kwargs={"user_id": user_id, "channel_id": channel_id, "force_full": force_full},
+            task_id=task_id,
+        )
+    except Exception as e:
+        await release_generation_task(user_id, task_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"작업 요청 실패: {str(e)}",
+        )
+
+    return PersonaGenerateTaskResponse(task_id=task_id, status="PENDING")
+
+
+@router.get("/generate/status/{task_id}", response_model=PersonaGenerateTaskResponse)
+async def get_persona_generate_status(
+    task_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    [비동기] 페르소나 생성 작업 상태 조회.
+
+    상태값:
+        PENDING  - 대기 중
+        PROGRESS - 실행 중 (progress에 현재 단계 포함)
+        SUCCESS  - 완료 (result에 생성 결과)
+        FAILURE  - 실패
+    """
+    task_result = AsyncResult(task_id)
+    response = PersonaGenerateTaskResponse(task_id=task_id, status=task_result.status)
+
+    if task_result.state == "PROGRESS":
+        response.progress = task_result.info or {}
+    elif task_result.state == "SUCCESS":
+        response.result = PersonaGenerateResponse(**task_result.result)
+    elif task_result.state == "FAILURE":
+        response.result = PersonaGenerateResponse(
+            success=False,
+            message=f"페르소나 생성 중 오류가 발생했습니다: {str(task_result.result)}",
+        )
+
+    return response
+
+
+@router.post("/generate/sync", response_model=PersonaGenerateResponse)
+async def generate_my_persona_sync(
+    force_full: bool = False,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    내 채널 페르소나 생성/재생성.
+    [동기] 내 채널 페르소나 생성/재생성 (Celery 워커 없이 실행하는 fallback / 테스트용).
 
     1. 채널 영상 동기화 (YouTube API)
     2. 규칙 기반 분석 (4개)
     3. LLM 분석 (3개)
     4. 종합 페르소나 생성
 
-    기존 페르소나가 있으면 덮어씁니다.
+    기존 페르소나가 있으면 덮어씁니다. 요청이 수 분간 열려 있을 수 있습니다.
     """
     channel_id = await _get_user_channel_id(db, current_user)
 
     try:
-        # 1. 영상 데이터 동기화
-        await sync_channel_videos(db, channel_id)
-
-        # 2. 페르소나 생성
-        persona = await generate_persona(db, channel_id)
+        persona = await run_persona_generation(db, channel_id, force_full=force_full)
 
         if not persona:
             return PersonaGenerateResponse(
@@ -135,37 +216,7 @@ async def generate_my_persona(
         return PersonaGenerateResponse(
             success=True,
             message="페르소나가 성공적으로 생성되었습니다.",
-            persona=PersonaResponse(
-                id=str(persona.id),
-                channel_id=persona.channel_id,
-                persona_summary=persona.persona_summary,
-                one_liner=persona.one_liner,
-                main_topics=persona.main_topics,
-                content_style=persona.content_style,
-                differentiator=persona.differentiator,
-                target_audience=persona.target_audience,
-                audience_needs=persona.audience_needs,
-                hit_topics=persona.hit_topics,
-                title_patterns=persona.title_patterns,
-                optimal_duration=persona.optimal_duration,
-                growth_opportunities=persona.growth_opportunities,
-                evidence=persona.evidence,
-                analyzed_categories=persona.analyzed_categories,
-                analyzed_subcategories=persona.analyzed_subcategories,
-                preferred_categories=persona.preferred_categories,
-                preferred_subcategories=persona.preferred_subcategories,
-                topic_keywords=persona.topic_keywords,
-                style_keywords=persona.style_keywords,
-                video_types=persona.video_types,
-                content_structures=persona.content_structures,
-                tone_manner=persona.tone_manner,
-                tone_samples=persona.tone_samples,
-                hit_patterns=persona.hit_patterns,
-                low_patterns=persona.low_patterns,
-                success_formula=persona.success_formula,
-                created_at=persona.created_at,
-                updated_at=persona.updated_at,
-            ),
+            persona=PersonaResponse.from_persona(persona),
         )
 
     except ValueError as e:
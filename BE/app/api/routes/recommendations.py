@@ -18,6 +18,7 @@ from app.schemas.recommendation import (
     TrendTopicResponse,
     TopicStatusUpdate,
     TopicSkipResponse,
+    RelatedVideosResponse,
     TrendTopicsGenerateResponse,
     # 레거시 호환
     RecommendationResponse,
@@ -29,6 +30,7 @@ from app.services.recommendation_service import (
     check_recommendations_exist,
     generate_trend_topics,
     skip_topic,
+    get_related_stored_videos,
     update_topic_status,
     # 레거시 호환
     get_recommendations_legacy,
@@ -207,6 +209,38 @@ async def skip_recommendation(
     )
 
 
+@router.get("/topics/{topic_type}/{topic_id}/related-videos", response_model=RelatedVideosResponse)
+async def get_related_videos(
+    topic_type: str,
+    topic_id: str,
+    limit: int = 5,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    주제와 관련된 저장 영상 (자막/분석 요약 전문 검색).
+
+    - 주제 제목과 검색 키워드로 검색, 영상당 가장 잘 맞는 구간 스니펫 포함
+    - topic_type: "channel" 또는 "trend"
+    """
+    if topic_type not in ["channel", "trend"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="topic_type은 'channel' 또는 'trend'여야 합니다.",
+        )
+
+    videos = await get_related_stored_videos(
+        db, topic_id, topic_type, current_user.id, limit=min(max(limit, 1), 20)
+    )
+    if videos is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="주제를 찾을 수 없습니다.",
+        )
+
+    return RelatedVideosResponse(topic_id=topic_id, videos=videos)
+
+
 @router.patch("/topics/{topic_type}/{topic_id}/status")
 async def update_topic_status_endpoint(
     topic_type: str,
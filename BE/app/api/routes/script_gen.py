@@ -4,8 +4,9 @@ Script Generation API Router
 스크립트 생성 워크플로우를 시작하고 관리하는 API 엔드포인트
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 import logging
 
 from app.core.db import get_db
@@ -178,7 +179,8 @@ async def run_complete_pipeline(
         result_dict = await generate_script(
             topic=planner_input["topic"],
             channel_profile=planner_input["channel_profile"],
-            topic_request_id=None
+            topic_request_id=None,
+            user_id=str(current_user.id),
         )
         
         # 3. 결과 매핑 (Dict -> Pydantic Schema)
@@ -307,51 +309,43 @@ async def start_script_generation(
 
 from sqlalchemy import select, desc, func
 
+from app.core.responses import ORJSONResponse
+
 
-@router.get("/scripts/list")
+@router.get("/scripts/list", response_class=ORJSONResponse)
 async def get_script_list(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-    page: int = 1,
-    page_size: int = 8,
+    cursor: Optional[str] = None,
+    page_size: int = Query(8, ge=1, le=100),
+    include_total: bool = False,
 ):
     """
-    사용자의 스크립트 목록 조회 (페이지네이션)
+    사용자의 스크립트 목록 조회 (keyset 페이지네이션)
     
-    script_drafts 테이블에서 사용자가 작성한 스크립트 목록을 조회합니다.
+    script_drafts 테이블에서 사용자가 작성한 스크립트 목록을 최신순으로 조회합니다.
     topic_request를 통해 주제 제목도 함께 가져옵니다.
+
+    - cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
+    - include_total: true면 전체 개수 포함 (사용자별 캐시)
     """
-    from app.models.topic_request import TopicRequest
-    from app.models.script_output import ScriptDraft
+    from app.services.script_list_service import InvalidCursorError, ScriptListService
 
     try:
-        # 전체 개수 조회
-        count_stmt = (
-            select(func.count())
-            .select_from(ScriptDraft)
-            .join(TopicRequest, ScriptDraft.topic_request_id == TopicRequest.id)
-            .where(TopicRequest.user_id == current_user.id)
-        )
-        total_count = (await db.execute(count_stmt)).scalar() or 0
-
-        # 페이지네이션 계산
-        total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 1
-        offset = (page - 1) * page_size
-
-        # 스크립트 목록 조회
-        stmt = (
-            select(ScriptDraft, TopicRequest)
-            .join(TopicRequest, ScriptDraft.topic_request_id == TopicRequest.id)
-            .where(TopicRequest.user_id == current_user.id)
-            .order_by(desc(ScriptDraft.generated_at))
-            .offset(offset)
-            .limit(page_size)
-        )
-        rows = (await db.execute(stmt)).all()
+        try:
+            rows, next_cursor = await ScriptListService.list_page(
+                db, current_user.id, page_size, cursor
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+
+        total_count = total_pages = None
+        if include_total:
+            total_count = await ScriptListService.count(db, current_user.id)
+            total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 1
 
         scripts = []
         for draft, topic_req in rows:
-            metadata = draft.metadata_json or {}
             scripts.append({
                 "id": str(draft.id),
                 "topic_request_id": str(draft.topic_request_id),
@@ -362,17 +356,20 @@ async def get_script_list(
                 "is_completed": topic_req.status == "verified",
             })
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "scripts": scripts,
+            "next_cursor": next_cursor,
             "pagination": {
-                "page": page,
                 "page_size": page_size,
+                "has_more": next_cursor is not None,
                 "total_count": total_count,
                 "total_pages": total_pages,
             }
-        }
+        })
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Script list fetch failed: {e}", exc_info=True)
         raise HTTPException(
@@ -381,50 +378,40 @@ async def get_script_list(
         )
 
 
-@router.get("/scripts/history")
+@router.get("/scripts/history", response_class=ORJSONResponse)
 async def get_script_history(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     limit: int = 10,
 ):
     """
-    사용자의 생성 이력 조회 (새로고침해도 결과 유지)
+    사용자의 생성 이력 조회 (요약)
+
+    목록 표시용 컬럼과 JSONB 일부 키만 SQL에서 뽑아 반환합니다.
+    스크립트 본문 / 참고자료 전체는 /scripts/{topic_request_id}에서 조회합니다.
     """
-    from app.models.topic_request import TopicRequest
-    from app.models.script_output import VerifiedScript
+    from app.services.script_list_service import build_history_query
 
     try:
-        # TopicRequest + VerifiedScript 조인 조회
-        stmt = (
-            select(TopicRequest, VerifiedScript)
-            .outerjoin(VerifiedScript, TopicRequest.id == VerifiedScript.topic_request_id)
-            .where(TopicRequest.user_id == current_user.id)
-            .order_by(desc(TopicRequest.created_at))
-            .limit(limit)
-        )
+        stmt = build_history_query(current_user.id, limit)
         rows = (await db.execute(stmt)).all()
 
-        results = []
-        for topic_req, verified in rows:
-            item = {
-                "topic_request_id": str(topic_req.id),
-                "topic_title": topic_req.topic_title,
-                "status": topic_req.status,
-                "created_at": topic_req.created_at.isoformat() if topic_req.created_at else None,
-                "script": None,
-                "references": None,
-                "competitor_videos": None,
+        results = [
+            {
+                "topic_request_id": str(row.id),
+                "topic_title": row.topic_title,
+                "status": row.status,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+                "verified_at": row.verified_at.isoformat() if row.verified_at else None,
+                "has_script": bool(row.has_script),
+                "hook_preview": row.hook_preview,
+                "chapter_count": row.chapter_count or 0,
+                "reference_count": row.reference_count or 0,
             }
-            if verified:
-                item["script"] = verified.final_script_json
-                source_map = verified.source_map_json or {}
-                item["references"] = source_map.get("references", [])
-                item["competitor_videos"] = source_map.get("competitor_videos", [])
-                item["citations"] = source_map.get("citations", [])
-                item["related_videos"] = source_map.get("related_videos", [])
-            results.append(item)
+            for row in rows
+        ]
 
-        return {"success": True, "results": results}
+        return ORJSONResponse({"success": True, "results": results})
 
     except Exception as e:
         logger.error(f"History fetch failed: {e}", exc_info=True)
@@ -434,14 +421,14 @@ async def get_script_history(
         )
 
 
-@router.get("/scripts/{topic_request_id}")
+@router.get("/scripts/{topic_request_id}", response_class=ORJSONResponse)
 async def get_script_by_id(
     topic_request_id: str,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    특정 스크립트 결과 조회
+    특정 스크립트 결과 조회 (본문 / 참고자료 전체)
     """
     from app.models.topic_request import TopicRequest
     from app.models.script_output import VerifiedScript
@@ -454,8 +441,16 @@ async def get_script_by_id(
         raise HTTPException(status_code=400, detail="유효하지 않은 ID 형식입니다.")
 
     try:
+        # 화면에 쓰는 JSONB 컬럼만 조회 (final_text / changes_json / 검증 리포트 제외)
         stmt = (
-            select(TopicRequest, VerifiedScript)
+            select(
+                TopicRequest.id,
+                TopicRequest.topic_title,
+                TopicRequest.status,
+                VerifiedScript.id.label("verified_id"),
+                VerifiedScript.final_script_json,
+                VerifiedScript.source_map_json,
+            )
             .outerjoin(VerifiedScript, TopicRequest.id == VerifiedScript.topic_request_id)
             .where(TopicRequest.id == topic_uuid)
             .where(TopicRequest.user_id == current_user.id)
@@ -465,25 +460,24 @@ async def get_script_by_id(
         if not row:
             raise HTTPException(status_code=404, detail="결과를 찾을 수 없습니다.")
 
-        topic_req, verified = row
         result = {
             "success": True,
-            "topic_request_id": str(topic_req.id),
-            "topic_title": topic_req.topic_title,
-            "status": topic_req.status,
+            "topic_request_id": str(row.id),
+            "topic_title": row.topic_title,
+            "status": row.status,
             "script": None,
             "references": None,
             "competitor_videos": None,
         }
-        if verified:
-            result["script"] = verified.final_script_json
-            source_map = verified.source_map_json or {}
+        if row.verified_id is not None:
+            result["script"] = row.final_script_json
+            source_map = row.source_map_json or {}
             result["references"] = source_map.get("references", [])
             result["competitor_videos"] = source_map.get("competitor_videos", [])
             result["citations"] = source_map.get("citations", [])
             result["related_videos"] = source_map.get("related_videos", [])
 
-        return result
+        return ORJSONResponse(result)
 
     except HTTPException:
         raise
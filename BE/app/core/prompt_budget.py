@@ -0,0 +1,214 @@
+"""
+토큰 기준 프롬프트 예산 (글자 수 제한 대체)
+
+한국어는 글자 수와 토큰 수의 비율이 영어와 크게 달라서, 글자 수 제한으로는
+컨텍스트를 넘기거나 반대로 남기게 됩니다. 로컬 토크나이저(tiktoken)로 토큰을 세고
+섹션별 우선순위에 따라 예산을 나눕니다.
+
+사용:
+    budget = PromptBudget(4000)
+    budget.add("visuals", visual_text, priority=0, max_tokens=300)
+    budget.add("body", article_text, priority=1)
+    result = budget.allocate()
+    result.sections["body"], result.token_counts   # 잘린 본문, 섹션별 토큰 수
+
+배정 규칙:
+    priority가 낮은 섹션부터 (같으면 추가한 순서) 필요한 만큼(max_tokens 이내) 배정하고,
+    남은 예산을 다음 섹션에 넘깁니다. 예산보다 긴 섹션은 문장 경계에서 자릅니다.
+
+토크나이저:
+    gpt-4o / gpt-4.1 계열 인코딩(o200k_base). 인코딩 파일을 내려받지 못하는 환경에서는
+    UTF-8 바이트 길이 기반 추정치(한글 1글자 ≈ 1토큰, 영어 3~4글자 ≈ 1토큰)로 대신합니다.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ENCODING_NAME = "o200k_base"
+
+# 영상 분석 프롬프트의 자막 토큰 예산 (분석 페이지 / 경쟁 채널 / 스크립트 생성 경쟁 영상 분석 공용)
+CAPTION_TOKEN_BUDGET = 8000
+
+# 문장 끝: 마침표/물음표/느낌표 (+ 닫는 따옴표·괄호) 뒤 공백, 또는 줄바꿈
+_SENTENCE_END = re.compile(r"[.!?。…]+[\"'”’」』)\]]*(?=\s)|\n")
+# 문장 시작 (뒤에서부터 자를 때): 위 문장 끝 바로 다음 위치
+_SENTENCE_START = re.compile(r"(?:[.!?。…]+[\"'”’」』)\]]*\s+|\n)(?=\S)")
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(ENCODING_NAME)
+    except Exception as e:
+        logger.warning(f"[PromptBudget] tiktoken 인코딩 로드 실패 → 바이트 길이 추정 사용: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """텍스트 토큰 수."""
+    if not text:
+        return 0
+    enc = _encoding()
+    if enc is not None:
+        return len(enc.encode(text, disallowed_special=()))
+    return -(-len(text.encode("utf-8")) // 3)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, keep: str = "head", ellipsis: str = "") -> str:
+    """
+    max_tokens 이내로 자르기 (문장 경계 우선).
+
+    Args:
+        keep: "head"면 앞부분, "tail"이면 뒷부분을 남김
+        ellipsis: 잘렸을 때 잘린 쪽에 붙일 표시 (예: "..."), 예산에 포함
+
+    자른 위치 근처(남길 길이의 절반 이내)에 문장 경계가 없으면 공백, 그것도 없으면 글자 단위로 자릅니다.
+    """
+    if max_tokens <= 0 or not text:
+        return ""
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    limit = max_tokens - count_tokens(ellipsis)
+    if limit <= 0:
+        return ""
+
+    lo = _fit_length(text, limit, keep)
+    if keep == "head":
+        piece = _cut_head(text[:lo])
+        return piece + ellipsis if piece else ""
+    piece = _cut_tail(text[len(text) - lo:])
+    return ellipsis + piece if piece else ""
+
+
+def _fit_length(text: str, limit: int, keep: str) -> int:
+    """limit 토큰 안에 들어가는 가장 긴 앞(뒤)부분의 글자 길이."""
+    enc = _encoding()
+    if enc is not None:
+        tokens = enc.encode(text, disallowed_special=())
+        # 토큰 경계가 글자 중간이면 깨진 글자(U+FFFD)가 생기므로 제외
+        if keep == "head":
+            return len(enc.decode(tokens[:limit]).rstrip("\ufffd"))
+        return len(enc.decode(tokens[-limit:]).lstrip("\ufffd"))
+
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        piece = text[:mid] if keep == "head" else text[len(text) - mid:]
+        if count_tokens(piece) <= limit:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _cut_head(piece: str) -> str:
+    """앞부분 조각의 끝을 문장 경계로."""
+    ends = [m.end() for m in _SENTENCE_END.finditer(piece)]
+    if ends and ends[-1] >= len(piece) // 2:
+        return piece[:ends[-1]].rstrip()
+    space = piece.rfind(" ")
+    if space >= len(piece) // 2:
+        return piece[:space].rstrip()
+    return piece.rstrip()
+
+
+def _cut_tail(piece: str) -> str:
+    """뒷부분 조각의 시작을 문장 경계로."""
+    starts = [m.end() for m in _SENTENCE_START.finditer(piece)]
+    if starts and starts[0] <= len(piece) // 2:
+        return piece[starts[0]:].lstrip()
+    space = piece.find(" ")
+    if 0 <= space <= len(piece) // 2:
+        return piece[space + 1:].lstrip()
+    return piece.lstrip()
+
+
+@dataclass
+class BudgetResult:
+    """
+    sections: 섹션 이름 → 예산 안으로 자른 텍스트
+    token_counts: 섹션 이름 → 자른 뒤 토큰 수
+    original_counts: 섹션 이름 → 원문 토큰 수
+    """
+    budget: int
+    sections: Dict[str, str] = field(default_factory=dict)
+    token_counts: Dict[str, int] = field(default_factory=dict)
+    original_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(self.token_counts.values())
+
+    @property
+    def truncated(self) -> List[str]:
+        return [name for name, n in self.original_counts.items() if self.token_counts[name] < n]
+
+    def summary(self) -> str:
+        """로그용: "body 3120/5230, visuals 84 (총 3204/4000)" """
+        parts = []
+        for name, n in self.token_counts.items():
+            original = self.original_counts[name]
+            parts.append(f"{name} {n}/{original}" if n < original else f"{name} {n}")
+        return f"{', '.join(parts)} (총 {self.total_tokens}/{self.budget})"
+
+
+@dataclass
+class _Section:
+    name: str
+    text: str
+    priority: int
+    max_tokens: Optional[int]
+    keep: str
+    ellipsis: str
+
+
+class PromptBudget:
+    """섹션별 우선순위 토큰 배정."""
+
+    def __init__(self, total_tokens: int):
+        self.total_tokens = total_tokens
+        self._sections: List[_Section] = []
+
+    def add(
+        self,
+        name: str,
+        text: str,
+        priority: int = 0,
+        max_tokens: Optional[int] = None,
+        keep: str = "head",
+        ellipsis: str = "",
+    ) -> "PromptBudget":
+        """섹션 추가 (priority가 낮을수록 먼저 배정, max_tokens는 섹션 상한)."""
+        self._sections.append(_Section(name, text or "", priority, max_tokens, keep, ellipsis))
+        return self
+
+    def allocate(self) -> BudgetResult:
+        remaining = self.total_tokens
+        allocated: Dict[str, tuple] = {}  # 이름 → (텍스트, 토큰 수, 원문 토큰 수)
+
+        for section in sorted(self._sections, key=lambda s: s.priority):
+            original = count_tokens(section.text)
+            cap = remaining if section.max_tokens is None else min(remaining, section.max_tokens)
+            if original <= cap:
+                text, used = section.text, original
+            else:
+                text = truncate_to_tokens(section.text, cap, keep=section.keep, ellipsis=section.ellipsis)
+                used = count_tokens(text)
+            allocated[section.name] = (text, used, original)
+            remaining -= used
+
+        # 결과는 추가한 순서로
+        result = BudgetResult(budget=self.total_tokens)
+        for section in self._sections:
+            text, used, original = allocated[section.name]
+            result.sections[section.name] = text
+            result.token_counts[section.name] = used
+            result.original_counts[section.name] = original
+        return result
@@ -0,0 +1,19 @@
+"""
+orjson 기반 JSON 응답
+
+큰 JSONB 결과(스크립트 본문, 참고자료)를 돌려주는 엔드포인트용.
+엔드포인트에서 ORJSONResponse(content)를 직접 반환하면 FastAPI의 jsonable_encoder
+변환을 건너뛰고 orjson으로 바로 직렬화합니다 (datetime / UUID도 orjson이 처리).
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
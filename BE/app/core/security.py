@@ -1,15 +1,18 @@
 from datetime import datetime, timedelta
 from typing import Optional
+import ipaddress
 import secrets
+import time
 
 from jose import JWTError, jwt
-from fastapi import Depends, HTTPException, status, Cookie, Header
+from fastapi import Depends, HTTPException, Request, status, Cookie, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.config import settings
 from app.core.db import get_db
+from app.core.user_cache import CachedUser, token_fingerprint, user_cache
 
 
 security = HTTPBearer(auto_error=False)
@@ -87,10 +90,13 @@ async def get_current_user(
     db: AsyncSession = Depends(get_db),
     authorization: Optional[HTTPAuthorizationCredentials] = Depends(security),
     session_token: Optional[str] = Cookie(None, alias="session_token")
-):
+) -> CachedUser:
     """
     Get current user from either JWT token or session cookie.
     Priority: JWT > Session Cookie
+
+    Returns a detached, read-only snapshot. Lookups are cached for a short TTL
+    keyed by user and token (see app/core/user_cache.py).
     """
     from app.models.user import User
     from app.models.session import Session
@@ -99,6 +105,11 @@ async def get_current_user(
     if authorization:
         payload = verify_token(authorization.credentials, "access")
         user_id = payload.get("sub")
+        cache_key = ("jwt", user_id, token_fingerprint(authorization.credentials))
+
+        cached = user_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         result = await db.execute(select(User).where(User.id == user_id))
         user = result.scalar_one_or_none()
@@ -108,10 +119,20 @@ async def get_current_user(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found"
             )
-        return user
+
+        snapshot = CachedUser.from_user(user)
+        expires_in = payload["exp"] - time.time() if payload.get("exp") else None
+        user_cache.put(cache_key, snapshot, expires_in)
+        return snapshot
     
     # Try session cookie
     if session_token:
+        cache_key = ("session", None, token_fingerprint(session_token))
+
+        cached = user_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         result = await db.execute(
             select(Session)
             .where(Session.session_token == session_token)
@@ -134,9 +155,43 @@ async def get_current_user(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found"
             )
-        return user
+
+        snapshot = CachedUser.from_user(user)
+        user_cache.put(cache_key, snapshot, (session.expires_at - datetime.utcnow()).total_seconds())
+        return snapshot
     
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Not authenticated"
     )
+
+
+def require_internal_request(
+    request: Request,
+    x_metrics_token: Optional[str] = Header(None, alias="X-Metrics-Token"),
+) -> None:
+    """
+    Guard for operational endpoints (/metrics).
+
+    If METRICS_TOKEN is set, the X-Metrics-Token header must match it.
+    Otherwise only loopback / private-network clients are allowed.
+    """
+    if settings.metrics_token:
+        if x_metrics_token and secrets.compare_digest(x_metrics_token, settings.metrics_token):
+            return
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Forbidden"
+        )
+
+    host = request.client.host if request.client else None
+    try:
+        address = ipaddress.ip_address(host) if host else None
+    except ValueError:
+        address = None
+
+    if address is None or not (address.is_loopback or address.is_private):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Forbidden"
+        )
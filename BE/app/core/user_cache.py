@@ -0,0 +1,140 @@
+"""
+인증 사용자 조회 캐시 (프로세스 로컬 TTL + LRU)
+
+get_current_user는 요청마다 토큰을 검증한 뒤 users(세션 쿠키면 sessions도)를 조회합니다.
+한 화면이 여러 API를 동시에 호출하면 같은 조회가 반복되므로, 검증이 끝난 결과를
+짧은 TTL 동안 재사용합니다.
+
+키:
+    ("jwt", user_id, 토큰 지문)      Access Token
+    ("session", None, 토큰 지문)     세션 쿠키
+    토큰 지문(sha256)이 토큰 버전 역할을 하므로, 토큰이 재발급되면 자연히 다른 키가 됩니다.
+
+값:
+    CachedUser — ORM 세션과 분리된 읽기 전용 스냅샷 (다른 요청의 DB 세션에 묶이지 않음)
+
+무효화:
+    invalidate_user()   사용자 정보 변경 (로그인 시 프로필 갱신)
+    invalidate_token()  세션 로그아웃
+    항목은 TTL과 토큰 만료 시각 중 빠른 쪽에 만료됩니다. 무효화는 프로세스 로컬이므로
+    다른 워커 프로세스에서는 최대 TTL(기본 30초) 동안 이전 값이 보일 수 있습니다.
+"""
+
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+CacheKey = Tuple[str, Optional[str], str]
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """인증된 사용자 읽기 전용 스냅샷 (User 모델과 같은 속성명)."""
+    id: uuid.UUID
+    email: str
+    name: Optional[str]
+    avatar_url: Optional[str]
+    google_sub: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user) -> "CachedUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            avatar_url=user.avatar_url,
+            google_sub=user.google_sub,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+def token_fingerprint(token: str) -> str:
+    """토큰 원문 대신 키에 쓰는 지문."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+
+
+class UserCache:
+
+    def __init__(self, ttl_sec: float, max_size: int):
+        self.ttl_sec = ttl_sec
+        self.max_size = max_size
+        self._entries: "OrderedDict[CacheKey, Tuple[float, CachedUser]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: CacheKey) -> Optional[CachedUser]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+        if entry is not None:
+            del self._entries[key]
+        self._misses += 1
+        return None
+
+    def put(self, key: CacheKey, user: CachedUser, expires_in: Optional[float] = None) -> None:
+        """expires_in: 토큰 남은 유효 시간(초) — TTL보다 짧으면 그 시점에 만료."""
+        if self.ttl_sec <= 0 or self.max_size <= 0:
+            return
+        ttl = self.ttl_sec if expires_in is None else min(self.ttl_sec, expires_in)
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, user)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id) -> int:
+        """사용자의 모든 항목 제거. Returns: 제거한 항목 수."""
+        stale = [key for key, (_, user) in self._entries.items() if user.id == user_id]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def invalidate_token(self, token: str) -> int:
+        """토큰 하나에 대한 항목 제거. Returns: 제거한 항목 수."""
+        fingerprint = token_fingerprint(token)
+        stale = [key for key in self._entries if key[2] == fingerprint]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def stats(self) -> Dict[str, object]:
+        """
+        프로세스 누적 캐시 통계.
+
+        Returns:
+            {"size", "max_size", "ttl_sec", "hits", "misses", "hit_rate"}
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_sec": self.ttl_sec,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+user_cache = UserCache(
+    ttl_sec=settings.auth_user_cache_ttl_sec,
+    max_size=settings.auth_user_cache_max_size,
+)
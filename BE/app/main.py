@@ -1,7 +1,7 @@
 import logging
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
@@ -10,6 +10,7 @@ logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 from app.core.config import settings
 from app.core.db import engine
+from app.core.security import require_internal_request
 from app.api.routes import auth, youtube, subtitle, persona, recommendations, script_gen, thumbnail
 from app.api.routes.channel import router as channel_router
 
@@ -57,6 +58,13 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", dependencies=[Depends(require_internal_request)])
+async def metrics():
+    """Process-local cache metrics (internal network or X-Metrics-Token only)."""
+    from app.core.user_cache import user_cache
+    return {"user_cache": user_cache.stats()}
+
+
 @app.on_event("startup")
 async def startup():
     """Startup event handler."""
@@ -70,3 +78,5 @@ async def shutdown():
     await engine.dispose()
     from app.core.redis import close_redis
     await close_redis()
+    from app.services.youtube_service import close_http_client
+    await close_http_client()
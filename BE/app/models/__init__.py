@@ -8,6 +8,9 @@ from app.models.youtube_channel import (
     YTChannelTopic,
     YTAudienceDaily,
     YTGeoDaily,
+    YTChannelPeriodRollup,
+    YTChannelAudienceRollup,
+    YTChannelGeoRollup,
 )
 from app.models.channel_video import YTChannelVideo, YTVideoStats
 from app.models.thumbnail_strategy import ThumbnailStrategy
@@ -45,6 +48,9 @@ __all__ = [
     "YTChannelTopic",
     "YTAudienceDaily",
     "YTGeoDaily",
+    "YTChannelPeriodRollup",
+    "YTChannelAudienceRollup",
+    "YTChannelGeoRollup",
     "YTChannelVideo",
     "YTVideoStats",
     "ThumbnailStrategy",
@@ -1,7 +1,7 @@
 import uuid
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Integer, LargeBinary, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.db import Base
 
@@ -18,6 +18,10 @@ class VideoCaption(Base):
         nullable=False,
         unique=True,
     )
-    segments_json = Column(JSONB, nullable=False)
+    # 저장 포맷은 app/services/caption_storage.py 참고
+    plain_text = Column(Text, nullable=True)  # 이어붙인 자막 텍스트
+    char_count = Column(Integer, nullable=True)  # plain_text 길이
+    cues_zstd = deferred(Column(LargeBinary, nullable=True))  # zstd 압축 cue 배열 (필요할 때만 로드)
+    segments_json = Column(JSONB, nullable=True)  # legacy (backfill 후 NULL)
 
     video = relationship("CompetitorVideo", backref="caption")
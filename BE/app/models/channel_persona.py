@@ -108,6 +108,12 @@ class ChannelPersona(Base):
     viewer_dislikes = Column(JSONB, nullable=True)       # 저조 영상에서 시청자가 싫어하는 것
     current_viewer_needs = Column(JSONB, nullable=True)  # 최신 시청자 니즈 (최근 영상 가중)
 
+    # =========================================================================
+    # 생성 기록 (회귀 추적용)
+    # =========================================================================
+    generation_stats = Column(JSONB, nullable=True)  # {"step_timings": {단계: 초}, "video_analysis_batches": [...]}
+    source_snapshot = Column(JSONB, nullable=True)   # 분석 기준 영상 ID/통계/그룹 패턴 (증분 재분석용)
+
     # =========================================================================
     # 메타
     # =========================================================================
@@ -159,6 +165,7 @@ class ChannelPersona(Base):
             "viewer_likes": self.viewer_likes,
             "viewer_dislikes": self.viewer_dislikes,
             "current_viewer_needs": self.current_viewer_needs,
+            "generation_stats": self.generation_stats,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
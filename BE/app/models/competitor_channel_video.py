@@ -1,8 +1,8 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.db import Base
 
@@ -100,8 +100,11 @@ class RecentVideoCaption(Base):
         index=True
     )
 
-    # 자막 데이터 (JSON)
-    segments_json = Column(JSONB, nullable=False)
+    # 자막 데이터 (저장 포맷은 app/services/caption_storage.py 참고)
+    plain_text = Column(Text, nullable=True)  # 이어붙인 자막 텍스트
+    char_count = Column(Integer, nullable=True)  # plain_text 길이
+    cues_zstd = deferred(Column(LargeBinary, nullable=True))  # zstd 압축 cue 배열 (필요할 때만 로드)
+    segments_json = Column(JSONB, nullable=True)  # legacy (backfill 후 NULL)
 
     # 메타
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
@@ -55,7 +55,11 @@ class TopicRequest(Base):
     )
 
     __table_args__ = (
-        Index("ix_topic_requests_user_id", "user_id"),
+        # 스크립트 목록 keyset 페이지네이션 (user_id 단독 조회도 이 인덱스 사용)
+        Index(
+            "ix_topic_requests_user_created",
+            "user_id", created_at.desc(), id.desc(),
+        ),
         Index("ix_topic_requests_status", "status"),
     )
 
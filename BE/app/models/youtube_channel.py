@@ -129,3 +129,56 @@ class YTGeoDaily(Base):
         Index("ix_geo_channel_id", "channel_id"),
         Index("ix_geo_date", "date"),
     )
+
+
+# ---------- 집계 롤업 (analytics_rollup_service가 동기화 직후 채널 단위로 갱신) ----------
+
+
+class YTChannelPeriodRollup(Base):
+    """채널 기간별 집계 (7d / 28d / 90d / all)."""
+
+    __tablename__ = "yt_channel_period_rollups"
+
+    channel_id = Column(String, ForeignKey("youtube_channels.channel_id", ondelete="CASCADE"), primary_key=True)
+    period = Column(String, primary_key=True)
+    period_start = Column(Date, nullable=True)  # all이면 NULL
+    period_end = Column(Date, nullable=False)
+
+    views_gained = Column(BigInteger, nullable=False, default=0)       # 기간 내 첫/마지막 스냅샷 차이
+    subscribers_gained = Column(Integer, nullable=False, default=0)
+    total_views = Column(BigInteger, nullable=True)                    # period_end 기준 누적
+    subscriber_count = Column(Integer, nullable=True)
+    videos_published = Column(Integer, nullable=False, default=0)
+    total_duration_seconds = Column(BigInteger, nullable=False, default=0)
+    refreshed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class YTChannelAudienceRollup(Base):
+    """채널 시청자 연령/성별 구성 (최신 보고서 기준)."""
+
+    __tablename__ = "yt_channel_audience_rollups"
+
+    channel_id = Column(String, ForeignKey("youtube_channels.channel_id", ondelete="CASCADE"), primary_key=True)
+    age_group = Column(String, primary_key=True)
+    gender = Column(String, primary_key=True)
+    share = Column(Float, nullable=False, default=0)  # viewerPercentage (%)
+    report_date = Column(Date, nullable=False)
+    refreshed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class YTChannelGeoRollup(Base):
+    """채널 국가별 시청 비중 (최신 보고서 기준, 조회수 순위)."""
+
+    __tablename__ = "yt_channel_geo_rollups"
+
+    channel_id = Column(String, ForeignKey("youtube_channels.channel_id", ondelete="CASCADE"), primary_key=True)
+    country = Column(String, primary_key=True)
+    views = Column(BigInteger, nullable=False, default=0)
+    share = Column(Float, nullable=False, default=0)  # 전체 조회수 대비 %
+    rank = Column(Integer, nullable=False)
+    report_date = Column(Date, nullable=False)
+    refreshed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_geo_rollups_channel_rank", "channel_id", "rank"),
+    )
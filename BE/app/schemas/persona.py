@@ -64,6 +64,13 @@ class PersonaResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_persona(cls, persona) -> "PersonaResponse":
+        """ChannelPersona 모델 → 응답 (id는 문자열로 변환)."""
+        data = {name: getattr(persona, name, None) for name in cls.model_fields}
+        data["id"] = str(persona.id)
+        return cls(**data)
+
 
 class PersonaUpdateRequest(BaseModel):
     """페르소나 수정 요청."""
@@ -102,3 +109,13 @@ class PersonaGenerateResponse(BaseModel):
     success: bool
     message: str
     persona: Optional[PersonaResponse] = None
+
+
+class PersonaGenerateTaskResponse(BaseModel):
+    """페르소나 생성 작업 상태 (POST /personas/generate, GET /personas/generate/status/{task_id})."""
+
+    task_id: str
+    status: str = Field(..., description="PENDING, PROGRESS, SUCCESS, FAILURE")
+    deduplicated: bool = Field(False, description="이미 진행 중인 작업을 반환했으면 True")
+    progress: Optional[dict] = None  # {"current_step", "message", "completed_steps", "total_steps", "steps"}
+    result: Optional[PersonaGenerateResponse] = None
@@ -92,6 +92,23 @@ class TopicSkipResponse(BaseModel):
     remaining_queued: int  # 남은 대기 주제 수
 
 
+class RelatedVideoItem(BaseModel):
+    """저장된 자막/분석 요약 검색으로 찾은 관련 영상."""
+    video_id: str
+    title: str
+    channel_title: Optional[str] = None
+    view_count: Optional[int] = None
+    source: str  # caption / recent_caption / analysis / recent_analysis
+    score: float
+    snippet: str  # 일치 구간 주변 텍스트
+
+
+class RelatedVideosResponse(BaseModel):
+    """주제 관련 저장 영상 목록 응답."""
+    topic_id: str
+    videos: List[RelatedVideoItem] = []
+
+
 # =============================================================================
 # 통합 조회 스키마
 # =============================================================================
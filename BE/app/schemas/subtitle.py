@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 # ── Request ──
@@ -43,6 +43,7 @@ class SubtitleResult(BaseModel):
     tracks: List[SubtitleTrack] = []
     no_captions: bool = False
     error: Optional[str] = None
+    timings: Optional[Dict[str, float]] = None  # 전략별 소요시간(초) {"transcript-api": 1.2, "yt-dlp": 3.4}
 
 
 class SubtitleFetchResponse(BaseModel):
@@ -0,0 +1,338 @@
+"""
+AnalyticsRollupService — 채널 분석 집계 롤업 갱신 / 조회 / 정합성 검사
+
+대시보드와 페르소나가 매 요청마다 원본 행(yt_channel_stats_daily, yt_channel_videos,
+yt_audience_daily, yt_geo_daily)을 집계하던 것을 채널 단위 롤업 테이블 조회로 대체한다.
+
+롤업 테이블 (alembic p7q8r9s0t1u2):
+    yt_channel_period_rollups    채널 × 기간(7d/28d/90d/all) 조회수/구독자 증가, 업로드 수/길이
+    yt_channel_audience_rollups  최신 보고서 기준 연령/성별 구성
+    yt_channel_geo_rollups       최신 보고서 기준 국가별 조회수 비중 + 순위
+
+갱신:
+    refresh_channel() — 동기화 직후 해당 채널 행만 INSERT ... SELECT로 다시 계산
+    (YouTubeService.sync_user_channel, channel_video_service.sync_channel_videos).
+    savepoint 안에서 실행하므로 실패해도 동기화 트랜잭션은 유지된다.
+
+정합성:
+    check_consistency() — 원본 행을 Python으로 다시 집계해 롤업과 비교
+    (scripts/check_analytics_rollups.py).
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.channel_video import YTChannelVideo
+from app.models.youtube_channel import (
+    YTAudienceDaily,
+    YTChannelAudienceRollup,
+    YTChannelGeoRollup,
+    YTChannelPeriodRollup,
+    YTChannelStatsDaily,
+    YTGeoDaily,
+)
+
+logger = logging.getLogger(__name__)
+
+# 기간 key → 일수 (None = 전체 기간)
+PERIODS: Dict[str, Optional[int]] = {"7d": 7, "28d": 28, "90d": 90, "all": None}
+
+_SHARE_TOLERANCE = 1e-6
+
+_PERIODS_VALUES = ", ".join(
+    f"('{key}', {days if days is not None else 'NULL'}::int)" for key, days in PERIODS.items()
+)
+
+# 기간별: 기간 내 첫/마지막 채널 통계 스냅샷 차이 + 기간 내 업로드 영상 수/길이
+_REFRESH_PERIODS_SQL = text(f"""
+WITH periods(period, days) AS (VALUES {_PERIODS_VALUES}),
+bounds AS (
+    SELECT period,
+           CASE WHEN days IS NULL THEN NULL
+                ELSE CAST(:as_of AS date) - (days - 1) END AS period_start
+    FROM periods
+)
+INSERT INTO yt_channel_period_rollups (
+    channel_id, period, period_start, period_end,
+    views_gained, subscribers_gained, total_views, subscriber_count,
+    videos_published, total_duration_seconds, refreshed_at
+)
+SELECT
+    :channel_id, b.period, b.period_start, CAST(:as_of AS date),
+    coalesce(last_s.view_count - first_s.view_count, 0),
+    coalesce(last_s.subscriber_count - first_s.subscriber_count, 0),
+    last_s.view_count, last_s.subscriber_count,
+    v.videos_published, v.total_duration_seconds, now() AT TIME ZONE 'UTC'
+FROM bounds b
+LEFT JOIN LATERAL (
+    SELECT view_count, subscriber_count FROM yt_channel_stats_daily s
+    WHERE s.channel_id = :channel_id AND s.date <= CAST(:as_of AS date)
+      AND (b.period_start IS NULL OR s.date >= b.period_start)
+    ORDER BY s.date ASC LIMIT 1
+) first_s ON true
+LEFT JOIN LATERAL (
+    SELECT view_count, subscriber_count FROM yt_channel_stats_daily s
+    WHERE s.channel_id = :channel_id AND s.date <= CAST(:as_of AS date)
+      AND (b.period_start IS NULL OR s.date >= b.period_start)
+    ORDER BY s.date DESC LIMIT 1
+) last_s ON true
+CROSS JOIN LATERAL (
+    SELECT count(*) AS videos_published,
+           coalesce(sum(duration_seconds), 0) AS total_duration_seconds
+    FROM yt_channel_videos v
+    WHERE v.channel_id = :channel_id
+      AND (b.period_start IS NULL
+           OR (v.published_at AT TIME ZONE 'UTC')::date BETWEEN b.period_start AND CAST(:as_of AS date))
+) v
+ON CONFLICT (channel_id, period) DO UPDATE SET
+    period_start = EXCLUDED.period_start,
+    period_end = EXCLUDED.period_end,
+    views_gained = EXCLUDED.views_gained,
+    subscribers_gained = EXCLUDED.subscribers_gained,
+    total_views = EXCLUDED.total_views,
+    subscriber_count = EXCLUDED.subscriber_count,
+    videos_published = EXCLUDED.videos_published,
+    total_duration_seconds = EXCLUDED.total_duration_seconds,
+    refreshed_at = EXCLUDED.refreshed_at
+""")
+
+# 구성 롤업은 차원 값 집합이 바뀔 수 있으므로 채널 행을 지우고 최신 보고서로 다시 채운다
+_DELETE_AUDIENCE_SQL = text("DELETE FROM yt_channel_audience_rollups WHERE channel_id = :channel_id")
+_REFRESH_AUDIENCE_SQL = text("""
+INSERT INTO yt_channel_audience_rollups (channel_id, age_group, gender, share, report_date, refreshed_at)
+SELECT channel_id, age_group, gender, coalesce(viewer_percentage, 0), date, now() AT TIME ZONE 'UTC'
+FROM yt_audience_daily
+WHERE channel_id = :channel_id
+  AND date = (SELECT max(date) FROM yt_audience_daily WHERE channel_id = :channel_id)
+""")
+
+_DELETE_GEO_SQL = text("DELETE FROM yt_channel_geo_rollups WHERE channel_id = :channel_id")
+# 국가 보고서는 views만 있고 viewerPercentage가 없으므로 조회수 비중을 계산한다
+_REFRESH_GEO_SQL = text("""
+INSERT INTO yt_channel_geo_rollups (channel_id, country, views, share, rank, report_date, refreshed_at)
+SELECT channel_id, country, coalesce(views, 0),
+       CASE WHEN sum(coalesce(views, 0)) OVER () > 0
+            THEN 100.0 * coalesce(views, 0) / sum(coalesce(views, 0)) OVER ()
+            ELSE coalesce(viewer_percentage, 0) END,
+       row_number() OVER (ORDER BY coalesce(views, 0) DESC, country),
+       date, now() AT TIME ZONE 'UTC'
+FROM yt_geo_daily
+WHERE channel_id = :channel_id
+  AND date = (SELECT max(date) FROM yt_geo_daily WHERE channel_id = :channel_id)
+""")
+
+
+@dataclass
+class ExpectedRollups:
+    """원본 행에서 다시 계산한 롤업 값 (정합성 검사용)."""
+    periods: Dict[str, dict]
+    audience: Dict[tuple, float]  # (age_group, gender) → share
+    geo: Dict[str, dict]          # country → {"views", "share", "rank"}
+
+
+def compute_expected_rollups(
+    stats_rows: List[YTChannelStatsDaily],
+    videos: List[YTChannelVideo],
+    audience_rows: List[YTAudienceDaily],
+    geo_rows: List[YTGeoDaily],
+    period_ends: Dict[str, date],
+) -> ExpectedRollups:
+    """
+    원본 행 → 롤업 값 (SQL과 독립적인 Python 구현).
+
+    audience_rows / geo_rows는 채널의 전체 행, period_ends는 기간별 기준일
+    (롤업 행의 period_end — 검사 시점과 무관하게 같은 기준으로 비교).
+    """
+    periods = {}
+    for period, as_of in period_ends.items():
+        days = PERIODS[period]
+        start = date.fromordinal(as_of.toordinal() - (days - 1)) if days else None
+
+        def in_window(day: date) -> bool:
+            return day <= as_of and (start is None or day >= start)
+
+        window = sorted((s for s in stats_rows if in_window(s.date)), key=lambda s: s.date)
+        first, last = (window[0], window[-1]) if window else (None, None)
+
+        published = [
+            v for v in videos
+            if start is None
+            or (v.published_at and in_window(v.published_at.astimezone(timezone.utc).date()))
+        ]
+        periods[period] = {
+            "views_gained": _diff(first, last, "view_count"),
+            "subscribers_gained": _diff(first, last, "subscriber_count"),
+            "total_views": last.view_count if last else None,
+            "subscriber_count": last.subscriber_count if last else None,
+            "videos_published": len(published),
+            "total_duration_seconds": sum(v.duration_seconds or 0 for v in published),
+        }
+
+    audience = {}
+    if audience_rows:
+        latest = max(r.date for r in audience_rows)
+        audience = {
+            (r.age_group, r.gender): r.viewer_percentage or 0
+            for r in audience_rows if r.date == latest
+        }
+
+    geo = {}
+    if geo_rows:
+        latest = max(r.date for r in geo_rows)
+        rows = [r for r in geo_rows if r.date == latest]
+        total = sum(r.views or 0 for r in rows)
+        ranked = sorted(rows, key=lambda r: (-(r.views or 0), r.country))
+        geo = {
+            r.country: {
+                "views": r.views or 0,
+                "share": 100.0 * (r.views or 0) / total if total > 0 else (r.viewer_percentage or 0),
+                "rank": rank,
+            }
+            for rank, r in enumerate(ranked, start=1)
+        }
+
+    return ExpectedRollups(periods=periods, audience=audience, geo=geo)
+
+
+def _diff(first, last, field: str) -> int:
+    if first is None or getattr(first, field) is None or getattr(last, field) is None:
+        return 0
+    return getattr(last, field) - getattr(first, field)
+
+
+class AnalyticsRollupService:
+
+    # ── 갱신 ──────────────────────────────────────
+
+    @staticmethod
+    async def refresh_channel(
+        db: AsyncSession,
+        channel_id: str,
+        as_of: Optional[date] = None,
+    ) -> bool:
+        """
+        채널 롤업 다시 계산 (커밋은 호출자가 함).
+
+        Returns:
+            성공 여부 (실패 시 savepoint만 롤백하고 False)
+        """
+        params = {"channel_id": channel_id, "as_of": as_of or date.today()}
+        try:
+            async with db.begin_nested():
+                await db.execute(_REFRESH_PERIODS_SQL, params)
+                await db.execute(_DELETE_AUDIENCE_SQL, params)
+                await db.execute(_REFRESH_AUDIENCE_SQL, params)
+                await db.execute(_DELETE_GEO_SQL, params)
+                await db.execute(_REFRESH_GEO_SQL, params)
+        except Exception as e:
+            logger.warning(f"[AnalyticsRollup] {channel_id} 롤업 갱신 실패: {e}")
+            return False
+
+        logger.info(f"[AnalyticsRollup] {channel_id} 롤업 갱신 완료 (as_of={params['as_of']})")
+        return True
+
+    # ── 조회 ──────────────────────────────────────
+
+    @staticmethod
+    async def get_periods(db: AsyncSession, channel_id: str) -> Dict[str, YTChannelPeriodRollup]:
+        """기간별 집계 → {"7d": row, "28d": row, "90d": row, "all": row} (갱신 전이면 빈 dict)."""
+        result = await db.execute(
+            select(YTChannelPeriodRollup).where(YTChannelPeriodRollup.channel_id == channel_id)
+        )
+        return {row.period: row for row in result.scalars()}
+
+    @staticmethod
+    async def get_audience_mix(db: AsyncSession, channel_id: str) -> List[YTChannelAudienceRollup]:
+        """연령/성별 구성 (비중 내림차순)."""
+        result = await db.execute(
+            select(YTChannelAudienceRollup)
+            .where(YTChannelAudienceRollup.channel_id == channel_id)
+            .order_by(YTChannelAudienceRollup.share.desc())
+        )
+        return list(result.scalars())
+
+    @staticmethod
+    async def get_top_countries(
+        db: AsyncSession, channel_id: str, limit: int = 10
+    ) -> List[YTChannelGeoRollup]:
+        """조회수 상위 국가."""
+        result = await db.execute(
+            select(YTChannelGeoRollup)
+            .where(YTChannelGeoRollup.channel_id == channel_id)
+            .order_by(YTChannelGeoRollup.rank)
+            .limit(limit)
+        )
+        return list(result.scalars())
+
+    # ── 정합성 검사 ──────────────────────────────────────
+
+    @staticmethod
+    async def check_consistency(db: AsyncSession, channel_id: str) -> List[str]:
+        """
+        롤업과 원본 행 재집계 결과 비교.
+
+        Returns:
+            불일치 설명 목록 (비어 있으면 일치)
+        """
+        rollups = await AnalyticsRollupService.get_periods(db, channel_id)
+        audience_rollups = await AnalyticsRollupService.get_audience_mix(db, channel_id)
+        geo_rollups = await AnalyticsRollupService.get_top_countries(db, channel_id, limit=None)
+
+        stats_rows = (await db.execute(
+            select(YTChannelStatsDaily).where(YTChannelStatsDaily.channel_id == channel_id)
+        )).scalars().all()
+        videos = (await db.execute(
+            select(YTChannelVideo).where(YTChannelVideo.channel_id == channel_id)
+        )).scalars().all()
+        audience_rows = (await db.execute(
+            select(YTAudienceDaily).where(YTAudienceDaily.channel_id == channel_id)
+        )).scalars().all()
+        geo_rows = (await db.execute(
+            select(YTGeoDaily).where(YTGeoDaily.channel_id == channel_id)
+        )).scalars().all()
+
+        problems = []
+        missing = set(PERIODS) - set(rollups)
+        if missing:
+            problems.append(f"기간 롤업 없음: {sorted(missing)}")
+
+        expected = compute_expected_rollups(
+            stats_rows, videos, audience_rows, geo_rows,
+            period_ends={p: row.period_end for p, row in rollups.items() if p in PERIODS},
+        )
+
+        for period, values in expected.periods.items():
+            row = rollups[period]
+            for field, value in values.items():
+                if getattr(row, field) != value:
+                    problems.append(f"{period}.{field}: 롤업={getattr(row, field)} 원본={value}")
+
+        actual_audience = {(r.age_group, r.gender): r.share for r in audience_rollups}
+        if set(actual_audience) != set(expected.audience):
+            problems.append(
+                f"시청자 구성 키 불일치: 롤업={len(actual_audience)}개 원본={len(expected.audience)}개"
+            )
+        for key, share in expected.audience.items():
+            if key in actual_audience and abs(actual_audience[key] - share) > _SHARE_TOLERANCE:
+                problems.append(f"audience{key}.share: 롤업={actual_audience[key]} 원본={share}")
+
+        actual_geo = {r.country: r for r in geo_rollups}
+        if set(actual_geo) != set(expected.geo):
+            problems.append(f"국가 키 불일치: 롤업={len(actual_geo)}개 원본={len(expected.geo)}개")
+        for country, values in expected.geo.items():
+            row = actual_geo.get(country)
+            if row is None:
+                continue
+            if row.views != values["views"] or row.rank != values["rank"] \
+                    or abs(row.share - values["share"]) > _SHARE_TOLERANCE:
+                problems.append(
+                    f"geo[{country}]: 롤업=({row.views}, {row.share:.4f}, #{row.rank}) "
+                    f"원본=({values['views']}, {values['share']:.4f}, #{values['rank']})"
+                )
+
+        return problems
@@ -10,6 +10,7 @@ from app.models.session import Session
 from app.models.jwt_token import JWTRefreshToken
 from app.core.config import settings
 from app.core.security import generate_session_token, create_access_token, create_refresh_token
+from app.core.user_cache import user_cache
 
 
 class AuthService:
@@ -104,6 +105,9 @@ class AuthService:
         
         await db.commit()
         await db.refresh(user)
+
+        # 프로필이 바뀌었을 수 있으므로 캐시된 스냅샷 폐기
+        user_cache.invalidate_user(user.id)
         
         return user
     
@@ -194,6 +198,7 @@ class AuthService:
         if session:
             session.revoked_at = datetime.utcnow()
             await db.commit()
+            user_cache.invalidate_token(session_token)
             return True
         
         return False
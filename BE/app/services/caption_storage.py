@@ -0,0 +1,116 @@
+"""
+자막 저장 포맷 (video_captions / recent_video_captions 공용)
+
+컬럼:
+    plain_text  공백으로 이어붙인 자막 텍스트 (프롬프트/샘플링에서 바로 사용)
+    char_count  plain_text 길이 (길이 제한 판단용, 텍스트 로드 없이 조회 가능)
+    cues_zstd   zstd 압축한 cue 배열 (타임스탬프가 필요할 때만 decode)
+    segments_json  (legacy) 압축 이전 포맷. backfill 후 NULL
+
+cues_zstd 내부 JSON (cue는 객체 대신 [start, end, text] 배열):
+    {"v": 1, "source": "...", "no_captions": false,
+     "tracks": [{"language_code": "ko", "language_name": "ko",
+                 "is_auto_generated": true, "cues": [[0.0, 2.5, "안녕하세요"], ...]}]}
+
+모델에서 cues_zstd는 deferred 컬럼이므로, tracks가 필요한 조회는
+options(undefer(Model.cues_zstd))를 붙여야 합니다.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+import zstandard
+from sqlalchemy import inspect as sa_inspect
+
+from app.services.subtitle_service import SubtitleService
+
+_FORMAT_VERSION = 1
+_ZSTD_LEVEL = 10
+
+
+def encode_segments(segments: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    segments dict ({"source", "tracks", "no_captions"}) → 저장 컬럼 값.
+
+    Returns:
+        {"plain_text": str, "char_count": int, "cues_zstd": bytes}
+    """
+    tracks = segments.get("tracks", []) or []
+    packed = {
+        "v": _FORMAT_VERSION,
+        "source": segments.get("source"),
+        "no_captions": segments.get("no_captions", False),
+        "tracks": [
+            {
+                "language_code": t.get("language_code"),
+                "language_name": t.get("language_name"),
+                "is_auto_generated": t.get("is_auto_generated", False),
+                "cues": [
+                    [c.get("start", 0.0), c.get("end", 0.0), c.get("text", "")]
+                    for c in t.get("cues", [])
+                ],
+            }
+            for t in tracks
+        ],
+    }
+    raw = json.dumps(packed, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    plain_text = SubtitleService.build_caption_text(tracks)
+
+    return {
+        "plain_text": plain_text,
+        "char_count": len(plain_text),
+        "cues_zstd": zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(raw),
+    }
+
+
+def decode_segments(blob: bytes) -> Dict[str, Any]:
+    """cues_zstd → 기존 segments_json과 동일한 구조 ({"source", "tracks", "no_captions"})."""
+    packed = json.loads(zstandard.ZstdDecompressor().decompress(blob))
+    return {
+        "source": packed.get("source"),
+        "no_captions": packed.get("no_captions", False),
+        "tracks": [
+            {
+                "language_code": t.get("language_code"),
+                "language_name": t.get("language_name"),
+                "is_auto_generated": t.get("is_auto_generated", False),
+                "cues": [
+                    {"start": start, "end": end, "text": text}
+                    for start, end, text in t.get("cues", [])
+                ],
+            }
+            for t in packed.get("tracks", [])
+        ],
+    }
+
+
+def apply_segments(caption, segments: Dict[str, Any]) -> None:
+    """VideoCaption / RecentVideoCaption 인스턴스에 새 포맷으로 저장 (legacy 컬럼 비움)."""
+    for column, value in encode_segments(segments).items():
+        setattr(caption, column, value)
+    caption.segments_json = None
+
+
+def get_caption_text(caption) -> str:
+    """자막 텍스트. 새 포맷이면 plain_text, legacy 행이면 segments_json에서 조립."""
+    if caption.plain_text is not None:
+        return caption.plain_text
+    return SubtitleService.build_caption_text((caption.segments_json or {}).get("tracks", []))
+
+
+def get_caption_segments(caption) -> Optional[Dict[str, Any]]:
+    """
+    cue 단위 segments ({"source", "tracks", "no_captions"}).
+    cues_zstd가 로드되어 있어야 합니다 (undefer). legacy 행은 segments_json 그대로 반환.
+    """
+    if "cues_zstd" in sa_inspect(caption).unloaded:
+        raise ValueError("cues_zstd가 로드되지 않았습니다. undefer(cues_zstd)로 조회하세요.")
+    if caption.cues_zstd is not None:
+        return decode_segments(caption.cues_zstd)
+    return caption.segments_json
+
+
+def get_caption_tracks(caption) -> List[Dict[str, Any]]:
+    """cue 단위 tracks (get_caption_segments 참고)."""
+    return (get_caption_segments(caption) or {}).get("tracks", [])
+
@@ -4,21 +4,33 @@
 사용자 채널의 영상 목록과 성과 통계를 수집합니다.
 YouTube Data API를 사용하여 영상 메타데이터와 통계를 가져옵니다.
 """
-from datetime import date
+import logging
+import uuid
+from datetime import date, datetime
 from typing import List, Optional
 from uuid import UUID
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.channel_video import YTChannelVideo, YTVideoStats
 from app.core.config import settings
+from app.services.analytics_rollup_service import AnalyticsRollupService
+
+logger = logging.getLogger(__name__)
 
 
 # YouTube Data API 기본 URL
 YT_API_BASE = "https://www.googleapis.com/youtube/v3"
 
+# 한 INSERT ... ON CONFLICT 문에 담는 행 수 (videos API 배치 크기와 동일)
+UPSERT_CHUNK_SIZE = 50
+
+# RETURNING에서 신규 삽입 여부 판별 (ON CONFLICT로 갱신된 행은 xmax != 0)
+_INSERTED = literal_column("(xmax = 0)").label("inserted")
+
 
 async def get_channel_uploads_playlist_id(
     channel_id: str,
@@ -176,6 +188,7 @@ async def sync_channel_videos(
     db: AsyncSession,
     channel_id: str,
     max_results: int = 50,
+    report_date: Optional[date] = None,
 ) -> List[YTChannelVideo]:
     """
     채널의 최근 영상을 수집하여 DB에 저장.
@@ -184,6 +197,7 @@ async def sync_channel_videos(
         db: 데이터베이스 세션
         channel_id: YouTube 채널 ID
         max_results: 수집할 최대 영상 수 (기본 50)
+        report_date: 통계 기록 / 롤업 기준일 (기본 오늘, 두 곳에 같은 날짜 사용)
 
     Returns:
         저장된 YTChannelVideo 목록
@@ -191,6 +205,7 @@ async def sync_channel_videos(
     api_key = settings.youtube_api_key
     if not api_key:
         raise ValueError("YOUTUBE_API_KEY 환경변수가 설정되지 않았습니다.")
+    report_date = report_date or date.today()
 
     # 1. uploads playlist ID 조회
     playlist_id = await get_channel_uploads_playlist_id(channel_id, api_key)
@@ -207,116 +222,127 @@ async def sync_channel_videos(
     videos_detail = await fetch_video_details(video_ids, api_key)
     detail_map = {v["video_id"]: v for v in videos_detail}
 
-    # 4. DB에 저장 (upsert) - Race condition 처리 포함
-    from sqlalchemy.exc import IntegrityError
+    # 4. DB에 저장 (청크별 INSERT ... ON CONFLICT DO UPDATE)
+    #    동시 동기화 요청도 충돌 없이 마지막 값으로 갱신됨
+    #    (같은 문에 같은 키가 두 번 있으면 ON CONFLICT가 실패하므로 video_id 중복 제거)
+    rows = []
+    for basic in {v["video_id"]: v for v in videos_basic}.values():
+        detail = detail_map.get(basic["video_id"], {})
+        rows.append({
+            "id": uuid.uuid4(),
+            "channel_id": channel_id,
+            "video_id": basic["video_id"],
+            "title": basic["title"],
+            "description": basic["description"],
+            "published_at": _parse_published_at(basic.get("published_at")),
+            "duration_seconds": detail.get("duration_seconds"),
+            "tags": detail.get("tags"),
+            "thumbnail_url": basic.get("thumbnail_url"),
+            "created_at": datetime.utcnow(),
+        })
 
     saved_videos = []
-    for basic in videos_basic:
-        vid = basic["video_id"]
-        detail = detail_map.get(vid, {})
-
-        # 기존 레코드 확인
-        stmt = select(YTChannelVideo).where(
-            YTChannelVideo.channel_id == channel_id,
-            YTChannelVideo.video_id == vid,
-        )
-        result = await db.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # 업데이트
-            existing.title = basic["title"]
-            existing.description = basic["description"]
-            existing.thumbnail_url = basic.get("thumbnail_url")
-            existing.duration_seconds = detail.get("duration_seconds")
-            existing.tags = detail.get("tags")
-            saved_videos.append(existing)
-        else:
-            # 새로 생성
-            from datetime import datetime
-            published_at = None
-            if basic.get("published_at"):
-                try:
-                    published_at = datetime.fromisoformat(
-                        basic["published_at"].replace("Z", "+00:00")
-                    )
-                except ValueError:
-                    pass
-
-            video = YTChannelVideo(
-                channel_id=channel_id,
-                video_id=vid,
-                title=basic["title"],
-                description=basic["description"],
-                published_at=published_at,
-                duration_seconds=detail.get("duration_seconds"),
-                tags=detail.get("tags"),
-                thumbnail_url=basic.get("thumbnail_url"),
-            )
-            db.add(video)
+    inserted = 0
+    for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = pg_insert(YTChannelVideo).values(rows[i:i + UPSERT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_channel_video",
+            set_={
+                # published_at / created_at은 최초 저장 값 유지
+                "title": stmt.excluded.title,
+                "description": stmt.excluded.description,
+                "duration_seconds": stmt.excluded.duration_seconds,
+                "tags": stmt.excluded.tags,
+                "thumbnail_url": stmt.excluded.thumbnail_url,
+            },
+        ).returning(YTChannelVideo, _INSERTED)
+
+        result = await db.execute(stmt, execution_options={"populate_existing": True})
+        for video, is_inserted in result:
             saved_videos.append(video)
+            inserted += int(bool(is_inserted))
 
-    try:
-        await db.commit()
-    except IntegrityError:
-        # Race condition: 다른 요청이 먼저 저장함 → 기존 데이터 사용
-        await db.rollback()
-        return await get_channel_videos(db, channel_id)
+    await db.commit()
+    logger.info(
+        f"[ChannelVideo] {channel_id} 영상 동기화: "
+        f"신규 {inserted}개, 갱신 {len(saved_videos) - inserted}개"
+    )
 
     # 5. 통계도 함께 저장
-    await sync_video_stats(db, saved_videos, detail_map)
+    await sync_video_stats(db, saved_videos, detail_map, report_date)
+
+    # 6. 업로드 수/길이 롤업 갱신 (통계와 같은 기준일)
+    if await AnalyticsRollupService.refresh_channel(db, channel_id, as_of=report_date):
+        await db.commit()
 
     return saved_videos
 
 
+def _parse_published_at(value: Optional[str]) -> Optional[datetime]:
+    """YouTube publishedAt (ISO 8601, Z) → datetime. 해석할 수 없으면 None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
 async def sync_video_stats(
     db: AsyncSession,
     videos: List[YTChannelVideo],
     detail_map: dict,
+    report_date: Optional[date] = None,
 ) -> List[YTVideoStats]:
     """
-    영상별 통계 저장 (오늘 날짜 기준).
+    영상별 통계 저장 (report_date 기준, 청크별 INSERT ... ON CONFLICT DO UPDATE).
 
     Args:
         db: 데이터베이스 세션
         videos: YTChannelVideo 목록
         detail_map: {video_id: {view_count, like_count, comment_count}}
+        report_date: 통계 날짜 (기본 오늘)
     """
-    today = date.today()
-    saved_stats = []
+    today = report_date or date.today()
+    rows = []
 
     for video in videos:
         detail = detail_map.get(video.video_id, {})
         if not detail:
             continue
+        rows.append({
+            "id": uuid.uuid4(),
+            "video_id": video.id,
+            "date": today,
+            "view_count": detail.get("view_count"),
+            "like_count": detail.get("like_count"),
+            "comment_count": detail.get("comment_count"),
+            "created_at": datetime.utcnow(),
+        })
 
-        # 기존 레코드 확인
-        stmt = select(YTVideoStats).where(
-            YTVideoStats.video_id == video.id,
-            YTVideoStats.date == today,
-        )
-        result = await db.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # 업데이트
-            existing.view_count = detail.get("view_count")
-            existing.like_count = detail.get("like_count")
-            existing.comment_count = detail.get("comment_count")
-            saved_stats.append(existing)
-        else:
-            # 새로 생성
-            stat = YTVideoStats(
-                video_id=video.id,
-                date=today,
-                view_count=detail.get("view_count"),
-                like_count=detail.get("like_count"),
-                comment_count=detail.get("comment_count"),
-            )
-            db.add(stat)
+    saved_stats = []
+    inserted = 0
+    for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = pg_insert(YTVideoStats).values(rows[i:i + UPSERT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_video_stats_date",
+            set_={
+                "view_count": stmt.excluded.view_count,
+                "like_count": stmt.excluded.like_count,
+                "comment_count": stmt.excluded.comment_count,
+            },
+        ).returning(YTVideoStats, _INSERTED)
+
+        result = await db.execute(stmt, execution_options={"populate_existing": True})
+        for stat, is_inserted in result:
             saved_stats.append(stat)
+            inserted += int(bool(is_inserted))
 
     await db.commit()
+    logger.info(
+        f"[ChannelVideo] 영상 통계 저장 ({today}): "
+        f"신규 {inserted}개, 갱신 {len(saved_stats) - inserted}개"
+    )
     return saved_stats
 
 
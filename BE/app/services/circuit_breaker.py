@@ -0,0 +1,207 @@
+"""
+CircuitBreaker — Redis 기반 프로세스 공유 서킷 브레이커
+
+API 서버, Celery 워커 등 모든 프로세스가 같은 Redis 키를 보므로
+한 곳에서 차단(예: YouTube IP 차단)이 감지되면 모두 즉시 요청을 멈춥니다.
+
+상태:
+    closed     정상. 모든 요청 허용
+    open       차단 감지 후 cooldown 동안 모든 요청 거부
+    half_open  cooldown 만료. 탐색(probe) 요청 1건만 허용
+               → 성공 시 closed, 다시 차단되면 open (cooldown 재시작)
+
+키 구조:
+    circuit_breaker:{name}:tripped   차단 이력 (있으면 open 또는 half_open)
+    circuit_breaker:{name}:open      cooldown 동안만 존재 (TTL 만료 → half_open)
+    circuit_breaker:{name}:probe     half_open 탐색 요청 1건 점유 (SET NX)
+    circuit_breaker:{name}:metrics   상태 전이 카운터 (HASH, "closed->open": n)
+
+Redis 장애 시에는 프로세스 로컬 상태로 동일하게 동작합니다.
+"""
+
+import logging
+import time
+from typing import Dict, Optional
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "circuit_breaker"
+_TRIPPED_TTL_SECONDS = 86400  # 차단 이력 보관 (1일)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# acquire() 반환값
+PERMIT_NORMAL = "normal"
+PERMIT_PROBE = "probe"
+
+
+class CircuitBreaker:
+
+    def __init__(self, name: str, cooldown_sec: int, probe_timeout_sec: int = 120):
+        self.name = name
+        self.cooldown_sec = cooldown_sec
+        self.probe_timeout_sec = probe_timeout_sec
+
+        # Redis 장애 시 사용하는 로컬 상태
+        self._local_tripped = False
+        self._local_open_until = 0.0
+        self._local_probe_until = 0.0
+        self._local_metrics: Dict[str, int] = {}
+
+    def _key(self, suffix: str) -> str:
+        return f"{_KEY_PREFIX}:{self.name}:{suffix}"
+
+    # ── 상태 조회 ──────────────────────────────────────
+
+    async def get_state(self) -> str:
+        """현재 상태 (closed / open / half_open)."""
+        try:
+            redis = await get_redis()
+            tripped, is_open = await redis.mget(self._key("tripped"), self._key("open"))
+        except Exception as e:
+            logger.warning(f"[CircuitBreaker] {self.name} 상태 조회 실패 → 로컬 상태 사용: {e}")
+            return self._local_state()
+
+        if not tripped:
+            return CLOSED
+        return OPEN if is_open else HALF_OPEN
+
+    def _local_state(self) -> str:
+        if not self._local_tripped:
+            return CLOSED
+        return OPEN if time.monotonic() < self._local_open_until else HALF_OPEN
+
+    # ── 요청 허가 ──────────────────────────────────────
+
+    async def acquire(self) -> Optional[str]:
+        """
+        요청 허가 여부.
+
+        Returns:
+            PERMIT_NORMAL  closed 상태 → 요청 진행
+            PERMIT_PROBE   half_open 탐색 요청으로 선택됨 → 결과를 record_* 로 보고하고
+                           요청이 끝나면 (취소·예외 포함) 반드시 release() 호출
+            None           open 상태이거나 다른 요청이 이미 탐색 중 → 요청 중단
+        """
+        state = await self.get_state()
+        if state == CLOSED:
+            return PERMIT_NORMAL
+        if state == OPEN:
+            return None
+
+        # half_open: 탐색 요청 1건만 통과
+        try:
+            redis = await get_redis()
+            acquired = await redis.set(
+                self._key("probe"), "1", ex=self.probe_timeout_sec, nx=True
+            )
+        except Exception as e:
+            logger.warning(f"[CircuitBreaker] {self.name} probe 점유 실패 → 로컬 상태 사용: {e}")
+            now = time.monotonic()
+            acquired = now >= self._local_probe_until
+            if acquired:
+                self._local_probe_until = now + self.probe_timeout_sec
+
+        if not acquired:
+            return None
+
+        await self._emit_transition(OPEN, HALF_OPEN, "cooldown 만료 → 탐색 요청 1건 허용")
+        return PERMIT_PROBE
+
+    # ── 결과 보고 ──────────────────────────────────────
+
+    async def record_success(self, permit: Optional[str]) -> None:
+        """요청 성공 보고. 탐색 요청이었다면 closed로 복구."""
+        if permit != PERMIT_PROBE:
+            return
+
+        try:
+            redis = await get_redis()
+            deleted = await redis.delete(self._key("tripped"), self._key("probe"))
+        except Exception as e:
+            logger.warning(f"[CircuitBreaker] {self.name} 복구 기록 실패 → 로컬 상태 사용: {e}")
+            deleted = int(self._local_tripped)
+            self._local_tripped = False
+            self._local_probe_until = 0.0
+
+        if deleted:
+            await self._emit_transition(HALF_OPEN, CLOSED, "탐색 요청 성공 → 정상 복구")
+
+    async def record_failure(self, reason: str = "") -> None:
+        """차단 감지 보고. cooldown 동안 open 상태로 전환."""
+        previous = await self.get_state()
+        if previous == OPEN:
+            return  # 이미 차단 중 (동시에 진행 중이던 요청들의 중복 보고)
+
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline()
+            pipe.set(self._key("tripped"), "1", ex=_TRIPPED_TTL_SECONDS)
+            pipe.set(self._key("open"), "1", ex=self.cooldown_sec, nx=True)
+            pipe.delete(self._key("probe"))
+            _, opened, _ = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[CircuitBreaker] {self.name} 차단 기록 실패 → 로컬 상태 사용: {e}")
+            opened = self._local_state() != OPEN
+            self._local_tripped = True
+            self._local_open_until = time.monotonic() + self.cooldown_sec
+            self._local_probe_until = 0.0
+
+        if opened:
+            await self._emit_transition(
+                previous, OPEN, f"{self.cooldown_sec}s 동안 요청 차단 ({reason})"
+            )
+
+    async def release(self, permit: Optional[str]) -> None:
+        """
+        요청 종료 시 허가 반납 (finally에서 호출).
+
+        탐색 요청이 결과 보고 없이 끝난 경우(취소, 차단과 무관한 예외)
+        probe 점유만 풀어 half_open을 유지하고 다음 요청이 다시 탐색하게 한다.
+        record_* 이후 호출해도 probe 키만 지우므로 안전하다.
+        """
+        if permit != PERMIT_PROBE:
+            return
+
+        try:
+            redis = await get_redis()
+            await redis.delete(self._key("probe"))
+        except Exception as e:
+            logger.warning(f"[CircuitBreaker] {self.name} probe 해제 실패 → 로컬 상태 사용: {e}")
+            self._local_probe_until = 0.0
+
+    # ── 메트릭 ──────────────────────────────────────
+
+    async def _emit_transition(self, from_state: str, to_state: str, detail: str) -> None:
+        """상태 전이 로그 + 전이 카운터 증가."""
+        transition = f"{from_state}->{to_state}"
+        log = logger.error if to_state == OPEN else logger.warning
+        log(f"[CircuitBreaker] {self.name} {from_state} → {to_state}: {detail}")
+
+        self._local_metrics[transition] = self._local_metrics.get(transition, 0) + 1
+        try:
+            redis = await get_redis()
+            await redis.hincrby(self._key("metrics"), transition, 1)
+        except Exception as e:
+            logger.debug(f"[CircuitBreaker] {self.name} 메트릭 기록 실패: {e}")
+
+    async def get_metrics(self) -> Dict[str, object]:
+        """
+        현재 상태와 상태 전이 횟수.
+
+        Returns:
+            {"state": "closed", "transitions": {"closed->open": 3, ...}}
+            (Redis 장애 시 transitions는 이 프로세스에서 발생한 것만 포함)
+        """
+        state = await self.get_state()
+        try:
+            redis = await get_redis()
+            raw = await redis.hgetall(self._key("metrics"))
+            transitions = {k: int(v) for k, v in raw.items()}
+        except Exception:
+            transitions = dict(self._local_metrics)
+        return {"state": state, "transitions": transitions}
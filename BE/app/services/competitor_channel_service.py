@@ -6,17 +6,19 @@ from uuid import UUID
 
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 from fastapi import HTTPException
 
 import httpx
 
 from app.core.config import settings
+from app.core.prompt_budget import CAPTION_TOKEN_BUDGET, truncate_to_tokens
 from app.models.competitor_channel import CompetitorChannel
 from app.models.competitor_channel_video import CompetitorRecentVideo, RecentVideoComment, RecentVideoCaption
 from app.schemas.competitor_channel import CompetitorChannelCreate
 from app.services.channel_service import ChannelService
 from app.services.subtitle_service import SubtitleService
+from app.services.caption_storage import apply_segments, get_caption_segments
 from sqlalchemy import delete as sql_delete
 from app.services.keyword_extraction_service import extract_keywords_batch
 
@@ -457,11 +459,12 @@ class CompetitorChannelService:
         result = await db.execute(
             select(RecentVideoCaption)
             .where(RecentVideoCaption.recent_video_id == recent_video.id)
+            .options(undefer(RecentVideoCaption.cues_zstd))
         )
         cached_caption = result.scalar_one_or_none()
 
-        if cached_caption and cached_caption.segments_json:
-            segments = cached_caption.segments_json
+        segments = get_caption_segments(cached_caption) if cached_caption else None
+        if segments:
             # 자막 데이터가 있는지 확인
             tracks = segments.get("tracks", [])
             cue_count = sum(len(t.get("cues", [])) for t in tracks)
@@ -509,13 +512,11 @@ class CompetitorChannelService:
 
             # 기존 캐시가 있으면 업데이트, 없으면 생성
             if cached_caption:
-                cached_caption.segments_json = segments_data
+                apply_segments(cached_caption, segments_data)
                 logger.info(f"자막 캐시 업데이트: {youtube_video_id}")
             else:
-                new_caption = RecentVideoCaption(
-                    recent_video_id=recent_video.id,
-                    segments_json=segments_data,
-                )
+                new_caption = RecentVideoCaption(recent_video_id=recent_video.id)
+                apply_segments(new_caption, segments_data)
                 db.add(new_caption)
                 logger.info(f"자막 캐시 생성: {youtube_video_id}")
 
@@ -571,17 +572,10 @@ class CompetitorChannelService:
         if cue_count == 0:
             raise HTTPException(status_code=400, detail="자막이 없는 영상은 AI 분석을 할 수 없습니다")
 
-        # 자막 텍스트 합치기
-        caption_text = ""
-        for track in tracks:
-            for cue in track.get("cues", []):
-                caption_text += cue.get("text", "") + " "
-        caption_text = caption_text.strip()
-
-        # 자막 길이 제한
-        max_chars = 12000
-        if len(caption_text) > max_chars:
-            caption_text = caption_text[:max_chars] + "..."
+        # 자막 텍스트 합치기 (토큰 예산 내에서 문장 경계로 자름)
+        caption_text = truncate_to_tokens(
+            SubtitleService.build_caption_text(tracks), CAPTION_TOKEN_BUDGET, ellipsis="..."
+        )
 
         # 4. 유저의 ChannelPersona 조회 (내 채널 컨텍스트)
         from app.models.channel_persona import ChannelPersona
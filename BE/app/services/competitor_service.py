@@ -13,12 +13,14 @@ from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.prompt_budget import CAPTION_TOKEN_BUDGET, truncate_to_tokens
 from app.core.db import AsyncSessionLocal
 from app.models.competitor import CompetitorCollection, CompetitorVideo, VideoCommentSample
 from app.models.caption import VideoCaption
 from app.models.video_content_analysis import VideoContentAnalysis
 from app.schemas.competitor import CompetitorSaveRequest
 from app.services.subtitle_service import SubtitleService
+from app.services.caption_storage import get_caption_text
 
 logger = logging.getLogger(__name__)
 
@@ -421,20 +423,6 @@ class CompetitorService:
 
     # ── 영상 자막 기반 LLM 분석 ─────────────────────────────
 
-    @staticmethod
-    def _extract_text_from_segments(seg: dict) -> Optional[str]:
-        """segments_json에서 자막 텍스트 추출."""
-        if seg.get("no_captions"):
-            return None
-        tracks = seg.get("tracks", [])
-        texts = []
-        for track in tracks:
-            for cue in track.get("cues", []):
-                t = (cue.get("text") or "").strip() if isinstance(cue.get("text"), str) else ""
-                if t:
-                    texts.append(t)
-        return " ".join(texts) if texts else None
-
     @staticmethod
     async def get_or_fetch_caption_text(
         db: AsyncSession,
@@ -454,8 +442,8 @@ class CompetitorService:
         )
         caption = result.scalar_one_or_none()
 
-        if caption and caption.segments_json:
-            text = CompetitorService._extract_text_from_segments(caption.segments_json)
+        if caption:
+            text = get_caption_text(caption)
             if text:
                 return text
 
@@ -532,10 +520,8 @@ class CompetitorService:
                 detail="OpenAI API 키가 설정되지 않았습니다.",
             )
 
-        # 자막이 너무 길면 앞부분만 사용 (토큰 제한)
-        max_chars = 12000
-        if len(caption_text) > max_chars:
-            caption_text = caption_text[:max_chars] + "..."
+        # 자막이 너무 길면 앞부분만 사용 (토큰 예산, 문장 경계로 자름)
+        caption_text = truncate_to_tokens(caption_text, CAPTION_TOKEN_BUDGET, ellipsis="...")
 
         llm = ChatOpenAI(model="gpt-4o-mini", api_key=api_key)
         prompt = f"""You are a professional YouTube content analyst and strategist. Your job is to evaluate video content quality, information value, logical structure, delivery effectiveness, and viewer impact based strictly on the caption transcript.
@@ -8,6 +8,7 @@ Gemini API를 사용하여 채널 콘텐츠를 분석합니다.
 2. 히트 vs 저조 영상 비교 → 성공 요인, 피해야 할 방향
 3. 채널 설명 분석 → 정체성, 브랜딩 수준
 """
+import asyncio
 import json
 from typing import List, Optional
 from dataclasses import dataclass, asdict
@@ -15,6 +16,7 @@ from dataclasses import dataclass, asdict
 import httpx
 
 from app.core.config import settings
+from app.services.rate_limit_gate import estimate_tokens, gemini_gate, parse_retry_after
 
 
 # Gemini API 설정
@@ -48,7 +50,8 @@ class DescriptionAnalysisResult:
 
 
 async def _call_gemini(prompt: str, api_key: str) -> Optional[str]:
-    """Gemini API 호출."""
+    """Gemini API 호출. 공용 gemini_gate로 분당 한도를 지킵니다."""
+    await gemini_gate.acquire(estimate_tokens(prompt))
     async with httpx.AsyncClient(timeout=60.0) as client:
         resp = await client.post(
             f"{GEMINI_API_URL}?key={api_key}",
@@ -61,6 +64,9 @@ async def _call_gemini(prompt: str, api_key: str) -> Optional[str]:
             },
         )
 
+        if resp.status_code == 429:
+            gemini_gate.penalize(parse_retry_after(resp.headers.get("retry-after")) or 5)
+
         if resp.status_code != 200:
             print(f"Gemini API error: {resp.status_code} - {resp.text}")
             return None
@@ -456,10 +462,19 @@ async def get_all_llm_interpretations(
             "description_analysis": DescriptionAnalysisResult or None,
         }
     """
-    # 병렬로 실행해도 되지만, API 부담 고려해서 순차 실행
-    title_result = await analyze_video_titles(titles)
-    hit_low_result = await analyze_hit_vs_low(hit_videos, low_videos)
-    desc_result = await analyze_channel_description(channel_description, channel_title)
+    # 세 해석은 서로 독립이므로 동시 실행 (Gemini 한도는 gemini_gate가 관리)
+    outcomes = await asyncio.gather(
+        analyze_video_titles(titles),
+        analyze_hit_vs_low(hit_videos, low_videos),
+        analyze_channel_description(channel_description, channel_title),
+        return_exceptions=True,
+    )
+    for name, outcome in zip(("title_analysis", "hit_vs_low", "description_analysis"), outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"[Persona LLM] {name} 실패: {outcome}")
+    title_result, hit_low_result, desc_result = (
+        None if isinstance(outcome, BaseException) else outcome for outcome in outcomes
+    )
 
     return {
         "title_analysis": asdict(title_result) if title_result else None,
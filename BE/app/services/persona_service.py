@@ -4,13 +4,17 @@
 규칙 기반 해석 + 자막 분석을 종합하여 최종 페르소나를 생성합니다.
 """
 import asyncio
-from typing import List, Optional
+import time
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
 from dataclasses import asdict
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.db import AsyncSessionLocal
+from app.core.redis import get_redis
 from app.models.channel_persona import ChannelPersona
 from app.models.channel_video import YTChannelVideo, YTVideoStats
 from app.services.persona_analyzer import (
@@ -23,28 +27,128 @@ from app.services.persona_analyzer import (
     GeoData,
     VideoStatsData,
 )
+from app.services.analytics_rollup_service import AnalyticsRollupService
+from app.services.channel_video_service import sync_channel_videos
+from app.services.rate_limit_gate import estimate_tokens, gemini_gate, parse_retry_after
 from app.services.video_analyzer import analyze_channel_videos, ChannelVideoSummary
 
 
+# 페르소나 생성 진행 단계 (Celery 작업 PROGRESS 표시용)
+PERSONA_STEPS = [
+    {"key": "sync_videos",    "label": "채널 영상 동기화",        "emoji": "🔄"},
+    {"key": "channel_data",   "label": "채널/시청자 데이터 분석", "emoji": "📊"},
+    {"key": "video_analysis", "label": "영상 자막 분석",          "emoji": "🎬"},
+    {"key": "synthesis",      "label": "종합 페르소나 생성",      "emoji": "🧠"},
+    {"key": "save",           "label": "페르소나 저장",           "emoji": "💾"},
+]
+
+# progress_callback(current_step, message, completed_steps)
+ProgressCallback = Callable[[str, str, List[str]], None]
+
+# 유저당 진행 중인 생성 작업 1개 (중복 클릭 방지)
+_GENERATION_LOCK_PREFIX = "persona_generation"
+GENERATION_LOCK_TTL_SECONDS = 1800  # 워커가 해제하지 못해도 30분 뒤 만료
+
+
+async def run_persona_generation(
+    db: AsyncSession,
+    channel_id: str,
+    force_full: bool = False,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> Optional[ChannelPersona]:
+    """
+    영상 동기화 + 페르소나 생성 (동기 API / Celery 작업 공용).
+
+    Args:
+        db: 데이터베이스 세션
+        channel_id: YouTube 채널 ID
+        force_full: 증분 재분석 대신 전체 재분석
+        progress_callback: 단계 시작 시 호출 (PERSONA_STEPS key 기준)
+
+    Returns:
+        ChannelPersona or None
+    """
+    _report(progress_callback, "sync_videos", "채널 영상을 동기화하고 있습니다.", [])
+    await sync_channel_videos(db, channel_id)
+
+    after_sync = None
+    if progress_callback:
+        def after_sync(step: str, message: str, completed_steps: List[str]) -> None:
+            progress_callback(step, message, ["sync_videos", *completed_steps])
+
+    return await generate_persona(
+        db, channel_id, force_full=force_full, progress_callback=after_sync
+    )
+
+
+def _report(
+    progress_callback: Optional[ProgressCallback],
+    step: str,
+    message: str,
+    completed_steps: List[str],
+) -> None:
+    if progress_callback:
+        progress_callback(step, message, list(completed_steps))
+
+
+async def claim_generation_task(user_id: str, task_id: str) -> str:
+    """
+    유저의 페르소나 생성 작업 점유 (SET NX).
+
+    Returns:
+        실행할 작업 ID. 이미 진행 중인 작업이 있으면 그 작업의 ID
+        (Redis 장애 시에는 중복 방지 없이 task_id)
+    """
+    key = f"{_GENERATION_LOCK_PREFIX}:{user_id}"
+    try:
+        redis = await get_redis()
+        if await redis.set(key, task_id, ex=GENERATION_LOCK_TTL_SECONDS, nx=True):
+            return task_id
+        active_task_id = await redis.get(key)
+    except Exception as e:
+        print(f"[Persona] ⚠️ 생성 작업 점유 실패 → 중복 방지 없이 진행: {e}")
+        return task_id
+    return active_task_id or task_id
+
+
+async def release_generation_task(user_id: str, task_id: str) -> None:
+    """작업 종료 시 점유 해제 (다른 작업이 점유 중이면 그대로 둠)."""
+    key = f"{_GENERATION_LOCK_PREFIX}:{user_id}"
+    try:
+        redis = await get_redis()
+        if await redis.get(key) == task_id:
+            await redis.delete(key)
+    except Exception as e:
+        print(f"[Persona] ⚠️ 생성 작업 점유 해제 실패 (TTL 만료 대기): {e}")
+
+
 async def generate_persona(
     db: AsyncSession,
     channel_id: str,
+    force_full: bool = False,
+    progress_callback: Optional[ProgressCallback] = None,
 ) -> Optional[ChannelPersona]:
     """
     채널 페르소나 생성 파이프라인.
 
     1. 채널 정보 조회
-    2. 영상 데이터 조회
-    3. 규칙 기반 해석 (5개)
-    4. 영상 자막 분석 (15개, 최소 8개 필수) - LLM 4번
-    5. 종합 페르소나 생성 (자막 분석 결과 포함) - LLM 1번
-    6. DB 저장
+    2. 영상 데이터 조회 ┐ 별도 세션에서 동시 조회
+    3. 시청자/구독자 조회 ┘
+    4. 규칙 기반 해석 (5개)
+    5. 영상 자막 분석 (15개, 최소 8개 필수) - LLM 4번 (2~4단계와 동시 진행)
+    6. 종합 페르소나 생성 (자막 분석 결과 포함) - LLM 1번
+    7. DB 저장 (단계별 소요 시간은 generation_stats에 함께 저장)
 
     총 LLM 호출: 5번 (기존 7번에서 2번 감소)
 
+    재생성 시에는 이전 페르소나의 source_snapshot을 기준으로 신규/변경 영상만
+    다시 분석합니다 (증분). force_full=True면 전체 영상을 다시 분석합니다.
+
     Args:
         db: 데이터베이스 세션
         channel_id: YouTube 채널 ID
+        force_full: 증분 재분석 대신 전체 재분석
+        progress_callback: 단계 시작 시 호출 (PERSONA_STEPS key 기준)
 
     Returns:
         ChannelPersona or None
@@ -52,6 +156,10 @@ async def generate_persona(
     print(f"\n{'='*60}")
     print(f"[Persona] 페르소나 생성 시작: {channel_id}")
     print(f"{'='*60}")
+    started = time.perf_counter()
+    step_timings = {}
+    completed_steps = []
+    _report(progress_callback, "channel_data", "채널 정보와 시청자 데이터를 분석하고 있습니다.", completed_steps)
 
     # 1. 채널 정보 조회
     print(f"[Persona] 1단계: 채널 정보 조회...")
@@ -76,64 +184,93 @@ async def generate_persona(
             access_token = oauth_account.access_token
             print(f"[Persona]   └─ OAuth 토큰 발견 → YouTube API로 자막 추출")
 
-    # 2. 영상 데이터 조회
-    print(f"[Persona] 2단계: 영상 데이터 조회...")
-    try:
-        videos = await _get_channel_videos_with_stats(db, channel_id)
-        print(f"[Persona] ✓ 2단계 완료: 영상 {len(videos)}개 조회")
-    except Exception as e:
-        print(f"[Persona] ❌ 2단계 실패: 영상 데이터 조회 오류 - {e}")
-        videos = []
-
-    # 3. 시청자 데이터 조회 (있는 경우)
-    print(f"[Persona] 3단계: 시청자/구독자 데이터 조회...")
-    audience_data = await _get_audience_data(db, channel_id)
-    geo_data = await _get_geo_data(db, channel_id)
-    subscriber_count = await _get_subscriber_count(db, channel_id)
-    print(f"[Persona] ✓ 3단계 완료: 구독자 {subscriber_count:,}명, 시청자 데이터 {len(audience_data)}개")
-
-    # 4. 규칙 기반 해석
-    print(f"[Persona] 4단계: 규칙 기반 해석 (5개)...")
-    rule_interpretations = _run_rule_interpretations(
-        subscriber_count=subscriber_count,
-        audience_data=audience_data,
-        geo_data=geo_data,
-        video_stats=videos,
+    # 1.6. 이전 분석 스냅샷 (증분 재분석 기준)
+    previous_snapshot = None
+    if not force_full:
+        snapshot_stmt = select(ChannelPersona.source_snapshot).where(ChannelPersona.channel_id == channel_id)
+        previous_snapshot = (await db.execute(snapshot_stmt)).scalar_one_or_none()
+    print(f"[Persona]   └─ 영상 분석 모드: {'증분' if previous_snapshot else '전체'}")
+    step_timings["channel"] = _elapsed(started)
+
+    # 5. 영상 자막 분석은 가장 오래 걸리므로 먼저 시작하고, 2~4단계를 그 사이에 처리
+    #    (자막 분석은 db 세션을, 2~3단계 조회는 별도 세션을 사용)
+    print(f"[Persona] 5단계: 영상 자막 분석 시작 (LLM 4번 호출, 2~4단계와 동시 진행)...")
+    video_task = asyncio.create_task(
+        _timed(
+            step_timings,
+            "video_analysis",
+            _run_video_analysis(db, channel_id, access_token, previous_snapshot),
+        )
     )
-    print(f"[Persona] ✓ 4단계 완료: 채널 티어, 시청자층, 조회수 일관성, 참여도, 적정 길이 분석")
 
-    # 5. 영상 자막 분석 (15개 영상, 5개씩 배치) - LLM 4번
-    print(f"[Persona] 5단계: 영상 자막 분석 (LLM 4번 호출)...")
-    video_analysis_summary = None
     try:
-        video_analysis_summary = await analyze_channel_videos(
-            db=db,
-            channel_id=channel_id,
-            min_videos_required=8,
-            access_token=access_token,
+        # 2~3. 영상/시청자/구독자 데이터 동시 조회
+        print(f"[Persona] 2~3단계: 영상 데이터 + 시청자/구독자 데이터 조회...")
+        videos, audience_data, geo_data, subscriber_count = await _timed(
+            step_timings, "channel_data", _load_channel_data(channel_id)
+        )
+        print(
+            f"[Persona] ✓ 2~3단계 완료: 영상 {len(videos)}개, "
+            f"구독자 {subscriber_count:,}명, 시청자 데이터 {len(audience_data)}개"
         )
-        if video_analysis_summary:
-            print(f"[Persona] ✓ 5단계 완료: 영상 유형={video_analysis_summary.video_types}")
-        else:
-            print(f"[Persona] ⚠ 5단계: 자막 분석 결과 없음 (자막 부족)")
-    except Exception as e:
-        print(f"[Persona] ❌ 5단계 실패: 자막 분석 오류 - {e}")
+
+        # 4. 규칙 기반 해석
+        print(f"[Persona] 4단계: 규칙 기반 해석 (5개)...")
+        rule_started = time.perf_counter()
+        rule_interpretations = _run_rule_interpretations(
+            subscriber_count=subscriber_count,
+            audience_data=audience_data,
+            geo_data=geo_data,
+            video_stats=videos,
+        )
+        step_timings["rule_interpretations"] = _elapsed(rule_started)
+        print(f"[Persona] ✓ 4단계 완료: 채널 티어, 시청자층, 조회수 일관성, 참여도, 적정 길이 분석")
+        completed_steps.append("channel_data")
+
+        _report(progress_callback, "video_analysis", "영상 자막과 댓글을 분석하고 있습니다.", completed_steps)
+        video_analysis_summary = await video_task
+    finally:
+        # 2~4단계 실패·취소 시 자막 분석이 db 세션을 계속 쓰지 않도록 취소하고 끝날 때까지 대기
+        if not video_task.done():
+            video_task.cancel()
+        await asyncio.gather(video_task, return_exceptions=True)
+    completed_steps.append("video_analysis")
 
     # 6. 종합 페르소나 생성 (자막 분석 결과 + 채널 설명 포함) - LLM 1번
     print(f"[Persona] 6단계: 종합 페르소나 생성 (LLM 1번 호출)...")
+    _report(progress_callback, "synthesis", "분석 결과를 종합해 페르소나를 만들고 있습니다.", completed_steps)
     try:
-        persona_data = await _synthesize_persona(
+        persona_data = await _timed(step_timings, "synthesis", _synthesize_persona(
             channel=channel,
             rule_interpretations=rule_interpretations,
             video_analysis_summary=video_analysis_summary,
-        )
+        ))
         print(f"[Persona] ✓ 6단계 완료: {persona_data.get('one_liner', '페르소나 생성됨')}")
     except Exception as e:
         print(f"[Persona] ❌ 6단계 실패: 종합 페르소나 생성 오류 - {e}")
         raise
 
+    step_timings["total"] = _elapsed(started)
+    persona_data["generation_stats"] = {
+        "step_timings": step_timings,
+        "video_analysis_batches": video_analysis_summary.batch_stats if video_analysis_summary else None,
+        "video_analysis_reuse": video_analysis_summary.reuse_stats if video_analysis_summary else None,
+        "generated_at": datetime.utcnow().isoformat(),
+    }
+    if video_analysis_summary:
+        # 자막 분석 실패 시에는 이전 스냅샷 유지 (영상 분석 필드도 갱신되지 않으므로)
+        persona_data["source_snapshot"] = video_analysis_summary.source_snapshot
+        reuse = video_analysis_summary.reuse_stats or {}
+        print(
+            f"[Persona]   └─ 영상 분석 {reuse.get('mode')}: 재사용 {reuse.get('reused_videos')}개, "
+            f"재분석 {reuse.get('analyzed_videos')}개, LLM 호출 절감 {reuse.get('llm_calls_saved')}회"
+        )
+    print(f"[Persona]   └─ 단계별 소요 시간(초): {step_timings}")
+
     # 7. DB 저장 (upsert)
     print(f"[Persona] 7단계: DB 저장...")
+    completed_steps.append("synthesis")
+    _report(progress_callback, "save", "페르소나를 저장하고 있습니다.", completed_steps)
     try:
         persona = await _save_persona(db, channel_id, persona_data)
         print(f"[Persona] ✓ 7단계 완료: DB 저장 성공")
@@ -148,6 +285,75 @@ async def generate_persona(
     return persona
 
 
+def _elapsed(started: float) -> float:
+    return round(time.perf_counter() - started, 2)
+
+
+async def _timed(step_timings: dict, step: str, coro):
+    """coro 실행 시간을 step_timings[step]에 기록 (초)."""
+    started = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        step_timings[step] = _elapsed(started)
+
+
+async def _run_video_analysis(
+    db: AsyncSession,
+    channel_id: str,
+    access_token: Optional[str],
+    previous_snapshot: Optional[dict] = None,
+) -> Optional[ChannelVideoSummary]:
+    """영상 자막 분석 (실패해도 페르소나 생성은 계속)."""
+    try:
+        video_analysis_summary = await analyze_channel_videos(
+            db=db,
+            channel_id=channel_id,
+            min_videos_required=8,
+            access_token=access_token,
+            previous_snapshot=previous_snapshot,
+        )
+        if video_analysis_summary:
+            print(f"[Persona] ✓ 5단계 완료: 영상 유형={video_analysis_summary.video_types}")
+        else:
+            print(f"[Persona] ⚠ 5단계: 자막 분석 결과 없음 (자막 부족)")
+        return video_analysis_summary
+    except Exception as e:
+        print(f"[Persona] ❌ 5단계 실패: 자막 분석 오류 - {e}")
+        return None
+
+
+async def _read_with_session(reader, channel_id: str):
+    """독립 조회를 별도 세션에서 실행 (AsyncSession 하나로는 쿼리를 동시에 보낼 수 없음)."""
+    async with AsyncSessionLocal() as session:
+        return await reader(session, channel_id)
+
+
+async def _load_channel_data(
+    channel_id: str,
+) -> Tuple[List[VideoStatsData], List[AudienceData], List[GeoData], int]:
+    """영상 통계 / 시청자 / 지역 / 구독자 수를 각각 별도 세션에서 동시 조회."""
+    videos, audience_data, geo_data, subscriber_count = await asyncio.gather(
+        _read_with_session(_get_channel_videos_with_stats, channel_id),
+        _read_with_session(_get_audience_data, channel_id),
+        _read_with_session(_get_geo_data, channel_id),
+        _read_with_session(_get_subscriber_count, channel_id),
+        return_exceptions=True,
+    )
+
+    if isinstance(videos, BaseException):
+        print(f"[Persona] ❌ 영상 데이터 조회 오류 - {videos}")
+        videos = []
+    if isinstance(audience_data, BaseException):
+        audience_data = []
+    if isinstance(geo_data, BaseException):
+        geo_data = []
+    if isinstance(subscriber_count, BaseException):
+        subscriber_count = 0
+
+    return videos, audience_data, geo_data, subscriber_count
+
+
 async def _get_channel_videos_with_stats(
     db: AsyncSession,
     channel_id: str,
@@ -233,55 +439,21 @@ async def _get_audience_data(
     db: AsyncSession,
     channel_id: str,
 ) -> List[AudienceData]:
-    """시청자 인구통계 데이터 조회."""
-    try:
-        from app.models.yt_audience_daily import YTAudienceDaily
-        stmt = (
-            select(YTAudienceDaily)
-            .where(YTAudienceDaily.channel_id == channel_id)
-            .order_by(YTAudienceDaily.date.desc())
-            .limit(7)  # 최근 7일
-        )
-        result = await db.execute(stmt)
-        records = list(result.scalars().all())
-
-        return [
-            AudienceData(
-                age_group=r.age_group,
-                gender=r.gender,
-                percentage=r.viewer_percentage or 0,
-            )
-            for r in records
-        ]
-    except Exception:
-        return []
+    """시청자 인구통계 데이터 조회 (최신 보고서 기준 롤업)."""
+    rows = await AnalyticsRollupService.get_audience_mix(db, channel_id)
+    return [
+        AudienceData(age_group=r.age_group, gender=r.gender, percentage=r.share)
+        for r in rows
+    ]
 
 
 async def _get_geo_data(
     db: AsyncSession,
     channel_id: str,
 ) -> List[GeoData]:
-    """지역별 시청자 데이터 조회."""
-    try:
-        from app.models.yt_geo_daily import YTGeoDaily
-        stmt = (
-            select(YTGeoDaily)
-            .where(YTGeoDaily.channel_id == channel_id)
-            .order_by(YTGeoDaily.date.desc())
-            .limit(10)
-        )
-        result = await db.execute(stmt)
-        records = list(result.scalars().all())
-
-        return [
-            GeoData(
-                country=r.country,
-                percentage=r.viewer_percentage or 0,
-            )
-            for r in records
-        ]
-    except Exception:
-        return []
+    """지역별 시청자 데이터 조회 (조회수 상위 10개국 롤업)."""
+    rows = await AnalyticsRollupService.get_top_countries(db, channel_id, limit=10)
+    return [GeoData(country=r.country, percentage=r.share) for r in rows]
 
 
 def _run_rule_interpretations(
@@ -358,6 +530,7 @@ async def _synthesize_persona(
 
     for attempt in range(MAX_RETRIES):
         try:
+            await gemini_gate.acquire(estimate_tokens(prompt))
             async with httpx.AsyncClient(timeout=60.0) as client:
                 resp = await client.post(
                     f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={api_key}",
@@ -372,10 +545,11 @@ async def _synthesize_persona(
                 )
 
                 if resp.status_code == 429:
-                    wait_time = (attempt + 1) * 5  # 5초, 10초, 15초
+                    # Retry-After가 없으면 5초, 10초, 15초 (대기는 다음 acquire에서)
+                    wait_time = parse_retry_after(resp.headers.get("retry-after")) or (attempt + 1) * 5
                     last_error = f"HTTP 429: Rate limit"
                     print(f"[Persona Synthesis] 429 에러, {wait_time}초 대기 후 재시도 ({attempt+1}/{MAX_RETRIES})")
-                    await asyncio.sleep(wait_time)
+                    gemini_gate.penalize(wait_time)
                     continue
 
                 if resp.status_code != 200:
@@ -0,0 +1,176 @@
+"""
+RateLimitGate — 분당 요청/토큰 한도 기반 호출 게이트
+
+고정 sleep 대신, 최근 window(기본 60초) 동안의 요청 수와 토큰 합계가
+한도를 넘을 때만 대기합니다. 429 응답을 받으면 penalize()로 Retry-After 동안
+같은 게이트를 쓰는 모든 호출을 멈춥니다.
+
+슬롯 예약은 await 없이 동기적으로 처리되므로 (SubtitleService._throttle과 동일)
+lock 없이 동시 호출에서도 순서대로 한도를 지킵니다. 프로세스 로컬 상태입니다.
+
+AdaptiveConcurrency — 429 응답에 맞춰 동시 실행 수를 조절하는 리미터 (AIMD)
+
+한도를 미리 알 수 없는 API용입니다. 성공이 이어지면 동시 실행 수를 1씩 늘리고,
+429를 받으면 절반으로 줄인 뒤 Retry-After 동안 새 호출을 멈춥니다.
+"""
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Deque, Optional, Tuple
+
+from app.core.config import settings
+
+
+class RateLimitGate:
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int,
+        tokens_per_minute: Optional[int] = None,
+        window_sec: float = 60.0,
+    ):
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window_sec = window_sec
+
+        self._events: Deque[Tuple[float, int]] = deque()  # (시작 시각, 토큰 수), 시각 오름차순
+        self._blocked_until = 0.0
+
+    def _reserve(self, tokens: int) -> float:
+        """한도 안에서 가장 빠른 시작 시각을 예약하고 반환."""
+        now = time.monotonic()
+        while self._events and self._events[0][0] <= now - self.window_sec:
+            self._events.popleft()
+
+        start = max(now, self._blocked_until)
+        if self._events:
+            start = max(start, self._events[-1][0])  # 예약 순서 유지
+
+        events = list(self._events)
+        if len(events) >= self.requests_per_minute:
+            start = max(start, events[-self.requests_per_minute][0] + self.window_sec)
+
+        if self.tokens_per_minute:
+            # 단일 요청이 한도보다 크면 window를 비운 뒤 통과
+            budget = max(self.tokens_per_minute - tokens, 0)
+            for idx, (t, _) in enumerate(events):
+                in_window = sum(n for et, n in events[idx:] if et > start - self.window_sec)
+                if in_window <= budget:
+                    break
+                start = max(start, t + self.window_sec)
+
+        self._events.append((start, tokens))
+        return start
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """
+        호출 1건 허가. 한도가 남아 있으면 바로 반환.
+
+        Returns:
+            대기한 시간(초)
+        """
+        started = time.monotonic()
+        delay = self._reserve(tokens) - started
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        # 대기 중에 429로 차단되었으면 차단이 풀릴 때까지 추가 대기
+        while (blocked := self._blocked_until - time.monotonic()) > 0:
+            await asyncio.sleep(blocked)
+
+        return time.monotonic() - started
+
+    def penalize(self, retry_after_sec: float) -> None:
+        """429 수신 — retry_after_sec 동안 이 게이트의 모든 호출 중단."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after_sec)
+
+
+class AdaptiveConcurrency:
+
+    def __init__(self, name: str, initial: int, maximum: int, minimum: int = 1):
+        self.name = name
+        self.minimum = minimum
+        self.maximum = max(maximum, minimum)
+        self.limit = min(max(initial, minimum), self.maximum)
+        self.peak = self.limit
+        self.throttled = 0
+
+        self._active = 0
+        self._successes = 0           # 마지막 조정 이후 성공 수
+        self._last_decrease = -1.0    # 마지막 감소 시각 (monotonic)
+        self._blocked_until = 0.0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> float:
+        """
+        실행 슬롯 1개 확보. Retry-After 차단 중이면 풀릴 때까지 대기.
+
+        Returns:
+            슬롯을 확보한 시각 (monotonic) — release()/throttle()에 그대로 넘긴다
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        while (blocked := self._blocked_until - time.monotonic()) > 0:
+            await asyncio.sleep(blocked)
+        return time.monotonic()
+
+    async def release(self, succeeded: bool = False) -> None:
+        """슬롯 반환. 성공이 현재 한도만큼 쌓이면 한도 +1."""
+        async with self._cond:
+            self._active -= 1
+            if succeeded:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self.peak = max(self.peak, self.limit)
+                    self._successes = 0
+            self._cond.notify_all()
+
+    def throttle(self, acquired_at: float, retry_after_sec: float) -> None:
+        """
+        429 수신 — 한도를 절반으로 줄이고 retry_after_sec 동안 새 호출 중단.
+
+        같은 혼잡으로 동시에 들어온 429(마지막 감소 전에 시작한 호출)는 한도를 다시 줄이지 않는다.
+        """
+        self.throttled += 1
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after_sec)
+        if acquired_at > self._last_decrease:
+            self.limit = max(self.limit // 2, self.minimum)
+            self._successes = 0
+            self._last_decrease = time.monotonic()
+
+
+# Gemini 호출 공용 게이트 (영상 분석 / 페르소나 해석 / 종합이 함께 사용)
+gemini_gate = RateLimitGate(
+    "gemini",
+    requests_per_minute=settings.gemini_rpm_limit,
+    tokens_per_minute=settings.gemini_tpm_limit,
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP-date) → 대기 초. 해석할 수 없으면 None."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def estimate_tokens(text: str) -> int:
+    """입력 토큰 수 대략 추정 (한글 위주 텍스트 기준 약 2자당 1토큰)."""
+    return len(text) // 2 + 1
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.content_topic import ChannelTopic, TrendTopic
 from app.models.channel_persona import ChannelPersona
 from app.models.channel_video import YTChannelVideo
+from app.services.transcript_search_service import TranscriptSearchService
 # [제거] Planner가 영상 구조에서 키워드를 역산하므로 미리 뽑을 필요 없음
 # from app.services.keyword_extraction_service import extract_keywords_batch
 
@@ -74,6 +75,28 @@ async def get_topic_by_id(
     return result.scalar_one_or_none()
 
 
+async def get_related_stored_videos(
+    db: AsyncSession,
+    topic_id: str,
+    topic_type: str,
+    user_id,
+    limit: int = 5,
+) -> Optional[List[dict]]:
+    """
+    주제 제목 + 검색 키워드로 저장된 자막/분석 요약을 검색해 관련 영상 반환.
+    경쟁 채널 최근 영상은 user_id가 등록한 채널 것만 검색.
+
+    Returns:
+        TranscriptSearchService.search 결과 목록. 주제가 없으면 None
+    """
+    topic = await get_topic_by_id(db, topic_id, topic_type)
+    if not topic:
+        return None
+
+    queries = [topic.title] + list(topic.search_keywords or [])
+    return await TranscriptSearchService.search_any(db, queries, user_id, limit=limit)
+
+
 async def check_recommendations_exist(
     db: AsyncSession,
     channel_id: str,
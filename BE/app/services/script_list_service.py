@@ -0,0 +1,188 @@
+"""
+ScriptListService — 사용자 스크립트 목록 keyset 페이지네이션 / 이력 요약 조회
+
+정렬 키: (topic_requests.created_at, topic_requests.id, script_drafts.id) 내림차순
+    ix_topic_requests_user_created (user_id, created_at DESC, id DESC) 인덱스를 커서 위치부터
+    이어 읽으므로 OFFSET과 달리 깊은 페이지도 page_size만큼만 스캔한다.
+    파이프라인 실행마다 topic_request가 새로 생기므로 보통 요청당 초안은 1개이고,
+    script_drafts.id는 같은 요청에 초안이 여러 개일 때의 동률 정리용이다.
+
+커서: 마지막 행의 정렬 키를 base64url(JSON)로 감싼 불투명 문자열.
+
+전체 개수: 선택 (include_total). 사용자별로 Redis에 COUNT_CACHE_TTL_SEC 동안 캐시하고
+새 초안이 저장되면 (worker._save_result_to_db) 무효화한다.
+
+이력 요약 (/scripts/history): verified_scripts의 큰 JSONB(스크립트 본문, source_map_json의
+참고자료·이미지)를 통째로 읽지 않고 목록에 필요한 키만 SQL에서 뽑는다.
+"""
+
+import base64
+import binascii
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import and_, case, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import get_redis
+from app.models.script_output import ScriptDraft, VerifiedScript
+from app.models.topic_request import TopicRequest
+
+logger = logging.getLogger(__name__)
+
+COUNT_CACHE_TTL_SEC = 300
+MAX_PAGE_SIZE = 100
+HOOK_PREVIEW_CHARS = 120  # 이력 목록 미리보기 글자 수
+
+Cursor = Tuple[datetime, uuid.UUID, uuid.UUID]
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없는 커서."""
+
+
+def encode_cursor(created_at: datetime, topic_request_id: uuid.UUID, draft_id: uuid.UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(topic_request_id), str(draft_id)])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, topic_request_id, draft_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (
+            datetime.fromisoformat(created_at),
+            uuid.UUID(topic_request_id),
+            uuid.UUID(draft_id),
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError(f"잘못된 커서: {cursor!r}") from e
+
+
+def build_page_query(user_id, page_size: int, cursor: Optional[Cursor] = None):
+    """
+    커서 다음 page_size + 1개 (다음 페이지 존재 여부 확인용 1개 포함) 조회 쿼리.
+    """
+    stmt = (
+        select(ScriptDraft, TopicRequest)
+        .join(TopicRequest, ScriptDraft.topic_request_id == TopicRequest.id)
+        .where(TopicRequest.user_id == user_id)
+    )
+    if cursor is not None:
+        created_at, topic_request_id, draft_id = cursor
+        # 선두 조건은 인덱스 범위 조건으로, draft id는 같은 요청 안의 동률 정리로만 사용
+        stmt = stmt.where(
+            tuple_(TopicRequest.created_at, TopicRequest.id) <= tuple_(created_at, topic_request_id),
+            or_(
+                tuple_(TopicRequest.created_at, TopicRequest.id) < tuple_(created_at, topic_request_id),
+                and_(TopicRequest.id == topic_request_id, ScriptDraft.id < draft_id),
+            ),
+        )
+    return stmt.order_by(
+        TopicRequest.created_at.desc(), TopicRequest.id.desc(), ScriptDraft.id.desc()
+    ).limit(page_size + 1)
+
+
+def _jsonb_array_length(expr):
+    """배열이 아니거나(null 포함) 키가 없으면 0."""
+    return case(
+        (func.jsonb_typeof(expr) == "array", func.jsonb_array_length(expr)),
+        else_=0,
+    )
+
+
+def build_history_query(user_id, limit: int):
+    """생성 이력 요약 쿼리 (최신순, 검증 결과가 없는 요청도 포함)."""
+    script = VerifiedScript.final_script_json
+    return (
+        select(
+            TopicRequest.id,
+            TopicRequest.topic_title,
+            TopicRequest.status,
+            TopicRequest.created_at,
+            VerifiedScript.verified_at,
+            # 실패한 실행은 JSON null이 저장되므로 IS NOT NULL이 아니라 타입으로 판단
+            (func.jsonb_typeof(script) == "object").label("has_script"),
+            func.left(script["hook"].astext, HOOK_PREVIEW_CHARS).label("hook_preview"),
+            _jsonb_array_length(script["chapters"]).label("chapter_count"),
+            _jsonb_array_length(VerifiedScript.source_map_json["references"]).label("reference_count"),
+        )
+        .outerjoin(VerifiedScript, TopicRequest.id == VerifiedScript.topic_request_id)
+        .where(TopicRequest.user_id == user_id)
+        .order_by(TopicRequest.created_at.desc())
+        .limit(limit)
+    )
+
+
+class ScriptListService:
+
+    @staticmethod
+    async def list_page(
+        db: AsyncSession,
+        user_id,
+        page_size: int,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Tuple[ScriptDraft, TopicRequest]], Optional[str]]:
+        """
+        스크립트 목록 한 페이지.
+
+        Returns:
+            ([(draft, topic_request), ...], next_cursor — 마지막 페이지면 None)
+
+        Raises:
+            InvalidCursorError: cursor를 해석할 수 없을 때
+        """
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        decoded = decode_cursor(cursor) if cursor else None
+
+        rows = (await db.execute(build_page_query(user_id, page_size, decoded))).all()
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            draft, topic_req = rows[-1]
+            next_cursor = encode_cursor(topic_req.created_at, topic_req.id, draft.id)
+        return rows, next_cursor
+
+    @staticmethod
+    async def count(db: AsyncSession, user_id) -> int:
+        """사용자 스크립트 수 (Redis 캐시, 실패 시 직접 집계)."""
+        key = _count_key(user_id)
+        redis: Any = None
+        try:
+            redis = await get_redis()
+            cached = await redis.get(key)
+            if cached is not None:
+                return int(cached)
+        except Exception as e:
+            logger.warning(f"[ScriptList] 개수 캐시 조회 실패: {e}")
+
+        total = (await db.execute(
+            select(func.count())
+            .select_from(ScriptDraft)
+            .join(TopicRequest, ScriptDraft.topic_request_id == TopicRequest.id)
+            .where(TopicRequest.user_id == user_id)
+        )).scalar() or 0
+
+        if redis is not None:
+            try:
+                await redis.set(key, total, ex=COUNT_CACHE_TTL_SEC)
+            except Exception as e:
+                logger.warning(f"[ScriptList] 개수 캐시 저장 실패: {e}")
+        return total
+
+    @staticmethod
+    async def invalidate_count(user_id) -> None:
+        """새 초안 저장 후 개수 캐시 삭제."""
+        try:
+            redis = await get_redis()
+            await redis.delete(_count_key(user_id))
+        except Exception as e:
+            logger.warning(f"[ScriptList] 개수 캐시 무효화 실패: {e}")
+
+
+def _count_key(user_id) -> str:
+    return f"script_list_count:{user_id}"
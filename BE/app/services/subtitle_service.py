@@ -20,6 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.caption import VideoCaption
 from app.models.competitor import CompetitorVideo
 from app.core.config import settings
+from app.services.circuit_breaker import CircuitBreaker, OPEN
 
 logger = logging.getLogger(__name__)
 
@@ -37,23 +38,17 @@ _IP_BLOCK_KEYWORDS = [
 ]
 
 # ── Circuit Breaker ──────────────────────────────────────────────────────────
-# 한 번 IP 차단이 감지되면 이 워커 프로세스에서 이후 모든 자막 요청을 차단한다.
-_ip_blocked: bool = False
-
-
-def _mark_ip_blocked() -> None:
-    """IP 차단 플래그를 세우고 로그를 남긴다."""
-    global _ip_blocked
-    if not _ip_blocked:
-        _ip_blocked = True
-        logger.error(
-            "[SUBTITLE] ⛔ YouTube IP 차단 확정 → 이후 모든 자막 요청이 차단됩니다."
-        )
+# IP 차단이 감지되면 Redis에 공유되는 브레이커가 open 되어 모든 프로세스가
+# cooldown 동안 자막 요청을 멈추고, 이후 탐색 요청 1건으로 복구 여부를 확인한다.
+_transcript_breaker = CircuitBreaker(
+    "youtube_transcript",
+    cooldown_sec=settings.youtube_ip_block_cooldown_sec,
+)
 
 
-def is_ip_blocked() -> bool:
-    """현재 IP 차단 상태 반환 (외부에서 확인용)."""
-    return _ip_blocked
+async def is_ip_blocked() -> bool:
+    """현재 IP 차단(open) 상태 반환 (외부에서 확인용)."""
+    return await _transcript_breaker.get_state() == OPEN
 # ────────────────────────────────────────────────────────────────────────────
 
 
@@ -73,9 +68,12 @@ class SubtitleService:
     - API: ydl_opts = {'writeautomaticsub': True}
     """
 
-    _last_request_time: float = 0
-    _MIN_INTERVAL = 2.0
+    _next_slot: float = 0
+    _MIN_INTERVAL = 2.0  # 요청 시작 간 최소 간격 (전역)
+    _MAX_CONCURRENT = 3  # 동시에 처리하는 영상 수
+    _PER_VIDEO_TIMEOUT = 60.0  # 영상 1개당 전체 fetch 제한 시간 (초)
     _proxy_rr_idx: int = 0
+    _strategy_stats: dict = {}
 
     # ── 프록시 관리 ──────────────────────────────────────
 
@@ -104,12 +102,69 @@ class SubtitleService:
 
     @staticmethod
     async def _throttle():
-        """요청 간 최소 간격 보장."""
-        elapsed = time.time() - SubtitleService._last_request_time
-        wait = SubtitleService._MIN_INTERVAL - elapsed
+        """
+        전역 요청 속도 제한 (_MIN_INTERVAL마다 1건 시작).
+
+        호출 시점에 다음 시작 슬롯을 예약하고 그 시각까지만 대기한다.
+        슬롯 예약은 await 없이 끝나므로 동시 호출에서도 간격이 보장되고,
+        요청 자체는 겹쳐서 진행될 수 있다 (시작 속도만 제한).
+        """
+        now = time.monotonic()
+        slot = max(now, SubtitleService._next_slot)
+        SubtitleService._next_slot = slot + SubtitleService._MIN_INTERVAL
+        wait = slot - now
         if wait > 0:
             await asyncio.sleep(wait)
-        SubtitleService._last_request_time = time.time()
+
+    @staticmethod
+    def _record_strategy(strategy: str, success: bool, elapsed: float) -> None:
+        """전략별(transcript-api / yt-dlp) 누적 시도·성공·소요시간 기록."""
+        stats = SubtitleService._strategy_stats.setdefault(
+            strategy, {"attempts": 0, "success": 0, "total_sec": 0.0}
+        )
+        stats["attempts"] += 1
+        stats["success"] += int(success)
+        stats["total_sec"] += elapsed
+
+    @staticmethod
+    def get_strategy_stats() -> dict:
+        """
+        프로세스 누적 전략별 통계.
+
+        Returns:
+            {"transcript-api": {"attempts", "success", "success_rate", "avg_sec"}, "yt-dlp": {...}}
+        """
+        report = {}
+        for strategy, stats in SubtitleService._strategy_stats.items():
+            attempts = stats["attempts"]
+            report[strategy] = {
+                "attempts": attempts,
+                "success": stats["success"],
+                "success_rate": round(stats["success"] / attempts, 3) if attempts else 0.0,
+                "avg_sec": round(stats["total_sec"] / attempts, 3) if attempts else 0.0,
+            }
+        return report
+
+    # ── 자막 텍스트 조립 ──────────────────────────────────────
+
+    @staticmethod
+    def build_caption_text(tracks: list[dict]) -> str:
+        """
+        tracks → 공백으로 이어붙인 자막 텍스트.
+
+        문자열 += 대신 조각 리스트를 모아 한 번에 join 한다.
+        프롬프트 길이 제한은 호출하는 쪽에서 토큰 예산(app.core.prompt_budget)으로 처리.
+        """
+        parts: list[str] = []
+        for track in tracks or []:
+            for cue in track.get("cues", []):
+                text = cue.get("text")
+                if not isinstance(text, str):
+                    continue
+                text = text.strip()
+                if text:
+                    parts.append(text)
+        return " ".join(parts)
 
     # ── 핵심: 자막 추출 (youtube-transcript-api 우선, yt-dlp 폴백) ──
 
@@ -170,7 +225,6 @@ class SubtitleService:
         except Exception as e:
             if _is_ip_block_error(e):
                 logger.error(f"[SUBTITLE] YouTube IP 차단 감지 [{video_id}]: {e}")
-                _mark_ip_blocked()
                 raise YouTubeIPBlockedError(str(e))
             logger.warning(f"[SUBTITLE] transcript-api 실패 [{video_id}]: {type(e).__name__}: {e}")
             return {"video_id": video_id, "status": "failed", "source": "transcript-api", "tracks": [], "no_captions": True, "error": str(e)}
@@ -186,6 +240,10 @@ class SubtitleService:
         
         1순위: youtube-transcript-api (프록시/쿠키 불필요)
         2순위: yt-dlp (프록시 사용, 폴백)
+
+        영상들은 최대 _MAX_CONCURRENT개씩 동시에 처리하며,
+        영상마다 _PER_VIDEO_TIMEOUT 안에 끝나지 않으면 실패로 처리한다.
+        요청 시작 속도는 _throttle이 전역으로 제한한다.
         
         Args:
             video_ids: YouTube 영상 ID 리스트
@@ -193,12 +251,11 @@ class SubtitleService:
             db: DB 세션 (자막 캐싱용)
         
         Returns:
-            [{"video_id": "...", "status": "success", "tracks": [...]}]
+            [{"video_id": "...", "status": "success", "tracks": [...], "timings": {...}}]
+            (입력 video_ids 순서 유지)
         """
-        results = []
-
-        # Circuit breaker: IP 차단 상태면 모든 요청 즉시 차단
-        if _ip_blocked:
+        # Circuit breaker: IP 차단(open) 상태면 모든 요청 즉시 차단
+        if await is_ip_blocked():
             logger.warning("[SUBTITLE] ⛔ IP 차단 상태 → 자막 요청 전체 스킵")
             return [
                 {
@@ -226,41 +283,152 @@ class SubtitleService:
                 for vid in video_ids
             ]
 
-        proxy_pool = SubtitleService._get_proxy_pool()
-        max_attempts = min(len(proxy_pool), 5) if proxy_pool else 3
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(SubtitleService._MAX_CONCURRENT)
 
-        for video_id in video_ids:
-            await SubtitleService._throttle()
-            
-            # ── 1순위: youtube-transcript-api ──
+        async def _bounded(video_id: str) -> dict:
+            async with semaphore:
+                return await SubtitleService._fetch_one_with_timeout(video_id, languages)
+
+        outcomes = await asyncio.gather(
+            *[_bounded(vid) for vid in video_ids],
+            return_exceptions=True,
+        )
+
+        results = []
+        ip_block_error: Optional[YouTubeIPBlockedError] = None
+        for video_id, outcome in zip(video_ids, outcomes):
+            if isinstance(outcome, YouTubeIPBlockedError):
+                ip_block_error = ip_block_error or outcome
+                continue
+            if isinstance(outcome, Exception):
+                logger.error(f"[SUBTITLE] ✗ 예외 [{video_id}] {type(outcome).__name__}: {outcome}")
+                outcome = {
+                    "video_id": video_id,
+                    "status": "failed",
+                    "source": None,
+                    "tracks": [],
+                    "no_captions": True,
+                    "error": str(outcome),
+                }
+            results.append(outcome)
+
+        # DB 저장은 세션 공유 문제로 fetch가 모두 끝난 뒤 순차 처리
+        if db is not None:
+            for result in results:
+                cue_count = sum(len(t.get("cues", [])) for t in result.get("tracks", []))
+                if result.get("status") == "success" and cue_count > 0:
+                    logger.info(f"[SUBTITLE] → DB 저장 시작 [{result['video_id']}] cues={cue_count}")
+                    await SubtitleService._save_caption(db, result["video_id"], result)
+
+        success = sum(1 for r in results if r.get("status") == "success")
+        logger.info(
+            f"[SUBTITLE] 요약: {success}/{len(video_ids)}개 성공, "
+            f"{time.monotonic() - started:.1f}s, 전략별={SubtitleService.get_strategy_stats()}"
+        )
+
+        if ip_block_error is not None:
+            raise ip_block_error  # IP 차단 → 상위로 전파 (성공분은 저장 완료)
+
+        return results
+
+    @staticmethod
+    async def _fetch_one_with_timeout(video_id: str, languages: list[str]) -> dict:
+        """
+        영상 1개 fetch에 _PER_VIDEO_TIMEOUT 적용.
+
+        타임아웃 시 대기만 중단되고 to_thread로 실행 중인 동기 호출은
+        백그라운드에서 끝까지 실행된다 (결과는 버려짐).
+        """
+        timings: dict = {}
+        try:
+            result = await asyncio.wait_for(
+                SubtitleService._fetch_one(video_id, languages, timings),
+                timeout=SubtitleService._PER_VIDEO_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            logger.error(
+                f"[SUBTITLE] ✗ 타임아웃 [{video_id}] "
+                f"{SubtitleService._PER_VIDEO_TIMEOUT:.0f}s 초과"
+            )
+            result = {
+                "video_id": video_id,
+                "status": "failed",
+                "source": "timeout",
+                "tracks": [],
+                "no_captions": True,
+                "error": f"Timeout after {SubtitleService._PER_VIDEO_TIMEOUT:.0f}s",
+            }
+        result["timings"] = {k: round(v, 3) for k, v in timings.items()}
+        return result
+
+    @staticmethod
+    async def _fetch_one(video_id: str, languages: list[str], timings: dict) -> dict:
+        """
+        영상 1개 자막 fetch. 서킷 브레이커 허가를 받은 경우에만 요청하고,
+        IP 차단 여부를 브레이커에 보고한다.
+        """
+        permit = await _transcript_breaker.acquire()
+        if permit is None:
+            logger.warning(f"[SUBTITLE] ⛔ IP 차단 상태 → 스킵 [{video_id}]")
+            return {
+                "video_id": video_id,
+                "status": "skipped",
+                "source": "ip-blocked",
+                "tracks": [],
+                "no_captions": True,
+                "error": "YouTube IP blocked",
+            }
+
+        try:
+            result = await SubtitleService._fetch_one_unguarded(video_id, languages, timings)
+        except YouTubeIPBlockedError as e:
+            await _transcript_breaker.record_failure(f"{video_id}: {e}")
+            raise
+        else:
+            await _transcript_breaker.record_success(permit)
+            return result
+        finally:
+            # 타임아웃 취소·다른 예외로 끝난 탐색 요청도 probe 점유를 풀어 half_open에 갇히지 않게 함
+            await _transcript_breaker.release(permit)
+
+    @staticmethod
+    async def _fetch_one_unguarded(video_id: str, languages: list[str], timings: dict) -> dict:
+        """영상 1개 자막 fetch (transcript-api → yt-dlp 폴백). timings에 전략별 소요시간 기록."""
+        await SubtitleService._throttle()
+
+        # ── 1순위: youtube-transcript-api ──
+        step_start = time.monotonic()
+        try:
             result = await asyncio.to_thread(
                 SubtitleService._fetch_with_transcript_api,
                 video_id,
                 languages,
             )
-            
-            cue_count = sum(len(t.get("cues", [])) for t in result.get("tracks", []))
-            if result.get("status") == "success" and cue_count > 0:
-                # 성공 → DB 저장 후 다음 영상
-                results.append(result)
-                if db is not None:
-                    logger.info(f"[SUBTITLE] → DB 저장 시작 [{video_id}] cues={cue_count}")
-                    await SubtitleService._save_caption(db, video_id, result)
-                continue
-            
-            # 자막이 실제로 없는 경우 (비활성화 등) → yt-dlp 시도 불필요
-            if result.get("no_captions") and not result.get("error"):
-                results.append(result)
-                continue
-            
-            # ── 2순위: yt-dlp 폴백 ──
-            logger.info(f"[SUBTITLE] transcript-api 실패, yt-dlp 폴백 시도 [{video_id}]")
-            proxy_pool = SubtitleService._get_proxy_pool()
-            max_attempts = min(len(proxy_pool), 5) if proxy_pool else 3
-            last_error = None
+        finally:
+            timings["transcript-api"] = time.monotonic() - step_start
+
+        cue_count = sum(len(t.get("cues", [])) for t in result.get("tracks", []))
+        transcript_ok = result.get("status") == "success" and cue_count > 0
+        SubtitleService._record_strategy("transcript-api", transcript_ok, timings["transcript-api"])
+        if transcript_ok:
+            return result
 
+        # 자막이 실제로 없는 경우 (비활성화 등) → yt-dlp 시도 불필요
+        if result.get("no_captions") and not result.get("error"):
+            return result
+
+        # ── 2순위: yt-dlp 폴백 ──
+        logger.info(f"[SUBTITLE] transcript-api 실패, yt-dlp 폴백 시도 [{video_id}]")
+        proxy_pool = SubtitleService._get_proxy_pool()
+        max_attempts = min(len(proxy_pool), 5) if proxy_pool else 3
+        last_error = None
+        step_start = time.monotonic()
+
+        try:
             for attempt in range(max_attempts):
                 proxy_url = SubtitleService._pick_proxy() if proxy_pool else None
+                await SubtitleService._throttle()
 
                 try:
                     result = await asyncio.to_thread(
@@ -297,29 +465,31 @@ class SubtitleService:
                         await asyncio.sleep(2.0)
                         continue
                     break
+        finally:
+            timings["yt-dlp"] = time.monotonic() - step_start
+
+        cue_count = sum(len(t.get("cues", [])) for t in (result or {}).get("tracks", []))
+        SubtitleService._record_strategy(
+            "yt-dlp",
+            bool(result) and result.get("status") == "success" and cue_count > 0,
+            timings["yt-dlp"],
+        )
 
-            # 최종 결과 처리
-            if result is None:
-                result = {
-                    "video_id": video_id,
-                    "status": "failed",
-                    "source": "yt-dlp",
-                    "tracks": [],
-                    "no_captions": True,
-                    "error": last_error or "Unknown error",
-                }
-                logger.error(f"[SUBTITLE] ✗ 최종 실패 [{video_id}] error={last_error}")
-            elif result.get("status") == "failed" and not result.get("error"):
-                result["error"] = last_error or "Unknown error"
-
-            results.append(result)
-            
-            cue_count = sum(len(t.get("cues", [])) for t in result.get("tracks", []))
-            if db is not None and result.get("status") == "success" and cue_count > 0:
-                logger.info(f"[SUBTITLE] → DB 저장 시작 [{video_id}] cues={cue_count}")
-                await SubtitleService._save_caption(db, video_id, result)
+        # 최종 결과 처리
+        if result is None:
+            result = {
+                "video_id": video_id,
+                "status": "failed",
+                "source": "yt-dlp",
+                "tracks": [],
+                "no_captions": True,
+                "error": last_error or "Unknown error",
+            }
+            logger.error(f"[SUBTITLE] ✗ 최종 실패 [{video_id}] error={last_error}")
+        elif result.get("status") == "failed" and not result.get("error"):
+            result["error"] = last_error or "Unknown error"
 
-        return results
+        return result
 
     @staticmethod
     def _fetch_subtitle_with_ytdlp(
@@ -463,7 +633,6 @@ class SubtitleService:
 
             # IP 차단 에러 → 재시도 무의미, 즉시 전파
             if _is_ip_block_error(e):
-                _mark_ip_blocked()
                 raise YouTubeIPBlockedError(error_msg)
 
             # 429나 sign in 에러는 프록시 전환으로 해결 가능
@@ -670,6 +839,8 @@ class SubtitleService:
         result: dict,
     ) -> None:
         """자막을 DB에 저장 (CompetitorVideo와 연결)."""
+        from app.services.caption_storage import apply_segments
+
         try:
             cue_total = sum(len(t.get("cues", [])) for t in result.get("tracks", []))
             if result.get("status") != "success" or cue_total == 0:
@@ -717,16 +888,14 @@ class SubtitleService:
                     f"[SUBTITLE] video_captions 업데이트 [{youtube_video_id}] "
                     f"caption_id={existing.id}, tracks={len(segments_data['tracks'])}, cues={cue_total}"
                 )
-                existing.segments_json = segments_data
+                apply_segments(existing, segments_data)
             else:
                 logger.info(
                     f"[SUBTITLE] video_captions 신규 생성 [{youtube_video_id}] "
                     f"competitor_video_id={comp_video.id}, tracks={len(segments_data['tracks'])}, cues={cue_total}"
                 )
-                caption = VideoCaption(
-                    competitor_video_id=comp_video.id,
-                    segments_json=segments_data,
-                )
+                caption = VideoCaption(competitor_video_id=comp_video.id)
+                apply_segments(caption, segments_data)
                 db.add(caption)
 
             await db.commit()
@@ -0,0 +1,170 @@
+"""
+TranscriptSearchService — 저장된 자막 / 영상 분석 요약 전문 검색
+
+검색 대상 (alembic m4n5o6p7q8r9 인덱스 사용):
+    caption          video_captions.plain_text           (competitor_videos)
+    recent_caption   recent_video_captions.plain_text    (competitor_recent_videos)
+    analysis         video_content_analyses.summary      (competitor_videos)
+    recent_analysis  competitor_recent_videos.analysis_summary
+
+매칭:
+    to_tsvector('simple', ...) @@ plainto_tsquery('simple', query)  단어 단위 일치
+    OR col ILIKE '%query%'                                          부분 문자열 (pg_trgm)
+    한국어는 조사가 붙어 단어 일치가 자주 실패하므로 부분 문자열 일치에 가산점을 준다.
+
+범위:
+    recent_caption / recent_analysis는 경쟁 채널을 등록한 사용자 것만 (competitor_channels.user_id).
+    다른 사용자의 채널 페르소나 기준 분석 요약이 섞이지 않도록 user_id 없이는 검색하지 않는다.
+
+plain_text가 비어 있는 legacy 자막 행(backfill 전)은 검색되지 않습니다.
+"""
+
+import logging
+import uuid
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+_SUBSTRING_BONUS = 0.5  # ILIKE 일치 가산점 (ts_rank_cd 값은 보통 0.1 내외)
+_SNIPPET_CONTEXT = 60  # 일치 위치 앞쪽으로 포함할 글자 수
+_SNIPPET_LENGTH = 200
+
+# source → (본문 컬럼, FROM 절, video_id, title, channel_title, view_count, 사용자 범위 조건)
+_SOURCES = {
+    "caption": (
+        "c.plain_text",
+        "video_captions c JOIN competitor_videos v ON v.id = c.competitor_video_id",
+        "v.youtube_video_id", "v.title", "v.channel_title", "NULL::bigint", None,
+    ),
+    "recent_caption": (
+        "c.plain_text",
+        "recent_video_captions c"
+        " JOIN competitor_recent_videos v ON v.id = c.recent_video_id"
+        " JOIN competitor_channels ch ON ch.id = v.competitor_channel_id",
+        "v.video_id", "v.title", "ch.title", "v.view_count::bigint", "ch.user_id = :user_id",
+    ),
+    "analysis": (
+        "a.summary",
+        "video_content_analyses a JOIN competitor_videos v ON v.id = a.competitor_video_id",
+        "v.youtube_video_id", "v.title", "v.channel_title", "NULL::bigint", None,
+    ),
+    "recent_analysis": (
+        "v.analysis_summary",
+        "competitor_recent_videos v"
+        " JOIN competitor_channels ch ON ch.id = v.competitor_channel_id",
+        "v.video_id", "v.title", "ch.title", "v.view_count::bigint", "ch.user_id = :user_id",
+    ),
+}
+
+
+def _source_select(source: str) -> str:
+    body, from_clause, video_id, title, channel_title, view_count, scope = _SOURCES[source]
+    # to_tsvector 표현식은 인덱스 표현식과 정확히 같아야 인덱스를 탄다
+    tsv = f"to_tsvector('simple', coalesce({body}, ''))"
+    return (
+        f"SELECT {video_id} AS video_id, {title} AS title,"
+        f" {channel_title} AS channel_title, {view_count} AS view_count,"
+        f" '{source}' AS source, {body} AS body,"
+        f" ts_rank_cd({tsv}, q.tsq)"
+        f" + CASE WHEN {body} ILIKE :pattern THEN {_SUBSTRING_BONUS} ELSE 0 END AS score"
+        f" FROM {from_clause}, q"
+        f" WHERE ({tsv} @@ q.tsq OR {body} ILIKE :pattern)"
+        + (f" AND {scope}" if scope else "")
+    )
+
+
+_MATCHES_SQL = "\nUNION ALL\n".join(_source_select(source) for source in _SOURCES)
+
+# 영상당 최고 점수 1건만 남긴 뒤 상위 limit개에 대해서만 스니펫 생성
+_SEARCH_SQL = text(f"""
+WITH q AS (SELECT plainto_tsquery('simple', :query) AS tsq),
+matches AS (
+{_MATCHES_SQL}
+),
+best AS (
+    SELECT DISTINCT ON (video_id) *
+    FROM matches
+    ORDER BY video_id, score DESC
+),
+top AS (
+    SELECT * FROM best ORDER BY score DESC, video_id LIMIT :limit
+)
+SELECT
+    video_id, title, channel_title, view_count, source, score,
+    CASE
+        WHEN strpos(lower(body), lower(:query)) > 0 THEN
+            substring(body FROM greatest(strpos(lower(body), lower(:query)) - {_SNIPPET_CONTEXT}, 1)
+                      FOR {_SNIPPET_LENGTH})
+        ELSE
+            ts_headline('simple', body, (SELECT tsq FROM q),
+                        'MaxFragments=1, MaxWords=30, MinWords=10, StartSel="", StopSel=""')
+    END AS snippet
+FROM top
+ORDER BY score DESC, video_id
+""")
+
+
+def _like_pattern(query: str) -> str:
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class TranscriptSearchService:
+
+    @staticmethod
+    async def search(
+        db: AsyncSession, query: str, user_id: Optional[uuid.UUID], limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        저장된 자막 / 분석 요약에서 query와 일치하는 영상 검색.
+
+        user_id가 등록한 경쟁 채널의 최근 영상만 포함 (None이면 최근 영상 소스는 제외).
+
+        Returns:
+            점수 내림차순, 영상당 1건:
+            [{"video_id", "title", "channel_title", "view_count",
+              "source", "score", "snippet"}, ...]
+        """
+        query = (query or "").strip()
+        if not query:
+            return []
+
+        result = await db.execute(
+            _SEARCH_SQL,
+            {"query": query, "pattern": _like_pattern(query), "user_id": user_id, "limit": limit},
+        )
+        rows = [
+            {
+                "video_id": row.video_id,
+                "title": row.title,
+                "channel_title": row.channel_title,
+                "view_count": row.view_count,
+                "source": row.source,
+                "score": float(row.score),
+                "snippet": (row.snippet or "").strip(),
+            }
+            for row in result
+        ]
+        logger.info(f"[TranscriptSearch] '{query}' → {len(rows)}건")
+        return rows
+
+    @staticmethod
+    async def search_any(
+        db: AsyncSession, queries: List[str], user_id: Optional[uuid.UUID], limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 검색어 결과를 합쳐 영상당 최고 점수 1건만 남김 (주제 제목 + 검색 키워드 등).
+
+        검색어끼리는 OR — 긴 주제 문장 하나를 넘기면 모든 단어가 일치해야 하므로 키워드를 나눠 넘긴다.
+        """
+        best: Dict[str, Dict[str, Any]] = {}
+        for query in dict.fromkeys(q.strip() for q in queries if q and q.strip()):
+            for row in await TranscriptSearchService.search(db, query, user_id, limit=limit):
+                current = best.get(row["video_id"])
+                if current is None or row["score"] > current["score"]:
+                    best[row["video_id"]] = row
+
+        return sorted(best.values(), key=lambda r: (-r["score"], r["video_id"]))[:limit]
@@ -7,20 +7,23 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import asyncio
 import json
 import re
+import time
 
 import httpx
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.prompt_budget import count_tokens, truncate_to_tokens
 from app.models.channel_video import YTChannelVideo, YTVideoStats
 from app.models.yt_my_video_analysis import YTMyVideoAnalysis
+from app.services.rate_limit_gate import estimate_tokens, gemini_gate, parse_retry_after
 from app.services.subtitle_service import SubtitleService
-from app.services.youtube_service import YouTubeService
+from app.services.youtube_service import CAPTION_TIMEOUT, YouTubeService
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +70,7 @@ class BatchAnalysisOutput:
     results: List["VideoAnalysisResult"]  # 개별 영상 분석 결과
     patterns: Optional[List[str]] = None  # 공통 패턴
     tone_candidates: Optional[List[str]] = None  # 말투 샘플 후보 문장
+    retries: int = 0  # 재시도 횟수 (429 / 파싱 실패 등)
 
 
 @dataclass
@@ -83,42 +87,48 @@ class ChannelVideoSummary:
     viewer_likes: List[str]         # 시청자가 좋아하는 포인트 (히트 영상 기반)
     viewer_dislikes: List[str]      # 시청자가 싫어하는 포인트 (저조 영상 기반)
     current_viewer_needs: List[str] # 현재 시청자 니즈 (최신 영상 기반)
+    batch_stats: Optional[List[dict]] = None  # 배치별 소요 시간/재시도 (analyze_videos_batch)
+    reuse_stats: Optional[dict] = None  # 증분 재분석 통계 (재사용/재분석 영상 수, LLM 호출 절감)
+    source_snapshot: Optional[dict] = None  # 분석 기준 영상/통계 스냅샷 (다음 증분 재분석용)
 
 
 # ============================================================================
 # 자막 샘플링 (긴 자막 → 앞+중간+뒤 추출)
 # ============================================================================
 
-MAX_TRANSCRIPT_LENGTH = 5000  # 이 길이 이하면 그대로 사용
+TRANSCRIPT_TOKEN_BUDGET = 3500  # 영상당 자막 토큰 예산 (이하면 그대로 사용)
+_SAMPLE_SEPARATOR = "\n\n[...중간 생략...]\n\n"
 
 def sample_transcript(transcript: str) -> str:
     """
     긴 자막을 앞+중간+뒤에서 샘플링하여 축약.
 
-    5000자 이하: 그대로 반환
-    5000자 초과: 구분자 포함 정확히 MAX_TRANSCRIPT_LENGTH 이내로 샘플링
+    TRANSCRIPT_TOKEN_BUDGET 이하: 그대로 반환
+    초과: 구분자 포함 TRANSCRIPT_TOKEN_BUDGET 이내로 샘플링 (각 구간은 문장 경계에서 자름)
 
     - 앞 (~30%): 인트로/훅/인사말 패턴
     - 중간 (~30%): 본론 전개 방식
     - 뒤 (~40%): 마무리/CTA 패턴
     """
-    if len(transcript) <= MAX_TRANSCRIPT_LENGTH:
+    if count_tokens(transcript) <= TRANSCRIPT_TOKEN_BUDGET:
         return transcript
 
-    separator = "\n\n[...중간 생략...]\n\n"
-    sep_total = len(separator) * 2
-    budget = MAX_TRANSCRIPT_LENGTH - sep_total
+    budget = TRANSCRIPT_TOKEN_BUDGET - count_tokens(_SAMPLE_SEPARATOR) * 2
 
-    front_len = int(budget * 0.30)
-    mid_len = int(budget * 0.30)
-    back_len = budget - front_len - mid_len
+    front_tokens = int(budget * 0.30)
+    mid_tokens = int(budget * 0.30)
+    back_tokens = budget - front_tokens - mid_tokens
 
-    front = transcript[:front_len]
-    mid_start = (len(transcript) - mid_len) // 2
-    middle = transcript[mid_start:mid_start + mid_len]
-    back = transcript[-back_len:]
+    front = truncate_to_tokens(transcript, front_tokens)
+    # 중간: 가운데 지점 앞뒤로 절반씩
+    center = len(transcript) // 2
+    middle = (
+        truncate_to_tokens(transcript[:center], mid_tokens // 2, keep="tail")
+        + truncate_to_tokens(transcript[center:], mid_tokens - mid_tokens // 2)
+    )
+    back = truncate_to_tokens(transcript, back_tokens, keep="tail")
 
-    return f"{front}{separator}{middle}{separator}{back}"
+    return f"{front}{_SAMPLE_SEPARATOR}{middle}{_SAMPLE_SEPARATOR}{back}"
 
 
 # ============================================================================
@@ -313,120 +323,178 @@ async def select_videos_for_analysis(
 
 
 # ============================================================================
-# 자막 추출
+# 자막 / 댓글 추출
 # ============================================================================
 
+MAX_CONCURRENT_FETCHES = 5  # 자막 API / 댓글 API 동시 요청 수 (두 작업이 공유)
+
+
+@dataclass
+class FetchResult:
+    """영상별 fetch 결과. value가 없으면 error에 사유 (예: "no_subtitle", "timeout")."""
+    value: Any = None
+    error: Optional[str] = None
+
+
+async def fetch_transcripts_and_comments(
+    videos: List[VideoForAnalysis],
+    access_token: Optional[str] = None,
+    max_comments_per_video: int = 10,
+) -> Tuple[Dict[str, FetchResult], Dict[str, FetchResult]]:
+    """
+    자막과 댓글을 동시에 가져옴.
+
+    두 작업은 하나의 httpx 클라이언트(커넥션 풀)와 세마포어를 공유하므로
+    전체 동시 요청 수는 MAX_CONCURRENT_FETCHES를 넘지 않습니다.
+
+    Returns:
+        (자막 결과, 댓글 결과) — 둘 다 {video.id: FetchResult}
+    """
+    if not videos:
+        return {}, {}
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=MAX_CONCURRENT_FETCHES),
+    ) as client:
+        transcripts, comments = await asyncio.gather(
+            get_transcripts_for_videos(
+                videos, access_token=access_token, client=client, semaphore=semaphore
+            ),
+            get_comments_for_videos(
+                videos, max_per_video=max_comments_per_video, client=client, semaphore=semaphore
+            ),
+        )
+    return transcripts, comments
+
+
+async def _gather_per_video(
+    videos: List[VideoForAnalysis],
+    fetch_one,
+    semaphore: asyncio.Semaphore,
+) -> Dict[str, FetchResult]:
+    """영상별 fetch_one(video)을 세마포어 안에서 동시 실행. 예외는 해당 영상의 error로 기록."""
+    async def run(video: VideoForAnalysis) -> FetchResult:
+        async with semaphore:
+            try:
+                return await fetch_one(video)
+            except httpx.TimeoutException:
+                return FetchResult(error="timeout")
+            except Exception as e:
+                return FetchResult(error=f"{type(e).__name__}: {e}")
+
+    results = await asyncio.gather(*[run(v) for v in videos])
+    return {video.id: result for video, result in zip(videos, results)}
+
+
+def _transcript_from_result(result: Optional[dict]) -> FetchResult:
+    """SubtitleService / Captions API 결과 → 첫 트랙 자막 텍스트."""
+    if not result:
+        return FetchResult(error="failed")
+    if result.get("status") != "success":
+        return FetchResult(error=result.get("error") or result.get("status") or "failed")
+
+    tracks = result.get("tracks", [])
+    if not tracks:
+        return FetchResult(error="no_subtitle")
+
+    cues = tracks[0].get("cues", [])
+    transcript_text = " ".join(cue.get("text", "") for cue in cues)
+    if not transcript_text.strip():
+        return FetchResult(error="empty_transcript")
+    return FetchResult(value=transcript_text)
+
+
 async def get_transcripts_for_videos(
     videos: List[VideoForAnalysis],
     access_token: Optional[str] = None,
-) -> List[Tuple[VideoForAnalysis, str]]:
+    client: Optional[httpx.AsyncClient] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict[str, FetchResult]:
     """
     영상 목록의 자막을 가져옴.
 
     Args:
         videos: 분석 대상 영상 목록
         access_token: OAuth 토큰 (있으면 YouTube API 사용, 없으면 yt-dlp)
+        client: 공유 httpx 클라이언트 (YouTube API 사용 시)
+        semaphore: 공유 세마포어 (없으면 MAX_CONCURRENT_FETCHES로 생성)
 
     Returns:
-        List[(video, transcript_text)]: 자막이 있는 영상과 자막 텍스트
+        {video.id: FetchResult(value=자막 텍스트)} — 자막이 없거나 실패하면 error에 사유
     """
     if not videos:
-        return []
-
-    videos_with_transcripts = []
+        return {}
 
     # access_token이 있으면 YouTube Captions API 사용 (본인 채널)
     if access_token:
         logger.info(f"[VideoAnalyzer] YouTube Captions API로 자막 추출 시작 ({len(videos)}개)")
 
-        for video in videos:
-            try:
-                result = await YouTubeService.fetch_video_captions(
-                    video_id=video.youtube_video_id,
-                    access_token=access_token,
-                    languages=["ko", "en"],
+        if client is None:
+            async with httpx.AsyncClient(timeout=CAPTION_TIMEOUT) as own_client:
+                return await get_transcripts_for_videos(
+                    videos, access_token=access_token, client=own_client, semaphore=semaphore
                 )
 
-                if result and result.get("status") == "success":
-                    tracks = result.get("tracks", [])
-                    if tracks:
-                        cues = tracks[0].get("cues", [])
-                        transcript_text = " ".join(cue.get("text", "") for cue in cues)
-
-                        if transcript_text.strip():
-                            videos_with_transcripts.append((video, transcript_text))
-                            logger.debug(
-                                f"[VideoAnalyzer] 자막 추출 성공 (API): {video.youtube_video_id}, "
-                                f"길이={len(transcript_text)}"
-                            )
-                else:
-                    logger.debug(f"[VideoAnalyzer] 자막 없음 (API): {video.youtube_video_id}")
-
-                # Rate limit 방지
-                await asyncio.sleep(0.5)
+        async def fetch_one(video: VideoForAnalysis) -> FetchResult:
+            result = await YouTubeService.fetch_video_captions(
+                video_id=video.youtube_video_id,
+                access_token=access_token,
+                languages=["ko", "en"],
+                client=client,
+            )
+            return _transcript_from_result(result)
 
-            except Exception as e:
-                logger.warning(f"[VideoAnalyzer] 자막 추출 실패 (API): {video.youtube_video_id}, {e}")
+        transcripts = await _gather_per_video(
+            videos, fetch_one, semaphore or asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        )
 
-    # access_token이 없으면 yt-dlp 사용 (경쟁자 채널 등)
+    # access_token이 없으면 yt-dlp 사용 (경쟁자 채널 등) — SubtitleService가 자체적으로 동시 처리
     else:
         logger.info(f"[VideoAnalyzer] yt-dlp로 자막 추출 시작 ({len(videos)}개)")
 
-        video_ids = [v.youtube_video_id for v in videos]
-
-        results = await SubtitleService.fetch_subtitles(
-            video_ids=video_ids,
-            languages=["ko", "en"],
-            db=None,
-        )
-
-        result_map = {r["video_id"]: r for r in results}
-
-        for video in videos:
-            result = result_map.get(video.youtube_video_id)
-            if not result or result.get("status") != "success":
-                logger.debug(f"[VideoAnalyzer] 자막 없음 (yt-dlp): {video.youtube_video_id}")
-                continue
-
-            tracks = result.get("tracks", [])
-            if not tracks:
-                continue
-
-            cues = tracks[0].get("cues", [])
-            transcript_text = " ".join(cue.get("text", "") for cue in cues)
-
-            if transcript_text.strip():
-                videos_with_transcripts.append((video, transcript_text))
-                logger.debug(
-                    f"[VideoAnalyzer] 자막 추출 성공 (yt-dlp): {video.youtube_video_id}, "
-                    f"길이={len(transcript_text)}"
-                )
+        try:
+            results = await SubtitleService.fetch_subtitles(
+                video_ids=[v.youtube_video_id for v in videos],
+                languages=["ko", "en"],
+                db=None,
+            )
+            result_map = {r["video_id"]: r for r in results}
+            transcripts = {
+                v.id: _transcript_from_result(result_map.get(v.youtube_video_id)) for v in videos
+            }
+        except Exception as e:
+            logger.warning(f"[VideoAnalyzer] 자막 추출 실패 (yt-dlp): {e}")
+            transcripts = {v.id: FetchResult(error=f"{type(e).__name__}: {e}") for v in videos}
 
+    success_count = sum(1 for r in transcripts.values() if r.value)
     logger.info(
         f"[VideoAnalyzer] 자막 추출 완료: "
-        f"{len(videos_with_transcripts)}/{len(videos)} 성공"
+        f"{success_count}/{len(videos)} 성공"
     )
 
-    return videos_with_transcripts
+    return transcripts
 
 
-# ============================================================================
-# 댓글 추출
-# ============================================================================
-
 async def get_comments_for_videos(
     videos: List[VideoForAnalysis],
     max_per_video: int = 10,
-) -> dict:
+    client: Optional[httpx.AsyncClient] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict[str, FetchResult]:
     """
     영상 목록의 댓글을 가져옴 (좋아요 순 상위 N개).
 
     Args:
         videos: 분석 대상 영상 목록
         max_per_video: 영상당 가져올 댓글 수
+        client: 공유 httpx 클라이언트
+        semaphore: 공유 세마포어 (없으면 MAX_CONCURRENT_FETCHES로 생성)
 
     Returns:
-        dict: {video.id: [{"text": 댓글내용, "likes": 좋아요수}, ...]}
+        {video.id: FetchResult(value=[{"text": 댓글내용, "likes": 좋아요수}, ...])}
+        댓글 비활성화 영상은 빈 리스트, API 실패는 error에 사유
     """
     if not videos:
         return {}
@@ -434,39 +502,47 @@ async def get_comments_for_videos(
     api_key = settings.youtube_api_key
     if not api_key:
         logger.warning("[VideoAnalyzer] YouTube API 키 없음, 댓글 수집 스킵")
-        return {}
-
-    comments_map = {}
+        return {v.id: FetchResult(value=[], error="no_api_key") for v in videos}
 
-    for video in videos:
-        try:
-            comments = await _fetch_video_comments(
-                video_id=video.youtube_video_id,
-                api_key=api_key,
-                max_results=max_per_video,
+    if client is None:
+        async with httpx.AsyncClient(timeout=15.0) as own_client:
+            return await get_comments_for_videos(
+                videos, max_per_video=max_per_video, client=own_client, semaphore=semaphore
             )
-            comments_map[video.id] = comments
-            logger.debug(
-                f"[VideoAnalyzer] 댓글 추출: {video.youtube_video_id}, "
-                f"{len(comments)}개"
-            )
-        except Exception as e:
-            logger.warning(f"[VideoAnalyzer] 댓글 추출 실패 ({video.youtube_video_id}): {e}")
-            comments_map[video.id] = []
 
-        # Rate limit 방지
-        await asyncio.sleep(0.5)
+    async def fetch_one(video: VideoForAnalysis) -> FetchResult:
+        comments = await _fetch_video_comments(
+            client=client,
+            video_id=video.youtube_video_id,
+            api_key=api_key,
+            max_results=max_per_video,
+        )
+        logger.debug(
+            f"[VideoAnalyzer] 댓글 추출: {video.youtube_video_id}, "
+            f"{len(comments)}개"
+        )
+        return FetchResult(value=comments)
 
-    success_count = sum(1 for c in comments_map.values() if c)
+    comments_results = await _gather_per_video(
+        videos, fetch_one, semaphore or asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    )
+
+    for video in videos:
+        error = comments_results[video.id].error
+        if error:
+            logger.warning(f"[VideoAnalyzer] 댓글 추출 실패 ({video.youtube_video_id}): {error}")
+
+    success_count = sum(1 for r in comments_results.values() if r.value)
     logger.info(
         f"[VideoAnalyzer] 댓글 추출 완료: "
         f"{success_count}/{len(videos)} 성공"
     )
 
-    return comments_map
+    return comments_results
 
 
 async def _fetch_video_comments(
+    client: httpx.AsyncClient,
     video_id: str,
     api_key: str,
     max_results: int = 10,
@@ -475,15 +551,18 @@ async def _fetch_video_comments(
     YouTube API로 단일 영상의 댓글 가져오기.
 
     Args:
+        client: httpx 클라이언트
         video_id: YouTube 영상 ID
         api_key: YouTube Data API 키
         max_results: 가져올 댓글 수
 
     Returns:
         List[dict]: [{"text": 댓글내용, "likes": 좋아요수}, ...]
-    """
-    BASE_URL = "https://www.googleapis.com/youtube/v3"
+        댓글 비활성화(403) / 영상 없음(404)은 빈 리스트
 
+    Raises:
+        RuntimeError: 그 밖의 API 에러 (타임아웃 등 httpx 예외는 그대로 전파)
+    """
     params = {
         "part": "snippet",
         "videoId": video_id,
@@ -492,47 +571,39 @@ async def _fetch_video_comments(
         "key": api_key,
     }
 
-    try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(f"{BASE_URL}/commentThreads", params=params)
-
-            if resp.status_code == 403:
-                # 댓글 비활성화된 영상
-                logger.debug(f"[VideoAnalyzer] 댓글 비활성화: {video_id}")
-                return []
+    resp = await client.get(
+        f"{YouTubeService.BASE_URL}/commentThreads", params=params, timeout=15.0
+    )
 
-            if resp.status_code == 404:
-                logger.debug(f"[VideoAnalyzer] 영상 없음: {video_id}")
-                return []
+    if resp.status_code == 403:
+        # 댓글 비활성화된 영상
+        logger.debug(f"[VideoAnalyzer] 댓글 비활성화: {video_id}")
+        return []
 
-            if resp.status_code != 200:
-                logger.warning(f"[VideoAnalyzer] 댓글 API 에러 {resp.status_code}: {video_id}")
-                return []
+    if resp.status_code == 404:
+        logger.debug(f"[VideoAnalyzer] 영상 없음: {video_id}")
+        return []
 
-            data = resp.json()
-            items = data.get("items", [])
+    if resp.status_code != 200:
+        raise RuntimeError(f"댓글 API 에러 {resp.status_code}")
 
-            comments = []
-            for item in items:
-                snippet = item.get("snippet", {})
-                top_comment = snippet.get("topLevelComment", {})
-                comment_snippet = top_comment.get("snippet", {})
+    data = resp.json()
+    items = data.get("items", [])
 
-                comments.append({
-                    "text": comment_snippet.get("textDisplay", ""),
-                    "likes": comment_snippet.get("likeCount", 0),
-                })
+    comments = []
+    for item in items:
+        snippet = item.get("snippet", {})
+        top_comment = snippet.get("topLevelComment", {})
+        comment_snippet = top_comment.get("snippet", {})
 
-            # 좋아요 순 정렬 후 상위 N개
-            comments.sort(key=lambda x: -x["likes"])
-            return comments[:max_results]
+        comments.append({
+            "text": comment_snippet.get("textDisplay", ""),
+            "likes": comment_snippet.get("likeCount", 0),
+        })
 
-    except httpx.TimeoutException:
-        logger.warning(f"[VideoAnalyzer] 댓글 API 타임아웃: {video_id}")
-        return []
-    except Exception as e:
-        logger.error(f"[VideoAnalyzer] 댓글 API 에러 ({video_id}): {e}")
-        return []
+    # 좋아요 순 정렬 후 상위 N개
+    comments.sort(key=lambda x: -x["likes"])
+    return comments[:max_results]
 
 
 # ============================================================================
@@ -542,91 +613,104 @@ async def _fetch_video_comments(
 async def analyze_videos_batch(
     videos_with_transcripts: List[Tuple[VideoForAnalysis, str]],
     comments_map: Optional[dict] = None,
-) -> Tuple[List[VideoAnalysisResult], List[str], List[str], List[str], List[str]]:
+) -> Tuple[List[VideoAnalysisResult], List[str], List[str], List[str], List[str], List[dict]]:
     """
     영상들을 배치로 LLM 분석.
 
-    hit/low/latest로 그룹화하여 처리하고,
+    hit/low/latest로 그룹화하여 세 배치를 동시에 처리하고,
     각 배치에서 공통 패턴 + 말투 후보 문장 추출.
+    Gemini 한도는 gemini_gate가 관리하므로 한도가 남아 있으면 대기 없이 호출합니다.
+    한 배치가 실패해도 나머지 배치 결과는 그대로 사용합니다.
 
     Args:
         videos_with_transcripts: (영상, 자막) 튜플 리스트
         comments_map: {video.id: [댓글 리스트]} 딕셔너리 (Optional)
 
     Returns:
-        Tuple[개별 분석 결과, hit 패턴, low 패턴, latest 패턴, tone 후보들]
+        Tuple[개별 분석 결과, hit 패턴, low 패턴, latest 패턴, tone 후보들, 배치별 통계]
+        배치별 통계: [{"batch_type", "videos", "results", "status", "elapsed_sec", "retries"}, ...]
     """
     if comments_map is None:
         comments_map = {}
     if not videos_with_transcripts:
-        return [], [], [], [], []
+        return [], [], [], [], [], []
 
     api_key = settings.gemini_api_key
     if not api_key:
         logger.error("[VideoAnalyzer] Gemini API 키 없음")
-        return [], [], [], [], []
+        return [], [], [], [], [], []
 
     # selection_reason별로 그룹화
-    hit_videos = [(v, t) for v, t in videos_with_transcripts if v.selection_reason == "hit"]
-    low_videos = [(v, t) for v, t in videos_with_transcripts if v.selection_reason == "low"]
-    latest_videos = [(v, t) for v, t in videos_with_transcripts if v.selection_reason == "latest"]
+    batches = {
+        batch_type: [(v, t) for v, t in videos_with_transcripts if v.selection_reason == batch_type]
+        for batch_type in ("hit", "low", "latest")
+    }
+    batches = {batch_type: batch for batch_type, batch in batches.items() if batch}
 
     logger.info(
-        f"[VideoAnalyzer] 그룹화 완료: hit={len(hit_videos)}, "
-        f"low={len(low_videos)}, latest={len(latest_videos)}"
+        "[VideoAnalyzer] 그룹화 완료: "
+        + ", ".join(f"{batch_type}={len(batch)}" for batch_type, batch in batches.items())
     )
 
-    all_results = []
-    hit_patterns = []
-    low_patterns = []
-    latest_patterns = []
-    all_tone_candidates = []
-
-    # 1. hit 배치 분석 (개별 분석 + 공통 패턴 + 말투 후보)
-    if hit_videos:
-        logger.info(f"[VideoAnalyzer] hit 배치 분석 시작 ({len(hit_videos)}개)")
-        try:
-            output = await _analyze_batch_with_llm(hit_videos, api_key, batch_type="hit", comments_map=comments_map)
-            all_results.extend(output.results)
-            hit_patterns = output.patterns or []
-            if output.tone_candidates:
-                all_tone_candidates.extend(output.tone_candidates)
-            logger.info(f"[VideoAnalyzer] hit 배치 완료: {len(output.results)}개 결과, 패턴 {len(hit_patterns)}개")
-        except Exception as e:
-            logger.error(f"[VideoAnalyzer] hit 배치 실패: {e}")
-
-        await asyncio.sleep(20.0)  # Gemini rate limit 방지 (TPM 고려)
+    async def run_batch(batch_type: str, batch: List[Tuple[VideoForAnalysis, str]]):
+        logger.info(f"[VideoAnalyzer] {batch_type} 배치 분석 시작 ({len(batch)}개)")
+        started = time.perf_counter()
+        output = await _analyze_batch_with_llm(
+            batch, api_key, batch_type=batch_type, comments_map=comments_map
+        )
+        return output, time.perf_counter() - started
 
-    # 2. low 배치 분석 (개별 분석 + 공통 패턴 + 말투 후보)
-    if low_videos:
-        logger.info(f"[VideoAnalyzer] low 배치 분석 시작 ({len(low_videos)}개)")
-        try:
-            output = await _analyze_batch_with_llm(low_videos, api_key, batch_type="low", comments_map=comments_map)
-            all_results.extend(output.results)
-            low_patterns = output.patterns or []
-            if output.tone_candidates:
-                all_tone_candidates.extend(output.tone_candidates)
-            logger.info(f"[VideoAnalyzer] low 배치 완료: {len(output.results)}개 결과, 패턴 {len(low_patterns)}개")
-        except Exception as e:
-            logger.error(f"[VideoAnalyzer] low 배치 실패: {e}")
+    outcomes = await asyncio.gather(
+        *[run_batch(batch_type, batch) for batch_type, batch in batches.items()],
+        return_exceptions=True,
+    )
 
-        await asyncio.sleep(20.0)  # Gemini rate limit 방지 (TPM 고려)
+    all_results = []
+    patterns = {"hit": [], "low": [], "latest": []}
+    all_tone_candidates = []
+    batch_stats = []
+
+    for (batch_type, batch), outcome in zip(batches.items(), outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"[VideoAnalyzer] {batch_type} 배치 실패: {outcome}")
+            batch_stats.append({
+                "batch_type": batch_type,
+                "videos": len(batch),
+                "results": 0,
+                "status": "failed",
+                "elapsed_sec": None,
+                "retries": None,
+            })
+            continue
 
-    # 3. latest 배치 분석 (개별 분석 + 공통 패턴 + 말투 후보)
-    if latest_videos:
-        logger.info(f"[VideoAnalyzer] latest 배치 분석 시작 ({len(latest_videos)}개)")
-        try:
-            output = await _analyze_batch_with_llm(latest_videos, api_key, batch_type="latest", comments_map=comments_map)
-            all_results.extend(output.results)
-            latest_patterns = output.patterns or []
-            if output.tone_candidates:
-                all_tone_candidates.extend(output.tone_candidates)
-            logger.info(f"[VideoAnalyzer] latest 배치 완료: {len(output.results)}개 결과, 패턴 {len(latest_patterns)}개")
-        except Exception as e:
-            logger.error(f"[VideoAnalyzer] latest 배치 실패: {e}")
+        output, elapsed = outcome
+        all_results.extend(output.results)
+        patterns[batch_type] = output.patterns or []
+        if output.tone_candidates:
+            all_tone_candidates.extend(output.tone_candidates)
+
+        batch_stats.append({
+            "batch_type": batch_type,
+            "videos": len(batch),
+            "results": len(output.results),
+            "status": "success" if output.results else "failed",
+            "elapsed_sec": round(elapsed, 2),
+            "retries": output.retries,
+        })
+        logger.info(
+            f"[VideoAnalyzer] {batch_type} 배치 완료: {len(output.results)}개 결과, "
+            f"패턴 {len(patterns[batch_type])}개, {elapsed:.1f}초, 재시도 {output.retries}회"
+        )
 
     logger.info(f"[VideoAnalyzer] 전체 분석 완료: {len(all_results)}개 결과, tone 후보 {len(all_tone_candidates)}개")
-    return all_results, hit_patterns, low_patterns, latest_patterns, all_tone_candidates
+    return (
+        all_results,
+        patterns["hit"],
+        patterns["low"],
+        patterns["latest"],
+        all_tone_candidates,
+        batch_stats,
+    )
 
 
 async def _analyze_batch_with_llm(
@@ -636,7 +720,12 @@ async def _analyze_batch_with_llm(
     max_retries: int = 3,
     comments_map: Optional[dict] = None,
 ) -> BatchAnalysisOutput:
-    """단일 배치를 LLM으로 분석. 429 에러 시 재시도."""
+    """
+    단일 배치를 LLM으로 분석. 429 에러 시 재시도.
+
+    호출마다 gemini_gate에서 허가를 받고, 429 응답의 Retry-After 동안은
+    게이트를 공유하는 다른 배치도 함께 대기합니다.
+    """
     if comments_map is None:
         comments_map = {}
 
@@ -731,8 +820,14 @@ async def _analyze_batch_with_llm(
 - performance_reason은 "{pattern_desc}" 영상인 이유를 댓글 반응 기반으로 분석해주세요
 """
 
+    prompt_tokens = estimate_tokens(prompt)
+    retries = 0
+
     for attempt in range(max_retries):
+        if attempt > 0:
+            retries += 1
         try:
+            await gemini_gate.acquire(prompt_tokens)
             async with httpx.AsyncClient(timeout=120.0) as client:
                 resp = await client.post(
                     f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={api_key}",
@@ -747,20 +842,21 @@ async def _analyze_batch_with_llm(
                 )
 
                 if resp.status_code == 429:
-                    wait_time = (attempt + 1) * 5  # 5초, 10초, 15초
+                    # Retry-After가 없으면 5초, 10초, 15초
+                    wait_time = parse_retry_after(resp.headers.get("retry-after")) or (attempt + 1) * 5
                     logger.warning(f"[VideoAnalyzer] 429 에러, {wait_time}초 대기 후 재시도 ({attempt+1}/{max_retries})")
-                    await asyncio.sleep(wait_time)
+                    gemini_gate.penalize(wait_time)
                     continue
 
                 if resp.status_code != 200:
                     logger.error(f"[VideoAnalyzer] LLM API 에러: {resp.status_code}")
-                    return BatchAnalysisOutput(results=[], patterns=None)
+                    return BatchAnalysisOutput(results=[], patterns=None, retries=retries)
 
                 data = resp.json()
                 candidates = data.get("candidates", [])
                 if not candidates:
                     logger.error("[VideoAnalyzer] LLM 응답에 candidates 없음")
-                    return BatchAnalysisOutput(results=[], patterns=None)
+                    return BatchAnalysisOutput(results=[], patterns=None, retries=retries)
 
                 text = candidates[0]["content"]["parts"][0]["text"]
 
@@ -800,6 +896,7 @@ async def _analyze_batch_with_llm(
                     results=results,
                     patterns=common_patterns,
                     tone_candidates=tone_candidates,
+                    retries=retries,
                 )
 
         except (json.JSONDecodeError, Exception) as e:
@@ -810,10 +907,10 @@ async def _analyze_batch_with_llm(
                 logger.warning(f"[VideoAnalyzer] {wait_time}초 대기 후 재시도")
                 await asyncio.sleep(wait_time)
             else:
-                return BatchAnalysisOutput(results=[], patterns=None, tone_candidates=None)
+                return BatchAnalysisOutput(results=[], patterns=None, tone_candidates=None, retries=retries)
 
     logger.error(f"[VideoAnalyzer] {max_retries}번 시도 후 실패")
-    return BatchAnalysisOutput(results=[], patterns=None, tone_candidates=None)
+    return BatchAnalysisOutput(results=[], patterns=None, tone_candidates=None, retries=retries)
 
 
 async def analyze_hit_vs_low_comparison(
@@ -1072,6 +1169,8 @@ async def save_analysis_results(
             existing.viewer_needs = result.viewer_needs
             existing.performance_reason = result.performance_reason
             existing.transcript_text = transcript
+            existing.selection_reason = video.selection_reason
+            existing.analyzed_at = datetime.utcnow()
         else:
             # 새로 생성
             analysis = YTMyVideoAnalysis(
@@ -1180,6 +1279,103 @@ def summarize_video_analyses(
     )
 
 
+# ============================================================================
+# 증분 재분석 (이전 페르소나의 source_snapshot 기준)
+# ============================================================================
+
+# 통계 변화가 이 기준 이상이면 재분석: (상대 변화율, 최소 절대 변화량)
+MATERIAL_CHANGE_THRESHOLDS = {
+    "view_count": (0.2, 100),
+    "comment_count": (0.2, 10),
+}
+MAX_MERGED_PATTERNS = 5
+MAX_MERGED_TONE_CANDIDATES = 20
+
+
+def is_materially_changed(video: VideoForAnalysis, previous: Optional[dict]) -> bool:
+    """이전 스냅샷 대비 재분석이 필요한지 (신규 영상 / 선정 그룹 변경 / 통계 큰 변화)."""
+    if not previous or previous.get("reason") != video.selection_reason:
+        return True
+    for field, (ratio, min_abs) in MATERIAL_CHANGE_THRESHOLDS.items():
+        before = previous.get(field) or 0
+        after = getattr(video, field)
+        if abs(after - before) >= max(before * ratio, min_abs):
+            return True
+    return False
+
+
+async def _load_reusable_analyses(
+    db: AsyncSession,
+    channel_id: str,
+    videos: List[VideoForAnalysis],
+) -> dict:
+    """저장된 영상별 분석 결과 조회 → {video.id: VideoAnalysisResult}."""
+    import uuid as uuid_module
+
+    video_uuids = []
+    for video in videos:
+        try:
+            video_uuids.append(uuid_module.UUID(video.id))
+        except ValueError:
+            continue
+    if not video_uuids:
+        return {}
+
+    stmt = select(YTMyVideoAnalysis).where(
+        YTMyVideoAnalysis.channel_id == channel_id,
+        YTMyVideoAnalysis.video_id.in_(video_uuids),
+    )
+    records = (await db.execute(stmt)).scalars().all()
+
+    return {
+        str(r.video_id): VideoAnalysisResult(
+            video_id=str(r.video_id),
+            video_type=r.video_type or "",
+            content_structure=r.content_structure or "",
+            tone_manner=r.tone_manner or "",
+            key_topics=r.key_topics or [],
+            summary=r.summary or "",
+            strengths=r.strengths or [],
+            weaknesses=r.weaknesses or [],
+            performance_insight=r.performance_insight or "",
+            viewer_reactions=r.viewer_reactions or [],
+            viewer_needs=r.viewer_needs or [],
+            performance_reason=r.performance_reason or "",
+        )
+        for r in records
+    }
+
+
+def _merge_unique(new: List[str], previous: List[str], limit: int) -> List[str]:
+    """새 항목 우선, 중복 제거 후 limit개."""
+    return list(dict.fromkeys([*(new or []), *(previous or [])]))[:limit]
+
+
+def _build_source_snapshot(
+    videos: List[VideoForAnalysis],
+    analyzed_ids: set,
+    patterns: dict,
+    tone_candidates: List[str],
+) -> dict:
+    """다음 증분 재분석의 기준이 되는 스냅샷 (분석 결과가 있는 영상만 포함)."""
+    return {
+        "videos": {
+            v.id: {
+                "youtube_video_id": v.youtube_video_id,
+                "reason": v.selection_reason,
+                "view_count": v.view_count,
+                "like_count": v.like_count,
+                "comment_count": v.comment_count,
+            }
+            for v in videos
+            if v.id in analyzed_ids
+        },
+        "patterns": patterns,
+        "tone_candidates": tone_candidates,
+        "built_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
 # ============================================================================
 # 메인 오케스트레이터
 # ============================================================================
@@ -1189,21 +1385,28 @@ async def analyze_channel_videos(
     channel_id: str,
     min_videos_required: int = 8,
     access_token: Optional[str] = None,
+    previous_snapshot: Optional[dict] = None,
 ) -> Optional[ChannelVideoSummary]:
     """
     채널 영상 분석 파이프라인.
 
     1. 영상 15개 선정
-    2. 자막 추출 (access_token 있으면 YouTube API, 없으면 yt-dlp)
-    3. LLM 분석 (5개씩 배치)
+    2. 자막 + 댓글 동시 추출 (자막: access_token 있으면 YouTube API, 없으면 yt-dlp)
+    3. LLM 분석 (hit/low/latest 배치 동시 실행)
     4. DB 저장
     5. 채널 요약 생성
 
+    previous_snapshot(이전 페르소나의 source_snapshot)이 있으면 증분 모드:
+    신규 / 선정 그룹이 바뀐 / 통계가 크게 변한 영상만 2~4단계를 거치고,
+    나머지는 저장된 영상별 분석과 그룹 패턴을 재사용합니다.
+    변경 영상이 없는 그룹은 Gemini 배치 호출을 건너뜁니다.
+
     Args:
         db: DB 세션
         channel_id: 채널 ID
         min_videos_required: 최소 필요 영상 수 (자막 있는 것 기준)
         access_token: OAuth 토큰 (본인 채널이면 전달)
+        previous_snapshot: 이전 분석 스냅샷 (None이면 전체 분석)
 
     Returns:
         ChannelVideoSummary or None
@@ -1216,35 +1419,80 @@ async def analyze_channel_videos(
         logger.warning(f"[VideoAnalyzer] 분석할 영상 없음: {channel_id}")
         return None
 
-    # 2. 자막 추출 (access_token 있으면 YouTube API 사용)
-    videos_with_transcripts = await get_transcripts_for_videos(videos, access_token=access_token)
+    # 1.5. 증분 모드: 재사용 가능한 영상별 분석 분리
+    reused = {}
+    previous_videos = (previous_snapshot or {}).get("videos", {})
+    if previous_snapshot:
+        unchanged = [v for v in videos if not is_materially_changed(v, previous_videos.get(v.id))]
+        reused = await _load_reusable_analyses(db, channel_id, unchanged)
+    to_analyze = [v for v in videos if v.id not in reused]
+
+    # 2. 자막 + 댓글 동시 추출 (재분석 대상만, access_token 있으면 YouTube API 사용)
+    transcript_results, comment_results = await fetch_transcripts_and_comments(
+        to_analyze, access_token=access_token, max_comments_per_video=10
+    )
+    videos_with_transcripts = [
+        (v, transcript_results[v.id].value) for v in to_analyze if transcript_results[v.id].value
+    ]
 
-    if len(videos_with_transcripts) < min_videos_required:
+    if len(videos_with_transcripts) + len(reused) < min_videos_required:
         logger.warning(
             f"[VideoAnalyzer] 자막 있는 영상 부족: "
-            f"{len(videos_with_transcripts)} < {min_videos_required}"
+            f"{len(videos_with_transcripts) + len(reused)} < {min_videos_required}"
         )
         return None
 
     # transcript 맵 만들기
     transcripts = {v.id: t for v, t in videos_with_transcripts}
 
-    # 2.5. 댓글 추출
-    videos_for_comments = [v for v, _ in videos_with_transcripts]
-    comments_map = await get_comments_for_videos(videos_for_comments, max_per_video=10)
+    # 댓글 맵 (자막 있는 영상만 LLM 분석에 사용)
+    comments_map = {
+        v.id: comment_results[v.id].value or [] for v, _ in videos_with_transcripts
+    }
 
     # 3. LLM 분석 (hit/low/latest 그룹별로 분석 + 패턴 + tone 후보 추출)
-    results, hit_patterns, low_patterns, latest_patterns, tone_candidates = await analyze_videos_batch(
+    new_results, hit_patterns, low_patterns, latest_patterns, new_tone_candidates, batch_stats = await analyze_videos_batch(
         videos_with_transcripts,
         comments_map=comments_map,
     )
 
+    # 3.1. 재사용 결과와 병합 (재분석한 그룹은 새 패턴 우선, 건너뛴 그룹은 이전 패턴 유지)
+    previous_patterns = (previous_snapshot or {}).get("patterns", {})
+    analyzed_groups = {v.selection_reason for v, _ in videos_with_transcripts}
+    patterns = {}
+    for group, new_patterns in (("hit", hit_patterns), ("low", low_patterns), ("latest", latest_patterns)):
+        old_patterns = previous_patterns.get(group, []) if reused else []
+        patterns[group] = (
+            _merge_unique(new_patterns, old_patterns, MAX_MERGED_PATTERNS)
+            if group in analyzed_groups else old_patterns
+        )
+    hit_patterns, low_patterns, latest_patterns = patterns["hit"], patterns["low"], patterns["latest"]
+    tone_candidates = _merge_unique(
+        new_tone_candidates,
+        (previous_snapshot or {}).get("tone_candidates", []) if reused else [],
+        MAX_MERGED_TONE_CANDIDATES,
+    )
+    results = list(reused.values()) + new_results
+
+    selected_groups = {v.selection_reason for v in videos}
+    reuse_stats = {
+        "mode": "incremental" if previous_snapshot else "full",
+        "reused_videos": len(reused),
+        "analyzed_videos": len(videos_with_transcripts),
+        "llm_calls_saved": len(selected_groups - analyzed_groups) if previous_snapshot else 0,
+    }
+    logger.info(
+        f"[VideoAnalyzer] 분석 모드={reuse_stats['mode']}: "
+        f"재사용 {reuse_stats['reused_videos']}개, 재분석 {reuse_stats['analyzed_videos']}개, "
+        f"LLM 호출 절감 {reuse_stats['llm_calls_saved']}회"
+    )
+
     if not results:
         logger.warning(f"[VideoAnalyzer] LLM 분석 결과 없음: {channel_id}")
         return None
 
     # 3.5. 개별 분석 결과에서 시청자 데이터 추출 (hit/low/latest별)
-    videos_map = {v.id: v for v, _ in videos_with_transcripts}
+    videos_map = {v.id: v for v in videos}
     hit_viewer_data = []
     low_viewer_data = []
     latest_viewer_data = []
@@ -1294,7 +1542,7 @@ async def analyze_channel_videos(
         db=db,
         channel_id=channel_id,
         videos=videos,
-        results=results,
+        results=new_results,
         transcripts=transcripts,
     )
 
@@ -1310,6 +1558,14 @@ async def analyze_channel_videos(
         viewer_dislikes=viewer_dislikes,
         current_viewer_needs=current_viewer_needs,
     )
+    summary.batch_stats = batch_stats
+    summary.reuse_stats = reuse_stats
+    summary.source_snapshot = _build_source_snapshot(
+        videos,
+        analyzed_ids={r.video_id for r in results},
+        patterns=patterns,
+        tone_candidates=tone_candidates,
+    )
 
     logger.info(
         f"[VideoAnalyzer] 채널 영상 분석 완료: {channel_id}, "
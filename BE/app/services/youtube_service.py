@@ -1,12 +1,15 @@
+import asyncio
 import logging
 import math
 import re
+import uuid
 from datetime import datetime, date, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 import httpx
 from fastapi import HTTPException
 from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.youtube_channel import (
@@ -16,9 +19,87 @@ from app.models.youtube_channel import (
     YTAudienceDaily,
     YTGeoDaily,
 )
+from app.services.analytics_rollup_service import AnalyticsRollupService
 
 logger = logging.getLogger(__name__)
 
+# 앱 수명 동안 재사용하는 커넥션 풀 (keep-alive로 TLS 핸드셰이크 재사용)
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    YouTube API 공용 httpx 클라이언트 (lazy init).
+
+    커넥션은 이벤트 루프에 묶이므로 루프가 바뀌면 (Celery 워커는 task마다 새 루프)
+    새 클라이언트를 만든다. task는 끝날 때 close_http_client()로 닫아야 하며,
+    닫히지 않은 채 남은 이전 루프의 클라이언트는 _discard_stale_client에서 정리한다.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        if _http_client is not None and not _http_client.is_closed:
+            _discard_stale_client(_http_client, _http_client_loop)
+        _http_client = httpx.AsyncClient(
+            timeout=15.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _http_client_loop = loop
+        logger.info("[YouTube] HTTP 클라이언트 초기화")
+    return _http_client
+
+
+def _discard_stale_client(
+    client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """
+    다른 이벤트 루프에 묶인 클라이언트 정리.
+
+    그 루프가 아직 돌고 있으면 (다른 스레드) 그 루프에서 닫고,
+    이미 멈춘 루프라면 현재 루프에서 닫을 수 없으므로 경고만 남긴다.
+    """
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        logger.info("[YouTube] 이전 이벤트 루프의 HTTP 클라이언트 종료 예약")
+    else:
+        logger.warning(
+            "[YouTube] 닫히지 않은 이전 이벤트 루프의 HTTP 클라이언트를 교체 "
+            "(task 종료 시 close_http_client 호출 누락)"
+        )
+
+
+async def close_http_client() -> None:
+    """애플리케이션 종료 시 커넥션 풀 정리."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
+        logger.info("[YouTube] HTTP 클라이언트 종료")
+
+
+# Captions API 자막 다운로드 타임아웃 (트랙 목록 조회는 15초)
+CAPTION_TIMEOUT = 30.0
+
+# 한 INSERT 문의 최대 행 수 (Postgres 바인드 파라미터 65535개 한도, 보고서 행당 9개)
+# 실제 Analytics 보고서(연령×성별 ~21행, 국가 ~250행)는 항상 한 문으로 저장된다.
+_MAX_REPORT_ROWS_PER_STATEMENT = 5000
+
+
+def _to_float(val) -> Optional[float]:
+    try:
+        return float(val) if val is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(val) -> Optional[int]:
+    try:
+        return int(val) if val is not None else None
+    except (TypeError, ValueError):
+        return None
+
 
 class YouTubeService:
     """YouTube Data/Analytics API 연동 서비스."""
@@ -51,6 +132,7 @@ class YouTubeService:
 
         # Analytics 보고서는 scope가 없거나 권한이 없을 수 있으므로 실패를 삼킨다.
         await YouTubeService._safe_record_analytics(db, channel.channel_id, access_token, report_date)
+        await AnalyticsRollupService.refresh_channel(db, channel.channel_id, as_of=report_date)
 
         await db.commit()
         await db.refresh(channel)
@@ -103,10 +185,10 @@ class YouTubeService:
             "mine": "true",
         }
         headers = {"Authorization": f"Bearer {access_token}"}
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(f"{YouTubeService.BASE_URL}/channels", params=params, headers=headers)
-            resp.raise_for_status()
-            return resp.json()
+        client = get_http_client()
+        resp = await client.get(f"{YouTubeService.BASE_URL}/channels", params=params, headers=headers)
+        resp.raise_for_status()
+        return resp.json()
 
     @staticmethod
     async def _upsert_channel(db: AsyncSession, user_id, parsed: Dict[str, Any]) -> YouTubeChannel:
@@ -145,32 +227,27 @@ class YouTubeService:
         report_date: date,
     ) -> None:
         stats = parsed.get("stats") or {}
-        result = await db.execute(
-            select(YTChannelStatsDaily).where(
-                YTChannelStatsDaily.channel_id == channel_id,
-                YTChannelStatsDaily.date == report_date,
-            )
+        stmt = pg_insert(YTChannelStatsDaily).values(
+            id=uuid.uuid4(),
+            channel_id=channel_id,
+            date=report_date,
+            subscriber_count=stats.get("subscriber_count"),
+            view_count=stats.get("view_count"),
+            video_count=stats.get("video_count"),
+            comment_count=stats.get("comment_count"),
+            raw_stats_json=stats.get("raw_stats_json"),
+            created_at=datetime.utcnow(),
         )
-        row = result.scalar_one_or_none()
-        if row:
-            row.subscriber_count = stats.get("subscriber_count")
-            row.view_count = stats.get("view_count")
-            row.video_count = stats.get("video_count")
-            row.comment_count = stats.get("comment_count")
-            row.raw_stats_json = stats.get("raw_stats_json")
-        else:
-            db.add(
-                YTChannelStatsDaily(
-                    channel_id=channel_id,
-                    date=report_date,
-                    subscriber_count=stats.get("subscriber_count"),
-                    view_count=stats.get("view_count"),
-                    video_count=stats.get("video_count"),
-                    comment_count=stats.get("comment_count"),
-                    raw_stats_json=stats.get("raw_stats_json"),
-                )
-            )
-        await db.flush()
+        await db.execute(stmt.on_conflict_do_update(
+            constraint="uq_stats_channel_date",
+            set_={
+                "subscriber_count": stmt.excluded.subscriber_count,
+                "view_count": stmt.excluded.view_count,
+                "video_count": stmt.excluded.video_count,
+                "comment_count": stmt.excluded.comment_count,
+                "raw_stats_json": stmt.excluded.raw_stats_json,
+            },
+        ))
 
     @staticmethod
     async def _sync_topics(db: AsyncSession, channel_id: str, parsed: Dict[str, Any]) -> None:
@@ -226,26 +303,26 @@ class YouTubeService:
             "endDate": report_date.isoformat(),
         }
         headers = {"Authorization": f"Bearer {access_token}"}
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(YouTubeService.ANALYTICS_URL, params=params, headers=headers)
-            # scope가 없거나 권한/데이터 부족 시 400/401/403이 반환될 수 있다.
-            if resp.status_code in (400, 401, 403):
-                logger.info(
-                    "YouTube Analytics skipped (status=%s, dims=%s, metrics=%s)",
-                    resp.status_code,
-                    dimensions,
-                    metrics,
-                )
-                return None
-            resp.raise_for_status()
-            data = resp.json()
+        client = get_http_client()
+        resp = await client.get(YouTubeService.ANALYTICS_URL, params=params, headers=headers)
+        # scope가 없거나 권한/데이터 부족 시 400/401/403이 반환될 수 있다.
+        if resp.status_code in (400, 401, 403):
             logger.info(
-                "YouTube Analytics fetched (dims=%s, metrics=%s, rows=%s)",
+                "YouTube Analytics skipped (status=%s, dims=%s, metrics=%s)",
+                resp.status_code,
                 dimensions,
                 metrics,
-                len(data.get("rows", [])) if isinstance(data, dict) else "n/a",
             )
-            return data
+            return None
+        resp.raise_for_status()
+        data = resp.json()
+        logger.info(
+            "YouTube Analytics fetched (dims=%s, metrics=%s, rows=%s)",
+            dimensions,
+            metrics,
+            len(data.get("rows", [])) if isinstance(data, dict) else "n/a",
+        )
+        return data
 
     @staticmethod
     async def _record_audience(
@@ -265,60 +342,18 @@ class YouTubeService:
             return
 
         headers = [h.get("name") for h in report.get("columnHeaders", [])]
+        rows = {}
         for row in report["rows"]:
             row_dict = dict(zip(headers, row))
-            await YouTubeService._upsert_audience_row(db, channel_id, report_date, row_dict)
-        await db.flush()
-
-    @staticmethod
-    async def _upsert_audience_row(
-        db: AsyncSession,
-        channel_id: str,
-        report_date: date,
-        row: Dict[str, Any],
-    ) -> None:
-        def _to_float(val):
-            try:
-                return float(val) if val is not None else None
-            except (TypeError, ValueError):
-                return None
-
-        def _to_int(val):
-            try:
-                return int(val) if val is not None else None
-            except (TypeError, ValueError):
-                return None
-
-        age_group = row.get("ageGroup")
-        gender = row.get("gender")
-
-        result = await db.execute(
-            select(YTAudienceDaily).where(
-                YTAudienceDaily.channel_id == channel_id,
-                YTAudienceDaily.date == report_date,
-                YTAudienceDaily.age_group == age_group,
-                YTAudienceDaily.gender == gender,
-            )
+            # 같은 키가 한 문에 두 번 있으면 ON CONFLICT가 실패하므로 마지막 값만 사용
+            rows[(row_dict.get("ageGroup"), row_dict.get("gender"))] = {
+                **YouTubeService._report_values(channel_id, report_date, row_dict),
+                "age_group": row_dict.get("ageGroup"),
+                "gender": row_dict.get("gender"),
+            }
+        await YouTubeService._bulk_upsert_report(
+            db, YTAudienceDaily, "uq_audience_channel_date_age_gender", list(rows.values())
         )
-        existing = result.scalar_one_or_none()
-        if existing:
-            existing.viewer_percentage = _to_float(row.get("viewerPercentage"))
-            existing.views = _to_int(row.get("views"))
-            existing.watch_time_minutes = _to_float(row.get("watchTimeMinutes"))
-            existing.raw_report_json = row
-        else:
-            db.add(
-                YTAudienceDaily(
-                    channel_id=channel_id,
-                    date=report_date,
-                    age_group=age_group,
-                    gender=gender,
-                    viewer_percentage=_to_float(row.get("viewerPercentage")),
-                    views=_to_int(row.get("views")),
-                    watch_time_minutes=_to_float(row.get("watchTimeMinutes")),
-                    raw_report_json=row,
-                )
-            )
 
     @staticmethod
     async def _record_geo(
@@ -338,57 +373,51 @@ class YouTubeService:
             return
 
         headers = [h.get("name") for h in report.get("columnHeaders", [])]
+        rows = {}
         for row in report["rows"]:
             row_dict = dict(zip(headers, row))
-            await YouTubeService._upsert_geo_row(db, channel_id, report_date, row_dict)
-        await db.flush()
+            rows[row_dict.get("country")] = {
+                **YouTubeService._report_values(channel_id, report_date, row_dict),
+                "country": row_dict.get("country"),
+            }
+        await YouTubeService._bulk_upsert_report(
+            db, YTGeoDaily, "uq_geo_channel_date_country", list(rows.values())
+        )
 
     @staticmethod
-    async def _upsert_geo_row(
+    def _report_values(channel_id: str, report_date: date, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Analytics 보고서 행 → 공통 컬럼 값 (차원 컬럼 제외)."""
+        return {
+            "id": uuid.uuid4(),
+            "channel_id": channel_id,
+            "date": report_date,
+            "viewer_percentage": _to_float(row.get("viewerPercentage")),
+            "views": _to_int(row.get("views")),
+            "watch_time_minutes": _to_float(row.get("watchTimeMinutes")),
+            "raw_report_json": row,
+            "created_at": datetime.utcnow(),
+        }
+
+    @staticmethod
+    async def _bulk_upsert_report(
         db: AsyncSession,
-        channel_id: str,
-        report_date: date,
-        row: Dict[str, Any],
+        model,
+        constraint: str,
+        rows: List[Dict[str, Any]],
     ) -> None:
-        def _to_float(val):
-            try:
-                return float(val) if val is not None else None
-            except (TypeError, ValueError):
-                return None
-
-        def _to_int(val):
-            try:
-                return int(val) if val is not None else None
-            except (TypeError, ValueError):
-                return None
-
-        country = row.get("country")
-
-        result = await db.execute(
-            select(YTGeoDaily).where(
-                YTGeoDaily.channel_id == channel_id,
-                YTGeoDaily.date == report_date,
-                YTGeoDaily.country == country,
-            )
-        )
-        existing = result.scalar_one_or_none()
-        if existing:
-            existing.viewer_percentage = _to_float(row.get("viewerPercentage"))
-            existing.views = _to_int(row.get("views"))
-            existing.watch_time_minutes = _to_float(row.get("watchTimeMinutes"))
-            existing.raw_report_json = row
-        else:
-            db.add(
-                YTGeoDaily(
-                    channel_id=channel_id,
-                    date=report_date,
-                    country=country,
-                    viewer_percentage=_to_float(row.get("viewerPercentage")),
-                    views=_to_int(row.get("views")),
-                    watch_time_minutes=_to_float(row.get("watchTimeMinutes")),
-                    raw_report_json=row,
-                )
-            )
+        """보고서 전체를 INSERT ... ON CONFLICT DO UPDATE 한 문으로 저장."""
+        for i in range(0, len(rows), _MAX_REPORT_ROWS_PER_STATEMENT):
+            stmt = pg_insert(model).values(rows[i:i + _MAX_REPORT_ROWS_PER_STATEMENT])
+            await db.execute(stmt.on_conflict_do_update(
+                constraint=constraint,
+                set_={
+                    "viewer_percentage": stmt.excluded.viewer_percentage,
+                    "views": stmt.excluded.views,
+                    "watch_time_minutes": stmt.excluded.watch_time_minutes,
+                    "raw_report_json": stmt.excluded.raw_report_json,
+                },
+            ))
+        logger.info("YouTube Analytics saved (%s rows=%s)", model.__tablename__, len(rows))
 
     # ==================== YouTube 비디오 트렌드 검색 기능 ====================
 
@@ -626,30 +655,30 @@ class YouTubeService:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                resp = await client.get(
-                    f"{YouTubeService.BASE_URL}/search",
-                    params=params
-                )
-                
-                # 할당량 초과 처리
-                if resp.status_code == 403:
-                    error_data = resp.json()
-                    error_reason = error_data.get("error", {}).get("errors", [{}])[0].get("reason", "")
-                    if "quotaExceeded" in error_reason:
-                        raise HTTPException(
-                            status_code=429,
-                            detail="YouTube API 일일 할당량 초과"
-                        )
-                
-                resp.raise_for_status()
-                data = resp.json()
-                
-                return [
-                    item["id"]["videoId"]
-                    for item in data.get("items", [])
-                    if item.get("id", {}).get("videoId")
-                ]
+            client = get_http_client()
+            resp = await client.get(
+                f"{YouTubeService.BASE_URL}/search",
+                params=params
+            )
+            
+            # 할당량 초과 처리
+            if resp.status_code == 403:
+                error_data = resp.json()
+                error_reason = error_data.get("error", {}).get("errors", [{}])[0].get("reason", "")
+                if "quotaExceeded" in error_reason:
+                    raise HTTPException(
+                        status_code=429,
+                        detail="YouTube API 일일 할당량 초과"
+                    )
+            
+            resp.raise_for_status()
+            data = resp.json()
+            
+            return [
+                item["id"]["videoId"]
+                for item in data.get("items", [])
+                if item.get("id", {}).get("videoId")
+            ]
         except httpx.TimeoutException:
             logger.error(f"YouTube search API timeout for query: {query}")
             raise HTTPException(
@@ -688,15 +717,15 @@ class YouTubeService:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                resp = await client.get(
-                    f"{YouTubeService.BASE_URL}/videos",
-                    params=params
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                
-                return data.get("items", [])
+            client = get_http_client()
+            resp = await client.get(
+                f"{YouTubeService.BASE_URL}/videos",
+                params=params
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            
+            return data.get("items", [])
         except httpx.TimeoutException:
             logger.error("YouTube videos API timeout")
             raise HTTPException(
@@ -717,6 +746,7 @@ class YouTubeService:
         video_id: str,
         access_token: str,
         languages: List[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         본인 소유 영상의 자막을 YouTube Captions API로 가져옴.
@@ -725,10 +755,14 @@ class YouTubeService:
             video_id: YouTube 영상 ID
             access_token: OAuth access token
             languages: 우선순위 언어 코드 (예: ["ko", "en"])
+            client: 재사용할 httpx 클라이언트 (없으면 공용 커넥션 풀, 요청별 타임아웃 지정)
 
         Returns:
             {"video_id": "...", "status": "success", "tracks": [...]} or None
         """
+        if client is None:
+            client = get_http_client()
+
         if languages is None:
             languages = ["ko", "en"]
 
@@ -736,33 +770,33 @@ class YouTubeService:
 
         try:
             # 1. captions.list로 자막 트랙 목록 조회
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                params = {
-                    "part": "snippet",
-                    "videoId": video_id,
-                }
-                resp = await client.get(
-                    f"{YouTubeService.BASE_URL}/captions",
-                    params=params,
-                    headers=headers,
-                )
+            params = {
+                "part": "snippet",
+                "videoId": video_id,
+            }
+            resp = await client.get(
+                f"{YouTubeService.BASE_URL}/captions",
+                params=params,
+                headers=headers,
+                timeout=15.0,
+            )
 
-                if resp.status_code == 403:
-                    error_detail = resp.text
-                    logger.warning(f"[Captions] 403 에러 상세: {video_id} - {error_detail}")
-                    return None
+            if resp.status_code == 403:
+                error_detail = resp.text
+                logger.warning(f"[Captions] 403 에러 상세: {video_id} - {error_detail}")
+                return None
 
-                if resp.status_code == 404:
-                    logger.info(f"[Captions] 자막 없음: {video_id}")
-                    return {
-                        "video_id": video_id,
-                        "status": "no_subtitle",
-                        "tracks": [],
-                        "no_captions": True,
-                    }
+            if resp.status_code == 404:
+                logger.info(f"[Captions] 자막 없음: {video_id}")
+                return {
+                    "video_id": video_id,
+                    "status": "no_subtitle",
+                    "tracks": [],
+                    "no_captions": True,
+                }
 
-                resp.raise_for_status()
-                data = resp.json()
+            resp.raise_for_status()
+            data = resp.json()
 
             items = data.get("items", [])
             if not items:
@@ -809,7 +843,7 @@ class YouTubeService:
 
             # 3. captions.download로 자막 다운로드
             caption_text = await YouTubeService._download_caption(
-                caption_id, access_token
+                caption_id, access_token, client
             )
 
             if not caption_text:
@@ -847,28 +881,29 @@ class YouTubeService:
     async def _download_caption(
         caption_id: str,
         access_token: str,
+        client: httpx.AsyncClient,
     ) -> Optional[str]:
         """자막 트랙 다운로드."""
         headers = {"Authorization": f"Bearer {access_token}"}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                params = {"tfmt": "srt"}
-                resp = await client.get(
-                    f"{YouTubeService.BASE_URL}/captions/{caption_id}",
-                    params=params,
-                    headers=headers,
-                )
+            params = {"tfmt": "srt"}
+            resp = await client.get(
+                f"{YouTubeService.BASE_URL}/captions/{caption_id}",
+                params=params,
+                headers=headers,
+                timeout=CAPTION_TIMEOUT,
+            )
 
-                if resp.status_code != 200:
-                    logger.warning(f"[Captions] 다운로드 실패: {caption_id}, status={resp.status_code}")
-                    return None
+            if resp.status_code != 200:
+                logger.warning(f"[Captions] 다운로드 실패: {caption_id}, status={resp.status_code}")
+                return None
 
-                srt_content = resp.text
-                plain_text = YouTubeService._parse_srt_to_text(srt_content)
+            srt_content = resp.text
+            plain_text = YouTubeService._parse_srt_to_text(srt_content)
 
-                logger.info(f"[Captions] 다운로드 성공: {caption_id}, length={len(plain_text)}")
-                return plain_text
+            logger.info(f"[Captions] 다운로드 성공: {caption_id}, length={len(plain_text)}")
+            return plain_text
 
         except Exception as e:
             logger.error(f"[Captions] 다운로드 예외 ({caption_id}): {e}")
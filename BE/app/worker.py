@@ -58,6 +58,12 @@ async def _save_result_to_db(topic_request_id: str, formatted: dict):
         except Exception as e:
             await session.rollback()
             logger.error(f"[DB] 결과 저장 실패: {e}", exc_info=True)
+            return
+
+    # 스크립트 목록 개수 캐시 무효화
+    if row and formatted.get("script"):
+        from app.services.script_list_service import ScriptListService
+        await ScriptListService.invalidate_count(row.user_id)
 
 
 async def _create_topic_request(topic: str, user_id: str = None, channel_id: str = None, topic_keywords: list = None):
@@ -138,6 +144,7 @@ def task_generate_script(self, topic: str, channel_profile: dict, topic_request_
                 channel_profile=channel_profile,
                 topic_request_id=topic_request_id,
                 progress_callback=progress_callback,
+                user_id=user_id,
             ))
 
             logger.info(f"[Task {self.request.id}] 스크립트 생성 완료")
@@ -357,6 +364,12 @@ def task_generate_script(self, topic: str, channel_profile: dict, topic_request_
                 except Exception as e:
                     logger.error(f"[DB 저장 실패] {e}", exc_info=True)
         finally:
+            # Redis 클라이언트는 이 이벤트 루프에 묶이므로 성공/실패 무관하게 루프와 함께 정리
+            from app.core.redis import close_redis
+            try:
+                loop.run_until_complete(close_redis())
+            except Exception as e:
+                logger.warning(f"[Redis 정리 실패] {e}")
             loop.close()  # 성공/실패 무관하게 반드시 루프 닫기
         
         # topic_request_id를 결과에 포함 (프론트에서 조회용)
@@ -563,3 +576,90 @@ async def _sync_user_competitor_videos_async(user_id: str):
         "skipped_count": skipped_count,
         "failed_count": failed_count,
     }
+
+
+@celery_app.task(bind=True)
+def task_generate_persona(self, user_id: str, channel_id: str, force_full: bool = False):
+    """
+    [Celery Task] 채널 페르소나 생성 (영상 동기화 → 데이터/자막 분석 → 종합 → 저장)
+
+    단계별 진행 상황을 PROGRESS 상태로 보고합니다 (PERSONA_STEPS 기준).
+    라우트에서 점유한 유저별 생성 키(claim_generation_task)는 종료 시 해제합니다.
+    """
+    from app.services.persona_service import PERSONA_STEPS
+
+    def progress_callback(current_step: str, message: str, completed_steps: list):
+        self.update_state(
+            state='PROGRESS',
+            meta={
+                'current_step': current_step,
+                'message': message,
+                'completed_steps': completed_steps,
+                'total_steps': len(PERSONA_STEPS),
+                'steps': PERSONA_STEPS,
+            }
+        )
+
+    try:
+        logger.info(f"[Task {self.request.id}] 페르소나 생성 시작: channel_id={channel_id}, force_full={force_full}")
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        from app.core.db import engine
+        loop.run_until_complete(engine.dispose())
+
+        try:
+            result = loop.run_until_complete(_generate_persona_async(
+                self.request.id, user_id, channel_id, force_full, progress_callback
+            ))
+        finally:
+            loop.close()
+
+        logger.info(f"[Task {self.request.id}] 페르소나 생성 완료: success={result['success']}")
+        return result
+
+    except Exception as e:
+        logger.error(f"[Task {self.request.id}] 실행 실패: {e}", exc_info=True)
+        return {
+            "success": False,
+            "message": f"페르소나 생성 중 오류가 발생했습니다: {str(e)}",
+            "persona": None,
+        }
+
+
+async def _generate_persona_async(task_id: str, user_id: str, channel_id: str, force_full: bool, progress_callback):
+    """페르소나 생성 + 채널 프로필 캐시 무효화 (비동기)"""
+    from app.core.db import AsyncSessionLocal
+    from app.core.redis import close_redis
+    from app.schemas.persona import PersonaResponse
+    from app.services.persona_service import release_generation_task, run_persona_generation
+    from app.services.shared_state_service import SharedStateService
+    from app.services.youtube_service import close_http_client
+
+    try:
+        async with AsyncSessionLocal() as db:
+            persona = await run_persona_generation(
+                db, channel_id, force_full=force_full, progress_callback=progress_callback
+            )
+
+        if not persona:
+            return {
+                "success": False,
+                "message": "페르소나 생성에 실패했습니다. 채널 데이터를 확인해주세요.",
+                "persona": None,
+            }
+
+        # 페르소나 재생성 시 Redis 캐시 무효화
+        await SharedStateService.invalidate_channel_profile(user_id)
+
+        return {
+            "success": True,
+            "message": "페르소나가 성공적으로 생성되었습니다.",
+            "persona": PersonaResponse.from_persona(persona).model_dump(mode="json"),
+        }
+    finally:
+        await release_generation_task(user_id, task_id)
+        # Redis / YouTube HTTP 클라이언트는 이 이벤트 루프에 묶이므로 task 종료 시 정리
+        await close_redis()
+        await close_http_client()
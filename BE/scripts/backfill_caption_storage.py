@@ -0,0 +1,134 @@
+"""
+자막 저장 포맷 backfill 스크립트
+
+segments_json(JSONB)만 있는 기존 video_captions / recent_video_captions 행을
+plain_text + char_count + cues_zstd 포맷으로 이전하고 segments_json을 비운다.
+
+사용법:
+    python scripts/backfill_caption_storage.py [--batch-size N] [--dry-run]
+    python scripts/backfill_caption_storage.py --restore   # downgrade 전 segments_json 복원
+
+주의사항:
+    - alembic upgrade (l3m4n5o6p7q8) 이후 실행
+    - 배치마다 커밋하므로 중간에 중단해도 다시 실행하면 남은 행부터 이어서 처리
+"""
+import asyncio
+import json
+import sys
+import os
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, update
+
+from app.core.db import AsyncSessionLocal
+from app.models.caption import VideoCaption
+from app.models.competitor_channel_video import RecentVideoCaption
+from app.services.caption_storage import encode_segments, decode_segments
+
+MODELS = (VideoCaption, RecentVideoCaption)
+
+
+async def backfill_model(model, batch_size: int, dry_run: bool) -> dict:
+    """한 테이블을 id 순(keyset)으로 batch_size씩 이전."""
+    table = model.__tablename__
+    migrated = 0
+    json_bytes = 0
+    new_bytes = 0
+    last_id = None
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            stmt = (
+                select(model.id, model.segments_json)
+                .where(model.cues_zstd.is_(None), model.segments_json.isnot(None))
+                .order_by(model.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(model.id > last_id)
+            rows = (await db.execute(stmt)).all()
+            if not rows:
+                break
+
+            params = []
+            for row_id, segments in rows:
+                encoded = encode_segments(segments)
+                json_bytes += len(json.dumps(segments, ensure_ascii=False).encode("utf-8"))
+                new_bytes += len(encoded["plain_text"].encode("utf-8")) + len(encoded["cues_zstd"])
+                params.append({"id": row_id, "segments_json": None, **encoded})
+
+            if not dry_run:
+                await db.execute(update(model), params)
+                await db.commit()
+
+            migrated += len(rows)
+            last_id = rows[-1][0]
+            print(f"  [{table}] {migrated}행 처리")
+
+    return {"table": table, "rows": migrated, "json_bytes": json_bytes, "new_bytes": new_bytes}
+
+
+async def restore_model(model, batch_size: int) -> int:
+    """cues_zstd → segments_json 복원 (downgrade 대비)."""
+    restored = 0
+    last_id = None
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            stmt = (
+                select(model.id, model.cues_zstd)
+                .where(model.segments_json.is_(None), model.cues_zstd.isnot(None))
+                .order_by(model.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(model.id > last_id)
+            rows = (await db.execute(stmt)).all()
+            if not rows:
+                break
+
+            await db.execute(
+                update(model),
+                [{"id": row_id, "segments_json": decode_segments(blob)} for row_id, blob in rows],
+            )
+            await db.commit()
+
+            restored += len(rows)
+            last_id = rows[-1][0]
+            print(f"  [{model.__tablename__}] {restored}행 복원")
+
+    return restored
+
+
+async def main(batch_size: int, dry_run: bool, restore: bool):
+    print("=" * 70)
+    print("자막 저장 포맷 " + ("복원" if restore else "backfill") + (" (dry-run)" if dry_run else ""))
+    print("=" * 70)
+
+    for model in MODELS:
+        if restore:
+            count = await restore_model(model, batch_size)
+            print(f"{model.__tablename__}: {count}행 복원 완료")
+            continue
+
+        stats = await backfill_model(model, batch_size, dry_run)
+        ratio = stats["new_bytes"] / stats["json_bytes"] if stats["json_bytes"] else 0
+        print(
+            f"{stats['table']}: {stats['rows']}행, "
+            f"{stats['json_bytes'] / 1024:.1f}KB → {stats['new_bytes'] / 1024:.1f}KB ({ratio:.0%})"
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="자막 저장 포맷 backfill")
+    parser.add_argument('--batch-size', type=int, default=200, help='배치당 행 수 (기본: 200)')
+    parser.add_argument('--dry-run', action='store_true', help='DB를 수정하지 않고 크기만 계산')
+    parser.add_argument('--restore', action='store_true', help='segments_json 복원 (downgrade 전 실행)')
+
+    args = parser.parse_args()
+
+    asyncio.run(main(batch_size=args.batch_size, dry_run=args.dry_run, restore=args.restore))
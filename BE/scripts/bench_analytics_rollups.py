@@ -0,0 +1,147 @@
+"""
+채널 분석 조회 벤치마크 (원본 행 집계 vs 롤업 조회)
+
+임시 스키마에 채널 N개 × 일별 통계/영상/시청자 보고서를 채운 뒤,
+채널마다 대시보드가 필요로 하는 값(기간별 증가량, 업로드 수/길이,
+최신 연령·성별 구성, 상위 국가)을 두 방식으로 읽어 시간을 비교한다.
+- raw:    원본 테이블 집계 (기간마다 첫/마지막 스냅샷, max(date) 서브쿼리)
+- rollup: AnalyticsRollupService.get_periods / get_audience_mix / get_top_countries
+롤업 갱신(refresh_channel) 비용도 함께 출력한다.
+
+사용법 (로컬 Postgres 필요, 기본값은 DATABASE_URL):
+    python scripts/bench_analytics_rollups.py [--channels 200] [--days 365] [--db-url postgresql+asyncpg://...]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.db import Base
+from app.services.analytics_rollup_service import PERIODS, AnalyticsRollupService
+
+_SCHEMA = "bench_analytics_rollups"
+_AS_OF = date(2026, 6, 30)
+
+_SEED_SQL = [
+    "INSERT INTO users (id, email, created_at, updated_at) "
+    "VALUES ('00000000-0000-0000-0000-000000000001', 'bench@example.com', now(), now())",
+    """INSERT INTO youtube_channels (channel_id, user_id, raw_channel_json, created_at, updated_at)
+       SELECT 'UC' || c, '00000000-0000-0000-0000-000000000001', '{}', now(), now()
+       FROM generate_series(1, :channels) c""",
+    """INSERT INTO yt_channel_stats_daily (id, channel_id, date, subscriber_count, view_count, created_at)
+       SELECT gen_random_uuid(), 'UC' || c, CAST(:as_of AS date) - d, 10000 - d * 3, 5000000 - d * 1000, now()
+       FROM generate_series(1, :channels) c, generate_series(0, :days - 1) d""",
+    """INSERT INTO yt_channel_videos (id, channel_id, video_id, title, published_at, duration_seconds, created_at)
+       SELECT gen_random_uuid(), 'UC' || c, 'v' || c || '_' || v, 'video',
+              CAST(:as_of AS timestamptz) - make_interval(days => v * 3), 300 + v, now()
+       FROM generate_series(1, :channels) c, generate_series(0, :days / 3) v""",
+    """INSERT INTO yt_audience_daily (id, channel_id, date, age_group, gender, viewer_percentage, created_at)
+       SELECT gen_random_uuid(), 'UC' || c, CAST(:as_of AS date) - d, 'age' || a, g, 100.0 / 14, now()
+       FROM generate_series(1, :channels) c, generate_series(0, :days - 1, 7) d,
+            generate_series(1, 7) a, unnest(ARRAY['male', 'female']) g""",
+    """INSERT INTO yt_geo_daily (id, channel_id, date, country, views, created_at)
+       SELECT gen_random_uuid(), 'UC' || c, CAST(:as_of AS date) - d, 'C' || k, 1000 - k, now()
+       FROM generate_series(1, :channels) c, generate_series(0, :days - 1, 7) d, generate_series(1, 50) k""",
+    "ANALYZE",
+]
+
+_RAW_PERIOD_SQL = text("""
+SELECT
+    (SELECT view_count FROM yt_channel_stats_daily WHERE channel_id = :cid
+       AND date BETWEEN :start AND :as_of ORDER BY date DESC LIMIT 1)
+  - (SELECT view_count FROM yt_channel_stats_daily WHERE channel_id = :cid
+       AND date BETWEEN :start AND :as_of ORDER BY date ASC LIMIT 1),
+    (SELECT count(*) FROM yt_channel_videos WHERE channel_id = :cid
+       AND published_at::date BETWEEN :start AND :as_of)
+""")
+_RAW_AUDIENCE_SQL = text("""
+SELECT age_group, gender, viewer_percentage FROM yt_audience_daily
+WHERE channel_id = :cid AND date = (SELECT max(date) FROM yt_audience_daily WHERE channel_id = :cid)
+""")
+_RAW_GEO_SQL = text("""
+SELECT country, views, 100.0 * views / sum(views) OVER () FROM yt_geo_daily
+WHERE channel_id = :cid AND date = (SELECT max(date) FROM yt_geo_daily WHERE channel_id = :cid)
+ORDER BY views DESC LIMIT 10
+""")
+
+
+async def read_raw(db: AsyncSession, cid: str) -> None:
+    for days in PERIODS.values():
+        start = date.fromordinal(_AS_OF.toordinal() - (days or 100000) + 1)
+        (await db.execute(_RAW_PERIOD_SQL, {"cid": cid, "start": start, "as_of": _AS_OF})).all()
+    (await db.execute(_RAW_AUDIENCE_SQL, {"cid": cid})).all()
+    (await db.execute(_RAW_GEO_SQL, {"cid": cid})).all()
+
+
+async def read_rollup(db: AsyncSession, cid: str) -> None:
+    await AnalyticsRollupService.get_periods(db, cid)
+    await AnalyticsRollupService.get_audience_mix(db, cid)
+    await AnalyticsRollupService.get_top_countries(db, cid, limit=10)
+
+
+async def timed(engine, channel_ids, reader) -> list:
+    latencies = []
+    for cid in channel_ids:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            started = time.perf_counter()
+            await reader(db, cid)
+            latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+async def main(db_url: str, channels: int, days: int) -> None:
+    engine = create_async_engine(db_url, connect_args={"server_settings": {"search_path": _SCHEMA}})
+    tables = [
+        Base.metadata.tables[name]
+        for name in (
+            "users", "youtube_channels", "yt_channel_stats_daily", "yt_channel_videos",
+            "yt_audience_daily", "yt_geo_daily", "yt_channel_period_rollups",
+            "yt_channel_audience_rollups", "yt_channel_geo_rollups",
+        )
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {_SCHEMA}"))
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+        for sql in _SEED_SQL:
+            await conn.execute(text(sql), {"channels": channels, "days": days, "as_of": _AS_OF})
+
+    channel_ids = [f"UC{c}" for c in range(1, channels + 1)]
+    print(f"채널 {channels}개 × {days}일 (통계 {channels * days}행)\n")
+
+    started = time.perf_counter()
+    for cid in channel_ids:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await AnalyticsRollupService.refresh_channel(db, cid, as_of=_AS_OF)
+            await db.commit()
+    refresh_ms = (time.perf_counter() - started) * 1000 / channels
+    print(f"롤업 갱신: 채널당 {refresh_ms:.2f}ms\n")
+
+    print(f"{'방식':<7} {'p50(ms)':>8} {'p95(ms)':>8} {'합계(s)':>8}")
+    for name, reader in (("raw", read_raw), ("rollup", read_rollup)):
+        latencies = sorted(await timed(engine, channel_ids, reader))
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"{name:<7} {statistics.median(latencies):>8.2f} {p95:>8.2f} {sum(latencies) / 1000:>8.2f}")
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--channels", type=int, default=200)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--db-url", default=os.getenv("TEST_DATABASE_URL") or settings.database_url)
+    args = parser.parse_args()
+    asyncio.run(main(args.db_url, args.channels, args.days))
@@ -0,0 +1,141 @@
+"""
+YouTube Analytics 보고서 저장 벤치마크 (행별 SELECT → INSERT/UPDATE vs 일괄 upsert)
+
+합성 보고서(연령×성별 + 국가 N개)를 임시 스키마에 두 번 저장(신규 삽입 → 갱신)하며
+실행된 SQL 문 수와 소요 시간을 비교한다.
+- per-row: 기존 방식 (행마다 SELECT 후 ORM add / 속성 갱신, flush)
+- bulk:    YouTubeService._record_audience / _record_geo (테이블당 INSERT ... ON CONFLICT 1문)
+
+사용법 (로컬 Postgres 필요, 기본값은 DATABASE_URL):
+    python scripts/bench_analytics_upsert.py [--countries 2000] [--db-url postgresql+asyncpg://...]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import date
+
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.db import Base
+from app.models import User
+from app.models.youtube_channel import YouTubeChannel, YTAudienceDaily, YTGeoDaily
+from app.services import youtube_service
+from app.services.youtube_service import YouTubeService
+
+_SCHEMA = "bench_analytics_upsert"
+_CHANNEL_ID = "UC_bench"
+_AGE_GROUPS = ["age13-17", "age18-24", "age25-34", "age35-44", "age45-54", "age55-64", "age65-"]
+_GENDERS = ["male", "female", "user_specified"]
+
+
+def make_reports(countries: int, seed: int) -> dict:
+    """dimensions별 합성 Analytics 보고서 (seed가 바뀌면 수치만 바뀜)."""
+    audience = {
+        "columnHeaders": [{"name": "ageGroup"}, {"name": "gender"}, {"name": "viewerPercentage"}],
+        "rows": [
+            [age, gender, round((i * 7 + seed) % 100 / 10, 1)]
+            for i, (age, gender) in enumerate((a, g) for a in _AGE_GROUPS for g in _GENDERS)
+        ],
+    }
+    geo = {
+        "columnHeaders": [{"name": "country"}, {"name": "views"}, {"name": "estimatedMinutesWatched"}],
+        "rows": [[f"C{i:04d}", i * 10 + seed, i * 2.5 + seed] for i in range(countries)],
+    }
+    return {"ageGroup,gender": audience, "country": geo}
+
+
+async def legacy_record(db: AsyncSession, reports: dict, report_date: date) -> None:
+    """기존 구현: 보고서 행마다 SELECT 후 INSERT 또는 UPDATE."""
+    for dimensions, model, keys in (
+        ("ageGroup,gender", YTAudienceDaily, (("age_group", "ageGroup"), ("gender", "gender"))),
+        ("country", YTGeoDaily, (("country", "country"),)),
+    ):
+        report = reports[dimensions]
+        headers = [h["name"] for h in report["columnHeaders"]]
+        for row in report["rows"]:
+            row_dict = dict(zip(headers, row))
+            filters = [getattr(model, col) == row_dict.get(key) for col, key in keys]
+            result = await db.execute(
+                select(model).where(model.channel_id == _CHANNEL_ID, model.date == report_date, *filters)
+            )
+            existing = result.scalar_one_or_none()
+            values = {
+                "viewer_percentage": youtube_service._to_float(row_dict.get("viewerPercentage")),
+                "views": youtube_service._to_int(row_dict.get("views")),
+                "watch_time_minutes": youtube_service._to_float(row_dict.get("watchTimeMinutes")),
+                "raw_report_json": row_dict,
+            }
+            if existing:
+                for col, value in values.items():
+                    setattr(existing, col, value)
+            else:
+                db.add(model(
+                    channel_id=_CHANNEL_ID, date=report_date,
+                    **{col: row_dict.get(key) for col, key in keys}, **values,
+                ))
+        await db.flush()
+
+
+async def bulk_record(db: AsyncSession, reports: dict, report_date: date) -> None:
+    await YouTubeService._record_audience(db, _CHANNEL_ID, "bench", report_date)
+    await YouTubeService._record_geo(db, _CHANNEL_ID, "bench", report_date)
+
+
+async def main(db_url: str, countries: int) -> None:
+    engine = create_async_engine(db_url, connect_args={"server_settings": {"search_path": _SCHEMA}})
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(1))
+
+    tables = [Base.metadata.tables[name] for name in ("users", "youtube_channels", "yt_audience_daily", "yt_geo_daily")]
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {_SCHEMA}"))
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        user = User(email="bench@example.com")
+        db.add(user)
+        await db.flush()
+        db.add(YouTubeChannel(channel_id=_CHANNEL_ID, user_id=user.id, title="bench"))
+        await db.commit()
+
+    row_count = len(_AGE_GROUPS) * len(_GENDERS) + countries
+    print(f"보고서 행 {row_count}개 (연령×성별 {len(_AGE_GROUPS) * len(_GENDERS)} + 국가 {countries})\n")
+    print(f"{'방식':<9} {'단계':<7} {'SQL 문':>7} {'시간(s)':>8}")
+
+    for day, (name, recorder) in enumerate((("per-row", legacy_record), ("bulk", bulk_record)), start=1):
+        report_date = date(2026, 1, day)  # 방식별로 다른 날짜 → 서로 간섭 없음
+        for phase, seed in (("insert", 0), ("update", 1)):
+            reports = make_reports(countries, seed)
+
+            async def fake_report(access_token, channel_id, dimensions, metrics, report_date):
+                return reports[dimensions]
+
+            YouTubeService._fetch_analytics_report = staticmethod(fake_report)
+
+            async with AsyncSession(engine, expire_on_commit=False) as db:
+                statements.clear()
+                started = time.perf_counter()
+                await recorder(db, reports, report_date)
+                await db.commit()
+                elapsed = time.perf_counter() - started
+            print(f"{name:<9} {phase:<7} {len(statements):>7} {elapsed:>8.3f}")
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--countries", type=int, default=2000, help="합성 국가 행 수")
+    parser.add_argument("--db-url", default=os.getenv("TEST_DATABASE_URL") or settings.database_url)
+    args = parser.parse_args()
+    asyncio.run(main(args.db_url, args.countries))
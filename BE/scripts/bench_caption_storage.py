@@ -0,0 +1,132 @@
+"""
+자막 저장 포맷 벤치마크 (segments_json vs plain_text + cues_zstd)
+
+합성 자막(한국어 cue)으로 행 크기와 로드 시간을 비교한다.
+- 행 크기: segments_json 직렬화 크기 vs plain_text + cues_zstd
+- 텍스트 로드: JSON 파싱 + 텍스트 조립 vs plain_text 그대로 사용
+- cue 로드: JSON 파싱 vs zstd decode
+
+사용법:
+    python scripts/bench_caption_storage.py [--minutes 20] [--rows 200]
+    python scripts/bench_caption_storage.py --db   # 실제 DB 행 크기 (pg_column_size) 비교
+"""
+import asyncio
+import json
+import random
+import sys
+import os
+import time
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.caption_storage import encode_segments, decode_segments
+from app.services.subtitle_service import SubtitleService
+
+_WORDS = [
+    "오늘은", "인공지능", "반도체", "시장에", "대해서", "이야기해", "보려고", "합니다",
+    "여러분", "생각보다", "중요한", "포인트가", "있는데요", "바로", "이", "부분입니다",
+    "그래서", "결론적으로", "구독과", "좋아요", "부탁드립니다", "데이터를", "보면",
+]
+
+
+def make_segments(minutes: int, seed: int = 0) -> dict:
+    """분당 약 20개 cue(3초 간격)의 합성 자막."""
+    rng = random.Random(seed)
+    cues = []
+    for i in range(minutes * 20):
+        start = i * 3.0
+        text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 9)))
+        cues.append({"start": start, "end": start + 2.8, "text": text})
+    return {
+        "source": "transcript-api",
+        "tracks": [{
+            "language_code": "ko",
+            "language_name": "ko",
+            "is_auto_generated": True,
+            "cues": cues,
+        }],
+        "no_captions": False,
+    }
+
+
+def _timeit(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def run_synthetic(minutes: int, rows: int) -> None:
+    samples = [make_segments(minutes, seed) for seed in range(rows)]
+    legacy_rows = [json.dumps(s, ensure_ascii=False) for s in samples]
+    new_rows = [encode_segments(s) for s in samples]
+
+    legacy_bytes = sum(len(r.encode("utf-8")) for r in legacy_rows) / rows
+    text_bytes = sum(len(r["plain_text"].encode("utf-8")) for r in new_rows) / rows
+    blob_bytes = sum(len(r["cues_zstd"]) for r in new_rows) / rows
+
+    def legacy_text():
+        for raw in legacy_rows:
+            SubtitleService.build_caption_text(json.loads(raw)["tracks"])
+
+    def new_text():
+        for r in new_rows:
+            r["plain_text"]
+
+    def legacy_cues():
+        for raw in legacy_rows:
+            json.loads(raw)
+
+    def new_cues():
+        for r in new_rows:
+            decode_segments(r["cues_zstd"])
+
+    repeat = 5
+    print(f"합성 자막: {minutes}분 영상, {len(samples[0]['tracks'][0]['cues'])} cues, {rows}행")
+    print("-" * 70)
+    print(f"{'항목':<28}{'before (segments_json)':>22}{'after':>20}")
+    print(f"{'행 크기 (평균)':<28}{legacy_bytes / 1024:>20.1f}KB{(text_bytes + blob_bytes) / 1024:>18.1f}KB")
+    print(f"{'  └ plain_text / cues_zstd':<28}{'':>22}{text_bytes / 1024:>8.1f}KB / {blob_bytes / 1024:.1f}KB")
+    print(f"{'텍스트 로드 ({rows}행)'.format(rows=rows):<28}{_timeit(legacy_text, repeat):>20.2f}ms{_timeit(new_text, repeat):>18.2f}ms")
+    print(f"{'cue 로드 ({rows}행)'.format(rows=rows):<28}{_timeit(legacy_cues, repeat):>20.2f}ms{_timeit(new_cues, repeat):>18.2f}ms")
+
+
+async def run_db() -> None:
+    """실제 DB에서 컬럼별 평균 저장 크기 조회 (TOAST 압축 반영)."""
+    from sqlalchemy import text
+
+    from app.core.db import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        for table in ("video_captions", "recent_video_captions"):
+            row = (await db.execute(text(f"""
+                SELECT
+                    count(*) FILTER (WHERE segments_json IS NOT NULL),
+                    avg(pg_column_size(segments_json)),
+                    count(*) FILTER (WHERE cues_zstd IS NOT NULL),
+                    avg(coalesce(pg_column_size(plain_text), 0) + pg_column_size(cues_zstd))
+                        FILTER (WHERE cues_zstd IS NOT NULL)
+                FROM {table}
+            """))).one()
+            legacy_n, legacy_avg, new_n, new_avg = row
+            print(
+                f"{table}: legacy {legacy_n}행 평균 {float(legacy_avg or 0) / 1024:.1f}KB, "
+                f"new {new_n}행 평균 {float(new_avg or 0) / 1024:.1f}KB"
+            )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="자막 저장 포맷 벤치마크")
+    parser.add_argument('--minutes', type=int, default=20, help='합성 영상 길이 (분)')
+    parser.add_argument('--rows', type=int, default=200, help='합성 행 수')
+    parser.add_argument('--db', action='store_true', help='실제 DB 행 크기 비교')
+
+    args = parser.parse_args()
+
+    if args.db:
+        asyncio.run(run_db())
+    else:
+        run_synthetic(args.minutes, args.rows)
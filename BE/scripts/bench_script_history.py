@@ -0,0 +1,227 @@
+"""
+스크립트 이력 응답 벤치마크 (전체 JSONB 행 vs 요약 projection)
+
+/scripts/history 한 번 호출 (limit개 이력) 의 응답 크기와 지연을 비교한다.
+- full:    기존 방식 — TopicRequest + VerifiedScript 전체 행 조회, 스크립트/참고자료 포함,
+           jsonable_encoder + JSONResponse 직렬화 (FastAPI 기본)
+- summary: build_history_query (필요한 JSONB 키만 SQL에서 추출) + ORJSONResponse
+상세 조회(/scripts/{id}) 1건의 직렬화도 기존(jsonable_encoder + JSONResponse)과 orjson을 비교한다.
+
+합성 이력은 실제 결과와 비슷한 크기 (챕터 8개, 참고 기사 10개, 기사당 base64 이미지 2장).
+
+사용법:
+    python scripts/bench_script_history.py --payload-only [--limit 10]   # DB 없이 직렬화만
+    python scripts/bench_script_history.py [--limit 10] [--db-url ...]   # 로컬 Postgres 필요
+"""
+import argparse
+import asyncio
+import base64
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.responses import ORJSONResponse
+
+_SCHEMA = "bench_script_history"
+_USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+_IMAGE = "data:image/jpeg;base64," + base64.b64encode(os.urandom(45_000)).decode("ascii")
+
+
+def make_payload(seed: int) -> tuple:
+    """(final_script_json, source_map_json) 합성."""
+    script = {
+        "hook": f"{seed}번째 영상 훅 — 오늘은 금리와 환율 이야기를 해보겠습니다. " * 3,
+        "chapters": [
+            {"title": f"챕터 {c}", "content": "기준금리 인하가 시장에 미치는 영향을 정리합니다. " * 40}
+            for c in range(8)
+        ],
+        "outro": "구독과 좋아요 부탁드립니다.",
+    }
+    references = [
+        {
+            "title": f"기사 {r}", "summary": "요약 " * 30, "source": "연합뉴스",
+            "url": f"https://news.example.com/{seed}/{r}", "date": "2026-01-01", "query": "금리",
+            "analysis": {
+                "facts": [{"id": f"f{r}_{i}", "content": "팩트 내용 " * 15} for i in range(5)],
+                "opinions": ["의견 " * 20 for _ in range(2)],
+            },
+            "images": [{"url": _IMAGE, "caption": "차트", "is_chart": True} for _ in range(2)],
+        }
+        for r in range(10)
+    ]
+    source_map = {
+        "references": references,
+        "competitor_videos": [{"video_id": f"v{i}", "title": "경쟁 영상"} for i in range(5)],
+        "related_videos": [],
+        "citations": [{"marker": f"[{i}]", "url": f"https://news.example.com/{seed}/{i}"} for i in range(10)],
+    }
+    return script, source_map
+
+
+def full_item(topic, verified) -> dict:
+    """기존 /scripts/history 항목 구성."""
+    item = {
+        "topic_request_id": str(topic.id),
+        "topic_title": topic.topic_title,
+        "status": topic.status,
+        "created_at": topic.created_at.isoformat() if topic.created_at else None,
+        "script": None,
+        "references": None,
+        "competitor_videos": None,
+    }
+    if verified:
+        item["script"] = verified.final_script_json
+        source_map = verified.source_map_json or {}
+        item["references"] = source_map.get("references", [])
+        item["competitor_videos"] = source_map.get("competitor_videos", [])
+        item["citations"] = source_map.get("citations", [])
+        item["related_videos"] = source_map.get("related_videos", [])
+    return item
+
+
+def summary_item(row) -> dict:
+    return {
+        "topic_request_id": str(row.id),
+        "topic_title": row.topic_title,
+        "status": row.status,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "verified_at": row.verified_at.isoformat() if row.verified_at else None,
+        "has_script": bool(row.has_script),
+        "hook_preview": row.hook_preview,
+        "chapter_count": row.chapter_count or 0,
+        "reference_count": row.reference_count or 0,
+    }
+
+
+def render_json(content) -> bytes:
+    """기존: dict 반환 → FastAPI가 jsonable_encoder 후 JSONResponse로 직렬화."""
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def render_orjson(content) -> bytes:
+    return ORJSONResponse(content).body
+
+
+def report(name: str, timings: list, size: int) -> None:
+    print(f"{name:<14} {statistics.median(timings):>10.2f} {size / 1024:>12.1f}")
+
+
+def run_payload_only(limit: int, repeat: int) -> None:
+    """DB 없이 행 → 응답 바이트 변환 비용만 측정."""
+    now = datetime(2026, 1, 1)
+    rows = []
+    for i in range(limit):
+        script, source_map = make_payload(i)
+        topic = SimpleNamespace(id=uuid.uuid4(), topic_title=f"주제 {i}", status="verified",
+                                created_at=now - timedelta(hours=i))
+        verified = SimpleNamespace(final_script_json=script, source_map_json=source_map, verified_at=now)
+        summary = SimpleNamespace(
+            id=topic.id, topic_title=topic.topic_title, status=topic.status, created_at=topic.created_at,
+            verified_at=now, has_script=True, hook_preview=script["hook"][:120],
+            chapter_count=len(script["chapters"]), reference_count=len(source_map["references"]),
+        )
+        rows.append((topic, verified, summary))
+
+    print(f"이력 {limit}개, 직렬화만 (DB 제외), 중앙값 {repeat}회\n")
+    print(f"{'방식':<14} {'지연(ms)':>10} {'응답(KiB)':>12}")
+    topic, verified, _ = rows[0]
+    for name, build, render in (
+        ("full", lambda: {"success": True, "results": [full_item(t, v) for t, v, _ in rows]}, render_json),
+        ("summary", lambda: {"success": True, "results": [summary_item(s) for _, _, s in rows]}, render_orjson),
+        ("detail", lambda: full_item(topic, verified), render_json),
+        ("detail-orjson", lambda: full_item(topic, verified), render_orjson),
+    ):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            body = render(build())
+            timings.append((time.perf_counter() - started) * 1000)
+        report(name, timings, len(body))
+
+
+async def run_with_db(db_url: str, limit: int, repeat: int) -> None:
+    from sqlalchemy import desc, select, text
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from app.core.db import Base
+    from app.models import User
+    from app.models.script_output import VerifiedScript
+    from app.models.topic_request import TopicRequest
+    from app.services.script_list_service import build_history_query
+
+    engine = create_async_engine(db_url, connect_args={"server_settings": {"search_path": _SCHEMA}})
+    tables = [
+        Base.metadata.tables[name]
+        for name in ("users", "youtube_channels", "topic_requests", "agent_runs", "verified_scripts")
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {_SCHEMA}"))
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        db.add(User(id=_USER_ID, email="bench@example.com"))
+        await db.flush()
+        for i in range(limit * 3):
+            topic = TopicRequest(user_id=_USER_ID, topic_title=f"주제 {i}", status="verified",
+                                 created_at=datetime(2026, 1, 1) + timedelta(hours=i))
+            db.add(topic)
+            await db.flush()
+            script, source_map = make_payload(i)
+            db.add(VerifiedScript(topic_request_id=topic.id, final_script_json=script, source_map_json=source_map))
+        await db.commit()
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+
+    async def full(db):
+        rows = (await db.execute(
+            select(TopicRequest, VerifiedScript)
+            .outerjoin(VerifiedScript, TopicRequest.id == VerifiedScript.topic_request_id)
+            .where(TopicRequest.user_id == _USER_ID)
+            .order_by(desc(TopicRequest.created_at))
+            .limit(limit)
+        )).all()
+        return render_json({"success": True, "results": [full_item(t, v) for t, v in rows]})
+
+    async def summary(db):
+        rows = (await db.execute(build_history_query(_USER_ID, limit))).all()
+        return render_orjson({"success": True, "results": [summary_item(row) for row in rows]})
+
+    print(f"이력 {limit}개, 쿼리 + 직렬화, 중앙값 {repeat}회\n")
+    print(f"{'방식':<14} {'지연(ms)':>10} {'응답(KiB)':>12}")
+    for name, runner in (("full", full), ("summary", summary)):
+        timings = []
+        for _ in range(repeat):
+            async with AsyncSession(engine, expire_on_commit=False) as db:
+                started = time.perf_counter()
+                body = await runner(db)
+                timings.append((time.perf_counter() - started) * 1000)
+        report(name, timings, len(body))
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--payload-only", action="store_true", help="DB 없이 직렬화만 측정")
+    parser.add_argument("--db-url", default=os.getenv("TEST_DATABASE_URL") or settings.database_url)
+    args = parser.parse_args()
+    if args.payload_only:
+        run_payload_only(args.limit, args.repeat)
+    else:
+        asyncio.run(run_with_db(args.db_url, args.limit, args.repeat))
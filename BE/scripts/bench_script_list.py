@@ -0,0 +1,132 @@
+"""
+스크립트 목록 페이지네이션 벤치마크 (OFFSET vs keyset)
+
+임시 스키마에 한 사용자의 topic_requests + script_drafts를 --rows개(기본 10만) 채우고
+(다른 사용자 행도 같은 수만큼 섞음) 페이지 깊이별 조회 시간을 비교한다.
+- offset: 기존 방식 (count(*) + ORDER BY generated_at OFFSET/LIMIT)
+- keyset: ScriptListService.list_page (커서 위치부터 인덱스 이어 읽기, 개수 생략)
+keyset은 깊이와 무관하게 거의 일정해야 한다.
+
+사용법 (로컬 Postgres 필요, 기본값은 DATABASE_URL):
+    python scripts/bench_script_list.py [--rows 100000] [--page-size 8] [--repeat 5]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+from sqlalchemy import desc, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.db import Base
+from app.models.script_output import ScriptDraft
+from app.models.topic_request import TopicRequest
+from app.services.script_list_service import ScriptListService, encode_cursor
+
+_SCHEMA = "bench_script_list"
+_USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+_OTHER_USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000002")
+
+_SEED_SQL = [
+    """INSERT INTO users (id, email, created_at, updated_at) VALUES
+       (:user_id, 'bench@example.com', now(), now()), (:other_id, 'other@example.com', now(), now())""",
+    # 두 사용자 행을 시간순으로 교차 배치
+    """INSERT INTO topic_requests (id, user_id, topic_title, topic_keywords, language, region,
+                                  status, created_at, updated_at)
+       SELECT gen_random_uuid(), CASE WHEN i % 2 = 0 THEN :user_id ELSE :other_id END,
+              '주제 ' || i, '[]', 'ko', 'KR', 'verified',
+              timestamp '2026-01-01' + make_interval(secs => i), now()
+       FROM generate_series(1, :rows * 2) i""",
+    """INSERT INTO script_drafts (id, topic_request_id, generated_at, metadata_json, script_json)
+       SELECT gen_random_uuid(), id, created_at + interval '5 minutes', '{}', '{"hook": "", "chapters": []}'
+       FROM topic_requests""",
+    "ANALYZE",
+]
+
+
+async def offset_page(db: AsyncSession, page: int, page_size: int) -> None:
+    """기존 /scripts/list 쿼리."""
+    await db.execute(
+        select(func.count()).select_from(ScriptDraft)
+        .join(TopicRequest, ScriptDraft.topic_request_id == TopicRequest.id)
+        .where(TopicRequest.user_id == _USER_ID)
+    )
+    (await db.execute(
+        select(ScriptDraft, TopicRequest)
+        .join(TopicRequest, ScriptDraft.topic_request_id == TopicRequest.id)
+        .where(TopicRequest.user_id == _USER_ID)
+        .order_by(desc(ScriptDraft.generated_at))
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )).all()
+
+
+async def cursor_at(db: AsyncSession, position: int) -> str:
+    """position번째 행 직전까지 넘겨 온 커서 (측정 대상 아님)."""
+    draft, topic = (await db.execute(
+        select(ScriptDraft, TopicRequest)
+        .join(TopicRequest, ScriptDraft.topic_request_id == TopicRequest.id)
+        .where(TopicRequest.user_id == _USER_ID)
+        .order_by(TopicRequest.created_at.desc(), TopicRequest.id.desc(), ScriptDraft.id.desc())
+        .offset(position - 1)
+        .limit(1)
+    )).one()
+    return encode_cursor(topic.created_at, topic.id, draft.id)
+
+
+async def measure(engine, runner, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            started = time.perf_counter()
+            await runner(db)
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def main(db_url: str, rows: int, page_size: int, repeat: int) -> None:
+    engine = create_async_engine(db_url, connect_args={"server_settings": {"search_path": _SCHEMA}})
+    tables = [Base.metadata.tables[name] for name in ("users", "youtube_channels", "topic_requests", "agent_runs", "script_drafts")]
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {_SCHEMA}"))
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+        for sql in _SEED_SQL:
+            await conn.execute(text(sql), {"user_id": _USER_ID, "other_id": _OTHER_USER_ID, "rows": rows})
+
+    print(f"사용자 스크립트 {rows}개 (전체 {rows * 2}개), page_size={page_size}, 중앙값 {repeat}회\n")
+    print(f"{'페이지':>8} {'offset(ms)':>11} {'keyset(ms)':>11}")
+
+    last_page = rows // page_size
+    for page in sorted({1, 10, 100, last_page // 10, last_page // 2, last_page}):
+        if page < 1:
+            continue
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            cursor = await cursor_at(db, (page - 1) * page_size) if page > 1 else None
+
+        offset_ms = await measure(engine, lambda db: offset_page(db, page, page_size), repeat)
+        keyset_ms = await measure(
+            engine, lambda db: ScriptListService.list_page(db, _USER_ID, page_size, cursor), repeat
+        )
+        print(f"{page:>8} {offset_ms:>11.2f} {keyset_ms:>11.2f}")
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--db-url", default=os.getenv("TEST_DATABASE_URL") or settings.database_url)
+    args = parser.parse_args()
+    asyncio.run(main(args.db_url, args.rows, args.page_size, args.repeat))
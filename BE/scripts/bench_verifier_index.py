@@ -0,0 +1,314 @@
+"""
+Verifier 팩트/수치 색인 마이크로벤치마크 (선형 탐색 vs FactIndex)
+
+Verifier의 LLM 호출 전 단계(Phase 1 Lightweight → Phase 2 Suspicious Beat → Source Map)만 측정한다.
+- linear:  기존 방식 — Phase마다 fact_map을 새로 만들고, Source Map은 next(...)로 팩트 목록을 선형 탐색,
+           수치 패턴은 호출마다 정규식 목록을 순회 (이전 verifier 코드를 그대로 옮겨 둠)
+- indexed: FactIndex 1회 생성 (fact_id / 정규화 수치 → 팩트) + 모듈 수준 컴파일 정규식
+
+Source Map이 같은지, 색인 방식의 '출처에 없는 수치'가 기존 결과의 부분집합인지도 확인한다
+(정규화로 "1,200만" = "12,000,000" 같은 표기 차이를 일치로 보므로 오탐만 줄어든다).
+
+사용법:
+    python scripts/bench_verifier_index.py [--beats 300] [--facts 500] [--runs 50]
+"""
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.script_gen.nodes import verifier
+from src.script_gen.schemas.verifier import (
+    BeatVerification, SourceInfo, SourceMapEntry, VerificationAction, VerificationIssue,
+)
+from src.script_gen.schemas.writer import Script
+from src.script_gen.utils.fact_index import FactIndex
+
+
+def make_inputs(n_beats: int, n_facts: int):
+    facts = [
+        {
+            "id": f"fact-{i:04d}", "article_id": f"a{i % 40}", "category": "Statistic",
+            "content": (
+                f"{i}번째 팩트: 2025년 3분기 매출은 {i % 9 + 1}조 {i % 7 + 1}000억원으로 "
+                f"전년 대비 {i % 40 + 10}.{i % 10}% 증가했고 이용자는 {i + 100:,}만명이다."
+            ),
+        }
+        for i in range(n_facts)
+    ]
+    articles = [{"id": f"a{i}", "publisher": f"언론사{i}", "url": f"https://news.example/{i}"} for i in range(40)]
+
+    per_chapter = 10
+    chapters = []
+    for c in range(n_beats // per_chapter):
+        beats = []
+        for k in range(per_chapter):
+            b = c * per_chapter + k
+            i = (b * 7) % n_facts
+            refs = [facts[i]["id"], facts[(i + 1) % n_facts]["id"]] if b % 3 else []
+            # 표기를 바꾼 수치 / 출처에 없는 수치 / 수치 없는 문장을 섞는다
+            if b % 5 == 0:
+                line = f"이용자가 {(i + 100) * 10000:,}명, 매출은 {i % 9 + 1}.{i % 7 + 1}조원으로 {i % 40 + 10}.{i % 10}% 늘었습니다."
+            elif b % 5 == 1:
+                line = f"보고서에 따르면 점유율이 {b % 50 + 51}.5%까지 올랐습니다."
+            elif b % 5 == 2:
+                line = "그런데 여기서 중요한 건 흐름이에요."
+            else:
+                line = f"전년 대비 {i % 40 + 10}.{i % 10}% 늘어난 {i % 9 + 1}조 {i % 7 + 1}000억원입니다."
+            beats.append({"beat_id": f"c{c}b{k}", "purpose": "evidence", "line": line, "fact_references": refs})
+        chapters.append({"chapter_id": str(c), "title": f"챕터 {c}", "beats": beats})
+
+    script = Script(
+        hook={"text": "매출 1조원 시대, 진짜일까요?", "fact_references": [facts[0]["id"]]},
+        chapters=chapters,
+        closing={"text": "마무리", "cta": "구독"},
+    )
+    return script, facts, articles
+
+
+# -----------------------------------------------------------------------------
+# 기존 방식 (색인 도입 전 verifier의 Phase 2 / Source Map 그대로)
+# -----------------------------------------------------------------------------
+
+def legacy_find_suspicious_beats(
+    beat_verifications: List[BeatVerification],
+    facts: List[Dict]
+) -> List[str]:
+    """
+    의심스러운 Beat 찾기 (Deep 검증 필요)
+    """
+    suspicious = []
+    fact_map = {f.get("id"): f for f in facts}
+    
+    for beat_ver in beat_verifications:
+        # 1. 숫자/통계가 있는데 fact_references 없음
+        if legacy_has_numbers(beat_ver.beat_text) and not beat_ver.fact_references:
+            beat_ver.issues.append(VerificationIssue(
+                beat_id=beat_ver.beat_id,
+                issue_type="suspicious_claim",
+                description="숫자/통계가 있지만 출처가 없습니다",
+                severity="warning",
+                suggested_action=VerificationAction.ADD_SOURCE
+            ))
+            suspicious.append(beat_ver.beat_id)
+        
+        # 2. Attribution phrase가 있는데 fact_references 없음
+        if legacy_has_attribution_phrase(beat_ver.beat_text) and not beat_ver.fact_references:
+            beat_ver.issues.append(VerificationIssue(
+                beat_id=beat_ver.beat_id,
+                issue_type="suspicious_claim",
+                description="출처 표현('~에 따르면')이 있지만 Fact 참조가 없습니다",
+                severity="warning",
+                suggested_action=VerificationAction.ADD_SOURCE
+            ))
+            suspicious.append(beat_ver.beat_id)
+        
+        # 3. 숫자 교차검증 - 대본의 숫자가 인용 팩트에 실제 있는지
+        if beat_ver.fact_references and legacy_has_numbers(beat_ver.beat_text):
+            ref_fact_contents = []
+            for fr in beat_ver.fact_references:
+                fact = fact_map.get(fr.fact_id)
+                if fact:
+                    ref_fact_contents.append(fact.get("content", ""))
+            
+            unmatched = legacy_find_unmatched_numbers(beat_ver.beat_text, ref_fact_contents)
+            if unmatched:
+                beat_ver.issues.append(VerificationIssue(
+                    beat_id=beat_ver.beat_id,
+                    issue_type="unverified_number",
+                    description=f"출처에 없는 수치 사용: {', '.join(unmatched)}",
+                    severity="warning",
+                    suggested_action=VerificationAction.ADD_SOURCE
+                ))
+                suspicious.append(beat_ver.beat_id)
+    
+    return suspicious
+
+
+def legacy_has_numbers(text: str) -> bool:
+    """텍스트에 숫자/통계가 있는지 확인"""
+    # 패턴: 숫자 + % 또는 숫자 + 단위
+    patterns = [
+        r'\d+%',           # 40%
+        r'\d+억',          # 10억
+        r'\d+만',          # 100만
+        r'\d+배',          # 2배
+        r'\d+\.?\d*배',    # 1.5배
+    ]
+    
+    for pattern in patterns:
+        if re.search(pattern, text):
+            return True
+    return False
+
+
+def legacy_has_attribution_phrase(text: str) -> bool:
+    """출처 표현이 있는지 확인"""
+    phrases = [
+        "에 따르면",
+        "에 의하면",
+        "연구에서",
+        "보고서에서",
+        "발표했다",
+        "밝혔다",
+        "말했다",
+        "according to",
+        "research shows",
+        "study found"
+    ]
+    
+    for phrase in phrases:
+        if phrase in text.lower():
+            return True
+    return False
+
+
+def legacy_find_unmatched_numbers(beat_text: str, fact_contents: List[str]) -> List[str]:
+
+    """
+    대본 문장의 숫자+단위가 인용 팩트 원문에 없으면 반환.
+    할루시네이션 수치 탐지용.
+    """
+    patterns = [
+        r'\d[\d,\.]*\s*%',
+        r'\d[\d,\.]*\s*억',
+        r'\d[\d,\.]*\s*만',
+        r'\d[\d,\.]*\s*조',
+        r'\d[\d,\.]*\s*배',
+        r'\d[\d,\.]*\s*달러',
+        r'\d[\d,\.]*\s*원',
+        r'\d[\d,\.]*\s*명',
+    ]
+    
+    unmatched = []
+    all_fact_text = " ".join(fact_contents)
+    
+    for pattern in patterns:
+        matches = re.findall(pattern, beat_text)
+        for match in matches:
+            # 핵심 숫자 추출 (단위/공백 제거)
+            core_num = re.findall(r'[\d,\.]+', match)[0].replace(',', '')
+            # 1자리 숫자는 무시 ("2배" 등 흔한 표현)
+            if len(core_num.replace('.', '')) < 2:
+                continue
+            # 팩트 원문에 해당 숫자가 있는지 확인
+            if core_num not in all_fact_text:
+                unmatched.append(match.strip())
+    
+    return list(set(unmatched))
+
+
+def legacy_build_source_map(
+    beat_verifications: List[BeatVerification],
+    facts: List[Dict],
+    articles: List[Dict]
+) -> List[SourceMapEntry]:
+    """
+    출처 맵 생성
+    """
+    source_map = []
+    
+    # Article ID → Article 매핑
+    article_map = {a.get("id"): a for a in articles}
+    
+    for beat_ver in beat_verifications:
+        if not beat_ver.fact_references:
+            continue
+        
+        sources = []
+        for fact_ref in beat_ver.fact_references:
+            # Fact에서 article_id 찾기
+            fact = next((f for f in facts if f.get("id") == fact_ref.fact_id), None)
+            if not fact:
+                continue
+            
+            article_id = fact.get("article_id")
+            article = article_map.get(article_id, {})
+            
+            source = SourceInfo(
+                fact_id=fact_ref.fact_id,
+                article_id=article_id,
+                publisher=article.get("publisher", "Unknown"),
+                published_date=article.get("published_date"),
+                url=article.get("url"),
+                snippet=fact.get("content", "")[:150]
+            )
+            sources.append(source)
+        
+        if sources:
+            source_map.append(SourceMapEntry(
+                beat_id=beat_ver.beat_id,
+                sentence=beat_ver.beat_text[:100],
+                sources=sources
+            ))
+    
+    return source_map
+
+
+def run_linear(script, facts, articles):
+    fact_map = {f.get("id"): f for f in facts}
+    beat_verifications = verifier._lightweight_verify(script, SimpleNamespace(facts_by_id=fact_map))
+    legacy_find_suspicious_beats(beat_verifications, facts)
+    source_map = legacy_build_source_map(beat_verifications, facts, articles)
+    return _unverified(beat_verifications), source_map
+
+
+def run_indexed(script, facts, articles):
+    index = FactIndex(facts)
+    beat_verifications = verifier._lightweight_verify(script, index)
+    verifier._find_suspicious_beats(beat_verifications, index)
+    source_map = verifier._build_source_map(beat_verifications, index, articles)
+    return _unverified(beat_verifications), source_map
+
+
+def _unverified(beat_verifications):
+    return {
+        bv.beat_id for bv in beat_verifications
+        if any(issue.issue_type == "unverified_number" for issue in bv.issues)
+    }
+
+
+def bench(fn, args, runs: int):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), statistics.quantiles(samples, n=20)[18]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--beats", type=int, default=300)
+    parser.add_argument("--facts", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    inputs = make_inputs(args.beats, args.facts)
+    linear_unmatched, linear_map = run_linear(*inputs)
+    indexed_unmatched, indexed_map = run_indexed(*inputs)
+    assert linear_map == indexed_map, "Source Map이 다름"
+    assert indexed_unmatched <= linear_unmatched, "색인 방식에서 새 경고가 생김"
+    print(
+        f"출처에 없는 수치 경고: linear {len(linear_unmatched)}개 Beat → indexed {len(indexed_unmatched)}개 Beat "
+        f"(표기 차이 오탐 {len(linear_unmatched) - len(indexed_unmatched)}개 제거)"
+    )
+
+    print(f"Beat {args.beats}개, 팩트 {args.facts}개, {args.runs}회 (ms, median / p95)")
+    results = {}
+    for name, fn in (("linear", run_linear), ("indexed", run_indexed)):
+        median, p95 = bench(fn, inputs, args.runs)
+        results[name] = median
+        print(f"  {name:<8} {median:8.3f} / {p95:8.3f}")
+    print(f"  speedup  {results['linear'] / results['indexed']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
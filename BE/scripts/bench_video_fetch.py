@@ -0,0 +1,123 @@
+"""
+채널 분석 자막/댓글 추출 벤치마크 (직렬 vs 동시)
+
+로컬 가짜 YouTube API 서버(요청마다 --latency 초 지연)를 띄우고
+video_analyzer의 자막(Captions API) + 댓글 추출 시간을 비교한다.
+- serial:     자막 전체 → 댓글 전체, 동시 요청 1개 (기존 방식, 영상 간 0.5초 sleep 제외)
+- concurrent: fetch_transcripts_and_comments (자막/댓글 병렬, 공유 세마포어 + 커넥션 풀)
+
+사용법:
+    python scripts/bench_video_fetch.py [--videos 15] [--latency 0.2]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import video_analyzer
+from app.services.video_analyzer import VideoForAnalysis
+from app.services.youtube_service import YouTubeService
+
+_SRT = "1\n00:00:00,000 --> 00:00:03,000\n오늘은 벤치마크 자막입니다\n"
+
+
+def make_handler(latency: float):
+    class FakeYouTubeHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            url = urlparse(self.path)
+            if url.path.endswith("/captions"):
+                body = {"items": [{"id": "cap_" + parse_qs(url.query)["videoId"][0], "snippet": {"language": "ko"}}]}
+                self._send(200, json.dumps(body), "application/json")
+            elif "/captions/" in url.path:
+                self._send(200, _SRT, "text/plain")
+            elif url.path.endswith("/commentThreads"):
+                items = [
+                    {"snippet": {"topLevelComment": {"snippet": {"textDisplay": f"댓글 {i}", "likeCount": i}}}}
+                    for i in range(20)
+                ]
+                self._send(200, json.dumps({"items": items}), "application/json")
+            else:
+                self._send(404, "", "text/plain")
+
+        def _send(self, status: int, body: str, content_type: str):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    return FakeYouTubeHandler
+
+
+def make_videos(count: int):
+    return [
+        VideoForAnalysis(
+            id=f"v{i}", youtube_video_id=f"yt{i}", title=f"영상 {i}",
+            view_count=1000, like_count=10, comment_count=5,
+            duration_seconds=600, days_since_upload=10, selection_reason="latest",
+        )
+        for i in range(count)
+    ]
+
+
+async def run_serial(videos):
+    semaphore = asyncio.Semaphore(1)
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        transcripts = await video_analyzer.get_transcripts_for_videos(
+            videos, access_token="bench", client=client, semaphore=semaphore
+        )
+        comments = await video_analyzer.get_comments_for_videos(
+            videos, client=client, semaphore=semaphore
+        )
+    return transcripts, comments
+
+
+async def run_concurrent(videos):
+    return await video_analyzer.fetch_transcripts_and_comments(videos, access_token="bench")
+
+
+async def main(video_count: int, latency: float) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    YouTubeService.BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/youtube/v3"
+    video_analyzer.settings.youtube_api_key = video_analyzer.settings.youtube_api_key or "bench"
+
+    videos = make_videos(video_count)
+    print(f"영상 {video_count}개, 요청당 지연 {latency}s "
+          f"(영상당 요청 3건: captions.list + download + commentThreads)")
+    print(f"동시 요청 수 (concurrent): {video_analyzer.MAX_CONCURRENT_FETCHES}\n")
+
+    for name, runner in (("serial", run_serial), ("concurrent", run_concurrent)):
+        started = time.perf_counter()
+        transcripts, comments = await runner(videos)
+        elapsed = time.perf_counter() - started
+        ok_t = sum(1 for r in transcripts.values() if r.value)
+        ok_c = sum(1 for r in comments.values() if r.value)
+        print(f"{name:<11} {elapsed:6.2f}s  자막 {ok_t}/{video_count}, 댓글 {ok_c}/{video_count}")
+
+    legacy_sleep = 0.5 * video_count * 2
+    print(f"\n(기존 코드는 여기에 영상 간 sleep {legacy_sleep:.1f}s가 추가로 있었음)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--videos", type=int, default=15)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(main(args.videos, args.latency))
@@ -0,0 +1,113 @@
+"""
+Writer 컨텍스트 조립 마이크로벤치마크 (챕터마다 재조립 vs WriterContext 1회 생성)
+
+Writer 1회 실행에서 LLM 호출 전에 하는 컨텍스트 작업만 측정한다.
+- rebuild: 기존 방식 — 챕터마다 전체 컨텍스트를 새로 조립 (채널/블루프린트/의견 섹션, 기사 번호 매핑),
+           인용번호 매핑을 따로 한 번 더 계산, 사용 팩트 요약은 next(...) 선형 탐색
+- cached:  WriterContext 1회 생성 후 챕터별로 팩트 필터링/요약(delta)만 조립
+
+두 방식의 챕터 프롬프트가 같은지도 확인한다.
+
+사용법:
+    python scripts/bench_writer_context.py [--facts 200] [--chapters 10] [--runs 200]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.script_gen.nodes.writer import WriterContext
+
+
+def make_inputs(n_facts: int, n_chapters: int):
+    facts = [
+        {
+            "id": f"f{i}", "source_index": i % 12, "source_name": f"언론사{i % 12}",
+            "content": f"{i}번째 팩트: 2025년 3분기 매출은 전년 대비 {i % 40 + 1}.{i % 10}% 증가했다. " * 2,
+        }
+        for i in range(n_facts)
+    ]
+    per_chapter = n_facts // n_chapters
+    plans = [
+        {
+            "title": f"챕터 {c}", "goal": "흐름 설명",
+            "required_facts": [f"f{i}" for i in range(c * per_chapter, (c + 1) * per_chapter)],
+        }
+        for c in range(n_chapters)
+    ]
+    channel = {
+        "name": "벤치 채널", "target_audience": "직장인", "persona_summary": "경제 해설",
+        "tone_manner": "친근한 설명체", "tone_samples": [f"샘플 문장 {i}이거든요" for i in range(5)],
+        "hit_patterns": ["숫자로 시작"], "low_patterns": ["나열식"],
+        "content_structures": {"해설": "훅 → 배경 → 분석 → 전망"},
+    }
+    insight = {
+        "positioning": {"thesis": "벤치"}, "hook_plan": {"hook_type": "curiosity"},
+        "story_structure": {"chapters": plans},
+    }
+    opinions = [f"[언론사{i % 12}] 전문가 의견 {i}" for i in range(20)]
+    return channel, insight, facts, opinions, plans
+
+
+def run_rebuild(channel, insight, facts, opinions, plans):
+    """챕터마다 전체 재조립 + 선형 탐색 (기존 writer_node의 컨텍스트 작업)"""
+    prompts = []
+    WriterContext(channel, insight, facts, opinions).fact_marker_map  # 인용번호 매핑 (별도 전체 순회)
+    base = WriterContext(channel, insight, facts, opinions).base
+    used = []
+    for i, plan in enumerate(plans, 1):
+        prompts.append(
+            WriterContext(channel, insight, facts, opinions).for_chapter(set(plan["required_facts"]), used or None)
+        )
+        for ref_id in plan["required_facts"]:
+            fact_obj = next((f for f in facts if f.get("id") == ref_id), None)
+            if fact_obj:
+                used.append(f"\"{fact_obj.get('content', '')[:50]}\" (Ch{i}에서 사용됨)")
+    return base, prompts
+
+
+def run_cached(channel, insight, facts, opinions, plans):
+    """WriterContext 1회 생성 + 챕터별 delta"""
+    prompts = []
+    ctx = WriterContext(channel, insight, facts, opinions)
+    used = []
+    for i, plan in enumerate(plans, 1):
+        prompts.append(ctx.for_chapter(set(plan["required_facts"]), used or None))
+        used.extend(ctx.used_summary(plan["required_facts"], i))
+    return ctx.base, prompts
+
+
+def bench(fn, args, runs: int):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), statistics.quantiles(samples, n=20)[18]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--facts", type=int, default=200)
+    parser.add_argument("--chapters", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    inputs = make_inputs(args.facts, args.chapters)
+    assert run_rebuild(*inputs) == run_cached(*inputs), "챕터 프롬프트가 다름"
+
+    print(f"팩트 {args.facts}개, 챕터 {args.chapters}개, {args.runs}회 (ms, median / p95)")
+    results = {}
+    for name, fn in (("rebuild", run_rebuild), ("cached", run_cached)):
+        median, p95 = bench(fn, inputs, args.runs)
+        results[name] = median
+        print(f"  {name:<8} {median:8.3f} / {p95:8.3f}")
+    print(f"  speedup  {results['rebuild'] / results['cached']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
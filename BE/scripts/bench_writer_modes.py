@@ -0,0 +1,114 @@
+"""
+Writer 작성 모드 벤치마크 (sequential vs parallel)
+
+writer_node를 모드별로 실행해 작성 시간(metadata.writer_timing.wall_time_sec)과
+첫 Beat까지 걸린 시간(time_to_first_beat_sec, WRITER_STREAM=1일 때)을 비교한다.
+LLM 호출(_generate_intro / _generate_chapter / _generate_outro / 경계 다듬기)은
+지정한 지연만큼 기다린 뒤 고정 결과를 돌려주는 가짜 호출로 바꾸므로 API 키 없이 실행된다.
+
+사용법:
+    python scripts/bench_writer_modes.py [--chapters 6] [--chapter-latency 8.0] \
+        [--intro-latency 3.0] [--outro-latency 2.0] [--smooth-latency 1.5] [--concurrency 3]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.script_gen.nodes import writer
+from src.script_gen.nodes.writer import Beat, Chapter, Closing, Hook, TransitionPass
+
+
+def make_state(chapters: int, mode: str) -> dict:
+    facts = [
+        {"id": f"f{i}", "content": f"팩트 {i} 내용", "source_index": i % 5, "source_name": f"언론사{i % 5}"}
+        for i in range(chapters * 3)
+    ]
+    plans = [
+        {
+            "title": f"챕터 {c}", "goal": "설명", "key_points": ["포인트"],
+            "required_facts": [f"f{c * 3 + k}" for k in range(3)],
+        }
+        for c in range(chapters)
+    ]
+    return {
+        "topic_request_id": "bench",
+        "writer_mode": mode,
+        "channel_profile": {"name": "벤치 채널"},
+        "insight_pack": {"positioning": {"thesis": "벤치"}, "story_structure": {"chapters": plans}},
+        "news_data": {"structured_facts": facts, "structured_opinions": []},
+    }
+
+
+def install_fakes(args) -> None:
+    async def fake_intro(context_str):
+        await asyncio.sleep(args.intro_latency)
+        return Hook(text="훅①", fact_references=["f0"])
+
+    async def fake_chapter(context_str, chapter_plan, chapter_index, previous_openings=None,
+                           must_include_facts=None, progress=None):
+        refs = chapter_plan["required_facts"]
+        beats = [Beat(beat_id=f"b{k}", purpose="evidence", line=f"문단 {k}", fact_references=[r])
+                 for k, r in enumerate(refs)]
+        # 스트리밍: Beat가 지연 시간에 걸쳐 하나씩 완성됨
+        for beat in beats:
+            await asyncio.sleep(args.chapter_latency / len(beats))
+            if progress:
+                await progress.emit(beat)
+        return Chapter(chapter_id=str(chapter_index), title=chapter_plan["title"], beats=beats)
+
+    async def fake_outro(context_str):
+        await asyncio.sleep(args.outro_latency)
+        return Closing(text="마무리", cta="구독")
+
+    class FakeStructured:
+        async def ainvoke(self, messages):
+            await asyncio.sleep(args.smooth_latency)
+            return TransitionPass(transitions=[])
+
+    class FakeLLM:
+        def __init__(self, **kwargs):
+            pass
+
+        def with_structured_output(self, schema):
+            return FakeStructured()
+
+    writer._generate_intro = fake_intro
+    writer._generate_chapter = fake_chapter
+    writer._generate_outro = fake_outro
+    writer.ChatOpenAI = FakeLLM
+    writer.WRITER_CHAPTER_CONCURRENCY = args.concurrency
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chapters", type=int, default=6)
+    parser.add_argument("--chapter-latency", type=float, default=8.0)
+    parser.add_argument("--intro-latency", type=float, default=3.0)
+    parser.add_argument("--outro-latency", type=float, default=2.0)
+    parser.add_argument("--smooth-latency", type=float, default=1.5)
+    parser.add_argument("--concurrency", type=int, default=3)
+    args = parser.parse_args()
+
+    install_fakes(args)
+
+    print(f"챕터 {args.chapters}개, 챕터 지연 {args.chapter_latency}s, 동시 생성 {args.concurrency}")
+    results = {}
+    for mode in ("sequential", "parallel"):
+        out = await writer.writer_node(make_state(args.chapters, mode))
+        timing = out["script_draft"]["metadata"]["writer_timing"]
+        results[mode] = timing["wall_time_sec"]
+        print(
+            f"  {mode:<10} {timing['wall_time_sec']:>7.2f}s  "
+            f"첫 Beat {timing.get('time_to_first_beat_sec')}s  {timing}"
+        )
+
+    if results["parallel"]:
+        print(f"  speedup    {results['sequential'] / results['parallel']:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+"""
+채널 분석 롤업 정합성 검사
+
+모든 채널의 롤업(yt_channel_*_rollups)을 원본 행 재집계 결과와 비교한다.
+--fix를 주면 롤업이 없거나 어긋난 채널을 다시 계산한 뒤 재검사한다
+(alembic p7q8r9s0t1u2 직후 기존 채널 롤업을 채울 때도 사용).
+
+사용법:
+    python scripts/check_analytics_rollups.py [--fix] [--channel UC...]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from app.core.db import AsyncSessionLocal
+from app.models.youtube_channel import YouTubeChannel
+from app.services.analytics_rollup_service import AnalyticsRollupService
+
+
+async def main(fix: bool, channel_id: str = None) -> int:
+    async with AsyncSessionLocal() as db:
+        if channel_id:
+            channel_ids = [channel_id]
+        else:
+            result = await db.execute(select(YouTubeChannel.channel_id).order_by(YouTubeChannel.channel_id))
+            channel_ids = list(result.scalars())
+
+    mismatched = 0
+    for cid in channel_ids:
+        # 채널마다 새 세션 (identity map에 남은 이전 롤업 값을 읽지 않도록)
+        async with AsyncSessionLocal() as db:
+            problems = await AnalyticsRollupService.check_consistency(db, cid)
+
+        if problems and fix:
+            async with AsyncSessionLocal() as db:
+                if await AnalyticsRollupService.refresh_channel(db, cid):
+                    await db.commit()
+            async with AsyncSessionLocal() as db:
+                problems = await AnalyticsRollupService.check_consistency(db, cid)
+
+        if problems:
+            mismatched += 1
+            print(f"❌ {cid}")
+            for problem in problems:
+                print(f"    {problem}")
+        else:
+            print(f"✅ {cid}")
+
+    print(f"\n채널 {len(channel_ids)}개 중 불일치 {mismatched}개")
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fix", action="store_true", help="불일치 채널 롤업 다시 계산")
+    parser.add_argument("--channel", help="특정 채널만 검사")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.fix, args.channel)))
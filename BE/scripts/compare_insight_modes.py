@@ -0,0 +1,169 @@
+"""
+Insight Builder 모드 비교 (two_pass vs single_pass) — 품질 / 지연 시간
+
+기록해 둔 노드 입력(INSIGHT_RECORD_DIR=<dir> 로 파이프라인을 돌리면 <topic_request_id>.json 으로 저장됨)을
+모드별로 insight_builder_node에 다시 넣고 결과를 비교한다. 실제 Claude를 호출하므로 ANTHROPIC_API_KEY가 필요하다.
+
+품질 지표 (결정적 규칙 검사, 높을수록 좋음):
+    - valid_fact_ratio : 챕터 required_facts / 훅 uses_fact_ids 중 실제 팩트 ID 비율
+    - chapter_fact_ok  : required_facts가 1~3개인 챕터 비율
+    - hook_uses_facts  : 팩트를 쓰는 훅 스크립트 비율
+    - distinct_facts   : 전략 전체에서 쓴 서로 다른 팩트 수
+    - complete         : 썸네일 컨셉 / 작성 지침(톤) / thesis(한국어) 존재 여부
+    - score            : 위 비율 지표 + complete 평균 (0~1)
+
+사용법:
+    python scripts/compare_insight_modes.py <기록 디렉터리 또는 json ...> [--repeat 1] [--out result.json]
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.script_gen.nodes import insight_builder_2
+
+MODES = insight_builder_2.INSIGHT_MODES
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def load_records(paths: List[str]) -> List[Dict]:
+    files = []
+    for path in paths:
+        files.extend(sorted(glob.glob(os.path.join(path, "*.json"))) if os.path.isdir(path) else [path])
+    records = []
+    for file in files:
+        with open(file, encoding="utf-8") as f:
+            record = json.load(f)
+        record.setdefault("topic_request_id", os.path.splitext(os.path.basename(file))[0])
+        records.append(record)
+    return records
+
+
+def quality(pack: Dict, fact_ids: set) -> Dict:
+    chapters = pack.get("story_structure", {}).get("chapters", [])
+    hook_plan = pack.get("hook_plan", {})
+    hooks = hook_plan.get("hook_scripts", [])
+
+    cited = [fid for ch in chapters for fid in ch.get("required_facts", [])]
+    cited += [fid for h in hooks for fid in h.get("uses_fact_ids", [])]
+    complete = all([
+        hook_plan.get("thumbnail_angle", {}).get("concept"),
+        pack.get("writer_instructions", {}).get("tone"),
+        _HANGUL.search(pack.get("positioning", {}).get("thesis", "")),
+    ])
+
+    metrics = {
+        "valid_fact_ratio": sum(fid in fact_ids for fid in cited) / len(cited) if cited else 0.0,
+        "chapter_fact_ok": (
+            sum(1 <= len(ch.get("required_facts", [])) <= 3 for ch in chapters) / len(chapters) if chapters else 0.0
+        ),
+        "hook_uses_facts": sum(bool(h.get("uses_fact_ids")) for h in hooks) / len(hooks) if hooks else 0.0,
+        "complete": 1.0 if complete else 0.0,
+    }
+    metrics["score"] = round(statistics.mean(metrics.values()), 3)
+    metrics["distinct_facts"] = len(set(cited) & fact_ids)
+    return metrics
+
+
+def variant_of(mode: str, timing: Dict) -> str:
+    """요약 집계 단위: 폴백한 실행은 요청 모드가 아니라 '요청->실제' 모드로 따로 집계"""
+    if timing.get("fallback_from"):
+        return f"{timing['fallback_from']}->{timing['mode']}"
+    return timing.get("mode", mode)
+
+
+async def run_one(record: Dict, mode: str) -> Dict:
+    state = {**record, "insight_mode": mode}
+    started = time.perf_counter()
+    try:
+        out = await insight_builder_2.insight_builder_node(state)
+    except Exception as e:
+        return {"mode": mode, "error": str(e), "latency_sec": round(time.perf_counter() - started, 2)}
+    pack = out["insight_pack"]
+    timing = pack.get("insight_timing") or {}
+    fact_ids = {f.get("id") for f in record.get("news_data", {}).get("structured_facts", [])}
+    return {
+        "mode": mode,
+        "variant": variant_of(mode, timing),
+        "latency_sec": round(time.perf_counter() - started, 2),
+        "timing": timing,
+        "quality": quality(pack, fact_ids),
+        "thesis": pack.get("positioning", {}).get("thesis"),
+        "self_critique": pack.get("self_critique", []),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs="+", help="기록 디렉터리 또는 JSON 파일")
+    parser.add_argument("--repeat", type=int, default=1, help="입력·모드별 반복 횟수")
+    parser.add_argument("--out", help="전체 결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    records = load_records(args.inputs)
+    if not records:
+        sys.exit("기록된 입력이 없습니다")
+
+    results = []
+    runs = [record for record in records for _ in range(args.repeat)]
+    for i, record in enumerate(runs):
+        # 실행마다 모드 순서를 번갈아 바꿈 (프롬프트 캐시 등 순서 효과 완화)
+        order = MODES if i % 2 == 0 else tuple(reversed(MODES))
+        for mode in order:
+            result = await run_one(record, mode)
+            result["topic_request_id"] = record["topic_request_id"]
+            results.append(result)
+            if "error" in result:
+                print(f"  {record['topic_request_id']:<20} {mode:<22} 실패: {result['error']}")
+            else:
+                q = result["quality"]
+                print(
+                    f"  {record['topic_request_id']:<20} {result['variant']:<22} {result['latency_sec']:>6.2f}s  "
+                    f"score {q['score']:.3f}  facts {q['distinct_facts']:>2}  {result['timing']}"
+                )
+
+    print(f"\n입력 {len(records)}개 × {args.repeat}회 (latency median / max, LLM 호출 평균, 품질 score 평균)")
+    print("  폴백한 실행(single_pass->two_pass)은 single_pass에 섞지 않고 따로 집계")
+    summary = {}
+    variants = list(MODES) + sorted({r["variant"] for r in results if "variant" in r} - set(MODES))
+    for variant in variants:
+        ok = [r for r in results if r.get("variant") == variant]
+        failed = sum(1 for r in results if r["mode"] == variant and "error" in r)
+        if not ok:
+            print(f"  {variant:<22} 성공 결과 없음 (실패 {failed})")
+            continue
+        latencies = [r["latency_sec"] for r in ok]
+        summary[variant] = {
+            "runs": len(ok),
+            "latency_median_sec": round(statistics.median(latencies), 2),
+            "latency_max_sec": round(max(latencies), 2),
+            "llm_calls_mean": round(statistics.mean(r["timing"].get("llm_calls", 0) for r in ok), 2),
+            "score_mean": round(statistics.mean(r["quality"]["score"] for r in ok), 3),
+            "distinct_facts_mean": round(statistics.mean(r["quality"]["distinct_facts"] for r in ok), 1),
+            "failed": failed,
+        }
+        s = summary[variant]
+        print(
+            f"  {variant:<22} {s['runs']:>3}회  {s['latency_median_sec']:>6.2f}s / {s['latency_max_sec']:>6.2f}s  "
+            f"calls {s['llm_calls_mean']}  score {s['score_mean']:.3f}  facts {s['distinct_facts_mean']}  실패 {failed}"
+        )
+    if "two_pass" in summary and summary.get("single_pass", {}).get("latency_median_sec"):
+        print(f"  speedup (폴백 제외)    {summary['two_pass']['latency_median_sec'] / summary['single_pass']['latency_median_sec']:.2f}x")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"summary": summary, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
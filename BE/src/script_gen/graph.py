@@ -12,6 +12,7 @@ Workflow (Full Pipeline):
     → Insight Builder (전략 수립)
     → Writer (대본 작성)
     → Verifier (팩트 체크 & 출처 정리)
+      ⇄ Writer Rewrite (critical 이슈 Beat만 재작성 → 바뀐 Beat만 재검증, 최대 WRITER_MAX_REWRITE_ROUNDS회)
     → Output (Verified ScriptDraft)
 
 Note: Trend Scout는 topic_recommendations로 대체됨 (주석처리)
@@ -29,7 +30,7 @@ from src.script_gen.nodes.yt_fetcher import yt_fetcher_node
 from src.script_gen.nodes.competitor_anal import competitor_anal_node
 # from src.script_gen.nodes.insight_builder import insight_builder_node
 from src.script_gen.nodes.insight_builder_2 import insight_builder_node  
-from src.script_gen.nodes.writer import writer_node
+from src.script_gen.nodes.writer import writer_node, writer_rewrite_node, WRITER_MAX_REWRITE_ROUNDS
 from src.script_gen.nodes.verifier import verifier_node
 # from src.script_gen.nodes.trend_scout import trend_scout_node  # 주석처리: topic_recommendations로 대체
 
@@ -40,6 +41,20 @@ logger = logging.getLogger(__name__)
 # Graph Construction
 # =============================================================================
 
+def needs_rewrite(verifier_output: dict, rounds_done: int) -> bool:
+    """critical 이슈가 남아 있고 재작성 라운드가 남았으면 True"""
+    if rounds_done >= WRITER_MAX_REWRITE_ROUNDS or not verifier_output:
+        return False
+    issues = (verifier_output.get("verification_report") or {}).get("issues", [])
+    return any(issue.get("severity") == "critical" for issue in issues)
+
+
+def _route_after_verifier(state: dict) -> str:
+    if needs_rewrite(state.get("verifier_output"), state.get("verifier_retry_count", 0)):
+        return "writer_rewrite"
+    return END
+
+
 def create_script_gen_graph():
     """Script Generation Graph 생성 (전체 파이프라인)"""
 
@@ -56,6 +71,7 @@ def create_script_gen_graph():
     workflow.add_node("insight_builder", insight_builder_node)
     workflow.add_node("writer", writer_node)
     workflow.add_node("verifier", verifier_node)
+    workflow.add_node("writer_rewrite", writer_rewrite_node)
 
     # 3. 엣지 연결
     workflow.set_entry_point("intent_analyzer")
@@ -78,12 +94,15 @@ def create_script_gen_graph():
 
     workflow.add_edge("insight_builder", "writer")
     workflow.add_edge("writer", "verifier")
-    workflow.add_edge("verifier", END)
+
+    # Verifier critical 이슈 → 해당 Beat만 재작성 → 재검증 (bounded loop)
+    workflow.add_conditional_edges("verifier", _route_after_verifier, ["writer_rewrite", END])
+    workflow.add_edge("writer_rewrite", "verifier")
 
     # 4. 컴파일
     app = workflow.compile()
 
-    logger.info("Script Generation Graph 생성 완료 (Full Pipeline: 9 nodes)")
+    logger.info("Script Generation Graph 생성 완료 (Full Pipeline: 10 nodes)")
     return app
 
 
@@ -105,6 +124,10 @@ PIPELINE_STEPS = [
     {"key": "verifier",         "label": "팩트 체크 검증",                     "emoji": "✅", "nodes": ["verifier"]},
 ]
 
+# 스텝 그룹에 속하지 않는 보조 노드 → 진행 상황을 표시할 스텝 key
+# (writer_rewrite는 재작성 루프에서만 실행되므로 verifier 스텝 완료 조건에 넣지 않음)
+_AUX_NODE_TO_STEP = {"writer_rewrite": "verifier"}
+
 # 노드 이름 → 스텝 key 역매핑
 _NODE_TO_STEP = {}
 for _step in PIPELINE_STEPS:
@@ -119,6 +142,7 @@ async def generate_script(
     channel_profile: dict,
     topic_request_id: str = None,
     progress_callback=None,
+    user_id: str = None,
 ) -> dict:
     """
     주제를 입력받아 전체 파이프라인을 실행합니다.
@@ -128,6 +152,7 @@ async def generate_script(
         channel_profile: 채널 정보 (name, tone, target_audience 등)
         topic_request_id: 요청 ID (선택)
         progress_callback: 진행 상황 콜백 (step_key, status) → Celery update_state용
+        user_id: 요청한 사용자 ID (선택, 사용자 범위 DB 조회용)
 
     Returns:
         ScriptDraft dict (최종 대본, news_data, competitor_data 포함)
@@ -141,6 +166,7 @@ async def generate_script(
     initial_state = {
         "topic": topic,
         "topic_request_id": topic_request_id,
+        "user_id": str(user_id) if user_id else None,
         "channel_profile": channel_profile,
         "intent_analysis": {},
         "trend_data": {},
@@ -148,6 +174,7 @@ async def generate_script(
         "news_data": {},
         "insight_pack": {},
         "script_draft": {},
+        "verifier_retry_count": 0,
         "competitor_data": None,
         "youtube_data": None
     }
@@ -161,6 +188,7 @@ async def generate_script(
         final_state = None
         completed_nodes = set()    # 개별 노드 완료 추적
         completed_steps = []       # UI 스텝 완료 추적
+        rewrite_rounds = 0         # Verifier 재작성 루프 라운드
 
         def _notify(current_step_key, message):
             """진행 상황을 콜백으로 전달"""
@@ -175,6 +203,27 @@ async def generate_script(
             kind = event.get("event", "")
             name = event.get("name", "")
 
+            # Writer 스트리밍 진행 (완성된 Beat마다)
+            if kind == "on_custom_event" and name == "writer_progress":
+                data = event.get("data") or {}
+                _notify(
+                    "writer",
+                    f"✍️ 스크립트 작성 중... (챕터 {data.get('chapter')}/{data.get('total_chapters')}, "
+                    f"문단 {data.get('total_beats')}개 완성)",
+                )
+                continue
+
+            # Verifier 재작성 루프
+            if name in _AUX_NODE_TO_STEP:
+                if kind == "on_chain_start":
+                    rewrite_rounds += 1
+                    _notify(
+                        _AUX_NODE_TO_STEP[name],
+                        f"✍️ 검증 이슈 문단 수정 중... ({rewrite_rounds}/{WRITER_MAX_REWRITE_ROUNDS})",
+                    )
+                    logger.info(f"▶ Node 시작: {name} (round {rewrite_rounds})")
+                continue
+
             if name not in ALL_NODE_NAMES:
                 # 최종 결과 수집
                 if kind == "on_chain_end" and event.get("data", {}).get("output"):
@@ -197,6 +246,13 @@ async def generate_script(
                 completed_nodes.add(name)
                 logger.info(f"✓ Node 완료: {name}")
 
+                # 재작성 루프로 이어지면 아직 완료 아님
+                if name == "verifier":
+                    output = event.get("data", {}).get("output") or {}
+                    if isinstance(output, dict) and needs_rewrite(output.get("verifier_output"), rewrite_rounds):
+                        _notify(step_key, f"{step_info['emoji']} 검증 이슈 발견, 해당 문단만 수정합니다")
+                        continue
+
                 # 그룹 내 모든 노드가 완료되었는지 확인
                 group_nodes = set(step_info["nodes"])
                 if group_nodes.issubset(completed_nodes) and step_key not in completed_steps:
@@ -14,20 +14,29 @@ News Research Node가 수집한 각 기사의 본문을 읽고
 각 기사 article["analysis"]["key_points"]  → 핵심 포인트 서술 (팝업 상세보기용)
 news_data["structured_facts"]              → insight_builder 호환 팩트 (ID+카테고리 포함)
 news_data["structured_opinions"]           → 의견 전체 모음
+news_data["analysis_metrics"]              → 기사별 지연 시간·재시도·토큰 사용량
+
+[동시 실행]
+기사들은 AdaptiveConcurrency로 동시에 분석합니다. 429를 받으면 동시 실행 수를 절반으로 줄이고
+Retry-After 동안 새 호출을 멈추며 (news_research 이미지 분석과 TPM을 나눠 쓰므로),
+성공이 이어지면 ARTICLE_ANALYZER_MAX_CONCURRENCY까지 1씩 늘립니다.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import asyncio
-import json
 import logging
 import os
+import time
 import uuid
 
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 from dotenv import load_dotenv
 
+from app.core.prompt_budget import PromptBudget
+from app.services.rate_limit_gate import AdaptiveConcurrency, parse_retry_after
 from src.script_gen.nodes.news_research import _extract_source_from_url
+from src.script_gen.schemas.article import ArticleAnalysis
 
 load_dotenv()
 
@@ -35,10 +44,13 @@ logger = logging.getLogger(__name__)
 
 # 설정
 MODEL_NAME = "gpt-4o"
-MAX_CONCURRENT = 1          # 순차 처리 → news_research 이미지 분석과 TPM 충돌 방지
-MAX_CONTENT_LENGTH = 6000   # 기사당 최대 분석 본문 길이 (토큰 절약)
-MAX_RETRY = 4               # 429 재시도 최대 횟수
-RETRY_BASE_DELAY = 5.0      # 재시도 초기 대기 시간 (초)
+INITIAL_CONCURRENCY = int(os.getenv("ARTICLE_ANALYZER_INITIAL_CONCURRENCY", "2"))  # 시작 동시 실행 수
+MAX_CONCURRENCY = int(os.getenv("ARTICLE_ANALYZER_MAX_CONCURRENCY", "6"))          # 429가 없을 때 늘릴 수 있는 상한
+PROMPT_TOKEN_BUDGET = 4000  # 기사당 프롬프트 가변 섹션(본문 + 시각 자료) 토큰 예산
+VISUALS_TOKEN_BUDGET = 300  # 그중 시각 자료 설명 상한 (본문보다 먼저 배정)
+MAX_RETRY = 4               # 429를 받을 때 최대 시도 횟수 (재시도 3회)
+MAX_PARSE_RETRY = 1         # 스키마 검증 실패 재시도 횟수
+RETRY_BASE_DELAY = 5.0      # Retry-After가 없을 때 재시도 초기 대기 시간 (초)
 
 
 async def article_analyzer_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -53,6 +65,7 @@ async def article_analyzer_node(state: Dict[str, Any]) -> Dict[str, Any]:
         news_data.articles          : analysis 필드가 채워진 기사 목록
         news_data.structured_facts  : insight_builder 호환 팩트 리스트
         news_data.structured_opinions : 의견 전체 모음
+        news_data.analysis_metrics  : 기사별 latency/재시도/토큰 + 동시 실행 요약
     """
     logger.info("[Article Analyzer] 기사 심층 분석 시작")
 
@@ -69,13 +82,18 @@ async def article_analyzer_node(state: Dict[str, Any]) -> Dict[str, Any]:
         logger.error("[Article Analyzer] OPENAI_API_KEY 없음 → 분석 건너뜀")
         return {}
 
-    llm = ChatOpenAI(model=MODEL_NAME, api_key=api_key, temperature=0.2)
+    # 재시도는 아래 루프에서 직접 처리 (SDK 내부 재시도는 429/Retry-After를 리미터에 알리지 못함)
+    llm = ChatOpenAI(model=MODEL_NAME, api_key=api_key, temperature=0.2, max_retries=0)
+    structured_llm = llm.with_structured_output(ArticleAnalysis, include_raw=True)
+    limiter = AdaptiveConcurrency(
+        "article_analyzer", initial=INITIAL_CONCURRENCY, maximum=MAX_CONCURRENCY
+    )
 
     # ------------------------------------------------------------------
     # 단일 기사 분석 함수 (asyncio.gather에서 병렬 실행)
     # ------------------------------------------------------------------
-    async def analyze_single_article(article: Dict) -> Dict:
-        """기사 본문 → 팩트·의견·핵심포인트 추출"""
+    async def analyze_single_article(article: Dict, metrics: Dict) -> Dict:
+        """기사 본문 → 팩트·의견·핵심포인트 추출 (metrics에 지연 시간/재시도/토큰 기록)"""
         content = article.get("content", "")
         title = article.get("title", "")
         url = article.get("url", "")
@@ -100,10 +118,9 @@ async def article_analyzer_node(state: Dict[str, Any]) -> Dict[str, Any]:
                     "facts": [], "opinions": [], "key_points": []
                 }
                 logger.info(f"[Article Analyzer] 본문 부족, 건너뜀: {title[:40]}")
+            metrics["status"] = "skipped"
             return article
 
-        input_text = content[:MAX_CONTENT_LENGTH]
-
         # 이미지/차트 컨텍스트 추가 (분석 힌트 제공)
         visual_context = ""
         if has_visuals:
@@ -119,6 +136,17 @@ async def article_analyzer_node(state: Dict[str, Any]) -> Dict[str, Any]:
             if visual_items:
                 visual_context = f"\n\n[기사 내 시각 자료]\n" + "\n".join(visual_items)
 
+        # 토큰 예산 배정: 시각 자료 설명 → 본문 (본문은 문장 경계에서 자름)
+        allocated = (
+            PromptBudget(PROMPT_TOKEN_BUDGET)
+            .add("visuals", visual_context, priority=0, max_tokens=VISUALS_TOKEN_BUDGET)
+            .add("body", content, priority=1)
+            .allocate()
+        )
+        input_text = allocated.sections["body"]
+        visual_context = allocated.sections["visuals"]
+        logger.info(f"[Article Analyzer] 프롬프트 토큰 {allocated.summary()}: {title[:40]}")
+
         prompt = f"""당신은 YouTube 크리에이터의 리서치 어시스턴트입니다.
 
 [영상 주제]
@@ -130,52 +158,74 @@ async def article_analyzer_node(state: Dict[str, Any]) -> Dict[str, Any]:
 [기사 본문]
 {input_text}{visual_context}
 
-위 기사를 꼼꼼히 읽고, 아래 JSON 형식으로만 응답하세요 (설명 없이):
-
-{{
-  "source": "언론사/출처명 (예: 매일경제, TechCrunch, 네이버 블로그)",
-  "summary_short": "기사 핵심 1문장 요약 (한국어, 40자 이내)",
-  "analysis": {{
-    "key_points": [
-      "이 기사가 영상 주제와 관련하여 말하는 핵심 포인트 1 (서술형 완결 문장, 한국어)",
-      "핵심 포인트 2",
-      "핵심 포인트 3"
-    ],
-    "facts": [
-      {{
-        "content": "팩트 내용 (완결된 한 문장, 한국어)",
-        "category": "Statistic | Event | Quote | Fact",
-        "value": "핵심 수치·키워드 (없으면 null)"
-      }}
-    ],
-    "opinions": [
-      "[태그] 발언자/기관명: 의견 내용 (한국어)"
-    ]
-  }}
-}}
-
-[key_points] 3~5개 서술형, [facts] 3~6개, [opinions] 발언자 필수. JSON만 반환."""
-
-        # ── 재시도 루프 (429 Rate Limit 대응) ──────────────────────────────
+위 기사를 꼼꼼히 읽고 출처명, 1문장 요약, 분석 결과(key_points / facts / opinions)를 정리하세요.
+
+[key_points] 3~5개 서술형, [facts] 3~6개, [opinions] 발언자 필수."""
+
+        # ── 재시도 루프 (429 → 리미터에 알리고 Retry-After만큼 대기) ─────────────
         last_error = None
-        for attempt in range(MAX_RETRY):
+        data: Optional[ArticleAnalysis] = None
+        parse_failures = 0
+        attempt = 0
+        while attempt < MAX_RETRY:
+            acquired_at = await limiter.acquire()
             try:
-                delay = RETRY_BASE_DELAY * (2 ** attempt)  # 지수 백오프: 5s, 10s, 20s, 40s
-                if attempt > 0:
-                    logger.info(
-                        f"[Article Analyzer] 재시도 {attempt}/{MAX_RETRY-1} "
-                        f"({delay:.0f}초 대기): {title[:40]}"
-                    )
-                    await asyncio.sleep(delay)
-
-                res = await llm.ainvoke([HumanMessage(content=prompt)])
-                raw = res.content.replace("```json", "").replace("```", "").strip()
-                data = json.loads(raw)
+                result = await structured_llm.ainvoke([HumanMessage(content=prompt)])
+            except Exception as e:
+                if not _is_rate_limited(e):
+                    await limiter.release()
+                    logger.warning(f"[Article Analyzer] 분석 실패 ({title[:40]}): {e}")
+                    last_error = e
+                    break  # 다른 에러는 재시도 안 함
 
+                attempt += 1
+                last_error = e
+                metrics["throttled"] += 1
+                if attempt >= MAX_RETRY:
+                    # 더 재시도하지 않으므로 한도만 줄이고 다른 기사의 새 호출은 막지 않음
+                    limiter.throttle(acquired_at, 0.0)
+                    await limiter.release()
+                    logger.warning(
+                        f"[Article Analyzer] Rate limit 429 ({title[:40]}) → 재시도 소진 ({MAX_RETRY}회 시도), "
+                        f"동시 실행 {limiter.limit}"
+                    )
+                    break
+
+                wait = _retry_after(e) or RETRY_BASE_DELAY * (2 ** (attempt - 1))  # 헤더 없으면 5s, 10s, 20s
+                limiter.throttle(acquired_at, wait)
+                await limiter.release()
+                metrics["retries"] += 1
+                metrics["retry_wait_sec"] += wait
+                logger.warning(
+                    f"[Article Analyzer] Rate limit 429 ({title[:40]}) → attempt {attempt}/{MAX_RETRY}, "
+                    f"{wait:.1f}초 대기, 동시 실행 {limiter.limit}"
+                )
+                continue
+
+            _add_usage(metrics, result.get("raw"))
+            data = result.get("parsed")
+            if data is None:
+                # 스키마 검증 실패 → 1회만 재시도
+                await limiter.release()
+                last_error = result.get("parsing_error") or ValueError("구조화 출력 없음")
+                logger.warning(f"[Article Analyzer] 스키마 검증 실패 ({title[:40]}): {last_error}")
+                parse_failures += 1
+                if parse_failures > MAX_PARSE_RETRY:
+                    break
+                metrics["parse_retries"] += 1
+                metrics["retries"] += 1
+                continue
+
+            await limiter.release(succeeded=True)
+            last_error = None
+            break
+
+        if data is not None:
+            try:
                 # ── 출처명 결정: URL 맵 → og:site_name → GPT 순서 ──
                 url_source = _extract_source_from_url(url)
                 og_source = article.get("og_source", "")
-                gpt_source = data.get("source", "")
+                gpt_source = data.source
 
                 if url_source:
                     article["source"] = url_source
@@ -187,22 +237,14 @@ async def article_analyzer_node(state: Dict[str, Any]) -> Dict[str, Any]:
                     article["source"] = og_source or gpt_source or "Unknown"
 
                 # ── summary_short 업데이트 ──
-                if data.get("summary_short"):
-                    article["summary_short"] = data["summary_short"]
+                if data.summary_short:
+                    article["summary_short"] = data.summary_short
 
                 # ── analysis 업데이트 ──
-                raw_analysis = data.get("analysis", {})
-                raw_facts: List = raw_analysis.get("facts", [])
-                opinions: List[str] = raw_analysis.get("opinions", [])
-                key_points: List[str] = raw_analysis.get("key_points", [])
-
-                # facts 정규화 (dict → content 문자열 추출)
-                normalized_facts = []
-                for f in raw_facts:
-                    if isinstance(f, dict):
-                        normalized_facts.append(f.get("content", str(f)))
-                    else:
-                        normalized_facts.append(str(f))
+                raw_facts: List = [f.model_dump() for f in data.analysis.facts]
+                opinions: List[str] = data.analysis.opinions
+                key_points: List[str] = data.analysis.key_points
+                normalized_facts = [f["content"] for f in raw_facts]
 
                 article["analysis"] = {
                     "key_points": key_points,
@@ -217,26 +259,11 @@ async def article_analyzer_node(state: Dict[str, Any]) -> Dict[str, Any]:
                     f"→ 핵심포인트 {len(key_points)}개, 팩트 {len(normalized_facts)}개, "
                     f"의견 {len(opinions)}개, 이미지 {len(images)+len(charts)}개"
                 )
-                last_error = None
-                break  # 성공 → 루프 탈출
+                metrics["status"] = "ok"
 
-            except json.JSONDecodeError as e:
-                logger.warning(f"[Article Analyzer] JSON 파싱 실패 ({title[:40]}): {e}")
-                last_error = e
-                break  # JSON 에러는 재시도해도 의미 없음
             except Exception as e:
-                err_str = str(e)
-                if "429" in err_str or "rate_limit" in err_str.lower():
-                    logger.warning(
-                        f"[Article Analyzer] Rate limit 429 ({title[:40]}) "
-                        f"→ attempt {attempt+1}/{MAX_RETRY}"
-                    )
-                    last_error = e
-                    continue  # 재시도
-                else:
-                    logger.warning(f"[Article Analyzer] 분석 실패 ({title[:40]}): {e}")
-                    last_error = e
-                    break  # 다른 에러는 재시도 안 함
+                logger.warning(f"[Article Analyzer] 분석 결과 반영 실패 ({title[:40]}): {e}")
+                last_error = e
 
         if last_error:
             logger.warning(f"[Article Analyzer] 최종 실패 ({title[:40]}): {last_error}")
@@ -250,26 +277,57 @@ async def article_analyzer_node(state: Dict[str, Any]) -> Dict[str, Any]:
             if fallback_summary and len(fallback_summary) > 20:
                 article["analysis"]["facts"] = [fallback_summary[:300]]
                 article["analysis"]["key_points"] = [fallback_summary[:200]]
+            metrics["status"] = "fallback"
+            metrics["error"] = str(last_error)[:200]
 
         return article
 
     # ------------------------------------------------------------------
-    # 세마포어로 동시 실행 수 제한하면서 병렬 분석
+    # AdaptiveConcurrency로 동시 실행 수를 조절하면서 병렬 분석
     # ------------------------------------------------------------------
     logger.info(
         f"[Article Analyzer] {len(articles)}개 기사 병렬 분석 시작 "
-        f"(concurrent={MAX_CONCURRENT})"
+        f"(concurrent={limiter.limit}, max={limiter.maximum})"
     )
 
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-
-    async def analyze_with_semaphore(article: Dict) -> Dict:
-        async with semaphore:
-            return await analyze_single_article(article)
-
+    article_metrics: List[Dict] = []
+
+    async def analyze_with_metrics(article: Dict) -> Dict:
+        metrics = {
+            "article_id": article.get("id", ""),
+            "title": article.get("title", "")[:60],
+            "status": "failed",
+            "latency_sec": 0.0,
+            "throttled": 0,
+            "parse_retries": 0,
+            "retries": 0,
+            "retry_wait_sec": 0.0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+        }
+        article_metrics.append(metrics)
+        started = time.perf_counter()
+        try:
+            return await analyze_single_article(article, metrics)
+        finally:
+            metrics["latency_sec"] = round(time.perf_counter() - started, 2)
+            metrics["retry_wait_sec"] = round(metrics["retry_wait_sec"], 2)
+
+    wall_started = time.perf_counter()
     analyzed_articles = await asyncio.gather(
-        *[analyze_with_semaphore(art) for art in articles]
+        *[analyze_with_metrics(art) for art in articles]
     )
+    analysis_metrics = {
+        "wall_time_sec": round(time.perf_counter() - wall_started, 2),
+        "initial_concurrency": INITIAL_CONCURRENCY,
+        "peak_concurrency": limiter.peak,
+        "final_concurrency": limiter.limit,
+        "throttled": limiter.throttled,
+        "retries": sum(m["retries"] for m in article_metrics),
+        "input_tokens": sum(m["input_tokens"] for m in article_metrics),
+        "output_tokens": sum(m["output_tokens"] for m in article_metrics),
+        "articles": article_metrics,
+    }
 
     # ------------------------------------------------------------------
     # structured_facts / structured_opinions 재생성
@@ -327,7 +385,8 @@ async def article_analyzer_node(state: Dict[str, Any]) -> Dict[str, Any]:
         f"[Article Analyzer] 분석 완료: "
         f"기사 {len(analyzed_articles)}개, "
         f"팩트 {len(structured_facts)}개, "
-        f"의견 {len(structured_opinions)}개"
+        f"의견 {len(structured_opinions)}개, "
+        f"{analysis_metrics['wall_time_sec']}s (동시 실행 최대 {limiter.peak}, 429 {limiter.throttled}회)"
     )
 
     return {
@@ -336,5 +395,34 @@ async def article_analyzer_node(state: Dict[str, Any]) -> Dict[str, Any]:
             "articles": list(analyzed_articles),
             "structured_facts": structured_facts,
             "structured_opinions": structured_opinions,
+            "analysis_metrics": analysis_metrics,
         }
     }
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """OpenAI 429 (RateLimitError) 여부"""
+    if getattr(error, "status_code", None) == 429:
+        return True
+    err_str = str(error)
+    return "429" in err_str or "rate_limit" in err_str.lower()
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """429 응답의 retry-after-ms / Retry-After 헤더 → 대기 초. 없으면 None."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(float(retry_after_ms) / 1000, 0.0)
+        except ValueError:
+            pass
+    return parse_retry_after(headers.get("retry-after"))
+
+
+def _add_usage(metrics: Dict, message: Any) -> None:
+    """AIMessage.usage_metadata의 입력/출력 토큰을 기사 metrics에 더함"""
+    usage = getattr(message, "usage_metadata", None) or {}
+    metrics["input_tokens"] += usage.get("input_tokens", 0)
+    metrics["output_tokens"] += usage.get("output_tokens", 0)
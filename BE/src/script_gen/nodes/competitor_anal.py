@@ -1,24 +1,38 @@
 """
 Competitor Analyzer Node - 경쟁 영상 분석 에이전트
-YT Fetcher가 찾은 영상들을 분석하여 성공이유, 부족한점, 적용포인트, 시청자반응을 파악합니다.
+YT Fetcher가 찾은 영상들(저장 자막/분석 검색 결과 포함)을 분석하여 성공이유, 부족한점, 적용포인트, 시청자반응을 파악합니다.
 
 분석 페이지(competitor_channel_service.py)와 100% 동일한 방식:
 - gpt-4.1 모델
 - 자막 텍스트 + 시청자 댓글 + 채널 페르소나 기반 분석
 - 동일한 프롬프트 (조건부 처리 포함)
+
+처리 순서:
+1. DB(video_captions / recent_video_captions / competitor_recent_videos)에서
+   캐시된 자막과 기존 영상 분석 결과를 한 번에 조회
+2. 캐시 미스 영상만 세마포어로 동시 처리 (자막 fetch + 댓글 + LLM 분석)
+3. 영상별 소요 시간과 캐시 적중 여부를 결과에 첨부
 """
 
+import asyncio
 import logging
 import json
 import os
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
+from sqlalchemy import select
 
 from app.services.subtitle_service import SubtitleService
+from app.core.prompt_budget import CAPTION_TOKEN_BUDGET, PromptBudget
 from app.core.config import settings
+from app.core.db import AsyncSessionLocal
+from app.models.caption import VideoCaption
+from app.models.competitor import CompetitorVideo
+from app.models.competitor_channel_video import CompetitorRecentVideo, RecentVideoCaption
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -26,6 +40,10 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 MODEL_NAME = "gpt-4.1"
+MAX_VIDEOS = 5
+MAX_CONCURRENT = 3  # 동시 분석 영상 수 (자막 fetch + LLM 호출)
+# 프롬프트 가변 섹션 토큰 예산: 페르소나 → 자막 (분석 페이지와 같은 상한) → 댓글 순으로 배정
+PROMPT_TOKEN_BUDGET = CAPTION_TOKEN_BUDGET + 2000
 
 
 async def competitor_anal_node(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -38,6 +56,7 @@ async def competitor_anal_node(state: Dict[str, Any]) -> Dict[str, Any]:
     - 동일한 프롬프트
     """
     logger.info("Competitor Analyzer Node 시작")
+    node_start = time.perf_counter()
 
     youtube_data = state.get("youtube_data", {})
     # ★ 필터링된 related_videos 우선 분석 (쇼츠+관련성 필터 적용됨)
@@ -49,68 +68,304 @@ async def competitor_anal_node(state: Dict[str, Any]) -> Dict[str, Any]:
         logger.warning("분석할 영상이 없음 - 빈 결과 반환")
         return {"competitor_data": None}
 
-    target_videos = videos[:5]
+    target_videos = videos[:MAX_VIDEOS]
     logger.info(f"분석 대상: {len(target_videos)}개 영상")
 
-    video_analyses = []
+    # 1. DB 캐시 일괄 조회 (자막 + 기존 분석)
+    video_ids = [v.get("video_id") for v in target_videos if v.get("video_id")]
+    cached_captions, cached_analyses = await _load_cached_from_db(video_ids)
 
-    for video in target_videos:
-        try:
-            analysis = await _analyze_single_video(video, topic, channel_profile)
-            if analysis:
-                video_analyses.append(analysis)
-        except Exception as e:
-            logger.warning(f"영상 분석 실패 ({video.get('video_id')}): {e}")
-            continue
+    # 2. 캐시 미스 영상은 세마포어로 동시 처리
+    llm = None
+    if settings.openai_api_key:
+        llm = ChatOpenAI(model=MODEL_NAME, api_key=settings.openai_api_key)
+    else:
+        logger.error("OpenAI API 키가 설정되지 않았습니다.")
 
-    logger.info(f"분석 완료: {len(video_analyses)}개 영상")
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+
+    async def _run(video: Dict) -> Tuple[Optional[Dict], Dict]:
+        video_id = video.get("video_id", "")
+        async with semaphore:
+            return await _analyze_single_video(
+                video,
+                topic,
+                channel_profile,
+                llm=llm,
+                cached_text=cached_captions.get(video_id),
+                cached_analysis=cached_analyses.get(video_id),
+            )
+
+    outcomes = await asyncio.gather(
+        *[_run(video) for video in target_videos],
+        return_exceptions=True,
+    )
+
+    video_analyses = []
+    video_timings = []
+    for video, outcome in zip(target_videos, outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning(f"영상 분석 실패 ({video.get('video_id')}): {outcome}")
+            video_timings.append({
+                "video_id": video.get("video_id", ""),
+                "caption_source": "none",
+                "analysis_source": "failed",
+                "error": str(outcome),
+            })
+            continue
+        analysis, timing = outcome
+        video_timings.append(timing)
+        if analysis:
+            video_analyses.append(analysis)
+
+    caption_hits = sum(1 for t in video_timings if t.get("caption_source") == "db")
+    analysis_hits = sum(1 for t in video_timings if t.get("analysis_source") == "db")
+    total_sec = round(time.perf_counter() - node_start, 3)
+
+    logger.info(
+        f"분석 완료: {len(video_analyses)}개 영상 ({total_sec}s, "
+        f"자막 캐시 {caption_hits}/{len(target_videos)}, 분석 캐시 {analysis_hits}/{len(target_videos)})"
+    )
 
     result = {
         "video_analyses": video_analyses,
         "analyzed_at": datetime.utcnow().isoformat(),
+        "cache_hits": {
+            "caption": caption_hits,
+            "analysis": analysis_hits,
+            "total_videos": len(target_videos),
+        },
+        "timings": {
+            "total_sec": total_sec,
+            "videos": video_timings,
+        },
     }
 
     return {"competitor_data": result}
 
 
-async def _analyze_single_video(video: Dict, topic: str, channel_profile: Dict) -> Optional[Dict]:
+async def _load_cached_from_db(video_ids: List[str]) -> Tuple[Dict[str, str], Dict[str, Dict]]:
+    """
+    DB에 저장된 자막 텍스트와 기존 영상 분석 결과를 video_id 기준으로 일괄 조회.
+
+    - 자막: video_captions(CompetitorVideo) → recent_video_captions(CompetitorRecentVideo) 순
+            (plain_text 컬럼만 조회, cue 배열은 로드하지 않음)
+    - 분석: competitor_recent_videos의 strengths / weaknesses / comment_insights만
+            (applicable_points는 분석한 사용자의 채널 기준이므로 재사용하지 않고 현재 채널 기준으로 새로 생성)
+
+    DB 장애 시 빈 결과를 반환하여 기존 fetch 경로로 진행합니다.
+    """
+    captions: Dict[str, str] = {}
+    analyses: Dict[str, Dict] = {}
+    if not video_ids:
+        return captions, analyses
+
+    try:
+        async with AsyncSessionLocal() as db:
+            rows = await db.execute(
+                select(CompetitorVideo.youtube_video_id, VideoCaption.plain_text, VideoCaption.segments_json)
+                .join(VideoCaption, VideoCaption.competitor_video_id == CompetitorVideo.id)
+                .where(CompetitorVideo.youtube_video_id.in_(video_ids))
+            )
+            for vid, plain_text, legacy_segments in rows.all():
+                text = _stored_caption_text(plain_text, legacy_segments)
+                if vid not in captions and text:
+                    captions[vid] = text
+
+            rows = await db.execute(
+                select(CompetitorRecentVideo.video_id, RecentVideoCaption.plain_text, RecentVideoCaption.segments_json)
+                .join(RecentVideoCaption, RecentVideoCaption.recent_video_id == CompetitorRecentVideo.id)
+                .where(CompetitorRecentVideo.video_id.in_(video_ids))
+            )
+            for vid, plain_text, legacy_segments in rows.all():
+                text = _stored_caption_text(plain_text, legacy_segments)
+                if vid not in captions and text:
+                    captions[vid] = text
+
+            rows = await db.execute(
+                select(CompetitorRecentVideo)
+                .where(
+                    CompetitorRecentVideo.video_id.in_(video_ids),
+                    CompetitorRecentVideo.analyzed_at.isnot(None),
+                )
+                .order_by(CompetitorRecentVideo.analyzed_at.desc())
+            )
+            for video in rows.scalars().all():
+                if video.video_id in analyses:
+                    continue
+                if video.analysis_strengths and video.analysis_weaknesses:
+                    analyses[video.video_id] = {
+                        "strengths": video.analysis_strengths,
+                        "weaknesses": video.analysis_weaknesses,
+                        "comment_insights": video.comment_insights or {"reactions": [], "needs": []},
+                    }
+    except Exception as e:
+        logger.warning(f"DB 캐시 조회 실패 (YouTube/LLM으로 진행): {e}")
+        return {}, {}
+
+    logger.info(f"DB 캐시 조회: 자막 {len(captions)}개, 분석 {len(analyses)}개 / {len(video_ids)}개 영상")
+    return captions, analyses
+
+
+def _stored_caption_text(plain_text: Optional[str], legacy_segments: Optional[Dict]) -> str:
+    """저장된 자막 텍스트 (새 포맷 plain_text 우선, backfill 전 행은 segments_json에서 조립)."""
+    if plain_text is not None:
+        return plain_text
+    return SubtitleService.build_caption_text((legacy_segments or {}).get("tracks", []))
+
+
+def _build_persona_context(channel_profile: Optional[Dict]) -> str:
+    """채널 페르소나 → 프롬프트용 [내 채널 정보] 블록 (정보가 없으면 빈 문자열)"""
+    if not channel_profile:
+        return ""
+    one_liner = channel_profile.get("one_liner", "없음")
+    main_topics = channel_profile.get("main_topics", [])
+    content_style = channel_profile.get("content_style", "없음")
+    target_audience = channel_profile.get("target_audience", "없음")
+    differentiator = channel_profile.get("differentiator", "없음")
+
+    if not any([one_liner != "없음", main_topics, content_style != "없음"]):
+        return ""
+    return f"""
+[내 채널 정보]
+- 채널 한줄 정의: {one_liner}
+- 주요 주제: {', '.join(main_topics) if main_topics else '없음'}
+- 콘텐츠 스타일: {content_style}
+- 타겟 시청자: {target_audience}
+- 차별화 포인트: {differentiator}
+"""
+
+
+async def _generate_applicable_points(
+    title: str,
+    cached_analysis: Dict,
+    channel_profile: Optional[Dict],
+    llm: Optional[ChatOpenAI],
+) -> List[str]:
+    """
+    기존 분석 결과(strengths/weaknesses/comment_insights)를 기반으로 현재 채널의
+    적용 포인트만 새로 생성하는 경량 LLM 호출
+    (competitor_channel_service._generate_applicable_points와 같은 프롬프트, 페르소나는 state에서).
+    """
+    fallback = ["경쟁 영상의 강점을 참고하여 채널에 적용해보세요."]
+    if llm is None:
+        return fallback
+
+    persona_context = _build_persona_context(channel_profile)
+    persona_instruction = (
+        f"내 채널에 맞춤형으로 제안해주세요.\n{persona_context.strip()}"
+        if persona_context
+        else "일반적인 유튜브 채널에 적용할 수 있도록 제안해주세요."
+    )
+    strengths_text = ", ".join(cached_analysis.get("strengths") or [])
+    weaknesses_text = ", ".join(cached_analysis.get("weaknesses") or [])
+    insights_text = json.dumps(cached_analysis.get("comment_insights") or {}, ensure_ascii=False)
+
+    prompt = f"""경쟁 유튜버의 영상 분석 결과를 바탕으로, 내 채널에 적용할 수 있는 구체적 액션 아이템 3~5개를 제안해주세요.
+
+[분석 대상 영상]
+제목: {title}
+성공 이유: {strengths_text}
+부족한 점: {weaknesses_text}
+시청자 반응: {insights_text}
+
+[내 채널]
+{persona_instruction}
+
+작성 규칙:
+- 한국어, 구어체, 구체적으로 작성
+- 각 항목은 1~2문장
+
+출력 형식 (JSON 문자열 배열만 출력, 다른 텍스트 없이):
+["액션1", "액션2", "액션3"]"""
+
+    try:
+        res = await llm.ainvoke([HumanMessage(content=prompt)])
+        content = res.content.strip().replace("```json", "").replace("```", "").strip()
+        parsed = json.loads(content)
+        if isinstance(parsed, list):
+            return [str(p) for p in parsed]
+    except Exception as e:
+        logger.warning(f"적용 포인트 생성 실패 ({title[:30]}): {e}")
+    return fallback
+
+
+async def _analyze_single_video(
+    video: Dict,
+    topic: str,
+    channel_profile: Dict,
+    llm: Optional[ChatOpenAI] = None,
+    cached_text: Optional[str] = None,
+    cached_analysis: Optional[Dict] = None,
+) -> Tuple[Optional[Dict], Dict]:
     """
     단일 영상 분석 (분석 페이지 competitor_channel_service.py와 100% 동일한 로직)
-    1. 자막 가져오기
+    0. DB에 기존 분석이 있으면 재사용하고 applicable_points만 현재 채널 기준으로 생성
+    1. 자막 가져오기 (DB 캐시 우선)
     2. 댓글 가져오기 (YouTube API)
     3. 페르소나 컨텍스트 구성
     4. gpt-4.1로 분석 (동일 프롬프트)
+
+    Returns:
+        (분석 결과 또는 None, 영상별 타이밍/캐시 정보)
     """
     video_id = video.get("video_id", "")
     title = video.get("title", "")
+    started = time.perf_counter()
+    timing: Dict[str, Any] = {
+        "video_id": video_id,
+        "caption_source": "none",
+        "analysis_source": "failed",
+    }
+
+    def _finish(result: Optional[Dict]) -> Tuple[Optional[Dict], Dict]:
+        timing["total_sec"] = round(time.perf_counter() - started, 3)
+        return result, timing
 
     # ---------------------------------------------------------------
-    # 1. 자막 가져오기
+    # 0. 기존 분석 재사용 (DB)
+    # ---------------------------------------------------------------
+    if cached_analysis:
+        timing["analysis_source"] = "db"
+        step_start = time.perf_counter()
+        applicable_points = await _generate_applicable_points(title, cached_analysis, channel_profile, llm)
+        timing["llm_sec"] = round(time.perf_counter() - step_start, 3)
+        logger.info(f"DB 분석 결과 재사용 + 적용 포인트 생성: {video_id}")
+        return _finish({
+            **cached_analysis,
+            "applicable_points": applicable_points,
+            "video_id": video_id,
+            "title": title,
+        })
+
     # ---------------------------------------------------------------
+    # 1. 자막 가져오기 (DB 캐시 → YouTube)
+    # ---------------------------------------------------------------
+    step_start = time.perf_counter()
     caption_text = ""
-    try:
-        results = await SubtitleService.fetch_subtitles(
-            video_ids=[video_id],
-            languages=["ko", "en"],
-            db=None,
-        )
-        if results:
-            fetch_result = results[0]
-            tracks = fetch_result.get("tracks", [])
-            for track in tracks:
-                for cue in track.get("cues", []):
-                    caption_text += cue.get("text", "") + " "
-            caption_text = caption_text.strip()
-
-            # 자막 길이 제한 (분석 페이지와 동일: 12,000자)
-            max_chars = 12000
-            if len(caption_text) > max_chars:
-                caption_text = caption_text[:max_chars] + "..."
-
-            if caption_text:
-                logger.info(f"자막 가져오기 성공 ({video_id}): {len(caption_text)}자")
-    except Exception as e:
-        logger.warning(f"자막 가져오기 실패 ({video_id}): {e}")
+    if cached_text:
+        caption_text = cached_text
+        if caption_text:
+            timing["caption_source"] = "db"
+            logger.info(f"DB 자막 사용 ({video_id}): {len(caption_text)}자")
+
+    if not caption_text:
+        try:
+            results = await SubtitleService.fetch_subtitles(
+                video_ids=[video_id],
+                languages=["ko", "en"],
+                db=None,
+            )
+            if results:
+                tracks = results[0].get("tracks", [])
+                caption_text = SubtitleService.build_caption_text(tracks)
+
+                if caption_text:
+                    timing["caption_source"] = "youtube"
+                    logger.info(f"자막 가져오기 성공 ({video_id}): {len(caption_text)}자")
+        except Exception as e:
+            logger.warning(f"자막 가져오기 실패 ({video_id}): {e}")
+    timing["caption_sec"] = round(time.perf_counter() - step_start, 3)
 
     if not caption_text:
         logger.info(f"자막 없음, 메타데이터로 분석: {video_id}")
@@ -124,22 +379,13 @@ async def _analyze_single_video(video: Dict, topic: str, channel_profile: Dict)
     # ---------------------------------------------------------------
     # 2. 댓글 가져오기 (YouTube API - 분석 페이지와 동일)
     # ---------------------------------------------------------------
+    step_start = time.perf_counter()
     comments_context = ""
     try:
         api_key = os.getenv("YOUTUBE_API_KEY")
         if api_key:
-            from googleapiclient.discovery import build
-            youtube = build("youtube", "v3", developerKey=api_key)
-
-            comments_res = youtube.commentThreads().list(
-                videoId=video_id,
-                part="snippet",
-                maxResults=10,
-                order="relevance",
-                textFormat="plainText",
-            ).execute()
-
-            comments = comments_res.get("items", [])
+            # googleapiclient는 동기 클라이언트 → 스레드에서 실행 (이벤트 루프 블로킹 방지)
+            comments = await asyncio.to_thread(_fetch_comments, api_key, video_id)
             if comments:
                 comment_lines = []
                 for c in comments:
@@ -159,38 +405,36 @@ async def _analyze_single_video(video: Dict, topic: str, channel_profile: Dict)
                 logger.info(f"댓글 없음 ({video_id})")
     except Exception as e:
         logger.warning(f"댓글 가져오기 실패 ({video_id}): {e}")
+    timing["comments_sec"] = round(time.perf_counter() - step_start, 3)
 
     # ---------------------------------------------------------------
     # 3. 채널 페르소나 컨텍스트 (state에서 가져옴 - DB 조회 불필요)
     # ---------------------------------------------------------------
-    persona_context = ""
-    if channel_profile:
-        one_liner = channel_profile.get("one_liner", "없음")
-        main_topics = channel_profile.get("main_topics", [])
-        content_style = channel_profile.get("content_style", "없음")
-        target_audience = channel_profile.get("target_audience", "없음")
-        differentiator = channel_profile.get("differentiator", "없음")
-
-        if any([one_liner != "없음", main_topics, content_style != "없음"]):
-            persona_context = f"""
-[내 채널 정보]
-- 채널 한줄 정의: {one_liner}
-- 주요 주제: {', '.join(main_topics) if main_topics else '없음'}
-- 콘텐츠 스타일: {content_style}
-- 타겟 시청자: {target_audience}
-- 차별화 포인트: {differentiator}
-"""
-            logger.info(f"페르소나 컨텍스트 포함 ({video_id})")
+    persona_context = _build_persona_context(channel_profile)
+    if persona_context:
+        logger.info(f"페르소나 컨텍스트 포함 ({video_id})")
+
+    allocated = (
+        PromptBudget(PROMPT_TOKEN_BUDGET)
+        .add("persona", persona_context, priority=0)
+        .add("caption", caption_text, priority=1, max_tokens=CAPTION_TOKEN_BUDGET, ellipsis="...")
+        .add("comments", comments_context, priority=2)
+        .allocate()
+    )
+    persona_context = allocated.sections["persona"]
+    caption_text = allocated.sections["caption"]
+    comments_context = allocated.sections["comments"]
+    timing["prompt_tokens"] = allocated.token_counts
+    logger.info(f"프롬프트 토큰 ({video_id}): {allocated.summary()}")
 
     # ---------------------------------------------------------------
     # 4. LLM 분석 (분석 페이지와 100% 동일한 프롬프트)
     # ---------------------------------------------------------------
-    openai_key = settings.openai_api_key
-    if not openai_key:
-        logger.error("OpenAI API 키가 설정되지 않았습니다.")
-        return None
-
-    llm = ChatOpenAI(model=MODEL_NAME, api_key=openai_key)
+    if llm is None:
+        if not settings.openai_api_key:
+            logger.error("OpenAI API 키가 설정되지 않았습니다.")
+            return _finish(None)
+        llm = ChatOpenAI(model=MODEL_NAME, api_key=settings.openai_api_key)
 
     # 조건부 텍스트 (원본과 동일)
     applicable_instruction = (
@@ -240,6 +484,7 @@ async def _analyze_single_video(video: Dict, topic: str, channel_profile: Dict)
   }}
 }}"""
 
+    step_start = time.perf_counter()
     try:
         res = await llm.ainvoke([HumanMessage(content=prompt)])
         content = res.content.strip()
@@ -250,9 +495,28 @@ async def _analyze_single_video(video: Dict, topic: str, channel_profile: Dict)
         parsed["video_id"] = video_id
         parsed["title"] = title
 
+        timing["analysis_source"] = "llm"
+        timing["llm_sec"] = round(time.perf_counter() - step_start, 3)
         logger.info(f"영상 분석 완료: {video_id} - {title[:30]}")
-        return parsed
+        return _finish(parsed)
 
     except (json.JSONDecodeError, Exception) as e:
+        timing["llm_sec"] = round(time.perf_counter() - step_start, 3)
         logger.error(f"LLM 분석 파싱 실패 ({video_id}): {e}")
-        return None
+        return _finish(None)
+
+
+def _fetch_comments(api_key: str, video_id: str) -> List[Dict]:
+    """YouTube Data API로 관련도 순 상위 댓글 10개 조회 (동기, to_thread용)."""
+    from googleapiclient.discovery import build
+    youtube = build("youtube", "v3", developerKey=api_key)
+
+    comments_res = youtube.commentThreads().list(
+        videoId=video_id,
+        part="snippet",
+        maxResults=10,
+        order="relevance",
+        textFormat="plainText",
+    ).execute()
+
+    return comments_res.get("items", [])
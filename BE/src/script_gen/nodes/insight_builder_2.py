@@ -7,11 +7,15 @@ A/B 테스트용: graph.py에서 import를 바꿔 두 버전 비교
   - v2: from src.script_gen.nodes.insight_builder_2 import insight_builder_node
 """
 
+import asyncio
+import json
 import logging
+import os
+import time
 import uuid
-import json
 from typing import Dict, Any, List, Optional
 
+from pydantic import BaseModel, Field
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import SystemMessage, HumanMessage
 
@@ -24,9 +28,125 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 MODEL_NAME = "claude-sonnet-4-5"
+MAX_RETRIES = 3
+
+# 전략 수립 모드: two_pass = 초안(Pass 1) → 비평·수정(Pass 2), single_pass = 초안+자기비평을 구조화 호출 1회로
+INSIGHT_MODES = ("two_pass", "single_pass")
+INSIGHT_MODE = os.getenv("INSIGHT_MODE", "two_pass")
+# 입력 기록 디렉터리 (설정 시 노드 입력을 JSON으로 저장 → scripts/compare_insight_modes.py에서 재생)
+INSIGHT_RECORD_DIR = os.getenv("INSIGHT_RECORD_DIR")
+
+_DRAFT_SYSTEM_PROMPT = """You are a visionary 'Content Strategist' for YouTube.
+Your goal is to find a 'Blue Ocean' strategy in a crowded market.
+
+**LANGUAGE RULE**:
+- All output fields (Thesis, Positioning, Chapter Titles, Goals, Key Points, Hook Plan) MUST be written in Korean.
+- Even if the research data contains English, the output must be natural Korean.
+
+**CORE PHILOSOPHY**:
+- **Differentiation is Key**: If the competitors said it, we usually shouldn't repeat it unless we add a new twist.
+- **Hook First**: Design a hook that stops the scroll immediately.
+- **Evidence-Based**: Build arguments on the provided Fact IDs.
+- **MANDATORY FACT ASSIGNMENT**: Each chapter MUST have 2-3 specific Fact IDs in its 'required_facts' list.
+
+**TASK**:
+Draft a Content Blueprint (InsightPack) based on the research provided.
+Focus on finding a unique 'Thesis' that contradicts or expands on the competitors.
+
+**CRITICAL REQUIREMENTS**:
+1. **Hook Plan**:
+   - hook_scripts MUST include 'uses_fact_ids' with at least 1 Fact ID
+   - Choose the most compelling/shocking facts for the hook
+   - **MANDATORY: thumbnail_angle** - MUST include concept, copy_candidates (list), avoid (list)
+
+2. **Story Structure - Chapters**:
+   - Each chapter should have 'required_facts' with 1-3 specific Fact IDs (when available)
+   - Prioritize quality over quantity - only assign facts that truly support the chapter
+   - These facts should directly support the chapter's key_points
+
+3. **Fact Selection Strategy**:
+   - Prioritize Statistic and Key Event type facts
+   - Ensure facts are distributed across chapters (don't use all facts in one chapter)
+   - Leave some facts unused if they don't fit the narrative
+
+4. **MANDATORY FIELDS - DO NOT SKIP**:
+   - hook_plan.thumbnail_angle: MUST include {concept, copy_candidates, avoid}
+   - writer_instructions: MUST include {tone, reading_level, must_include, must_avoid, claim_policy}
+"""
+
+_REFINE_SYSTEM_PROMPT = """You are a strict 'Content Editor'.
+Your job is to review the Strategist's Draft and fix any logical flaws, clichés, or hallucinations.
+
+**LANGUAGE RULE**:
+- Ensure all final fields are in Korean.
+- If the Draft contains English titles or descriptions, translate them into natural, compelling Korean.
+
+**CHECKLIST**:
+1. **Cliché Check**: Check the 'Common Gaps' in the research. Does the Draft's thesis actually address them? If it repeats competitors, REWRITE it.
+2. **Fact Check**: Verify 'fact_ids' and 'required_facts'. Do NOT invent IDs. If a claim lacks a fact ID, remove it or mark it as an opinion.
+3. **REQUIRED_FACTS VALIDATION**:
+   - Each chapter should have 1-3 Fact IDs in 'required_facts' (when available)
+   - If a chapter has empty required_facts, ADD appropriate Fact IDs from the available facts
+   - Ensure the selected facts actually support the chapter's content
+   - Quality over quantity - don't force facts that don't fit
+4. **Tone Check**: Does the hook and writing instruction match the Channel Profile?
+
+**ACTION**:
+Return the REFINED InsightPack. If the Draft is good, keep it. If flawed, fix it.
+"""
+
+_SINGLE_PASS_RULES = """
+**SINGLE-PASS MODE (Draft → Self-Critique → Final in one response)**:
+1. Privately draft a blueprint following the Strategist rules above.
+2. Review your own draft as the strict 'Content Editor' below and list the concrete problems you found
+   (cliché thesis, invented or missing Fact IDs, empty required_facts, tone mismatch) in 'self_critique'.
+   Keep each note to one sentence; at most 6 notes.
+3. Output the FINAL InsightPack with every problem fixed in 'insight_pack'. Do not output the draft itself.
+"""
 
 
-def insight_builder_node(state: Dict[str, Any]) -> Dict[str, Any]:
+class SinglePassInsight(BaseModel):
+    """single_pass 모드 구조화 출력: 자기비평 노트 + 수정 반영된 최종 InsightPack"""
+    self_critique: List[str] = Field(default=[], description="초안 자체 검토에서 발견해 고친 문제 (한 문장씩, 최대 6개)")
+    insight_pack: InsightPack = Field(description="자기비평을 반영한 최종 InsightPack")
+
+
+# =============================================================================
+# LLM 클라이언트 풀
+# =============================================================================
+
+_llm_pool: Dict[float, ChatAnthropic] = {}
+_llm_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_llm(temperature: float) -> ChatAnthropic:
+    """
+    온도별 ChatAnthropic 공용 인스턴스 (내부 HTTP 커넥션 풀 재사용).
+
+    커넥션은 이벤트 루프에 묶이므로 루프가 바뀌면 (Celery 워커는 task마다 새 루프)
+    새로 만든다. 이전 루프의 클라이언트는 루프와 함께 버려진다.
+    """
+    global _llm_pool_loop
+    loop = asyncio.get_running_loop()
+    if _llm_pool_loop is not loop:
+        _llm_pool.clear()
+        _llm_pool_loop = loop
+    if temperature not in _llm_pool:
+        _llm_pool[temperature] = ChatAnthropic(model=MODEL_NAME, temperature=temperature)
+    return _llm_pool[temperature]
+
+
+async def insight_builder_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Insight Builder v2: 리서치 결과로 콘텐츠 전략(InsightPack) 수립
+
+    Input (from state):
+        - topic, channel_profile, news_data(structured_facts), competitor_data
+        - insight_mode (선택): "two_pass" | "single_pass" (기본값: INSIGHT_MODE)
+
+    Output (to state):
+        - insight_pack: InsightPack dict (+ insight_timing, single_pass면 self_critique)
+    """
     logger.info("🤖 Insight Builder v2 (Claude Sonnet 4.5) 시작")
 
     # Fan-in Guard
@@ -47,36 +167,41 @@ def insight_builder_node(state: Dict[str, Any]) -> Dict[str, Any]:
     logger.info(f"🤖 [입력] 팩트 수: {len(facts)}개")
     logger.info(f"🤖 [입력] 경쟁사 데이터 존재: {competitor_result is not None}")
 
-    context_str = _build_context_string(topic, channel_profile, facts, competitor_result)
-
-    # --- Pass 1: Draft Generation ---
-    logger.info("🤖 Pass 1: Creating Strategy Draft (Claude)...")
-    draft_pack = None
-    max_retries = 3
-
-    for attempt in range(max_retries):
-        try:
-            draft_pack = _generate_draft(context_str)
-            break
-        except Exception as e:
-            logger.warning(f"🤖 Draft 생성 실패 (시도 {attempt + 1}/{max_retries}): {e}")
-            if attempt == max_retries - 1:
-                raise
+    if INSIGHT_RECORD_DIR:
+        _record_input(state)
 
-    logger.info(f"🤖 [Pass1 결과] thesis: {draft_pack.positioning.thesis}")
+    mode = state.get("insight_mode") or INSIGHT_MODE
+    if mode not in INSIGHT_MODES:
+        logger.warning(f"🤖 알 수 없는 insight_mode '{mode}' → two_pass")
+        mode = "two_pass"
 
-    # --- Pass 2: Critic & Repair ---
-    logger.info("🤖 Pass 2: Critiquing and Refining (Claude)...")
-    final_pack = None
+    context_str = _build_context_string(topic, channel_profile, facts, competitor_result)
 
-    for attempt in range(max_retries):
+    started = time.perf_counter()
+    calls = {"llm_calls": 0}  # 재시도·폴백 전 실패 시도까지 포함한 실제 LLM 호출 수
+    fallback_from = None
+    self_critique: List[str] = []
+    if mode == "single_pass":
         try:
-            final_pack = _critique_and_refine(context_str, draft_pack)
-            break
+            final_pack, self_critique = await _build_single_pass(context_str, calls)
         except Exception as e:
-            logger.warning(f"🤖 Refine 실패 (시도 {attempt + 1}/{max_retries}): {e}")
-            if attempt == max_retries - 1:
-                raise
+            logger.warning(f"🤖 single_pass 실패 → two_pass로 재시도: {e}")
+            fallback_from, mode = mode, "two_pass"
+            fallback_sec = round(time.perf_counter() - started, 2)
+            fallback_calls = calls["llm_calls"]
+    if mode == "two_pass":
+        final_pack = await _build_two_pass(context_str, calls)
+
+    insight_timing = {
+        "mode": mode,
+        "wall_time_sec": round(time.perf_counter() - started, 2),
+        "llm_calls": calls["llm_calls"],
+    }
+    if fallback_from:
+        insight_timing["fallback_from"] = fallback_from
+        insight_timing["fallback_after_sec"] = fallback_sec
+        insight_timing["fallback_llm_calls"] = fallback_calls
+    logger.info(f"🤖 전략 수립 시간 [{mode}]: {insight_timing['wall_time_sec']}s")
 
     # --- Finalize ---
     if not final_pack.insight_pack_id:
@@ -120,8 +245,15 @@ def insight_builder_node(state: Dict[str, Any]) -> Dict[str, Any]:
     logger.info(f"🤖   반드시 피하기: {wi.must_avoid}")
     logger.info("🤖 ===================================================================")
 
+    for note in self_critique:
+        logger.info(f"🤖 [자기비평] {note}")
+
+    insight_pack = final_pack.model_dump()
+    insight_pack["insight_timing"] = insight_timing
+    if self_critique:
+        insight_pack["self_critique"] = self_critique
     return {
-        "insight_pack": final_pack.model_dump()
+        "insight_pack": insight_pack
     }
 
 
@@ -129,48 +261,39 @@ def insight_builder_node(state: Dict[str, Any]) -> Dict[str, Any]:
 # Helper Functions
 # =============================================================================
 
-def _generate_draft(context_str: str) -> InsightPack:
-    """Pass 1: 창의적인 초안 생성 (Temperature 높게)"""
-    llm = ChatAnthropic(model=MODEL_NAME, temperature=0.7)
-    structured_llm = llm.with_structured_output(InsightPack)
+async def _with_retries(label: str, call, calls: Dict[str, int]):
+    """call()을 최대 MAX_RETRIES번 시도 (시도마다 calls["llm_calls"] 증가)"""
+    for attempt in range(MAX_RETRIES):
+        calls["llm_calls"] += 1
+        try:
+            return await call()
+        except Exception as e:
+            logger.warning(f"🤖 {label} 실패 (시도 {attempt + 1}/{MAX_RETRIES}): {e}")
+            if attempt == MAX_RETRIES - 1:
+                raise
 
-    system_prompt = """You are a visionary 'Content Strategist' for YouTube.
-Your goal is to find a 'Blue Ocean' strategy in a crowded market.
 
-**LANGUAGE RULE**:
-- All output fields (Thesis, Positioning, Chapter Titles, Goals, Key Points, Hook Plan) MUST be written in Korean.
-- Even if the research data contains English, the output must be natural Korean.
+async def _build_two_pass(context_str: str, calls: Dict[str, int]) -> InsightPack:
+    """Pass 1 초안 → Pass 2 비평·수정"""
+    logger.info("🤖 Pass 1: Creating Strategy Draft (Claude)...")
+    draft_pack = await _with_retries("Draft 생성", lambda: _generate_draft(context_str), calls)
+    logger.info(f"🤖 [Pass1 결과] thesis: {draft_pack.positioning.thesis}")
 
-**CORE PHILOSOPHY**:
-- **Differentiation is Key**: If the competitors said it, we usually shouldn't repeat it unless we add a new twist.
-- **Hook First**: Design a hook that stops the scroll immediately.
-- **Evidence-Based**: Build arguments on the provided Fact IDs.
-- **MANDATORY FACT ASSIGNMENT**: Each chapter MUST have 2-3 specific Fact IDs in its 'required_facts' list.
+    logger.info("🤖 Pass 2: Critiquing and Refining (Claude)...")
+    return await _with_retries("Refine", lambda: _critique_and_refine(context_str, draft_pack), calls)
 
-**TASK**:
-Draft a Content Blueprint (InsightPack) based on the research provided.
-Focus on finding a unique 'Thesis' that contradicts or expands on the competitors.
 
-**CRITICAL REQUIREMENTS**:
-1. **Hook Plan**:
-   - hook_scripts MUST include 'uses_fact_ids' with at least 1 Fact ID
-   - Choose the most compelling/shocking facts for the hook
-   - **MANDATORY: thumbnail_angle** - MUST include concept, copy_candidates (list), avoid (list)
+async def _build_single_pass(context_str: str, calls: Dict[str, int]) -> tuple:
+    """초안 + 자기비평 + 최종본을 구조화 호출 1회로 → (InsightPack, 자기비평 노트)"""
+    logger.info("🤖 Single Pass: Draft + Self-Critique (Claude)...")
+    result = await _with_retries("Single Pass", lambda: _generate_single_pass(context_str), calls)
+    return result.insight_pack, result.self_critique
 
-2. **Story Structure - Chapters**:
-   - Each chapter should have 'required_facts' with 1-3 specific Fact IDs (when available)
-   - Prioritize quality over quantity - only assign facts that truly support the chapter
-   - These facts should directly support the chapter's key_points
 
-3. **Fact Selection Strategy**:
-   - Prioritize Statistic and Key Event type facts
-   - Ensure facts are distributed across chapters (don't use all facts in one chapter)
-   - Leave some facts unused if they don't fit the narrative
+async def _generate_draft(context_str: str) -> InsightPack:
+    """Pass 1: 창의적인 초안 생성 (Temperature 높게)"""
+    structured_llm = _get_llm(0.7).with_structured_output(InsightPack)
 
-4. **MANDATORY FIELDS - DO NOT SKIP**:
-   - hook_plan.thumbnail_angle: MUST include {concept, copy_candidates, avoid}
-   - writer_instructions: MUST include {tone, reading_level, must_include, must_avoid, claim_policy}
-"""
     user_prompt = f"""
 [RESEARCH DATA]
 {context_str}
@@ -182,39 +305,18 @@ Generate the Draft Insight Pack. Risk-taking is encouraged regarding the angle/h
 - Assign 'required_facts' (1-3 Fact IDs per chapter) based on what's available. Quality over quantity!
 - DO NOT forget thumbnail_angle and writer_instructions - these are REQUIRED!
 """
-    return structured_llm.invoke([
-        SystemMessage(content=system_prompt),
+    return await structured_llm.ainvoke([
+        SystemMessage(content=_DRAFT_SYSTEM_PROMPT),
         HumanMessage(content=user_prompt)
     ])
 
 
-def _critique_and_refine(context_str: str, draft: InsightPack) -> InsightPack:
+async def _critique_and_refine(context_str: str, draft: InsightPack) -> InsightPack:
     """Pass 2: 비평 및 수정 (Temperature 낮게)"""
-    llm = ChatAnthropic(model=MODEL_NAME, temperature=0.2)
-    structured_llm = llm.with_structured_output(InsightPack)
+    structured_llm = _get_llm(0.2).with_structured_output(InsightPack)
 
     draft_json = draft.model_dump_json(indent=2)
 
-    system_prompt = """You are a strict 'Content Editor'.
-Your job is to review the Strategist's Draft and fix any logical flaws, clichés, or hallucinations.
-
-**LANGUAGE RULE**:
-- Ensure all final fields are in Korean.
-- If the Draft contains English titles or descriptions, translate them into natural, compelling Korean.
-
-**CHECKLIST**:
-1. **Cliché Check**: Check the 'Common Gaps' in the research. Does the Draft's thesis actually address them? If it repeats competitors, REWRITE it.
-2. **Fact Check**: Verify 'fact_ids' and 'required_facts'. Do NOT invent IDs. If a claim lacks a fact ID, remove it or mark it as an opinion.
-3. **REQUIRED_FACTS VALIDATION**:
-   - Each chapter should have 1-3 Fact IDs in 'required_facts' (when available)
-   - If a chapter has empty required_facts, ADD appropriate Fact IDs from the available facts
-   - Ensure the selected facts actually support the chapter's content
-   - Quality over quantity - don't force facts that don't fit
-4. **Tone Check**: Does the hook and writing instruction match the Channel Profile?
-
-**ACTION**:
-Return the REFINED InsightPack. If the Draft is good, keep it. If flawed, fix it.
-"""
     user_prompt = f"""
 [RESEARCH DATA]
 {context_str}
@@ -225,12 +327,54 @@ Return the REFINED InsightPack. If the Draft is good, keep it. If flawed, fix it
 **INSTRUCTION**:
 Critique and Refine this draft. Output the Final Insight Pack.
 """
-    return structured_llm.invoke([
-        SystemMessage(content=system_prompt),
+    return await structured_llm.ainvoke([
+        SystemMessage(content=_REFINE_SYSTEM_PROMPT),
         HumanMessage(content=user_prompt)
     ])
 
 
+async def _generate_single_pass(context_str: str) -> SinglePassInsight:
+    """single_pass: Strategist 초안 규칙 + Editor 체크리스트를 한 번에 (Temperature 중간)"""
+    structured_llm = _get_llm(0.5).with_structured_output(SinglePassInsight)
+
+    user_prompt = f"""
+[RESEARCH DATA]
+{context_str}
+
+**INSTRUCTION**:
+Draft the Insight Pack (risk-taking is encouraged regarding the angle/hook), critique it against the
+Editor checklist, and output only the self-critique notes and the FINAL Insight Pack.
+
+**REMINDER**:
+- Assign 'required_facts' (1-3 Fact IDs per chapter) based on what's available. Quality over quantity!
+- DO NOT forget thumbnail_angle and writer_instructions - these are REQUIRED!
+"""
+    return await structured_llm.ainvoke([
+        SystemMessage(content=_DRAFT_SYSTEM_PROMPT + _SINGLE_PASS_RULES + "\n" + _REFINE_SYSTEM_PROMPT),
+        HumanMessage(content=user_prompt)
+    ])
+
+
+def _record_input(state: Dict[str, Any]) -> None:
+    """노드 입력을 INSIGHT_RECORD_DIR/<topic_request_id>.json 으로 저장 (모드 비교 재생용)"""
+    record = {
+        "topic": state.get("topic"),
+        "topic_request_id": state.get("topic_request_id"),
+        "channel_profile": state.get("channel_profile", {}),
+        "news_data": {"structured_facts": (state.get("news_data") or {}).get("structured_facts", [])},
+        "competitor_data": state.get("competitor_data"),
+    }
+    try:
+        os.makedirs(INSIGHT_RECORD_DIR, exist_ok=True)
+        name = record["topic_request_id"] or f"trq_{uuid.uuid4().hex[:8]}"
+        path = os.path.join(INSIGHT_RECORD_DIR, f"{name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, default=str)
+        logger.info(f"🤖 입력 기록: {path}")
+    except Exception as e:
+        logger.warning(f"🤖 입력 기록 실패: {e}")
+
+
 def _calculate_fact_priority(fact: Dict) -> int:
     score = 0
     category = fact.get("category", "")
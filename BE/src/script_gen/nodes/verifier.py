@@ -7,10 +7,12 @@ Architecture:
     Phase 3: Semantic Distortion Detection (LLM 의미 대조)
 """
 
+import hashlib
 import logging
+import os
 import re
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pydantic import BaseModel, Field
 
 from langchain_openai import ChatOpenAI
@@ -19,7 +21,9 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from dotenv import load_dotenv
 load_dotenv()
 
+from app.core.prompt_budget import count_tokens
 from src.script_gen.schemas.writer import Script
+from src.script_gen.utils.fact_index import FactIndex
 from src.script_gen.schemas.verifier import (
     VerifierOutput, VerificationReport, BeatVerification,
     SourceMapEntry, SourceInfo, FactReference,
@@ -28,6 +32,27 @@ from src.script_gen.schemas.verifier import (
 
 logger = logging.getLogger(__name__)
 
+# Phase 3 배치 의미 대조: 배치당 대본 문장 + 팩트 원문 토큰 예산 / 최대 Beat 수 / 동시 배치 수
+SEMANTIC_BATCH_TOKEN_BUDGET = int(os.getenv("SEMANTIC_BATCH_TOKEN_BUDGET", "3000"))
+SEMANTIC_BATCH_MAX_BEATS = int(os.getenv("SEMANTIC_BATCH_MAX_BEATS", "20"))
+SEMANTIC_BATCH_CONCURRENCY = int(os.getenv("SEMANTIC_BATCH_CONCURRENCY", "3"))
+
+# Phase 2 패턴 (모듈 로드 시 1회 컴파일)
+# 숫자 + % 또는 숫자 + 단위: 40%, 10억, 100만, 3조, 2배, 1.5배
+_STAT_PATTERN = re.compile(r"\d+(?:%|억|만|조)|\d+\.?\d*배")
+_ATTRIBUTION_PHRASES = (
+    "에 따르면",
+    "에 의하면",
+    "연구에서",
+    "보고서에서",
+    "발표했다",
+    "밝혔다",
+    "말했다",
+    "according to",
+    "research shows",
+    "study found",
+)
+
 
 async def verifier_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -36,9 +61,15 @@ async def verifier_node(state: Dict[str, Any]) -> Dict[str, Any]:
     Input (from state):
         - script_draft: Writer의 결과
         - news_data: News Research의 결과 (facts)
+        - verifier_cache: 이전 라운드 Beat 판정 (재작성 루프에서 재검증할 때)
+        - verifier_retry_count: 지금까지의 재작성 라운드 수
     
     Output (to state):
         - verifier_output: VerifierOutput 객체
+        - verifier_cache: Beat 판정 캐시 (문장 + 인용 팩트 해시 → BeatVerification)
+    
+    재작성 루프(writer_rewrite → verifier)에서는 문장과 인용 팩트가 바뀐 Beat만 다시 검증하고,
+    나머지는 이전 라운드 판정을 그대로 재사용합니다.
     """
     logger.info("Verifier Node 시작")
     
@@ -52,23 +83,65 @@ async def verifier_node(state: Dict[str, Any]) -> Dict[str, Any]:
     facts = news_data.get("structured_facts", [])
     articles = news_data.get("articles", [])
     
+    # 팩트 색인 (fact_id / 수치 → 팩트) — 이번 실행의 모든 Phase에서 재사용
+    index = FactIndex(facts)
+    
+    cache: Dict[str, Dict] = dict(state.get("verifier_cache") or {})
+    round_no = state.get("verifier_retry_count", 0)
+    
     # Phase 1: Lightweight Verification
     logger.info("Phase 1: Lightweight Verification 시작")
-    beat_verifications = _lightweight_verify(script, facts)
+    beat_verifications = _lightweight_verify(script, index)
+    
+    # 이전 라운드 판정 재사용 (문장/인용 팩트가 그대로인 Beat)
+    keys = [_verdict_key(text, fact_ids, index) for _, text, fact_ids in _iter_beats(script)]
+    pending = []
+    for i, key in enumerate(keys):
+        if key in cache:
+            beat_verifications[i] = _reuse_verdict(cache[key], beat_verifications[i].beat_id)
+        else:
+            pending.append(beat_verifications[i])
     
     # Phase 2: Suspicious Beat Detection
-    logger.info("Phase 2: Suspicious Beat Detection 시작")
-    suspicious_beats = _find_suspicious_beats(script, beat_verifications, facts)
+    logger.info(f"Phase 2: Suspicious Beat Detection 시작 ({len(pending)}개 Beat)")
+    _find_suspicious_beats(pending, index)
     
     # Phase 3: Semantic Distortion Detection (LLM 의미 대조)
     logger.info("Phase 3: Semantic Distortion Detection 시작")
-    await _detect_semantic_distortion(beat_verifications, facts)
+    semantic_stats = await _detect_semantic_distortion(pending, index)
+    
+    for key, bv in zip(keys, beat_verifications):
+        cache[key] = bv.model_dump()
+    
+    suspicious_beats = [
+        bv.beat_id
+        for bv in beat_verifications
+        for issue in bv.issues
+        if issue.issue_type in ("suspicious_claim", "unverified_number")
+    ]
     
     # Source Map 생성
-    source_map = _build_source_map(beat_verifications, facts, articles)
+    source_map = _build_source_map(beat_verifications, index, articles)
     
     # Verification Report 생성
-    report = _build_verification_report(beat_verifications, suspicious_beats)
+    report = _build_verification_report(beat_verifications, suspicious_beats, semantic_stats)
+    
+    # 라운드 기록 (0 = Writer 초안, 1~ = 재작성 후 재검증)
+    previous_report = (state.get("verifier_output") or {}).get("verification_report") or {}
+    report.rounds = list(previous_report.get("rounds") or []) if round_no else []
+    report.rounds.append({
+        "round": round_no,
+        "reverified_beats": len(pending),
+        "reused_beats": len(beat_verifications) - len(pending),
+        "critical_beats": len({
+            issue.beat_id for issue in report.issues if issue.severity == "critical"
+        }),
+        "semantic_calls": semantic_stats.get("calls", 0),
+    })
+    logger.info(
+        f"Verifier 라운드 {round_no}: {len(pending)}개 Beat 재검증, "
+        f"{len(beat_verifications) - len(pending)}개 판정 재사용"
+    )
     
     # VerifierOutput 생성
     verifier_output = VerifierOutput(
@@ -82,7 +155,8 @@ async def verifier_node(state: Dict[str, Any]) -> Dict[str, Any]:
     logger.info(f"총 {len(report.issues)}개 이슈 발견")
     
     return {
-        "verifier_output": verifier_output.model_dump()
+        "verifier_output": verifier_output.model_dump(),
+        "verifier_cache": cache
     }
 
 
@@ -90,36 +164,46 @@ async def verifier_node(state: Dict[str, Any]) -> Dict[str, Any]:
 # Phase 1: Lightweight Verification
 # =============================================================================
 
-def _lightweight_verify(script: Script, facts: List[Dict]) -> List[BeatVerification]:
+def _lightweight_verify(script: Script, index: FactIndex) -> List[BeatVerification]:
     """
     fact_references 기반 검증
     """
-    beat_verifications = []
-    
-    # Fact ID → Fact 매핑 생성
-    fact_map = {f.get("id"): f for f in facts}
-    
-    # 1. Hook 검증
-    hook_verification = _verify_beat(
-        beat_id="hook",
-        beat_text=script.hook.text,
-        fact_references_ids=getattr(script.hook, 'fact_references', []),
-        fact_map=fact_map
-    )
-    beat_verifications.append(hook_verification)
-    
-    # 2. 각 Chapter의 Beat 검증
+    return [
+        _verify_beat(
+            beat_id=beat_id,
+            beat_text=beat_text,
+            fact_references_ids=fact_ids,
+            fact_map=index.facts_by_id
+        )
+        for beat_id, beat_text, fact_ids in _iter_beats(script)
+    ]
+
+
+def _iter_beats(script: Script) -> Iterator[Tuple[str, str, List[str]]]:
+    """검증 대상 Beat (beat_id, 문장, 인용 Fact ID): Hook → 각 Chapter의 Beat 순서"""
+    yield "hook", script.hook.text, getattr(script.hook, 'fact_references', [])
     for chapter in script.chapters:
         for beat in chapter.beats:
-            beat_verification = _verify_beat(
-                beat_id=beat.beat_id,
-                beat_text=beat.line,
-                fact_references_ids=getattr(beat, 'fact_references', []),
-                fact_map=fact_map
-            )
-            beat_verifications.append(beat_verification)
-    
-    return beat_verifications
+            yield beat.beat_id, beat.line, getattr(beat, 'fact_references', [])
+
+
+def _verdict_key(beat_text: str, fact_ids: List[str], index: FactIndex) -> str:
+    """판정 캐시 키: 문장 + 인용 팩트(ID와 원문) 해시"""
+    parts = [beat_text]
+    for fact_id in fact_ids:
+        fact = index.get(fact_id) or {}
+        parts.append(f"{fact_id}\t{fact.get('content', '')}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def _reuse_verdict(cached: Dict, beat_id: str) -> BeatVerification:
+    """캐시된 판정 복원 (같은 문장이 다른 beat_id로 옮겨졌으면 ID만 바꿈)"""
+    beat_ver = BeatVerification(**cached)
+    if beat_ver.beat_id != beat_id:
+        beat_ver.beat_id = beat_id
+        for issue in beat_ver.issues:
+            issue.beat_id = beat_id
+    return beat_ver
 
 
 def _verify_beat(
@@ -173,23 +257,23 @@ def _verify_beat(
 # =============================================================================
 
 def _find_suspicious_beats(
-    script: Script,
     beat_verifications: List[BeatVerification],
-    facts: List[Dict]
+    index: FactIndex
 ) -> List[str]:
     """
     의심스러운 Beat 찾기 (Deep 검증 필요)
     """
     suspicious = []
-    fact_map = {f.get("id"): f for f in facts}
     
     for beat_ver in beat_verifications:
+        has_numbers = _has_numbers(beat_ver.beat_text)
+        
         # 1. 숫자/통계가 있는데 fact_references 없음
-        if _has_numbers(beat_ver.beat_text) and not beat_ver.fact_references:
+        if has_numbers and not beat_ver.fact_references:
             beat_ver.issues.append(VerificationIssue(
                 beat_id=beat_ver.beat_id,
                 issue_type="suspicious_claim",
-                description="숫자/통계가 있지만 출처가 없습니다",
+                description="숫자/통계가 있지만 출처가 없습니다" + _candidate_hint(beat_ver.beat_text, index),
                 severity="warning",
                 suggested_action=VerificationAction.ADD_SOURCE
             ))
@@ -207,19 +291,18 @@ def _find_suspicious_beats(
             suspicious.append(beat_ver.beat_id)
         
         # 3. 숫자 교차검증 - 대본의 숫자가 인용 팩트에 실제 있는지
-        if beat_ver.fact_references and _has_numbers(beat_ver.beat_text):
-            ref_fact_contents = []
-            for fr in beat_ver.fact_references:
-                fact = fact_map.get(fr.fact_id)
-                if fact:
-                    ref_fact_contents.append(fact.get("content", ""))
-            
-            unmatched = _find_unmatched_numbers(beat_ver.beat_text, ref_fact_contents)
+        if beat_ver.fact_references and has_numbers:
+            unmatched = index.unmatched_numbers(
+                beat_ver.beat_text, [fr.fact_id for fr in beat_ver.fact_references]
+            )
             if unmatched:
                 beat_ver.issues.append(VerificationIssue(
                     beat_id=beat_ver.beat_id,
                     issue_type="unverified_number",
-                    description=f"출처에 없는 수치 사용: {', '.join(unmatched)}",
+                    description=(
+                        f"출처에 없는 수치 사용: {', '.join(unmatched)}"
+                        + _candidate_hint(" ".join(unmatched), index)
+                    ),
                     severity="warning",
                     suggested_action=VerificationAction.ADD_SOURCE
                 ))
@@ -230,75 +313,19 @@ def _find_suspicious_beats(
 
 def _has_numbers(text: str) -> bool:
     """텍스트에 숫자/통계가 있는지 확인"""
-    # 패턴: 숫자 + % 또는 숫자 + 단위
-    patterns = [
-        r'\d+%',           # 40%
-        r'\d+억',          # 10억
-        r'\d+만',          # 100만
-        r'\d+배',          # 2배
-        r'\d+\.?\d*배',    # 1.5배
-    ]
-    
-    for pattern in patterns:
-        if re.search(pattern, text):
-            return True
-    return False
+    return _STAT_PATTERN.search(text) is not None
 
 
 def _has_attribution_phrase(text: str) -> bool:
     """출처 표현이 있는지 확인"""
-    phrases = [
-        "에 따르면",
-        "에 의하면",
-        "연구에서",
-        "보고서에서",
-        "발표했다",
-        "밝혔다",
-        "말했다",
-        "according to",
-        "research shows",
-        "study found"
-    ]
-    
-    for phrase in phrases:
-        if phrase in text.lower():
-            return True
-    return False
+    lowered = text.lower()
+    return any(phrase in lowered for phrase in _ATTRIBUTION_PHRASES)
 
 
-def _find_unmatched_numbers(beat_text: str, fact_contents: List[str]) -> List[str]:
-
-    """
-    대본 문장의 숫자+단위가 인용 팩트 원문에 없으면 반환.
-    할루시네이션 수치 탐지용.
-    """
-    patterns = [
-        r'\d[\d,\.]*\s*%',
-        r'\d[\d,\.]*\s*억',
-        r'\d[\d,\.]*\s*만',
-        r'\d[\d,\.]*\s*조',
-        r'\d[\d,\.]*\s*배',
-        r'\d[\d,\.]*\s*달러',
-        r'\d[\d,\.]*\s*원',
-        r'\d[\d,\.]*\s*명',
-    ]
-    
-    unmatched = []
-    all_fact_text = " ".join(fact_contents)
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, beat_text)
-        for match in matches:
-            # 핵심 숫자 추출 (단위/공백 제거)
-            core_num = re.findall(r'[\d,\.]+', match)[0].replace(',', '')
-            # 1자리 숫자는 무시 ("2배" 등 흔한 표현)
-            if len(core_num.replace('.', '')) < 2:
-                continue
-            # 팩트 원문에 해당 숫자가 있는지 확인
-            if core_num not in all_fact_text:
-                unmatched.append(match.strip())
-    
-    return list(set(unmatched))
+def _candidate_hint(text: str, index: FactIndex) -> str:
+    """같은 수치가 나오는 팩트가 있으면 이슈 설명에 붙일 출처 후보"""
+    candidates = index.facts_with_numbers(text)
+    return f" (같은 수치가 있는 팩트: {', '.join(candidates)})" if candidates else ""
 
 
 # =============================================================================
@@ -307,7 +334,7 @@ def _find_unmatched_numbers(beat_text: str, fact_contents: List[str]) -> List[st
 
 def _build_source_map(
     beat_verifications: List[BeatVerification],
-    facts: List[Dict],
+    index: FactIndex,
     articles: List[Dict]
 ) -> List[SourceMapEntry]:
     """
@@ -325,7 +352,7 @@ def _build_source_map(
         sources = []
         for fact_ref in beat_ver.fact_references:
             # Fact에서 article_id 찾기
-            fact = next((f for f in facts if f.get("id") == fact_ref.fact_id), None)
+            fact = index.get(fact_ref.fact_id)
             if not fact:
                 continue
             
@@ -356,6 +383,23 @@ def _build_source_map(
 # Phase 3: Semantic Distortion Detection (LLM 의미 대조)
 # =============================================================================
 
+_SEMANTIC_SYSTEM_PROMPT = (
+    "당신은 팩트체커입니다. 대본 문장이 인용된 팩트 원문의 의미를 충실히 반영하는지 검증하세요.\n\n"
+    "왜곡 판정 기준:\n"
+    "- 확대: 팩트보다 범위나 의미를 키움 (예: '연구' → '산업 전체 변혁')\n"
+    "- 축소: 중요한 맥락이나 조건을 빠뜨려 의미가 달라짐\n"
+    "- 날조: 팩트에 없는 키워드/개념을 추가 (예: '방어책 연구' → '국방 통합')\n"
+    "- 맥락이탈: 팩트의 맥락과 다른 맥락에서 사용\n\n"
+    "자연스러운 서술을 위한 가벼운 표현 변경(의역)은 왜곡이 아닙니다.\n"
+    "핵심 의미가 바뀌었는지만 판단하세요."
+)
+
+_SEMANTIC_BATCH_RULES = (
+    "\n\n여러 대본 문장을 한 번에 검증합니다. 각 문장은 자신이 인용한 팩트 ID의 원문과만 비교하고, "
+    "입력된 모든 beat_id에 대해 판정을 정확히 하나씩 반환하세요."
+)
+
+
 class _SemanticCheckResult(BaseModel):
     """LLM 의미 대조 결과 (내부용)"""
     is_distorted: bool = Field(description="Beat이 팩트 원문의 의미를 왜곡했는지")
@@ -363,39 +407,212 @@ class _SemanticCheckResult(BaseModel):
     explanation: str = Field(description="판정 이유 (1-2문장)")
 
 
+class _BeatSemanticVerdict(BaseModel):
+    """배치 의미 대조의 Beat별 판정 (내부용)"""
+    beat_id: str = Field(description="판정 대상 beat_id (입력 그대로)")
+    is_distorted: bool = Field(description="Beat이 팩트 원문의 의미를 왜곡했는지")
+    distortion_type: Optional[str] = Field(description="왜곡 유형: 확대, 축소, 날조, 맥락이탈", default=None)
+    explanation: str = Field(description="판정 이유 (1-2문장)")
+
+
+class _BatchSemanticResult(BaseModel):
+    """배치 의미 대조 결과 (내부용)"""
+    verdicts: List[_BeatSemanticVerdict] = Field(description="입력된 모든 Beat의 판정")
+
+
 async def _detect_semantic_distortion(
     beat_verifications: List[BeatVerification],
-    facts: List[Dict]
-) -> None:
+    index: FactIndex
+) -> Dict[str, Any]:
     """
     fact_references가 있는 Beat에 대해, Beat 텍스트와 팩트 원문을 LLM으로 비교.
     의미 왜곡이 감지되면 해당 Beat에 이슈를 추가한다.
-    
-    비용 최적화: fact_references가 있는 Beat만 검증 (보통 전체의 30-50%)
+
+    비용 최적화:
+        - fact_references가 있는 Beat만 검증 (보통 전체의 30-50%)
+        - 여러 Beat를 배치 하나로 묶어 지시문과 공통 팩트 원문을 한 번만 보냄
+          (배치당 SEMANTIC_BATCH_TOKEN_BUDGET 토큰, 최대 SEMANTIC_BATCH_MAX_BEATS개)
+        - 배치 응답을 파싱하지 못하면 그 배치만 Beat 단위 호출로 대체
+
+    Returns:
+        호출/토큰 통계 (VerificationReport.semantic_check)
     """
-    fact_map = {f.get("id"): f for f in facts}
-    
-    # fact_references가 있는 Beat만 필터
+    fact_map = index.facts_by_id
+
+    # fact_references가 있고 원문을 찾을 수 있는 Beat만 필터
     beats_to_check = [
         bv for bv in beat_verifications
-        if bv.fact_references and len(bv.fact_references) > 0
+        if bv.fact_references and _fact_lines(bv, fact_map)
     ]
-    
+
     if not beats_to_check:
         logger.info("Phase 3: 검증 대상 Beat 없음 (fact_references 없음)")
-        return
-    
-    logger.info(f"Phase 3: {len(beats_to_check)}개 Beat 의미 대조 검증")
-    
-    # 병렬 검증 (최대 5개씩 배치)
-    BATCH_SIZE = 5
-    for i in range(0, len(beats_to_check), BATCH_SIZE):
-        batch = beats_to_check[i:i + BATCH_SIZE]
-        tasks = [
-            _check_single_beat_semantic(bv, fact_map)
-            for bv in batch
-        ]
-        await asyncio.gather(*tasks)
+        return {}
+
+    batches = _pack_semantic_batches(beats_to_check, fact_map)
+    logger.info(f"Phase 3: {len(beats_to_check)}개 Beat 의미 대조 검증 ({len(batches)}개 배치)")
+
+    semaphore = asyncio.Semaphore(SEMANTIC_BATCH_CONCURRENCY)
+
+    async def run(batch: List[BeatVerification]) -> Dict[str, int]:
+        async with semaphore:
+            return await _check_batch_semantic(batch, fact_map)
+
+    batch_stats = await asyncio.gather(*(run(batch) for batch in batches))
+
+    # 기존 방식(Beat당 1회 호출)의 프롬프트 토큰과 비교
+    baseline_tokens = sum(
+        count_tokens(_SEMANTIC_SYSTEM_PROMPT) + count_tokens(_single_prompt(bv, fact_map))
+        for bv in beats_to_check
+    )
+    calls = sum(s["calls"] for s in batch_stats)
+    prompt_tokens = sum(s["prompt_tokens"] for s in batch_stats)
+    stats = {
+        "beats": len(beats_to_check),
+        "batches": len(batches),
+        "calls": calls,
+        "fallback_beats": sum(s["fallback_beats"] for s in batch_stats),
+        "calls_saved": len(beats_to_check) - calls,
+        "prompt_tokens": prompt_tokens,
+        "prompt_tokens_saved": baseline_tokens - prompt_tokens,
+    }
+    logger.info(
+        f"Phase 3 완료: LLM 호출 {calls}회 (Beat 단위 대비 {stats['calls_saved']}회 절감), "
+        f"프롬프트 {prompt_tokens} 토큰 (절감 {stats['prompt_tokens_saved']}), "
+        f"fallback Beat {stats['fallback_beats']}개"
+    )
+    return stats
+
+
+def _fact_lines(beat_ver: BeatVerification, fact_map: Dict[str, Dict]) -> List[str]:
+    """Beat가 인용한 팩트 원문 ("[fact_id] 내용")"""
+    lines = []
+    for fr in beat_ver.fact_references:
+        fact = fact_map.get(fr.fact_id)
+        if fact:
+            lines.append(f"[{fr.fact_id}] {fact.get('content', '')}")
+    return lines
+
+
+def _pack_semantic_batches(
+    beats: List[BeatVerification],
+    fact_map: Dict[str, Dict]
+) -> List[List[BeatVerification]]:
+    """
+    Beat를 순서대로 배치에 채운다. 배치 안에서 팩트 원문은 한 번만 들어가므로
+    Beat 비용은 문장 + 그 배치에 아직 없는 팩트 원문의 토큰 수로 계산한다.
+    같은 beat_id는 한 배치에 넣지 않는다 (판정을 beat_id로 되돌려 매핑하므로).
+    """
+    batches: List[List[BeatVerification]] = []
+    batch: List[BeatVerification] = []
+    batch_ids: set = set()
+    batch_facts: set = set()
+    used = 0
+
+    for bv in beats:
+        fact_ids = {fr.fact_id for fr in bv.fact_references if fr.fact_id in fact_map}
+        new_facts = fact_ids - batch_facts
+        cost = count_tokens(bv.beat_text) + sum(
+            count_tokens(fact_map[fid].get("content", "")) for fid in new_facts
+        )
+        if batch and (
+            used + cost > SEMANTIC_BATCH_TOKEN_BUDGET
+            or len(batch) >= SEMANTIC_BATCH_MAX_BEATS
+            or bv.beat_id in batch_ids
+        ):
+            batches.append(batch)
+            batch, batch_ids, batch_facts, used = [], set(), set(), 0
+            new_facts = fact_ids
+            cost = count_tokens(bv.beat_text) + sum(
+                count_tokens(fact_map[fid].get("content", "")) for fid in new_facts
+            )
+        batch.append(bv)
+        batch_ids.add(bv.beat_id)
+        batch_facts |= new_facts
+        used += cost
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _batch_prompt(batch: List[BeatVerification], fact_map: Dict[str, Dict]) -> str:
+    """배치 프롬프트: 공통 팩트 원문 목록 + 인용 ID가 달린 대본 문장 목록"""
+    fact_lines: Dict[str, str] = {}
+    beat_lines = []
+    for bv in batch:
+        cited = []
+        for fr in bv.fact_references:
+            fact = fact_map.get(fr.fact_id)
+            if not fact:
+                continue
+            cited.append(fr.fact_id)
+            fact_lines.setdefault(fr.fact_id, f"[{fr.fact_id}] {fact.get('content', '')}")
+        beat_lines.append(f"- beat_id: {bv.beat_id} | 인용: {', '.join(cited)}\n  {bv.beat_text}")
+
+    return (
+        "## 인용된 팩트 원문\n" + "\n".join(fact_lines.values()) + "\n\n"
+        f"## 대본 문장 ({len(batch)}개)\n" + "\n".join(beat_lines) + "\n\n"
+        "각 대본 문장이 자신이 인용한 팩트의 의미를 왜곡했는지 beat_id별로 판정하세요."
+    )
+
+
+def _single_prompt(beat_ver: BeatVerification, fact_map: Dict[str, Dict]) -> str:
+    facts_str = "\n".join(_fact_lines(beat_ver, fact_map))
+    return (
+        f"## 대본 문장\n{beat_ver.beat_text}\n\n"
+        f"## 인용된 팩트 원문\n{facts_str}\n\n"
+        "이 대본 문장이 인용된 팩트의 의미를 왜곡했는지 판정하세요."
+    )
+
+
+async def _check_batch_semantic(
+    batch: List[BeatVerification],
+    fact_map: Dict[str, Dict]
+) -> Dict[str, int]:
+    """
+    배치 하나를 한 번의 구조화 출력 호출로 검증.
+    호출 실패/파싱 실패면 배치 전체를, 판정이 빠진 Beat가 있으면 그 Beat만 단일 호출로 재검증.
+    """
+    stats = {"calls": 0, "prompt_tokens": 0, "fallback_beats": 0}
+    pending = batch
+
+    # Beat 1개짜리 배치는 바로 단일 호출
+    if len(batch) > 1:
+        system = _SEMANTIC_SYSTEM_PROMPT + _SEMANTIC_BATCH_RULES
+        prompt = _batch_prompt(batch, fact_map)
+        stats["calls"] = 1
+        stats["prompt_tokens"] = count_tokens(system) + count_tokens(prompt)
+        try:
+            llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+            structured_llm = llm.with_structured_output(_BatchSemanticResult)
+            result = await structured_llm.ainvoke([
+                SystemMessage(content=system),
+                HumanMessage(content=prompt)
+            ])
+            verdicts = {v.beat_id: v for v in result.verdicts}
+            for bv in batch:
+                if bv.beat_id in verdicts:
+                    _apply_semantic_result(bv, verdicts[bv.beat_id])
+            pending = [bv for bv in batch if bv.beat_id not in verdicts]
+            if pending:
+                logger.warning(
+                    f"Phase 3 배치 판정 누락 {len(pending)}개 → 단일 검증: "
+                    f"{[bv.beat_id for bv in pending]}"
+                )
+        except Exception as e:
+            logger.warning(f"Phase 3 배치 의미 대조 실패 ({len(batch)}개 Beat) → 단일 검증: {e}")
+        stats["fallback_beats"] = len(pending)
+
+    if pending:
+        stats["calls"] += len(pending)
+        stats["prompt_tokens"] += sum(
+            count_tokens(_SEMANTIC_SYSTEM_PROMPT) + count_tokens(_single_prompt(bv, fact_map))
+            for bv in pending
+        )
+        await asyncio.gather(*(_check_single_beat_semantic(bv, fact_map) for bv in pending))
+
+    return stats
 
 
 async def _check_single_beat_semantic(
@@ -406,65 +623,49 @@ async def _check_single_beat_semantic(
     단일 Beat에 대한 의미 대조 검증.
     왜곡이 감지되면 beat_ver.issues에 직접 추가.
     """
-    # 인용된 팩트 원문 수집
-    fact_texts = []
-    for fr in beat_ver.fact_references:
-        fact = fact_map.get(fr.fact_id)
-        if fact:
-            fact_texts.append(f"[{fr.fact_id}] {fact.get('content', '')}")
-    
-    if not fact_texts:
+    if not _fact_lines(beat_ver, fact_map):
         return
-    
-    facts_str = "\n".join(fact_texts)
-    
+
     try:
         llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
         structured_llm = llm.with_structured_output(_SemanticCheckResult)
-        
+
         result = await structured_llm.ainvoke([
-            SystemMessage(content=(
-                "당신은 팩트체커입니다. 대본 문장이 인용된 팩트 원문의 의미를 충실히 반영하는지 검증하세요.\n\n"
-                "왜곡 판정 기준:\n"
-                "- 확대: 팩트보다 범위나 의미를 키움 (예: '연구' → '산업 전체 변혁')\n"
-                "- 축소: 중요한 맥락이나 조건을 빠뜨려 의미가 달라짐\n"
-                "- 날조: 팩트에 없는 키워드/개념을 추가 (예: '방어책 연구' → '국방 통합')\n"
-                "- 맥락이탈: 팩트의 맥락과 다른 맥락에서 사용\n\n"
-                "자연스러운 서술을 위한 가벼운 표현 변경(의역)은 왜곡이 아닙니다.\n"
-                "핵심 의미가 바뀌었는지만 판단하세요."
-            )),
-            HumanMessage(content=(
-                f"## 대본 문장\n{beat_ver.beat_text}\n\n"
-                f"## 인용된 팩트 원문\n{facts_str}\n\n"
-                "이 대본 문장이 인용된 팩트의 의미를 왜곡했는지 판정하세요."
-            ))
+            SystemMessage(content=_SEMANTIC_SYSTEM_PROMPT),
+            HumanMessage(content=_single_prompt(beat_ver, fact_map))
         ])
-        
-        if result.is_distorted:
-            beat_ver.issues.append(VerificationIssue(
-                beat_id=beat_ver.beat_id,
-                issue_type="semantic_distortion",
-                description=f"[{result.distortion_type}] {result.explanation}",
-                severity="critical",
-                suggested_action=VerificationAction.SOFTEN
-            ))
-            beat_ver.verified = False
-            logger.warning(
-                f"Phase 3 왜곡 감지 [{beat_ver.beat_id}]: "
-                f"{result.distortion_type} - {result.explanation}"
-            )
-    
+        _apply_semantic_result(beat_ver, result)
+
     except Exception as e:
         logger.warning(f"Phase 3 의미 대조 실패 [{beat_ver.beat_id}]: {e}")
 
 
+def _apply_semantic_result(beat_ver: BeatVerification, result) -> None:
+    """왜곡 판정이면 beat_ver에 semantic_distortion 이슈 추가"""
+    if not result.is_distorted:
+        return
+    beat_ver.issues.append(VerificationIssue(
+        beat_id=beat_ver.beat_id,
+        issue_type="semantic_distortion",
+        description=f"[{result.distortion_type}] {result.explanation}",
+        severity="critical",
+        suggested_action=VerificationAction.SOFTEN
+    ))
+    beat_ver.verified = False
+    logger.warning(
+        f"Phase 3 왜곡 감지 [{beat_ver.beat_id}]: "
+        f"{result.distortion_type} - {result.explanation}"
+    )
+
+
 # =============================================================================
 # Verification Report 생성
 # =============================================================================
 
 def _build_verification_report(
     beat_verifications: List[BeatVerification],
-    suspicious_beats: List[str]
+    suspicious_beats: List[str],
+    semantic_stats: Optional[Dict[str, Any]] = None
 ) -> VerificationReport:
     """
     검증 리포트 생성
@@ -489,5 +690,6 @@ def _build_verification_report(
         total_fact_references=total_fact_refs,
         valid_fact_references=valid_fact_refs,
         issues=all_issues,
-        suspicious_beats=suspicious_beats
+        suspicious_beats=suspicious_beats,
+        semantic_check=semantic_stats or {}
     )
@@ -8,7 +8,11 @@ Architecture (Phase 1 - MVP):
     3. (Phase 2) Validator: 필수 요소 검증
 """
 
+import json
 import logging
+import os
+import re
+import time
 import uuid
 import asyncio
 from datetime import datetime
@@ -16,14 +20,28 @@ from typing import List, Dict, Any, Optional, Literal
 from pydantic import BaseModel, Field
 
 from langchain_openai import ChatOpenAI
+from openai import pydantic_function_tool
+from langchain_core.callbacks import adispatch_custom_event
 from langchain_core.messages import SystemMessage, HumanMessage
 
+from src.script_gen.utils.partial_json import IncrementalArrayParser
+
 from dotenv import load_dotenv
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 MODEL_NAME = "gpt-4o"
+TRANSITION_MODEL_NAME = "gpt-4o-mini"  # 챕터 경계 다듬기 (짧은 입력, 저비용)
+
+# 챕터 작성 모드: parallel = 챕터 동시 생성 + 경계 다듬기, sequential = 기존 순차 생성
+WRITER_MODES = ("parallel", "sequential")
+WRITER_MODE = os.getenv("WRITER_MODE", "parallel")
+WRITER_CHAPTER_CONCURRENCY = int(os.getenv("WRITER_CHAPTER_CONCURRENCY", "3"))
+# 챕터 응답 스트리밍: 완성된 Beat마다 진행 이벤트(writer_progress) 발행 ("0"이면 응답 전체를 받은 뒤 파싱)
+WRITER_STREAM = os.getenv("WRITER_STREAM", "1") != "0"
+# Verifier critical 이슈 → 해당 Beat만 재작성 → 재검증 루프의 최대 라운드 수
+WRITER_MAX_REWRITE_ROUNDS = int(os.getenv("WRITER_MAX_REWRITE_ROUNDS", "2"))
 
 # =============================================================================
 # 공통 시스템 프롬프트 (Hook / Chapter / Outro 공유)
@@ -100,6 +118,9 @@ class Chapter(BaseModel):
     narration: Optional[str] = Field(description="Full narration text (optional, can be derived from beats)", default="")
     beats: List[Beat] = Field(description="List of beats making up the chapter")
 
+# Chapter 함수 호출 스키마 (strict: OpenAI가 스키마대로만 인자를 생성, 스트리밍/일반 경로 공통)
+_CHAPTER_TOOL = pydantic_function_tool(Chapter)
+
 class Hook(BaseModel):
     text: str = Field(description="Full text of the hook/intro")
     fact_references: List[str] = Field(default_factory=list)
@@ -131,6 +152,13 @@ class ScriptDraft(BaseModel):
     source_map: List[Any]
     quality_report: QualityReport
 
+class Transition(BaseModel):
+    chapter_id: str = Field(description="Chapter ID")
+    line: str = Field(description="다듬은 첫 문단 전체")
+
+class TransitionPass(BaseModel):
+    transitions: List[Transition] = Field(default_factory=list)
+
 
 async def writer_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -139,9 +167,10 @@ async def writer_node(state: Dict[str, Any]) -> Dict[str, Any]:
     Input (from state):
         - insight_pack: Insight Builder의 결과
         - news_data: News Research의 결과 (facts)
+        - writer_mode (선택): "parallel" | "sequential" (기본값: WRITER_MODE)
     
     Output (to state):
-        - script_draft: ScriptDraft 객체
+        - script_draft: ScriptDraft 객체 (metadata.writer_timing에 모드별 작성 시간)
     """
     logger.info("Writer Node 시작")
     
@@ -157,132 +186,63 @@ async def writer_node(state: Dict[str, Any]) -> Dict[str, Any]:
     opinions = news_data.get("structured_opinions", [])
     channel_profile = state.get("channel_profile", {})
     
-    # 인용번호 후처리용 매핑: fact_id → ①②③
-    fact_marker_map = _build_fact_marker_map(facts)
+    mode = state.get("writer_mode") or WRITER_MODE
+    if mode not in WRITER_MODES:
+        logger.warning(f"알 수 없는 writer_mode '{mode}' → parallel")
+        mode = "parallel"
     
-    # 1. Base Context 생성
-    base_context = _build_writer_context(channel_profile, insight_pack, facts, opinions)
+    # 1. 공통 컨텍스트 (1회 생성: 팩트 인덱스, 인용번호 매핑 fact_id → ①②③, 프롬프트 조각)
+    ctx = WriterContext(channel_profile, insight_pack, facts, opinions)
     
-    # 2. Iterative Generation
-    # (1) Intro
-    logger.info("Generating Intro...")
-    hook = await _generate_intro(base_context)
-    # 인용번호 교정 (후처리)
-    hook.text = _fix_citation_numbers(hook.text, hook.fact_references, fact_marker_map)
-    
-    # (2) Chapters — 순차 생성 (도입부 다양성 + 팩트 격리 + Self-Check)
+    # 2. 챕터별 팩트 배정
     chapter_plans = insight_pack.get("story_structure", {}).get("chapters", [])
+    all_chapter_facts = _assign_chapter_facts(chapter_plans, facts)
     
-    if chapter_plans:
-        logger.info(f"Generating {len(chapter_plans)} chapters SEQUENTIALLY...")
-        
-        all_chapter_facts = [
-            set(plan.get("required_facts", [])) for plan in chapter_plans
-        ]
-        
-        # ★ 안전장치: 모든 기사(source_index)에서 최소 1개 팩트가 배정되도록 보장
-        # Insight Builder가 일부 기사의 팩트를 required_facts에 넣지 않으면
-        # 해당 기사의 인용번호(③④ 등)가 대본에 아예 등장하지 않는 문제 방지
-        all_assigned = set()
-        for s in all_chapter_facts:
-            all_assigned.update(s)
-        
-        # 기사별로 최소 1개 팩트가 배정되었는지 확인
-        source_indices_covered = set()
-        for f in facts:
-            if f.get("id") in all_assigned:
-                source_indices_covered.add(f.get("source_index", -1))
-        
-        orphan_facts = []
-        for f in facts:
-            src_idx = f.get("source_index", -1)
-            if src_idx not in source_indices_covered and f.get("id"):
-                orphan_facts.append(f)
-                source_indices_covered.add(src_idx)  # 기사당 1개만
-        
-        if orphan_facts:
-            # 마지막 챕터에 미배정 팩트 추가
-            last_idx = len(all_chapter_facts) - 1
-            for f in orphan_facts:
-                all_chapter_facts[last_idx].add(f["id"])
-            orphan_sources = [f.get("source_name", "?") for f in orphan_facts]
-            logger.warning(
-                f"★ 미배정 기사 팩트 {len(orphan_facts)}개를 마지막 챕터에 추가: "
-                f"{orphan_sources}"
-            )
-        
-        chapters = []
-        previous_openings = []   # 이전 챕터 도입 문장 (패턴 반복 방지)
-        used_facts_summary = []  # 이전 챕터에서 사용된 팩트 요약
-        
-        for i, plan in enumerate(chapter_plans, 1):
-            # 이 챕터의 배정 팩트만 포함된 컨텍스트 생성
-            chapter_context = _build_writer_context(
-                channel_profile, insight_pack, facts, opinions,
-                filter_fact_ids=all_chapter_facts[i - 1],
-                used_facts_summary=used_facts_summary if used_facts_summary else None
-            )
-            
-            ch = await _generate_chapter(
-                chapter_context, plan, i,
-                previous_openings=previous_openings
+    # 3. Intro / Chapters / Outro 생성
+    started = time.perf_counter()
+    progress = BeatProgress(len(chapter_plans), started) if WRITER_STREAM else None
+    fallback_from = None
+    if mode == "parallel":
+        try:
+            hook, chapters, closing = await _write_parallel(
+                ctx, channel_profile, chapter_plans, all_chapter_facts, progress=progress
             )
-            ch.chapter_id = str(i)
-            ch.narration = "\n".join(beat.line for beat in ch.beats)
-            
-            # Self-Check: 누락 팩트 확인 → 1회 재시도
-            cited_ids = set(ref for beat in ch.beats for ref in beat.fact_references)
-            required_ids = all_chapter_facts[i - 1]
-            missing = required_ids - cited_ids
-            if missing:
-                logger.warning(f"Ch{i}: 미인용 팩트 {len(missing)}개 → 재생성")
-                ch = await _generate_chapter(
-                    chapter_context, plan, i,
-                    previous_openings=previous_openings,
-                    must_include_facts=list(missing)
-                )
-                ch.chapter_id = str(i)
-                ch.narration = "\n".join(beat.line for beat in ch.beats)
-                cited_ids = set(ref for beat in ch.beats for ref in beat.fact_references)
-            
-            # 이전 챕터 도입 문장 수집
-            if ch.beats:
-                first_line = ch.beats[0].line[:60]
-                previous_openings.append(f"Ch{i}: \"{first_line}\"")
-            
-            # 이전 챕터 사용 팩트 요약 수집 + 다음 챕터에서 제외
-            for ref_id in cited_ids:
-                fact_obj = next((f for f in facts if f.get("id") == ref_id), None)
-                if fact_obj:
-                    preview = fact_obj.get("content", "")[:50]
-                    used_facts_summary.append(f"\"{preview}\" (Ch{i}에서 사용됨)")
-                
-                # 이미 인용된 팩트를 다음 챕터 배정에서 제거 (코드 레벨 중복 방지)
-                for future_idx in range(i, len(all_chapter_facts)):
-                    all_chapter_facts[future_idx].discard(ref_id)
-            
-            # 인용번호 교정 (후처리): 각 Beat의 번호를 fact_references 기반으로 검증·수정
-            for beat in ch.beats:
-                beat.line = _fix_citation_numbers(beat.line, beat.fact_references, fact_marker_map)
-            ch.narration = "\n".join(beat.line for beat in ch.beats)
-            
-            chapters.append(ch)
-            logger.info(f"Chapter {i} generated: {ch.title}")
-    else:
-        chapters = []
-        
-    # (3) Outro
-    logger.info("Generating Outro...")
-    closing = await _generate_outro(base_context)
+        except Exception as e:
+            logger.warning(f"병렬 작성 실패 → 순차 작성으로 재시도: {e}")
+            fallback_from, mode = mode, "sequential"
+    if mode == "sequential":
+        hook, chapters, closing = await _write_sequential(
+            ctx, chapter_plans, all_chapter_facts, progress=progress
+        )
+    
+    # 인용번호 교정 (후처리, 마지막에 1회): Hook/각 Beat의 번호를 fact_references 기반으로 검증·수정
+    _apply_citation_fixes(hook, chapters, ctx.fact_marker_map)
     
-    # 3. Final Assembly
+    writer_timing = {
+        "mode": mode,
+        "wall_time_sec": round(time.perf_counter() - started, 2),
+        "chapters": len(chapters),
+    }
+    if mode == "parallel":
+        writer_timing["chapter_concurrency"] = WRITER_CHAPTER_CONCURRENCY
+    if fallback_from:
+        writer_timing["fallback_from"] = fallback_from
+    writer_timing["streamed"] = progress is not None
+    if progress is not None:
+        writer_timing["time_to_first_beat_sec"] = progress.first_beat_sec
+    logger.info(
+        f"Writer 작성 시간 [{mode}]: {writer_timing['wall_time_sec']}s ({len(chapters)}개 챕터), "
+        f"첫 Beat {writer_timing.get('time_to_first_beat_sec')}s"
+    )
+    
+    # 4. Final Assembly
     final_script = Script(
         hook=hook,
         chapters=chapters,
         closing=closing
     )
     
-    # 4. Quality Report (단순화: 전체 팩트 사용량 체크)
+    # 5. Quality Report (단순화: 전체 팩트 사용량 체크)
     all_refs = hook.fact_references + [ref for ch in chapters for beat in ch.beats for ref in beat.fact_references]
     unique_refs = list(set(all_refs))
     
@@ -290,7 +250,7 @@ async def writer_node(state: Dict[str, Any]) -> Dict[str, Any]:
         used_fact_ids=unique_refs,
         unused_required_fact_ids=[], # TODO: Check against plan
         warnings_used=[],
-        policy_checks={"iterative_mode": True}
+        policy_checks={"iterative_mode": True, "parallel_chapters": mode == "parallel"}
     )
     
     script_draft = ScriptDraft(
@@ -300,7 +260,8 @@ async def writer_node(state: Dict[str, Any]) -> Dict[str, Any]:
         metadata={
             "title": insight_pack.get("positioning", {}).get("thesis", "Untitled"),
             "hookType": insight_pack.get("hook_plan", {}).get("hook_type", "curiosity"),
-            "estimatedDurationMin": 10
+            "estimatedDurationMin": 10,
+            "writer_timing": writer_timing,
         },
         script=final_script,
         claims=[],
@@ -315,9 +276,192 @@ async def writer_node(state: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _assign_chapter_facts(chapter_plans: List[Dict], facts: List[Dict]) -> List[set]:
+    """챕터별 배정 팩트 (required_facts + 미배정 기사 팩트 보정)"""
+    all_chapter_facts = [
+        set(plan.get("required_facts", [])) for plan in chapter_plans
+    ]
+    if not all_chapter_facts:
+        return all_chapter_facts
+    
+    # ★ 안전장치: 모든 기사(source_index)에서 최소 1개 팩트가 배정되도록 보장
+    # Insight Builder가 일부 기사의 팩트를 required_facts에 넣지 않으면
+    # 해당 기사의 인용번호(③④ 등)가 대본에 아예 등장하지 않는 문제 방지
+    all_assigned = set()
+    for s in all_chapter_facts:
+        all_assigned.update(s)
+    
+    # 기사별로 최소 1개 팩트가 배정되었는지 확인
+    source_indices_covered = set()
+    for f in facts:
+        if f.get("id") in all_assigned:
+            source_indices_covered.add(f.get("source_index", -1))
+    
+    orphan_facts = []
+    for f in facts:
+        src_idx = f.get("source_index", -1)
+        if src_idx not in source_indices_covered and f.get("id"):
+            orphan_facts.append(f)
+            source_indices_covered.add(src_idx)  # 기사당 1개만
+    
+    if orphan_facts:
+        # 마지막 챕터에 미배정 팩트 추가
+        last_idx = len(all_chapter_facts) - 1
+        for f in orphan_facts:
+            all_chapter_facts[last_idx].add(f["id"])
+        orphan_sources = [f.get("source_name", "?") for f in orphan_facts]
+        logger.warning(
+            f"★ 미배정 기사 팩트 {len(orphan_facts)}개를 마지막 챕터에 추가: "
+            f"{orphan_sources}"
+        )
+    return all_chapter_facts
+
+
+def _dedupe_chapter_facts(all_chapter_facts: List[set]) -> List[set]:
+    """여러 챕터에 배정된 팩트는 처음 배정된 챕터에만 남김 (병렬 모드의 사전 중복 제거)"""
+    seen = set()
+    deduped = []
+    for assigned in all_chapter_facts:
+        deduped.append(assigned - seen)
+        seen |= assigned
+    return deduped
+
+
+async def _write_sequential(ctx: "WriterContext", chapter_plans: List[Dict], all_chapter_facts: List[set],
+                            progress: Optional["BeatProgress"] = None):
+    """순차 모드: Intro → 각 챕터 → Outro (도입부 다양성 + 팩트 격리 + Self-Check)"""
+    all_chapter_facts = [set(s) for s in all_chapter_facts]
+    
+    logger.info("Generating Intro...")
+    hook = await _generate_intro(ctx.base)
+    
+    chapters = []
+    if chapter_plans:
+        logger.info(f"Generating {len(chapter_plans)} chapters SEQUENTIALLY...")
+    previous_openings = []   # 이전 챕터 도입 문장 (패턴 반복 방지)
+    used_facts_summary = []  # 이전 챕터에서 사용된 팩트 요약
+    
+    for i, plan in enumerate(chapter_plans, 1):
+        # 이 챕터의 배정 팩트만 포함된 컨텍스트 생성
+        chapter_context = ctx.for_chapter(
+            filter_fact_ids=all_chapter_facts[i - 1],
+            used_facts_summary=used_facts_summary if used_facts_summary else None
+        )
+        ch = await _write_chapter(
+            chapter_context, plan, i, all_chapter_facts[i - 1],
+            previous_openings=previous_openings, progress=progress
+        )
+        cited_ids = set(ref for beat in ch.beats for ref in beat.fact_references)
+        
+        # 이전 챕터 도입 문장 수집
+        if ch.beats:
+            first_line = ch.beats[0].line[:60]
+            previous_openings.append(f"Ch{i}: \"{first_line}\"")
+        
+        # 이전 챕터 사용 팩트 요약 수집 + 다음 챕터에서 제외
+        used_facts_summary.extend(ctx.used_summary(cited_ids, i))
+        # 이미 인용된 팩트를 다음 챕터 배정에서 제거 (코드 레벨 중복 방지)
+        for future_idx in range(i, len(all_chapter_facts)):
+            all_chapter_facts[future_idx] -= cited_ids
+        
+        chapters.append(ch)
+        logger.info(f"Chapter {i} generated: {ch.title}")
+    
+    logger.info("Generating Outro...")
+    closing = await _generate_outro(ctx.base)
+    return hook, chapters, closing
+
+
+async def _write_parallel(ctx: "WriterContext", channel_profile: Dict,
+                          chapter_plans: List[Dict], all_chapter_facts: List[set],
+                          progress: Optional["BeatProgress"] = None):
+    """
+    병렬 모드: Intro / 챕터들 / Outro를 동시에 생성한 뒤 챕터 경계만 다듬기
+    
+    챕터는 기획(chapter_plans)과 팩트 배정만 공유하고 서로의 본문에는 의존하지 않으므로,
+    순차 모드에서 앞 챕터 결과로 하던 일을 다음으로 대신합니다.
+      - 팩트 중복 방지: 여러 챕터에 배정된 팩트는 처음 배정된 챕터에만 남김
+      - 반복 방지 요약: 앞 챕터에 '배정된' 팩트를 이미 다뤄진 내용으로 전달
+      - 도입부 다양성/연결: 생성 후 _smooth_transitions 1회 호출
+    챕터 동시 생성 수는 WRITER_CHAPTER_CONCURRENCY로 제한합니다.
+    """
+    chapter_facts = _dedupe_chapter_facts(all_chapter_facts)
+    semaphore = asyncio.Semaphore(max(1, WRITER_CHAPTER_CONCURRENCY))
+    
+    async def write(i: int, plan: Dict) -> Chapter:
+        used_facts_summary = [
+            s for j in range(1, i) for s in ctx.used_summary(chapter_facts[j - 1], j)
+        ]
+        chapter_context = ctx.for_chapter(
+            filter_fact_ids=chapter_facts[i - 1],
+            used_facts_summary=used_facts_summary if used_facts_summary else None
+        )
+        async with semaphore:
+            ch = await _write_chapter(chapter_context, plan, i, chapter_facts[i - 1], progress=progress)
+        logger.info(f"Chapter {i} generated: {ch.title}")
+        return ch
+    
+    logger.info(
+        f"Generating Intro/Outro + {len(chapter_plans)} chapters IN PARALLEL "
+        f"(concurrency={WRITER_CHAPTER_CONCURRENCY})..."
+    )
+    tasks = [
+        asyncio.create_task(_generate_intro(ctx.base)),
+        asyncio.create_task(_generate_outro(ctx.base)),
+        *(asyncio.create_task(write(i, plan)) for i, plan in enumerate(chapter_plans, 1))
+    ]
+    try:
+        hook, closing, *chapters = await asyncio.gather(*tasks)
+    except BaseException:
+        # 하나라도 실패하면 나머지 작업을 취소 (순차 폴백 중에 남은 LLM 호출이 계속 나가지 않도록)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    
+    await _smooth_transitions(chapters, channel_profile)
+    return hook, chapters, closing
+
+
+async def _write_chapter(context_str: str, chapter_plan: Dict, chapter_index: int,
+                         required_ids: set, previous_openings: List[str] = None,
+                         progress: Optional["BeatProgress"] = None) -> Chapter:
+    """챕터 1개 생성 + Self-Check (누락 팩트가 있으면 1회 재생성)"""
+    chapter_progress = progress.chapter(chapter_index) if progress else None
+    ch = await _generate_chapter(
+        context_str, chapter_plan, chapter_index,
+        previous_openings=previous_openings, progress=chapter_progress
+    )
+    
+    cited_ids = set(ref for beat in ch.beats for ref in beat.fact_references)
+    missing = required_ids - cited_ids
+    if missing:
+        logger.warning(f"Ch{chapter_index}: 미인용 팩트 {len(missing)}개 → 재생성")
+        ch = await _generate_chapter(
+            context_str, chapter_plan, chapter_index,
+            previous_openings=previous_openings,
+            must_include_facts=list(missing),
+            progress=chapter_progress
+        )
+    
+    ch.chapter_id = str(chapter_index)
+    ch.narration = "\n".join(beat.line for beat in ch.beats)
+    return ch
+
+
+def _apply_citation_fixes(hook: Hook, chapters: List[Chapter], fact_marker_map: Dict[str, str]) -> None:
+    """Hook과 모든 Beat의 인용번호 교정 후 챕터 narration 재조립"""
+    hook.text = _fix_citation_numbers(hook.text, hook.fact_references, fact_marker_map)
+    for ch in chapters:
+        for beat in ch.beats:
+            beat.line = _fix_citation_numbers(beat.line, beat.fact_references, fact_marker_map)
+        ch.narration = "\n".join(beat.line for beat in ch.beats)
+
+
 async def writer_rewrite_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     Verifier 피드백 루프: critical 이슈가 있는 Beat만 재생성
+    (graph: verifier → writer_rewrite → verifier, 최대 WRITER_MAX_REWRITE_ROUNDS 라운드)
     
     Input: script_draft, verifier_output, news_data, channel_profile, insight_pack
     Output: 수정된 script_draft + verifier_retry_count 증가
@@ -351,10 +495,11 @@ async def writer_rewrite_node(state: Dict[str, Any]) -> Dict[str, Any]:
             beat_issues[bid] = []
         beat_issues[bid].append(issue)
     
-    logger.info(f"Critical Beat {len(beat_issues)}개 재생성 (retry {retry_count + 1}/2)")
+    logger.info(f"Critical Beat {len(beat_issues)}개 재생성 (retry {retry_count + 1}/{WRITER_MAX_REWRITE_ROUNDS})")
     
-    # 3. 컨텍스트 조립 (원래 Writer와 동일)
-    base_context = _build_writer_context(channel_profile, insight_pack, facts, opinions)
+    # 3. 컨텍스트 조립 (원래 Writer와 동일, 인용번호 교정용 fact_marker_map 포함)
+    ctx = WriterContext(channel_profile, insight_pack, facts, opinions)
+    base_context = ctx.base
     
     # 4-A. Hook 재생성 (hook beat_id가 이슈에 포함된 경우)
     script = script_draft.get("script", {})
@@ -373,43 +518,55 @@ async def writer_rewrite_node(state: Dict[str, Any]) -> Dict[str, Any]:
             new_hook = await _rewrite_single_beat(
                 base_context, hook_beat, "Hook (인트로)", feedback, facts
             )
-            # Hook 텍스트 교체
+            new_hook.line = _fix_citation_numbers(new_hook.line, new_hook.fact_references, ctx.fact_marker_map)
+            # Hook 텍스트·인용 팩트 교체
             if isinstance(script.get("hook"), dict):
                 script["hook"]["text"] = new_hook.line
+                script["hook"]["fact_references"] = new_hook.fact_references
             else:
                 script["hook"] = new_hook.line
             logger.info("Hook 재생성 완료")
         except Exception as e:
             logger.warning(f"Hook 재생성 실패: {e}")
     
-    # 4-B. 챕터 Beat 재생성
+    # 4-B. 챕터 Beat 재생성 (이슈 Beat끼리는 서로 독립이므로 동시에)
     chapters = script.get("chapters", [])
+    targets = [
+        (ch_idx, beat_idx, beat)
+        for ch_idx, chapter in enumerate(chapters)
+        for beat_idx, beat in enumerate(chapter.get("beats", []))
+        if beat.get("beat_id", "") in beat_issues
+    ]
     
-    for ch_idx, chapter in enumerate(chapters):
-        beats = chapter.get("beats", [])
-        for beat_idx, beat in enumerate(beats):
-            bid = beat.get("beat_id", "")
-            if bid not in beat_issues:
-                continue
-            
-            feedback = "\n".join([
-                f"- [{i.get('issue_type')}] {i.get('description')}"
-                for i in beat_issues[bid]
-            ])
-            
-            try:
-                new_beat = await _rewrite_single_beat(
-                    base_context, beat, chapter.get("title", ""), feedback, facts
-                )
-                chapters[ch_idx]["beats"][beat_idx] = new_beat.model_dump()
-                
-                chapters[ch_idx]["narration"] = "\n".join(
-                    b.get("line", "") if isinstance(b, dict) else b.line
-                    for b in chapters[ch_idx]["beats"]
-                )
-                logger.info(f"Beat '{bid}' 재생성 완료")
-            except Exception as e:
-                logger.warning(f"Beat '{bid}' 재생성 실패: {e}")
+    async def rewrite(ch_idx: int, beat: Dict) -> Beat:
+        feedback = "\n".join([
+            f"- [{i.get('issue_type')}] {i.get('description')}"
+            for i in beat_issues[beat.get("beat_id", "")]
+        ])
+        return await _rewrite_single_beat(
+            base_context, beat, chapters[ch_idx].get("title", ""), feedback, facts
+        )
+    
+    results = await asyncio.gather(
+        *(rewrite(ch_idx, beat) for ch_idx, _, beat in targets), return_exceptions=True
+    )
+    rewritten_chapters = set()
+    for (ch_idx, beat_idx, beat), new_beat in zip(targets, results):
+        bid = beat.get("beat_id", "")
+        if isinstance(new_beat, Exception):
+            logger.warning(f"Beat '{bid}' 재생성 실패: {new_beat}")
+            continue
+        new_beat.line = _fix_citation_numbers(new_beat.line, new_beat.fact_references, ctx.fact_marker_map)
+        chapters[ch_idx]["beats"][beat_idx] = new_beat.model_dump()
+        rewritten_chapters.add(ch_idx)
+        logger.info(f"Beat '{bid}' 재생성 완료")
+    
+    # 재생성된 Beat가 있는 챕터만 narration 재조립 (교정된 인용번호 반영)
+    for ch_idx in rewritten_chapters:
+        chapters[ch_idx]["narration"] = "\n".join(
+            b.get("line", "") if isinstance(b, dict) else b.line
+            for b in chapters[ch_idx]["beats"]
+        )
     
     # 5. script_draft 업데이트
     script_draft["script"]["chapters"] = chapters
@@ -512,10 +669,16 @@ Generate the Hook object.
 
 async def _generate_chapter(context_str: str, chapter_plan: Dict, chapter_index: int,
                            previous_openings: List[str] = None,
-                           must_include_facts: List[str] = None) -> Chapter:
-    """Step 2: Single Chapter 생성 (팩트 격리 + 도입부 다양성 + Self-Check)"""
+                           must_include_facts: List[str] = None,
+                           progress: Optional["ChapterProgress"] = None) -> Chapter:
+    """
+    Step 2: Single Chapter 생성 (팩트 격리 + 도입부 다양성 + Self-Check)
+    
+    progress가 있으면 응답을 스트리밍하며 완성된 Beat마다 진행 이벤트를 보냅니다.
+    스트리밍 여부와 관계없이 같은 요청(Chapter 함수 호출)과 같은 파싱(_parse_chapter_args)을 거칩니다.
+    """
     llm = ChatOpenAI(model=MODEL_NAME, temperature=0.4)
-    structured_llm = llm.with_structured_output(Chapter)
+    chapter_llm = llm.bind_tools([_CHAPTER_TOOL], tool_choice="Chapter", parallel_tool_calls=False)
     
     required_facts = chapter_plan.get("required_facts", [])
     
@@ -567,18 +730,104 @@ async def _generate_chapter(context_str: str, chapter_plan: Dict, chapter_index:
 
 **OUTPUT**: A single Chapter object with multiple Beats.
 """
+    messages = [
+        SystemMessage(content=_build_system_prompt("Write DETAILED content.")),
+        HumanMessage(content=prompt)
+    ]
     for attempt in range(3):
         try:
-            return await structured_llm.ainvoke([
-                SystemMessage(content=_build_system_prompt("Write DETAILED content.")),
-                HumanMessage(content=prompt)
-            ])
+            if progress is None:
+                response = await chapter_llm.ainvoke(messages)
+                if not response.tool_calls:
+                    raise ValueError("Chapter 함수 호출 결과 없음")
+                return _parse_chapter_args(response.tool_calls[0]["args"])
+            
+            progress.reset()
+            return await _stream_chapter(chapter_llm, messages, progress)
         except Exception as e:
             logger.warning(f"Chapter {chapter_index} 생성 실패 (시도 {attempt+1}/3): {e}")
             if attempt == 2:
                 raise
             await asyncio.sleep(2)
 
+def _parse_chapter_args(args: Dict) -> Chapter:
+    """Chapter 함수 호출 인자 → Chapter (스트리밍/일반 경로 공통)"""
+    return Chapter.model_validate(args)
+
+
+async def _stream_chapter(chapter_llm, messages: List, progress: "ChapterProgress") -> Chapter:
+    """
+    Chapter 함수 호출 인자를 스트리밍으로 받으며 beats 배열의 원소가 닫힐 때마다 진행 이벤트 발행.
+    
+    최종 결과는 모은 인자 전체를 일반 경로와 같은 방식(json.loads → _parse_chapter_args)으로 파싱합니다.
+    """
+    parser = IncrementalArrayParser("beats")
+    async for chunk in chapter_llm.astream(messages):
+        for call in chunk.tool_call_chunks:
+            if call.get("index") not in (None, 0) or not call.get("args"):
+                continue
+            for item in parser.feed(call["args"]):
+                try:
+                    beat = Beat.model_validate(item)
+                except Exception:
+                    continue  # 불완전한 Beat는 진행 이벤트만 건너뜀 (최종 파싱에서 검증)
+                await progress.emit(beat)
+    
+    if not parser.text:
+        raise ValueError("Chapter 함수 호출 결과 없음")
+    return _parse_chapter_args(json.loads(parser.text, strict=False))
+
+
+class BeatProgress:
+    """
+    스트리밍 진행 상황 (writer 실행 1회분)
+    
+    완성된 Beat마다 LangGraph 커스텀 이벤트 "writer_progress"를 발행하고
+    (graph.generate_script가 astream_events로 받아 진행 메시지로 전달),
+    writer 시작부터 첫 Beat까지 걸린 시간(time_to_first_beat_sec)을 기록합니다.
+    """
+    
+    def __init__(self, total_chapters: int, started: float):
+        self.total_chapters = total_chapters
+        self.started = started
+        self.first_beat_sec: Optional[float] = None
+        self.beats: Dict[int, int] = {}  # 챕터 번호 → 현재 시도에서 완성된 Beat 수
+    
+    def chapter(self, chapter_index: int) -> "ChapterProgress":
+        return ChapterProgress(self, chapter_index)
+    
+    async def _emit(self, chapter_index: int, beat: Beat) -> None:
+        if self.first_beat_sec is None:
+            self.first_beat_sec = round(time.perf_counter() - self.started, 2)
+            logger.info(f"첫 Beat 완성: {self.first_beat_sec}s (Ch{chapter_index})")
+        self.beats[chapter_index] = self.beats.get(chapter_index, 0) + 1
+        try:
+            await adispatch_custom_event("writer_progress", {
+                "chapter": chapter_index,
+                "total_chapters": self.total_chapters,
+                "beat_id": beat.beat_id,
+                "chapter_beats": self.beats[chapter_index],
+                "total_beats": sum(self.beats.values()),
+            })
+        except Exception as e:
+            # 그래프 밖에서 직접 호출한 경우 (상위 실행 컨텍스트 없음)
+            logger.debug(f"writer_progress 이벤트 발행 생략: {e}")
+
+
+class ChapterProgress:
+    """챕터 1개의 진행 상황 (재시도/재생성 시 reset)"""
+    
+    def __init__(self, run: BeatProgress, chapter_index: int):
+        self.run = run
+        self.chapter_index = chapter_index
+    
+    def reset(self) -> None:
+        self.run.beats[self.chapter_index] = 0
+    
+    async def emit(self, beat: Beat) -> None:
+        await self.run._emit(self.chapter_index, beat)
+
+
 async def _generate_outro(context_str: str) -> Closing:
     """Step 3: Outro 생성"""
     llm = ChatOpenAI(model=MODEL_NAME, temperature=0.5)
@@ -613,32 +862,78 @@ Generate the Closing object.
                 raise
             await asyncio.sleep(2)
 
-CIRCLE_NUMBERS = ["①", "②", "③", "④", "⑤", "⑥", "⑦", "⑧", "⑨", "⑩",
-                  "⑪", "⑫", "⑬", "⑭", "⑮", "⑯", "⑰", "⑱", "⑲", "⑳"]
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+
+
+def _locked_tokens(text: str) -> List[str]:
+    """경계 다듬기 전후로 바뀌면 안 되는 수치·인용번호"""
+    return sorted(_NUMBER_RE.findall(text) + [c for c in text if c in CIRCLE_NUMBERS])
 
 
-def _build_fact_marker_map(facts: List[Dict]) -> Dict[str, str]:
-    """fact_id → 원형번호(①②③) 매핑 생성 (인용번호 후처리용)"""
-    article_idx_to_marker: Dict[int, str] = {}
-    next_marker_idx = 0
-    fact_to_marker: Dict[str, str] = {}
+async def _smooth_transitions(chapters: List[Chapter], channel_profile: Dict) -> None:
+    """
+    병렬 생성한 챕터들의 경계 다듬기 (저비용 모델 1회 호출)
     
-    for f in facts:
-        art_idx = f.get("source_index")
-        if art_idx is None:
-            source_indices = f.get("source_indices", [])
-            art_idx = source_indices[0] if source_indices and isinstance(source_indices[0], int) else 0
-        
-        if art_idx not in article_idx_to_marker:
-            marker = CIRCLE_NUMBERS[next_marker_idx] if next_marker_idx < len(CIRCLE_NUMBERS) else f"[{next_marker_idx+1}]"
-            article_idx_to_marker[art_idx] = marker
-            next_marker_idx += 1
-        
-        fact_id = f.get("id", "")
-        if fact_id:
-            fact_to_marker[fact_id] = article_idx_to_marker[art_idx]
+    각 챕터(2번째부터)의 첫 Beat만 앞 챕터 마지막 Beat에 이어지도록 고칩니다.
+    수치·인용번호가 달라진 결과는 버리고 원문을 유지하며, 호출이 실패해도 원문 그대로 둡니다.
+    """
+    boundaries = [
+        (prev, ch) for prev, ch in zip(chapters, chapters[1:])
+        if prev.beats and ch.beats
+    ]
+    if not boundaries:
+        return
     
-    return fact_to_marker
+    boundary_str = ""
+    for prev, ch in boundaries:
+        boundary_str += (
+            f"\n### Ch{ch.chapter_id}: {ch.title}\n"
+            f"- 앞 챕터(Ch{prev.chapter_id}) 마지막 문단: {prev.beats[-1].line}\n"
+            f"- 이 챕터 첫 문단: {ch.beats[0].line}\n"
+        )
+    
+    tone_str = f"\n**채널 톤앤매너**: {channel_profile['tone_manner']}\n" if channel_profile.get("tone_manner") else ""
+    prompt = f"""
+아래는 챕터별로 따로 작성한 유튜브 대본의 챕터 경계입니다.
+각 챕터의 **첫 문단**만 다듬어 앞 챕터 마지막 문단에서 자연스럽게 이어지게 하세요.
+{tone_str}
+**규칙**:
+- 수치, 고유명사, 인용번호(①②③)는 그대로 유지하세요 (추가/삭제/변경 금지).
+- 내용은 바꾸지 말고 첫 문장의 연결만 다듬으세요. 말투(어미)는 원문을 유지하세요.
+- 챕터마다 서로 다른 방식으로 시작하세요 (같은 첫 단어/패턴 반복 금지).
+- "자 여러분", "자 그러면", "자 이제", "안녕하세요", "여러분"으로 시작하지 마세요.
+- 고칠 필요가 없으면 원문을 그대로 반환하세요.
+{boundary_str}
+각 챕터의 chapter_id와 다듬은 첫 문단 전체(line)를 반환하세요. 한국어로 작성하세요.
+"""
+    llm = ChatOpenAI(model=TRANSITION_MODEL_NAME, temperature=0.3)
+    structured_llm = llm.with_structured_output(TransitionPass)
+    try:
+        result = await structured_llm.ainvoke([
+            SystemMessage(content="You are a Korean YouTube script editor. Only smooth chapter transitions."),
+            HumanMessage(content=prompt)
+        ])
+    except Exception as e:
+        logger.warning(f"챕터 경계 다듬기 실패 (원문 유지): {e}")
+        return
+    
+    by_id = {ch.chapter_id: ch for _, ch in boundaries}
+    smoothed = 0
+    for t in result.transitions:
+        ch = by_id.get(t.chapter_id)
+        if ch is None or not t.line.strip():
+            continue
+        first = ch.beats[0]
+        if _locked_tokens(t.line) != _locked_tokens(first.line):
+            logger.info(f"Ch{t.chapter_id} 경계 다듬기 결과 수치/인용번호 변경 → 원문 유지")
+            continue
+        first.line = t.line.strip()
+        smoothed += 1
+    logger.info(f"챕터 경계 다듬기: {smoothed}/{len(boundaries)}개 적용")
+
+
+CIRCLE_NUMBERS = ["①", "②", "③", "④", "⑤", "⑥", "⑦", "⑧", "⑨", "⑩",
+                  "⑪", "⑫", "⑬", "⑭", "⑮", "⑯", "⑰", "⑱", "⑲", "⑳"]
 
 
 def _fix_citation_numbers(text: str, fact_references: List[str], fact_marker_map: Dict[str, str]) -> str:
@@ -689,9 +984,111 @@ def _fix_citation_numbers(text: str, fact_references: List[str], fact_marker_map
     
     return text
 
-def _build_writer_context(channel: Dict, insight: Dict, facts: List[Dict], opinions: List[str] = [],
-                          filter_fact_ids: set = None, used_facts_summary: List[str] = None) -> str:
-    """공통 컨텍스트 조립 (기사 기준 인라인 출처 번호 포함, 챕터별 팩트 필터링 지원)"""
+def _article_index(fact: Dict) -> int:
+    """팩트의 기사 번호 (source_index → source_indices[0] → 0)"""
+    art_idx = fact.get("source_index")
+    if art_idx is None:
+        source_indices = fact.get("source_indices", [])
+        art_idx = source_indices[0] if source_indices and isinstance(source_indices[0], int) else 0
+    return art_idx
+
+
+class WriterContext:
+    """
+    Writer 실행 1회분의 공통 컨텍스트 (한 번 만들고 챕터마다 재사용)
+    
+    생성 시 팩트 목록을 한 번만 순회해 다음을 준비합니다.
+      - facts_by_id: fact_id → 팩트 (같은 ID가 여러 개면 먼저 나온 것)
+      - fact_marker_map: fact_id → 기사 번호(①②③) (인용번호 후처리용)
+      - 채널/블루프린트/인용 규칙/의견 프롬프트 조각과 기사별 팩트 줄 (미리 렌더링)
+      - base: 전체 팩트가 들어간 컨텍스트 (Intro/Outro/Rewrite용)
+    챕터 컨텍스트(for_chapter)는 배정 팩트 필터링과 '이미 다룬 내용' 요약만 새로 만듭니다.
+    """
+    
+    def __init__(self, channel: Dict, insight: Dict, facts: List[Dict], opinions: List[str] = []):
+        self.facts = facts
+        self.facts_by_id: Dict[str, Dict] = {}
+        self.fact_marker_map: Dict[str, str] = {}
+        
+        # 기사(article) 기준으로 번호 매핑: source_index(확정) → 기사 번호 (필터 전, 번호 일관성 유지)
+        article_idx_to_marker: Dict[int, str] = {}
+        article_idx_to_source: Dict[int, str] = {}
+        self._fact_lines: Dict[int, List[tuple]] = {}  # 기사 번호 → [(fact_id, 렌더링된 줄)]
+        for f in facts:
+            art_idx = _article_index(f)
+            if art_idx not in article_idx_to_marker:
+                n = len(article_idx_to_marker)
+                article_idx_to_marker[art_idx] = CIRCLE_NUMBERS[n] if n < len(CIRCLE_NUMBERS) else f"[{n+1}]"
+                article_idx_to_source[art_idx] = f.get("source_name", "")
+            
+            fact_id = f.get("id")
+            if fact_id:
+                self.facts_by_id.setdefault(fact_id, f)
+                self.fact_marker_map[fact_id] = article_idx_to_marker[art_idx]
+            self._fact_lines.setdefault(art_idx, []).append(
+                (fact_id, f"  - [{fact_id}] {f.get('content')}\n")
+            )
+        
+        self._article_headers = {
+            art_idx: f"\n### {article_idx_to_marker[art_idx]} {article_idx_to_source[art_idx]}\n"
+            for art_idx in article_idx_to_marker
+        }
+        self._article_order = sorted(self._fact_lines.keys())
+        
+        self._head = (
+            _render_channel_section(channel)
+            + _render_blueprint_section(insight)
+            + _FACT_RULES
+        )
+        self._opinions = _render_opinions_section(opinions, article_idx_to_marker, article_idx_to_source)
+        self.base = self.for_chapter()
+    
+    def for_chapter(self, filter_fact_ids: set = None, used_facts_summary: List[str] = None) -> str:
+        """배정 팩트만 포함한 컨텍스트 (filter_fact_ids=None이면 전체 팩트)"""
+        f_str = ""
+        # 이전 챕터에서 사용된 팩트 요약 (반복 방지)
+        if used_facts_summary:
+            f_str += "\n### ⚠️ 이전 챕터에서 이미 다뤄진 내용 (반복 금지)\n"
+            for s in used_facts_summary:
+                f_str += f"- {s}\n"
+            f_str += "\n"
+        
+        # 기사별 그룹핑 표시 (filter_fact_ids 적용)
+        for art_idx in self._article_order:
+            lines = [
+                line for fact_id, line in self._fact_lines[art_idx]
+                if filter_fact_ids is None or fact_id in filter_fact_ids
+            ]
+            if lines:
+                f_str += self._article_headers[art_idx] + "".join(lines)
+        
+        return self._head + f_str + self._opinions
+    
+    def used_summary(self, fact_ids, chapter_index: int) -> List[str]:
+        """'이전 챕터에서 이미 다뤄진 내용' 항목 (팩트 목록 순서)"""
+        return [
+            f"\"{self.facts_by_id[fid].get('content', '')[:50]}\" (Ch{chapter_index}에서 사용됨)"
+            for fid in self.ordered_ids(fact_ids)
+        ]
+    
+    def ordered_ids(self, fact_ids) -> List[str]:
+        """fact_ids 중 실제 존재하는 팩트 ID를 팩트 목록 순서로"""
+        return [fid for fid in self.facts_by_id if fid in fact_ids]
+
+
+_FACT_RULES = (
+    "\n## AVAILABLE FACTS\n"
+    "**인용 규칙 (필수)**:\n"
+    "- 아래 팩트는 **기사(출처) 단위**로 묶여 있습니다.\n"
+    "- 팩트를 인용할 때 반드시 **해당 기사 섹션 제목의 번호**(①②③)를 문장 끝에 붙이세요.\n"
+    "- 예시: ① 출처의 팩트면 → '불만이 70% 감소했습니다①'\n"
+    "- ⚠️ 번호를 절대 혼동하지 마세요. 각 기사 섹션 제목의 번호를 그대로 쓰세요.\n"
+    "- ⚠️ 아래 나열된 팩트를 **전부** 인용하세요. 하나라도 빠지면 실패입니다.\n"
+)
+
+
+def _render_channel_section(channel: Dict) -> str:
+    """CHANNEL 섹션 (페르소나/톤/패턴)"""
     c_str = f"## CHANNEL: {channel.get('name', 'Unknown')}\n"
     c_str += f"- 타겟 시청자: {channel.get('target_audience', '일반 시청자')}\n"
     
@@ -742,7 +1139,11 @@ def _build_writer_context(channel: Dict, insight: Dict, facts: List[Dict], opini
         c_str += f"\n### 영상 유형별 구조 (참고)\n"
         for vtype, structure in channel["content_structures"].items():
             c_str += f"- {vtype}: {structure}\n"
-    
+    return c_str
+
+
+def _render_blueprint_section(insight: Dict) -> str:
+    """BLUEPRINT 섹션 (논지/훅 전략/전체 목차)"""
     i_str = f"""
 ## BLUEPRINT
 **Thesis**: {insight.get("positioning", {}).get("thesis")}
@@ -754,60 +1155,12 @@ def _build_writer_context(channel: Dict, insight: Dict, facts: List[Dict], opini
         i_str += "\n**전체 목차**:\n"
         for idx, ch in enumerate(chapters_outline, 1):
             i_str += f"  {idx}. {ch.get('title', '')} -- {ch.get('goal', '')}\n"
-    # 기사(article) 기준으로 번호 매핑: source_index(확정) → 기사 번호
-    article_idx_to_marker: Dict[int, str] = {}
-    article_idx_to_source: Dict[int, str] = {}
-    next_marker_idx = 0
+    return i_str
 
-    # 1단계: 전체 팩트 순회 → 기사별 번호 매핑 (필터 전, 번호 일관성 유지)
-    for f in facts:
-        art_idx = f.get("source_index")
-        if art_idx is None:
-            source_indices = f.get("source_indices", [])
-            art_idx = source_indices[0] if source_indices and isinstance(source_indices[0], int) else 0
-        if art_idx not in article_idx_to_marker:
-            marker = CIRCLE_NUMBERS[next_marker_idx] if next_marker_idx < len(CIRCLE_NUMBERS) else f"[{next_marker_idx+1}]"
-            article_idx_to_marker[art_idx] = marker
-            article_idx_to_source[art_idx] = f.get("source_name", "")
-            next_marker_idx += 1
-
-    f_str = "\n## AVAILABLE FACTS\n"
-    f_str += (
-        "**인용 규칙 (필수)**:\n"
-        "- 아래 팩트는 **기사(출처) 단위**로 묶여 있습니다.\n"
-        "- 팩트를 인용할 때 반드시 **해당 기사 섹션 제목의 번호**(①②③)를 문장 끝에 붙이세요.\n"
-        "- 예시: ① 출처의 팩트면 → '불만이 70% 감소했습니다①'\n"
-        "- ⚠️ 번호를 절대 혼동하지 마세요. 각 기사 섹션 제목의 번호를 그대로 쓰세요.\n"
-        "- ⚠️ 아래 나열된 팩트를 **전부** 인용하세요. 하나라도 빠지면 실패입니다.\n"
-    )
-    # 이전 챕터에서 사용된 팩트 요약 (반복 방지)
-    if used_facts_summary:
-        f_str += "\n### ⚠️ 이전 챕터에서 이미 다뤄진 내용 (반복 금지)\n"
-        for s in used_facts_summary:
-            f_str += f"- {s}\n"
-        f_str += "\n"
-
-    # 2단계: 기사별 그룹핑 표시 (filter_fact_ids 적용)
-    source_groups: Dict[int, List[Dict]] = {}
-    for f in facts:
-        art_idx = f.get("source_index")
-        if art_idx is None:
-            source_indices = f.get("source_indices", [])
-            art_idx = source_indices[0] if source_indices and isinstance(source_indices[0], int) else 0
-        # 챕터별 팩트 필터링
-        if filter_fact_ids is not None and f.get("id") not in filter_fact_ids:
-            continue
-        if art_idx not in source_groups:
-            source_groups[art_idx] = []
-        source_groups[art_idx].append(f)
-
-    for art_idx in sorted(source_groups.keys()):
-        marker = article_idx_to_marker[art_idx]
-        source_name = article_idx_to_source.get(art_idx, "Unknown")
-        f_str += f"\n### {marker} {source_name}\n"
-        for f in source_groups[art_idx]:
-            f_str += f"  - [{f.get('id')}] {f.get('content')}\n"
-        
+
+def _render_opinions_section(opinions: List[str], article_idx_to_marker: Dict[int, str],
+                             article_idx_to_source: Dict[int, str]) -> str:
+    """AVAILABLE QUOTES/OPINIONS 섹션 (출처명 → 기사 번호)"""
     o_str = "\n## AVAILABLE QUOTES/OPINIONS\n"
     o_str += (
         "**인용 규칙**: 아래 의견/주장을 인용할 때도 반드시 출처 번호를 문장 끝에 붙이세요.\n"
@@ -824,5 +1177,4 @@ def _build_writer_context(channel: Dict, insight: Dict, facts: List[Dict], opini
                 op_marker = article_idx_to_marker.get(art_idx, "")
                 break
         o_str += f"- {op_marker} {op}\n"
-        
-    return c_str + i_str + f_str + o_str
+    return o_str
@@ -1,29 +1,41 @@
 """
 YouTube Fetcher Node - 유튜브 영상 검색 에이전트
 주제와 관련된 인기 유튜브 영상을 검색하여 경쟁사 분석 재료를 제공합니다.
+
+경쟁사 분석용 영상은 먼저 이미 저장된 자막/분석 전문 검색(TranscriptSearchService)에서 찾고,
+일치하는 영상이 YT_STORED_MIN_HITS개 이상이면 YouTube 검색을 생략합니다 (부족하면 쿼리 1개로 줄여 보충).
 """
 
+import asyncio
 import logging
+import os
 import re
-from typing import Dict, Any, List
+import uuid
+from typing import Dict, Any, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.youtube_service import YouTubeService
-from app.core.db import get_db
+from app.services.transcript_search_service import TranscriptSearchService
+from app.core.db import get_db, AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
 
+# 저장 영상 검색 결과가 이 수 이상이면 경쟁사 분석용 YouTube 검색 생략
+YT_STORED_MIN_HITS = int(os.getenv("YT_STORED_MIN_HITS", "3"))
+STORED_SEARCH_LIMIT = 5
+
 
-def yt_fetcher_node(state: Dict[str, Any]) -> Dict[str, Any]:
+async def yt_fetcher_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     YouTube에서 주제 관련 인기 영상을 검색하는 노드
 
     Input (from state):
         - topic: 주제
         - content_brief: Planner가 생성한 검색 쿼리
+        - user_id: 저장 영상 검색 범위 (사용자 본인의 경쟁 채널)
 
     Output (to state):
-        - youtube_data: 검색된 영상 리스트 (제목, URL, 조회수, 채널 등)
+        - youtube_data: 검색된 영상 리스트 (저장 영상 검색 결과 우선, 제목, URL, 조회수, 채널 등)
                         + related_videos: UI 표시용 관련 영상 2개
     """
     logger.info("=" * 60)
@@ -42,20 +54,31 @@ def yt_fetcher_node(state: Dict[str, Any]) -> Dict[str, Any]:
         search_queries = [topic]
         logger.warning(f"[YT Fetcher] youtube_keywords 없음 → 주제로 대체: {topic}")
 
-    # 2. 경쟁사 분석용 YouTube 검색 (기존)
-    videos = []
-    try:
-        logger.info(f"[YT Fetcher] 경쟁사 분석용 검색 시작 (쿼리: {search_queries[:2]})")
-        videos = _search_youtube_videos(search_queries[:2])
-        logger.info(f"[YT Fetcher] 경쟁사 분석용 검색 완료: {len(videos)}개 영상")
-    except Exception as e:
-        logger.error(f"[YT Fetcher] 경쟁사 분석용 검색 실패: {e}", exc_info=True)
+    # 2. 저장된 자막/분석에서 먼저 검색 (YouTube API 쿼터 절약)
+    stored_videos = await _search_stored_videos(_stored_search_queries(state), state.get("user_id"))
+    videos = list(stored_videos)
+
+    # 3. 경쟁사 분석용 YouTube 검색 (저장 영상이 충분하면 생략, 부족하면 쿼리 1개로 축소)
+    if len(stored_videos) >= YT_STORED_MIN_HITS:
+        logger.info(f"[YT Fetcher] 저장 영상 {len(stored_videos)}개 → 경쟁사 분석용 YouTube 검색 생략")
+    else:
+        queries = search_queries[:1] if stored_videos else search_queries[:2]
+        try:
+            logger.info(f"[YT Fetcher] 경쟁사 분석용 검색 시작 (쿼리: {queries}, 저장 영상 {len(stored_videos)}개)")
+            seen_ids = {v["video_id"] for v in videos}
+            for v in await asyncio.to_thread(_search_youtube_videos, queries):
+                if v.get("video_id") not in seen_ids:
+                    seen_ids.add(v.get("video_id"))
+                    videos.append(v)
+            logger.info(f"[YT Fetcher] 경쟁사 분석용 검색 완료: {len(videos)}개 영상")
+        except Exception as e:
+            logger.error(f"[YT Fetcher] 경쟁사 분석용 검색 실패: {e}", exc_info=True)
 
-    # 3. UI 표시용 관련 영상 검색 (신규)
+    # 4. UI 표시용 관련 영상 검색 (신규)
     related_videos = []
     try:
         logger.info(f"[YT Fetcher] 관련 영상 검색 시작 (키워드: {search_queries[:2]})")
-        related_videos = _search_related_videos_for_display(search_queries[:2], topic)
+        related_videos = await asyncio.to_thread(_search_related_videos_for_display, search_queries[:2], topic)
         logger.info(f"[YT Fetcher] 관련 영상 검색 완료: {len(related_videos)}개")
         for i, v in enumerate(related_videos):
             logger.info(
@@ -76,6 +99,7 @@ def yt_fetcher_node(state: Dict[str, Any]) -> Dict[str, Any]:
             "videos": videos,
             "related_videos": related_videos,
             "search_queries_used": search_queries[:2],
+            "stored_video_count": len(stored_videos),
         }
     }
 
@@ -389,6 +413,47 @@ def _mock_youtube_search(query: str, max_results: int) -> List[Dict]:
 # 헬퍼
 # =============================================================================
 
+def _stored_search_queries(state: Dict[str, Any]) -> List[str]:
+    """
+    저장 영상 검색어: 추천 주제 검색 키워드 + 플래너 youtube_keywords (없으면 주제 문장).
+
+    주제 문장 전체를 검색어 하나로 넘기면 plainto_tsquery가 모든 단어를 AND로 묶고
+    ILIKE도 문장 전체와 일치해야 해서 거의 매칭되지 않는다.
+    """
+    topic_context = (state.get("channel_profile") or {}).get("topic_context") or {}
+    keywords = [
+        *(topic_context.get("search_keywords") or []),
+        *((state.get("content_brief") or {}).get("search_queries") or []),
+    ]
+    keywords = [k.strip() for k in keywords if isinstance(k, str) and k.strip()]
+    return keywords or [state.get("topic", "")]
+
+
+async def _search_stored_videos(queries: List[str], user_id: Optional[str]) -> List[Dict[str, Any]]:
+    """저장된 자막/분석 요약에서 검색어 중 하나라도 일치하는 영상을 검색 (실패 시 빈 결과 → YouTube 검색)."""
+    try:
+        async with AsyncSessionLocal() as db:
+            matches = await TranscriptSearchService.search_any(
+                db, queries, uuid.UUID(str(user_id)) if user_id else None, limit=STORED_SEARCH_LIMIT
+            )
+    except Exception as e:
+        logger.warning(f"[YT Fetcher] 저장 영상 검색 실패: {e}")
+        return []
+
+    logger.info(f"[YT Fetcher] 저장 영상 검색 {len(matches)}건 (검색어: {queries})")
+    return [
+        {
+            "video_id": m["video_id"],
+            "title": m["title"],
+            "channel_title": m["channel_title"] or "",
+            "view_count": m["view_count"] or 0,
+            "url": f"https://www.youtube.com/watch?v={m['video_id']}",
+            "source": "stored",
+        }
+        for m in matches
+    ]
+
+
 def _extract_topic_keywords(topic: str) -> set:
     """주제에서 핵심 키워드 추출 (2자 이상, 불용어 제외)"""
     stop_words = {"은", "는", "이", "가", "을", "를", "의", "에", "와", "과", "도",
@@ -0,0 +1,20 @@
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
+
+class ArticleFact(BaseModel):
+    """기사에서 추출한 검증 가능한 팩트"""
+    content: str = Field(description="팩트 내용 (완결된 한 문장, 한국어)")
+    category: Literal["Statistic", "Event", "Quote", "Fact"] = Field("Fact", description="팩트 유형")
+    value: Optional[str] = Field(None, description="핵심 수치·키워드 (없으면 null)")
+
+class ArticleAnalysisBody(BaseModel):
+    """기사 내용 분석 결과"""
+    key_points: List[str] = Field(description="영상 주제와 관련해 기사가 말하는 핵심 포인트 3~5개 (서술형 완결 문장, 한국어)")
+    facts: List[ArticleFact] = Field(description="검증 가능한 팩트 3~6개")
+    opinions: List[str] = Field(default_factory=list, description="전문가 의견/해석 '[태그] 발언자/기관명: 의견 내용' (발언자 필수, 한국어)")
+
+class ArticleAnalysis(BaseModel):
+    """Article Analyzer 기사 1건 구조화 출력"""
+    source: str = Field(description="언론사/출처명 (예: 매일경제, TechCrunch, 네이버 블로그)")
+    summary_short: str = Field(description="기사 핵심 1문장 요약 (한국어, 40자 이내)")
+    analysis: ArticleAnalysisBody
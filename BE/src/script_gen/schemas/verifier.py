@@ -2,7 +2,7 @@
 Verifier Schema - 팩트 체크 & 출처 정리
 """
 
-from typing import List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -76,6 +76,8 @@ class VerificationReport(BaseModel):
     valid_fact_references: int
     issues: List[VerificationIssue]
     suspicious_beats: List[str] = Field(default=[], description="Deep 검증이 필요한 Beat ID 리스트")
+    semantic_check: Dict[str, Any] = Field(default={}, description="Phase 3 의미 대조 호출/토큰 통계")
+    rounds: List[Dict[str, Any]] = Field(default=[], description="검증 라운드별 재검증/재사용 Beat 수 (0 = 초안)")
 
 
 class VerifierOutput(BaseModel):
@@ -23,6 +23,7 @@ class ScriptGenState(TypedDict, total=False):
         → Insight Builder (insight_pack)
         → Writer (script_draft)
         → Verifier (verifier_output)
+          ⇄ Writer Rewrite (script_draft 부분 수정, verifier_retry_count)
     """
     
     # ==========================================================================
@@ -34,6 +35,9 @@ class ScriptGenState(TypedDict, total=False):
     topic_request_id: str
     """요청 ID (트래킹용)"""
     
+    user_id: Optional[str]
+    """요청한 사용자 ID (저장 영상 검색 등 사용자 범위 조회용, 없으면 사용자 데이터 제외)"""
+    
     channel_profile: Dict[str, Any]
     """
     채널 정보 (build_planner_input에서 생성)
@@ -61,6 +65,20 @@ class ScriptGenState(TypedDict, total=False):
             - recommendation_reason: 추천 이유
     """
     
+    insight_mode: str
+    """
+    Insight Builder 전략 수립 모드 (선택, 기본값: 환경변수 INSIGHT_MODE 또는 "two_pass")
+        - "two_pass": 초안 생성 후 별도 호출로 비평·수정
+        - "single_pass": 초안 + 자기비평 + 최종본을 구조화 호출 1회로 (실패 시 two_pass)
+    """
+    
+    writer_mode: str
+    """
+    Writer 챕터 작성 모드 (선택, 기본값: 환경변수 WRITER_MODE 또는 "parallel")
+        - "parallel": 챕터 동시 생성 후 챕터 경계 다듬기
+        - "sequential": 챕터를 순서대로 생성 (이전 챕터 도입문/인용 팩트 반영)
+    """
+    
     # ==========================================================================
     # 1.5. Intent Analyzer 노드 결과 (Planner 이전)
     # ==========================================================================
@@ -195,3 +213,13 @@ class ScriptGenState(TypedDict, total=False):
         - warnings: 경고 사항
         - final_script: 최종 검증된 스크립트
     """
+    
+    verifier_retry_count: int
+    """Verifier → Writer Rewrite 재작성 루프 라운드 수 (writer_rewrite_node가 증가, 최대 WRITER_MAX_REWRITE_ROUNDS)"""
+    
+    verifier_cache: Dict[str, Any]
+    """
+    Beat 판정 캐시 (재작성 루프에서 바뀌지 않은 Beat의 판정 재사용)
+    
+    구조: 문장 + 인용 팩트(ID, 원문) 해시 → BeatVerification dict
+    """
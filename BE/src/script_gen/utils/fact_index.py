@@ -0,0 +1,168 @@
+"""
+Verifier 팩트 색인
+
+Verifier 1회 실행 동안 재사용하는 색인입니다. 팩트 목록을 한 번만 훑어서
+    - fact_id → 팩트
+    - 팩트별 수치(정규화 값) / 정규화 값 → 그 수치가 나오는 팩트 ID
+를 만들어 두고, Beat마다 팩트 목록을 다시 순회하거나 정규식을 다시 만들지 않습니다.
+
+수치 정규화:
+    "1,200만" → 12,000,000 / "1.2조"·"1조 2000억" → 1,200,000,000,000
+    "40%" → 40 (퍼센트), "2.5배" → 2.5 (배수). 퍼센트·배수·일반 수량은 서로 다른 값으로 취급합니다.
+
+    index = FactIndex(facts)
+    index.get("f3")
+    index.unmatched_numbers("매출이 1.2조원으로 늘었다", ["f3"])   # 인용 팩트에 없는 수치
+    index.facts_with_numbers("매출이 1.2조원으로 늘었다")           # 같은 수치가 나오는 팩트 ID
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 숫자 + (선택) 단위. "1,200", "3.5", "0.25" 등
+# 세 번째 그룹은 공백만 사이에 두고 다음 숫자가 이어지는지 ("1조 2000억"의 "1조 " 뒤)
+_NUMBER_TOKEN = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(조|억|만|%|배|달러|원|명)?(?=(\s*\d)?)")
+# 대본에서 검증할 수치 표현 (숫자 + 단위)
+_CLAIM_NUMBER = re.compile(r"(\d[\d,\.]*)\s*(%|억|만|조|배|달러|원|명)")
+
+_KOREAN_SCALE = {"조": 10 ** 12, "억": 10 ** 8, "만": 10 ** 4}
+
+# (종류, 값): 종류는 "%"(퍼센트), "배"(배수), ""(일반 수량)
+NumberKey = Tuple[str, float]
+
+
+def _key(value: float, unit: Optional[str]) -> NumberKey:
+    if unit == "%" or unit == "배":
+        return (unit, value)
+    scale = _KOREAN_SCALE.get(unit, 1)
+    return ("", round(value * scale, 6) if scale > 1 else value)
+
+
+def _scan(tokens: Iterable[Tuple[str, Optional[str], str]]) -> List[Tuple[NumberKey, Optional[NumberKey]]]:
+    """
+    숫자 토큰 (숫자, 단위, 다음 숫자와 붙어 있는지) → (토큰 값, 복합 값).
+    "1조 2000억"처럼 큰 단위에서 작은 단위로 공백만 사이에 두고 이어지는 토큰은
+    하나의 복합 값으로도 묶는다 (조 > 억 > 만 > 단위 없음/원/명/달러).
+    """
+    result = []
+    run_start = 0        # 현재 복합 수량이 시작된 result 위치
+    run_total = 0.0
+    run_scale = 0        # 이어 붙일 수 있는 직전 배율 (0이면 묶을 수 없음)
+
+    for core, unit, adjacent in tokens:
+        value = float(core.replace(",", "") if "," in core else core)
+        if unit == "%" or unit == "배":
+            key, scale = (unit, value), 0
+        else:
+            scale = _KOREAN_SCALE.get(unit, 1)
+            key = ("", round(value * scale, 6) if scale > 1 else value)
+
+        if scale and scale < run_scale:
+            run_total += value * scale
+        else:
+            if len(result) - run_start > 1:
+                _close_run(result, run_start, run_total)
+            run_start, run_total = len(result), value * scale
+
+        result.append((key, None))
+        run_scale = scale if scale > 1 and adjacent else 0
+
+    if len(result) - run_start > 1:
+        _close_run(result, run_start, run_total)
+    return result
+
+
+def _close_run(result: list, start: int, total: float) -> None:
+    """복합 수량으로 묶인 토큰(start 이후)에 복합 값을 채운다."""
+    compound = ("", round(total, 6))
+    for i in range(start, len(result)):
+        result[i] = (result[i][0], compound)
+
+
+def number_keys(text: str) -> Set[NumberKey]:
+    """텍스트에 나오는 모든 수치의 정규화 값 (토큰 값 + 복합 값)"""
+    keys = set()
+    for key, compound in _scan(_NUMBER_TOKEN.findall(text or "")):
+        keys.add(key)
+        if compound is not None:
+            keys.add(compound)
+    return keys
+
+
+class FactIndex:
+    """fact_id / 수치 → 팩트 색인 (Verifier 실행마다 1회 생성)"""
+
+    def __init__(self, facts: Iterable[Dict]):
+        self.facts_by_id: Dict[str, Dict] = {}
+        self.numbers_by_fact: Dict[str, Set[NumberKey]] = {}
+        self.facts_by_number: Dict[NumberKey, List[str]] = defaultdict(list)
+
+        for fact in facts:
+            fact_id = fact.get("id")
+            self.facts_by_id[fact_id] = fact
+            keys = number_keys(fact.get("content", ""))
+            self.numbers_by_fact[fact_id] = keys
+            for key in keys:
+                self.facts_by_number[key].append(fact_id)
+
+    def __contains__(self, fact_id: str) -> bool:
+        return fact_id in self.facts_by_id
+
+    def get(self, fact_id: str) -> Optional[Dict]:
+        return self.facts_by_id.get(fact_id)
+
+    def unmatched_numbers(self, beat_text: str, fact_ids: Iterable[str]) -> List[str]:
+        """
+        대본 문장의 숫자+단위가 인용 팩트에 없으면 반환 (할루시네이션 수치 탐지용).
+
+        인용 팩트 원문에 숫자가 그대로 있거나, 정규화 값이 같으면("1.2조" = "1조 2000억",
+        "1,200만" = "12,000,000") 일치로 본다. 1자리 숫자("2배" 등 흔한 표현)는 무시.
+        """
+        fact_ids = [fid for fid in fact_ids if fid in self.facts_by_id]
+        cited = [self.numbers_by_fact[fid] for fid in fact_ids]
+        cited_text = None
+        compounds = None
+        unmatched = []
+        for m in _CLAIM_NUMBER.finditer(beat_text):
+            core = m.group(1).replace(",", "")
+            if len(core.replace(".", "")) < 2:
+                continue
+            try:
+                key = _key(float(core.rstrip(".")), m.group(2))
+            except ValueError:  # "1.2.3%" 같은 잘못된 표기
+                key = None
+            if any(key in keys for keys in cited):
+                continue
+            if cited_text is None:
+                cited_text = " ".join(self.facts_by_id[fid].get("content", "") for fid in fact_ids)
+            if core in cited_text:
+                continue
+            if compounds is None:
+                matches = list(_NUMBER_TOKEN.finditer(beat_text))
+                compounds = {
+                    tm.start(): compound
+                    for tm, (_, compound) in zip(matches, _scan(tm.groups("") for tm in matches))
+                    if compound
+                }
+            compound = compounds.get(m.start())
+            if compound and any(compound in keys for keys in cited):
+                continue
+            unmatched.append(m.group(0).strip())
+
+        return list(dict.fromkeys(unmatched))
+
+    def facts_with_numbers(self, beat_text: str, limit: int = 3) -> List[str]:
+        """대본 문장의 수치(숫자+단위)가 원문에 나오는 팩트 ID (출처 후보)"""
+        candidates: List[str] = []
+        tokens = _NUMBER_TOKEN.findall(beat_text)
+        for (_, unit, _), (key, compound) in zip(tokens, _scan(tokens)):
+            if not unit:
+                continue
+            for k in (compound, key) if compound else (key,):
+                for fact_id in self.facts_by_number.get(k, ()):
+                    if fact_id not in candidates:
+                        candidates.append(fact_id)
+                        if len(candidates) >= limit:
+                            return candidates
+        return candidates
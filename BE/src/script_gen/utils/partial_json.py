@@ -0,0 +1,89 @@
+"""
+스트리밍 JSON 점진 파서
+
+LLM이 JSON을 토큰 단위로 내보내는 동안, 최상위 객체의 지정 키 배열(예: Chapter.beats)에서
+원소 객체가 닫히는 즉시 꺼냅니다. 아직 끝나지 않은(잘린) 입력은 그대로 두고 다음 조각을 기다리며,
+전체 문서는 스트림이 끝난 뒤 따로 파싱합니다.
+
+    parser = IncrementalArrayParser("beats")
+    for piece in stream:
+        for beat in parser.feed(piece):
+            ...
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalArrayParser:
+
+    def __init__(self, key: str):
+        self.key = key
+        self._text = ""
+        self._pos = 0
+        self._depth = 0                  # 현재 열린 컨테이너 수
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+        self._keys: Dict[int, str] = {}  # 깊이 → 그 객체에서 마지막으로 읽은 키
+        self._array_depth: Optional[int] = None  # 대상 배열이 열린 뒤의 깊이
+        self._item_start: Optional[int] = None
+        self.done = False                # 대상 배열이 닫혔는지
+
+    def feed(self, piece: str) -> List[Any]:
+        """조각을 이어 붙이고, 이번에 완성된 배열 원소(디코딩된 값)를 반환."""
+        self._text += piece
+        items = []
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    self._last_string = text[self._string_start + 1:i]
+                continue
+
+            if c == '"':
+                self._in_string = True
+                self._string_start = i
+            elif c == ":":
+                self._keys[self._depth] = self._last_string
+            elif c in "{[":
+                if (
+                    c == "[" and self._array_depth is None and not self.done
+                    and self._depth == 1 and self._keys.get(1) == self.key
+                ):
+                    self._array_depth = self._depth + 1
+                elif c == "{" and self._depth == self._array_depth:
+                    self._item_start = i
+                self._depth += 1
+            elif c in "}]":
+                self._depth -= 1
+                if c == "}" and self._depth == self._array_depth and self._item_start is not None:
+                    raw = text[self._item_start:i + 1]
+                    self._item_start = None
+                    try:
+                        items.append(json.loads(raw, strict=False))
+                    except json.JSONDecodeError as e:
+                        logger.debug(f"[PartialJSON] 원소 파싱 실패 (건너뜀): {e}")
+                elif c == "]" and self._array_depth is not None and self._depth == self._array_depth - 1:
+                    self._array_depth = None
+                    self.done = True
+                self._keys.pop(self._depth + 1, None)
+
+        self._pos = len(text)
+        return items
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 전체 텍스트."""
+        return self._text
@@ -0,0 +1 @@
+"""Core 테스트 패키지"""
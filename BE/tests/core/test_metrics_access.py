@@ -0,0 +1,44 @@
+"""
+/metrics 접근 제한 테스트 (내부망 또는 X-Metrics-Token)
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import security
+from app.core.security import require_internal_request
+
+
+def _request(host):
+    return SimpleNamespace(client=SimpleNamespace(host=host) if host else None)
+
+
+@pytest.fixture
+def no_token(monkeypatch):
+    monkeypatch.setattr(security.settings, "metrics_token", None)
+
+
+@pytest.mark.parametrize("host", ["127.0.0.1", "::1", "10.0.3.7", "172.18.0.2", "192.168.1.20"])
+def test_internal_clients_allowed_without_token(no_token, host):
+    """토큰 미설정 시 루프백/사설망 요청 허용"""
+    require_internal_request(_request(host), None)
+
+
+@pytest.mark.parametrize("host", ["1.1.1.1", "8.8.8.8", "testclient", None])
+def test_external_or_unknown_clients_rejected(no_token, host):
+    """공인 IP, 알 수 없는 클라이언트는 403"""
+    with pytest.raises(HTTPException) as exc:
+        require_internal_request(_request(host), None)
+    assert exc.value.status_code == 403
+
+
+def test_token_required_when_configured(monkeypatch):
+    """토큰 설정 시 내부망이어도 헤더가 일치해야 허용"""
+    monkeypatch.setattr(security.settings, "metrics_token", "s3cret")
+
+    require_internal_request(_request("1.1.1.1"), "s3cret")
+    for token in (None, "wrong"):
+        with pytest.raises(HTTPException) as exc:
+            require_internal_request(_request("127.0.0.1"), token)
+        assert exc.value.status_code == 403
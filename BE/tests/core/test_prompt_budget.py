@@ -0,0 +1,90 @@
+"""
+토큰 기준 프롬프트 예산 테스트
+
+토크나이저(tiktoken / 바이트 길이 추정)에 관계없이 성립하는 성질만 검사한다.
+"""
+from app.core.prompt_budget import PromptBudget, count_tokens, truncate_to_tokens
+from app.services.video_analyzer import TRANSCRIPT_TOKEN_BUDGET, sample_transcript
+
+_ARTICLE = " ".join(
+    f"{i}번째 문장에서는 기준금리가 {i}.5% 움직였다고 설명합니다." for i in range(1, 200)
+)
+
+
+class TestTruncate:
+
+    def test_short_text_is_unchanged(self):
+        assert truncate_to_tokens("짧은 문장입니다.", 100) == "짧은 문장입니다."
+        assert count_tokens("") == 0
+
+    def test_head_cut_at_sentence_boundary(self):
+        cut = truncate_to_tokens(_ARTICLE, 200)
+
+        assert count_tokens(cut) <= 200
+        assert _ARTICLE.startswith(cut)
+        assert cut.endswith("설명합니다.")
+
+    def test_tail_starts_at_sentence_boundary(self):
+        cut = truncate_to_tokens(_ARTICLE, 200, keep="tail")
+
+        assert count_tokens(cut) <= 200
+        assert _ARTICLE.endswith(cut)
+        assert cut[0].isdigit()  # "N번째 문장..."의 시작
+
+    def test_ellipsis_counts_toward_budget(self):
+        cut = truncate_to_tokens(_ARTICLE, 150, ellipsis="...")
+
+        assert cut.endswith("설명합니다....")
+        assert count_tokens(cut) <= 150
+
+    def test_no_sentence_boundary_falls_back_to_words(self):
+        text = " ".join(["자막"] * 500)  # 자동 자막처럼 문장부호가 없는 텍스트
+        cut = truncate_to_tokens(text, 100)
+
+        assert count_tokens(cut) <= 100
+        assert cut.endswith("자막")
+
+
+class TestPromptBudget:
+
+    def test_priority_order_and_section_caps(self):
+        result = (
+            PromptBudget(600)
+            .add("body", _ARTICLE, priority=1)
+            .add("visuals", "[차트] 금리 추이", priority=0, max_tokens=50)
+            .add("comments", _ARTICLE, priority=2, max_tokens=100)
+            .allocate()
+        )
+
+        # 추가한 순서 유지, 우선순위 높은 섹션은 원문 그대로
+        assert list(result.sections) == ["body", "visuals", "comments"]
+        assert result.sections["visuals"] == "[차트] 금리 추이"
+        # comments는 body가 문장 경계에서 잘리고 남긴 예산만 사용
+        counts = result.token_counts
+        assert counts["comments"] <= 600 - counts["visuals"] - counts["body"]
+        assert result.truncated == ["body", "comments"]
+        assert result.total_tokens <= 600
+        assert result.token_counts["body"] == count_tokens(result.sections["body"])
+        assert result.original_counts["body"] == count_tokens(_ARTICLE)
+
+    def test_fits_without_truncation(self):
+        result = PromptBudget(1000).add("a", "가나다.").add("b", "라마바.").allocate()
+
+        assert result.sections == {"a": "가나다.", "b": "라마바."}
+        assert result.truncated == []
+        assert "총" in result.summary()
+
+
+class TestSampleTranscript:
+
+    def test_short_transcript_is_unchanged(self):
+        assert sample_transcript("안녕하세요. 오늘은 금리 이야기입니다.") == "안녕하세요. 오늘은 금리 이야기입니다."
+
+    def test_long_transcript_sampled_within_budget(self):
+        transcript = _ARTICLE * 5
+        sampled = sample_transcript(transcript)
+
+        assert count_tokens(sampled) <= TRANSCRIPT_TOKEN_BUDGET
+        assert sampled.count("[...중간 생략...]") == 2
+        assert sampled.startswith("1번째 문장")
+        assert sampled.endswith("설명합니다.")
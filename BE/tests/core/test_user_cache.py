@@ -0,0 +1,163 @@
+"""
+인증 사용자 조회 캐시 테스트
+"""
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.security import create_access_token, get_current_user
+from app.core.user_cache import CachedUser, UserCache, token_fingerprint, user_cache
+
+
+def _user(**overrides):
+    values = dict(
+        id=uuid.uuid4(), email="a@test.com", name="홍길동", avatar_url=None, google_sub="g1",
+        created_at=datetime(2026, 1, 1), updated_at=datetime(2026, 1, 1),
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class _Result:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class _FakeDB:
+    """execute 호출 순서대로 미리 정한 결과를 돌려주는 세션."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.queries = 0
+
+    async def execute(self, stmt):
+        self.queries += 1
+        return _Result(self.results.pop(0))
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+class TestUserCache:
+    """TTL / 크기 제한 / 무효화 / 통계"""
+
+    def test_hit_miss_and_hit_rate(self):
+        cache = UserCache(ttl_sec=30, max_size=10)
+        snapshot = CachedUser.from_user(_user())
+        key = ("jwt", str(snapshot.id), "fp")
+
+        assert cache.get(key) is None
+        cache.put(key, snapshot)
+        assert cache.get(key) is snapshot
+        assert cache.get(key) is snapshot
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (2, 1, 0.667)
+
+    def test_expires_at_token_expiry_before_ttl(self, monkeypatch):
+        cache = UserCache(ttl_sec=30, max_size=10)
+        now = [1000.0]
+        monkeypatch.setattr("app.core.user_cache.time.monotonic", lambda: now[0])
+
+        cache.put(("jwt", "u", "fp"), CachedUser.from_user(_user()), expires_in=5)
+        now[0] += 6
+        assert cache.get(("jwt", "u", "fp")) is None
+
+        cache.put(("jwt", "u", "expired"), CachedUser.from_user(_user()), expires_in=-1)
+        assert cache.stats()["size"] == 0
+
+    def test_bounded_size_evicts_least_recently_used(self):
+        cache = UserCache(ttl_sec=30, max_size=2)
+        users = [CachedUser.from_user(_user()) for _ in range(3)]
+        cache.put(("jwt", "0", "a"), users[0])
+        cache.put(("jwt", "1", "b"), users[1])
+        cache.get(("jwt", "0", "a"))
+        cache.put(("jwt", "2", "c"), users[2])
+
+        assert cache.get(("jwt", "1", "b")) is None
+        assert cache.get(("jwt", "0", "a")) is users[0]
+
+    def test_invalidate_user_and_token(self):
+        cache = UserCache(ttl_sec=30, max_size=10)
+        snapshot = CachedUser.from_user(_user())
+        cache.put(("jwt", str(snapshot.id), token_fingerprint("t1")), snapshot)
+        cache.put(("session", None, token_fingerprint("s1")), snapshot)
+        cache.put(("session", None, token_fingerprint("s2")), CachedUser.from_user(_user()))
+
+        assert cache.invalidate_token("s2") == 1
+        assert cache.invalidate_user(snapshot.id) == 2
+        assert cache.stats()["size"] == 0
+
+    def test_snapshot_is_read_only(self):
+        snapshot = CachedUser.from_user(_user())
+        with pytest.raises(AttributeError):
+            snapshot.email = "b@test.com"
+
+
+class TestGetCurrentUser:
+    """get_current_user 캐시 적용"""
+
+    @pytest.mark.asyncio
+    async def test_jwt_lookup_cached_per_token(self):
+        user = _user()
+        token = create_access_token(str(user.id), user.email)
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        db = _FakeDB(user)
+
+        first = await get_current_user(db=db, authorization=credentials, session_token=None)
+        second = await get_current_user(db=db, authorization=credentials, session_token=None)
+
+        assert db.queries == 1
+        assert first is second and isinstance(first, CachedUser)
+        assert first.id == user.id and first.email == user.email
+
+    @pytest.mark.asyncio
+    async def test_user_change_invalidates(self):
+        user = _user()
+        token = create_access_token(str(user.id), user.email)
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        db = _FakeDB(user, _user(id=user.id, name="새 이름"))
+
+        await get_current_user(db=db, authorization=credentials, session_token=None)
+        user_cache.invalidate_user(user.id)
+        refreshed = await get_current_user(db=db, authorization=credentials, session_token=None)
+
+        assert db.queries == 2
+        assert refreshed.name == "새 이름"
+
+    @pytest.mark.asyncio
+    async def test_session_cookie_cached_until_logout(self):
+        user = _user()
+        session = SimpleNamespace(user_id=user.id, expires_at=datetime.utcnow() + timedelta(days=1))
+        db = _FakeDB(session, user, None)
+
+        await get_current_user(db=db, authorization=None, session_token="cookie")
+        await get_current_user(db=db, authorization=None, session_token="cookie")
+        assert db.queries == 2  # sessions + users 1회씩
+
+        user_cache.invalidate_token("cookie")  # AuthService.revoke_session
+        with pytest.raises(HTTPException) as exc:
+            await get_current_user(db=db, authorization=None, session_token="cookie")
+        assert exc.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_missing_user_not_cached(self):
+        user = _user()
+        token = create_access_token(str(user.id), user.email)
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        db = _FakeDB(None, user)
+
+        with pytest.raises(HTTPException):
+            await get_current_user(db=db, authorization=credentials, session_token=None)
+        assert (await get_current_user(db=db, authorization=credentials, session_token=None)).id == user.id
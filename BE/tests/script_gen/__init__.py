@@ -0,0 +1 @@
+"""Script generation 테스트 패키지"""
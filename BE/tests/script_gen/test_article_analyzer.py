@@ -0,0 +1,191 @@
+"""
+Article Analyzer 노드 테스트 (구조화 출력 LLM은 기사 제목별 응답 큐로 대체)
+"""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("trafilatura")
+pytest.importorskip("playwright")
+pytest.importorskip("langchain_openai")
+
+from src.script_gen.nodes import article_analyzer
+from src.script_gen.schemas.article import ArticleAnalysis
+
+_BODY = "한국은행이 기준금리를 0.25%p 인하했다. " * 10
+_SUMMARY = "한국은행이 기준금리를 인하해 대출 금리가 내려갈 전망이다."
+
+
+def _analysis(source="테스트일보"):
+    return ArticleAnalysis.model_validate({
+        "source": source,
+        "summary_short": "기준금리 0.25%p 인하",
+        "analysis": {
+            "key_points": ["금리 인하로 대출 이자 부담이 줄어든다."],
+            "facts": [
+                {"content": "기준금리가 연 3.25%로 내려갔다.", "category": "Statistic", "value": "3.25%"},
+                {"content": "금통위가 만장일치로 결정했다."},
+            ],
+            "opinions": ["[전망] 김OO 교수: 하반기에 효과가 나타날 것"],
+        },
+    })
+
+
+def _ok():
+    return {"raw": SimpleNamespace(usage_metadata={"input_tokens": 100, "output_tokens": 20}),
+            "parsed": _analysis(), "parsing_error": None}
+
+
+def _unparsed():
+    return {"raw": SimpleNamespace(usage_metadata={"input_tokens": 100, "output_tokens": 5}),
+            "parsed": None, "parsing_error": ValueError("facts 누락")}
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+    def __init__(self, retry_after_ms="10"):
+        super().__init__("Error code: 429 - rate_limit_exceeded")
+        self.response = SimpleNamespace(headers={"retry-after-ms": retry_after_ms})
+
+
+class _FakeChatOpenAI:
+    """기사 제목(프롬프트에 포함)별 응답 큐: dict 결과 또는 예외"""
+
+    script = {}
+    kwargs = {}
+
+    def __init__(self, **kwargs):
+        _FakeChatOpenAI.kwargs = kwargs
+
+    def with_structured_output(self, schema, include_raw=False):
+        assert schema is ArticleAnalysis and include_raw
+        return self
+
+    async def ainvoke(self, messages):
+        prompt = messages[0].content
+        title = next(t for t in self.script if f'"{t}"' in prompt)
+        outcome = self.script[title].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class _RecordingLimiter(article_analyzer.AdaptiveConcurrency):
+    waits = []
+
+    def throttle(self, acquired_at, retry_after_sec):
+        _RecordingLimiter.waits.append(retry_after_sec)
+        super().throttle(acquired_at, retry_after_sec)
+
+
+@pytest.fixture(autouse=True)
+def fake_llm(monkeypatch):
+    _FakeChatOpenAI.script = {}
+    _RecordingLimiter.waits = []
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(article_analyzer, "ChatOpenAI", _FakeChatOpenAI)
+    monkeypatch.setattr(article_analyzer, "AdaptiveConcurrency", _RecordingLimiter)
+    monkeypatch.setattr(article_analyzer, "RETRY_BASE_DELAY", 0.01)
+    return _FakeChatOpenAI
+
+
+def _article(title, content=_BODY, **extra):
+    return {"id": f"a-{title}", "title": title, "url": "", "content": content, "summary_short": _SUMMARY, **extra}
+
+
+async def _run(*articles):
+    out = await article_analyzer.article_analyzer_node({"topic": "금리", "news_data": {"articles": list(articles)}})
+    news = out["news_data"]
+    return news, {m["article_id"]: m for m in news["analysis_metrics"]["articles"]}
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_retry_after_then_success(fake_llm):
+    fake_llm.script = {"기사A": [_RateLimited("10"), _ok()]}
+
+    news, metrics = await _run(_article("기사A"))
+
+    m = metrics["a-기사A"]
+    assert m["status"] == "ok"
+    assert m["throttled"] == 1 and m["retries"] == 1 and m["parse_retries"] == 0
+    assert m["retry_wait_sec"] == 0.01
+    assert _RecordingLimiter.waits == [0.01]
+    assert fake_llm.kwargs["max_retries"] == 0
+
+    art = news["articles"][0]
+    assert art["source"] == "테스트일보" and art["summary_short"] == "기준금리 0.25%p 인하"
+    assert art["analysis"]["facts"] == ["기준금리가 연 3.25%로 내려갔다.", "금통위가 만장일치로 결정했다."]
+    assert "_raw_facts" not in art["analysis"]
+    facts = news["structured_facts"]
+    assert [(f["category"], f["value"]) for f in facts] == [("Statistic", "3.25%"), ("Fact", "N/A")]
+    assert facts[0]["source_name"] == "테스트일보" and facts[0]["source_index"] == 0
+    assert news["structured_opinions"] == ["[테스트일보] [전망] 김OO 교수: 하반기에 효과가 나타날 것"]
+
+
+@pytest.mark.asyncio
+async def test_parse_failure_retried_once(fake_llm):
+    fake_llm.script = {"기사A": [_unparsed(), _ok()]}
+
+    _, metrics = await _run(_article("기사A"))
+
+    m = metrics["a-기사A"]
+    assert m["status"] == "ok"
+    assert m["parse_retries"] == 1 and m["retries"] == 1 and m["throttled"] == 0
+    # 두 응답의 토큰 사용량 합산
+    assert m["input_tokens"] == 200 and m["output_tokens"] == 25
+
+
+@pytest.mark.asyncio
+async def test_repeated_parse_failure_uses_summary_fallback(fake_llm):
+    fake_llm.script = {"기사A": [_unparsed(), _unparsed()]}
+
+    news, metrics = await _run(_article("기사A"))
+
+    m = metrics["a-기사A"]
+    assert m["status"] == "fallback" and "facts 누락" in m["error"]
+    assert news["articles"][0]["analysis"]["facts"] == [_SUMMARY]
+    assert news["articles"][0]["analysis"]["key_points"] == [_SUMMARY]
+    assert [f["content"] for f in news["structured_facts"]] == [_SUMMARY]
+
+
+@pytest.mark.asyncio
+async def test_exhausted_rate_limit_does_not_block_others(fake_llm):
+    fake_llm.script = {
+        "기사A": [_RateLimited("10") for _ in range(article_analyzer.MAX_RETRY)],
+        "기사B": [_ok()],
+    }
+
+    news, metrics = await _run(_article("기사A"), _article("기사B"))
+
+    a = metrics["a-기사A"]
+    assert a["status"] == "fallback"
+    assert a["throttled"] == article_analyzer.MAX_RETRY
+    assert a["retries"] == article_analyzer.MAX_RETRY - 1
+    # 마지막 429는 대기하지 않으므로 대기 시간/차단에 포함되지 않음
+    assert a["retry_wait_sec"] == round(0.01 * (article_analyzer.MAX_RETRY - 1), 2)
+    assert _RecordingLimiter.waits[-1] == 0.0
+    assert metrics["a-기사B"]["status"] == "ok"
+    assert news["analysis_metrics"]["throttled"] == article_analyzer.MAX_RETRY
+
+
+@pytest.mark.asyncio
+async def test_short_article_skipped_and_metrics_summary(fake_llm):
+    fake_llm.script = {"기사A": [_ok()]}
+
+    news, metrics = await _run(_article("기사A"), _article("짧은 기사", content="짧음"))
+
+    assert metrics["a-짧은 기사"]["status"] == "skipped"
+    assert news["articles"][1]["analysis"]["facts"] == [_SUMMARY]
+
+    summary = news["analysis_metrics"]
+    assert summary["initial_concurrency"] == article_analyzer.INITIAL_CONCURRENCY
+    assert summary["peak_concurrency"] >= summary["initial_concurrency"]
+    assert summary["final_concurrency"] >= 1
+    assert summary["throttled"] == 0 and summary["retries"] == 0
+    assert summary["input_tokens"] == 100 and summary["output_tokens"] == 20
+    assert summary["wall_time_sec"] >= 0
+    assert set(metrics["a-기사A"]) >= {
+        "title", "status", "latency_sec", "throttled", "parse_retries", "retries",
+        "retry_wait_sec", "input_tokens", "output_tokens",
+    }
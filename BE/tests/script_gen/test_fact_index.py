@@ -0,0 +1,63 @@
+"""
+Verifier 팩트 색인 테스트
+"""
+from src.script_gen.utils.fact_index import FactIndex, number_keys
+
+_FACTS = [
+    {"id": "f1", "content": "2025년 3분기 매출은 1조 2000억원, 이용자는 1,200만명이다."},
+    {"id": "f2", "content": "점유율은 40.0%로 전년보다 2.5배 늘었다."},
+    {"id": "f3", "content": "해외 매출은 3억 5000만 달러를 기록했다."},
+]
+
+
+class TestNumberKeys:
+
+    def test_korean_units_and_compounds(self):
+        keys = number_keys(_FACTS[0]["content"])
+
+        assert ("", 1_200_000_000_000) in keys      # 1조 2000억 (복합)
+        assert ("", 200_000_000_000) in keys        # 2000억 (토큰 단독)
+        assert ("", 12_000_000) in keys             # 1,200만
+
+    def test_percent_and_multiplier_are_separate_kinds(self):
+        keys = number_keys(_FACTS[1]["content"])
+
+        assert ("%", 40.0) in keys
+        assert ("배", 2.5) in keys
+        assert ("", 40.0) not in keys
+
+    def test_compound_requires_descending_units_and_whitespace_only(self):
+        assert ("", 350_000_000) in number_keys("3억 5000만")
+        assert ("", 350_000_000) not in number_keys("3억, 5000만")
+        assert ("", 50_030_000) not in number_keys("5000만 3만")
+
+
+class TestFactIndex:
+
+    def test_lookup_by_id(self):
+        index = FactIndex(_FACTS)
+
+        assert index.get("f2") is _FACTS[1]
+        assert index.get("missing") is None
+        assert "f3" in index
+
+    def test_unmatched_numbers_accepts_normalized_forms(self):
+        index = FactIndex(_FACTS)
+
+        line = "매출 1.2조원, 이용자 12,000,000명, 점유율 40%"
+        assert index.unmatched_numbers(line, ["f1", "f2"]) == []
+        assert index.unmatched_numbers("매출 1조 2000억원", ["f1"]) == []
+
+    def test_unmatched_numbers_reports_missing_values(self):
+        index = FactIndex(_FACTS)
+
+        # 인용하지 않은 팩트의 수치, 어디에도 없는 수치, 1자리 숫자(무시)
+        assert index.unmatched_numbers("점유율 40%, 성장 15%, 2배", ["f1"]) == ["40%", "15%"]
+        assert index.unmatched_numbers("이용자 1,200만명", ["missing"]) == ["1,200만"]
+
+    def test_facts_with_numbers(self):
+        index = FactIndex(_FACTS)
+
+        assert index.facts_with_numbers("이용자 1200만명, 점유율 40%") == ["f1", "f2"]
+        assert index.facts_with_numbers("해외 매출 3.5억 달러") == ["f3"]
+        assert index.facts_with_numbers("그냥 2025년 이야기") == []
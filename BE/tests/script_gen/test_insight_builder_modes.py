@@ -0,0 +1,156 @@
+"""
+Insight Builder 모드 선택 / 폴백 / LLM 호출 수 테스트 (ChatAnthropic은 가짜 구조화 출력으로 대체)
+"""
+import pytest
+
+pytest.importorskip("langchain_anthropic")
+
+from src.script_gen.nodes import insight_builder_2 as ib
+from src.script_gen.schemas.insight import InsightPack
+
+_STATE = {
+    "topic": "금리 인하",
+    "channel_profile": {"name": "머니 해설"},
+    "news_data": {"structured_facts": [{"id": "f1", "content": "기준금리 0.25%p 인하", "category": "Statistic"}]},
+    "competitor_data": {},
+}
+
+
+def _pack(thesis):
+    return InsightPack.model_validate({
+        "insight_pack_id": "",
+        "positioning": {
+            "thesis": thesis, "one_sentence_promise": "약속", "who_is_this_for": "직장인", "what_they_will_get": "이득",
+        },
+        "differentiators": [],
+        "hook_plan": {
+            "hook_type": "shock",
+            "hook_scripts": [{"id": "h1", "text": "훅", "uses_fact_ids": ["f1"]}],
+            "thumbnail_angle": {"concept": "컨셉"},
+        },
+        "story_structure": {
+            "chapters": [{"chapter_id": "1", "title": "1장", "goal": "목표", "key_points": [], "required_facts": ["f1"]}],
+            "call_to_action": {"primary": "구독"},
+        },
+        "writer_instructions": {"tone": "친근", "reading_level": "beginner", "claim_policy": {}},
+    })
+
+
+class _FakeChatAnthropic:
+    """schema별 응답 큐(값 또는 예외)를 순서대로 돌려주고, 호출한 schema 이름을 기록"""
+
+    responses = {}
+    calls = []
+
+    def __init__(self, **kwargs):
+        self.temperature = kwargs.get("temperature")
+
+    def with_structured_output(self, schema):
+        fake = self
+
+        class _Structured:
+            async def ainvoke(self, messages):
+                _FakeChatAnthropic.calls.append((schema.__name__, fake.temperature))
+                outcome = _FakeChatAnthropic.responses[schema.__name__].pop(0)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+
+        return _Structured()
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    _FakeChatAnthropic.responses = {}
+    _FakeChatAnthropic.calls = []
+    monkeypatch.setattr(ib, "ChatAnthropic", _FakeChatAnthropic)
+    monkeypatch.setattr(ib, "INSIGHT_RECORD_DIR", None)
+    monkeypatch.setattr(ib, "INSIGHT_MODE", "two_pass")
+    ib._llm_pool.clear()
+    monkeypatch.setattr(ib, "_llm_pool_loop", None)
+    return _FakeChatAnthropic
+
+
+def _single(thesis="단일", notes=("초안 thesis가 진부해 수정",)):
+    return ib.SinglePassInsight(self_critique=list(notes), insight_pack=_pack(thesis))
+
+
+@pytest.mark.asyncio
+async def test_default_mode_is_two_pass(llm):
+    llm.responses = {"InsightPack": [_pack("초안"), _pack("최종")]}
+
+    out = await ib.insight_builder_node(dict(_STATE))
+
+    pack = out["insight_pack"]
+    assert pack["positioning"]["thesis"] == "최종"
+    assert pack["insight_timing"]["mode"] == "two_pass"
+    assert pack["insight_timing"]["llm_calls"] == 2
+    assert llm.calls == [("InsightPack", 0.7), ("InsightPack", 0.2)]
+    assert pack["insight_pack_id"].startswith("ins_")
+
+
+@pytest.mark.asyncio
+async def test_env_mode_single_pass(llm, monkeypatch):
+    monkeypatch.setattr(ib, "INSIGHT_MODE", "single_pass")
+    llm.responses = {"SinglePassInsight": [_single()]}
+
+    out = await ib.insight_builder_node(dict(_STATE))
+
+    pack = out["insight_pack"]
+    timing = pack["insight_timing"]
+    assert timing["mode"] == "single_pass" and timing["llm_calls"] == 1
+    assert "fallback_from" not in timing
+    assert pack["self_critique"] == ["초안 thesis가 진부해 수정"]
+
+
+@pytest.mark.asyncio
+async def test_state_override_beats_env_mode(llm):
+    llm.responses = {"SinglePassInsight": [_single()]}
+
+    out = await ib.insight_builder_node({**_STATE, "insight_mode": "single_pass"})
+
+    assert out["insight_pack"]["insight_timing"]["mode"] == "single_pass"
+    assert [name for name, _ in llm.calls] == ["SinglePassInsight"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_mode_falls_back_to_two_pass(llm):
+    llm.responses = {"InsightPack": [_pack("초안"), _pack("최종")]}
+
+    out = await ib.insight_builder_node({**_STATE, "insight_mode": "three_pass"})
+
+    timing = out["insight_pack"]["insight_timing"]
+    assert timing["mode"] == "two_pass" and "fallback_from" not in timing
+
+
+@pytest.mark.asyncio
+async def test_single_pass_failure_falls_back_and_counts_every_call(llm):
+    llm.responses = {
+        "SinglePassInsight": [ValueError("parse error")] * ib.MAX_RETRIES,
+        "InsightPack": [_pack("초안"), _pack("최종")],
+    }
+
+    out = await ib.insight_builder_node({**_STATE, "insight_mode": "single_pass"})
+
+    pack = out["insight_pack"]
+    timing = pack["insight_timing"]
+    assert pack["positioning"]["thesis"] == "최종"
+    assert timing["mode"] == "two_pass" and timing["fallback_from"] == "single_pass"
+    assert timing["fallback_llm_calls"] == ib.MAX_RETRIES
+    assert timing["llm_calls"] == ib.MAX_RETRIES + 2
+    assert "self_critique" not in pack
+
+
+@pytest.mark.asyncio
+async def test_retries_are_counted(llm):
+    llm.responses = {"InsightPack": [RuntimeError("overloaded"), _pack("초안"), RuntimeError("timeout"), _pack("최종")]}
+
+    out = await ib.insight_builder_node(dict(_STATE))
+
+    assert out["insight_pack"]["insight_timing"]["llm_calls"] == 4
+
+
+@pytest.mark.asyncio
+async def test_competitor_fan_in_guard(llm):
+    assert await ib.insight_builder_node({**_STATE, "competitor_data": None}) == {}
+    assert llm.calls == []
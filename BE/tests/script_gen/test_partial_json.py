@@ -0,0 +1,63 @@
+"""
+스트리밍 JSON 점진 파서 테스트
+"""
+import json
+import random
+
+from src.script_gen.utils.partial_json import IncrementalArrayParser
+
+_CHAPTER = {
+    "chapter_id": "1",
+    "title": "금리 {인하}의 \"진짜\" 의미 [1]",
+    "narration": "",
+    "beats": [
+        {
+            "beat_id": "b1", "purpose": "evidence",
+            "line": "기준금리가 0.25%p 내려갔습니다① {괄호}와 [대괄호], \\\"따옴표\\\"도 있죠.",
+            "fact_references": ["f1"],
+            "on_screen_cues": [{"type": "chart", "caption": "금리 추이 {2024~2025}", "timing": ""}],
+        },
+        {"beat_id": "b2", "purpose": "narrative", "line": "그럼 대출 이자는요?", "fact_references": []},
+        {"beat_id": "b3", "purpose": "transition", "line": "다음으로 넘어가 볼게요.", "fact_references": []},
+    ],
+}
+
+
+def _chunks(text, seed):
+    rng = random.Random(seed)
+    i = 0
+    while i < len(text):
+        n = rng.randint(1, 12)
+        yield text[i:i + n]
+        i += n
+
+
+def test_items_match_full_parse_for_any_chunking():
+    full = json.dumps(_CHAPTER, ensure_ascii=False)
+
+    for seed in range(20):
+        parser = IncrementalArrayParser("beats")
+        items = [item for piece in _chunks(full, seed) for item in parser.feed(piece)]
+
+        assert items == _CHAPTER["beats"]
+        assert parser.done
+        assert json.loads(parser.text) == _CHAPTER
+
+
+def test_item_emitted_as_soon_as_it_closes():
+    full = json.dumps(_CHAPTER, ensure_ascii=False)
+    first_end = full.index('"b2"')  # b1이 닫힌 직후, b2는 아직 미완성
+
+    parser = IncrementalArrayParser("beats")
+    assert [b["beat_id"] for b in parser.feed(full[:first_end])] == ["b1"]
+    assert parser.feed(full[first_end:first_end + 5]) == []
+    assert not parser.done
+    assert [b["beat_id"] for b in parser.feed(full[first_end + 5:])] == ["b2", "b3"]
+
+
+def test_only_top_level_key_is_tracked():
+    doc = {"meta": {"beats": [{"x": 1}]}, "other": [{"y": 2}], "beats": [{"z": 3}]}
+
+    parser = IncrementalArrayParser("beats")
+
+    assert parser.feed(json.dumps(doc)) == [{"z": 3}]
@@ -0,0 +1,101 @@
+"""
+Verifier ⇄ Writer Rewrite 루프 테스트 (컴파일된 그래프, 상류 노드·LLM은 가짜로 대체)
+"""
+import pytest
+
+pytest.importorskip("langgraph")
+
+from src.script_gen import graph
+from src.script_gen.nodes import writer
+
+_FACTS = [
+    {"id": "f1", "content": "첫 팩트", "source_index": 0, "source_name": "A일보"},
+    {"id": "f2", "content": "둘째 팩트", "source_index": 1, "source_name": "B뉴스"},
+]
+
+
+def _node(output):
+    async def node(state):
+        return output
+    return node
+
+
+async def _writer_node(state):
+    return {
+        "script_draft": {
+            "script": {
+                "hook": {"text": "옛 훅", "fact_references": []},
+                "chapters": [{
+                    "title": "1장",
+                    "beats": [
+                        {"beat_id": "b1", "purpose": "narrative", "line": "첫 문장①", "fact_references": ["f1"]},
+                        {"beat_id": "b2", "purpose": "evidence", "line": "틀린 문장", "fact_references": ["f2"]},
+                    ],
+                    "narration": "첫 문장①\n틀린 문장",
+                }],
+            },
+        },
+    }
+
+
+class _FakeVerifier:
+    """첫 검증에서 hook/b2에 critical 이슈, 재검증에서는 이슈 없음"""
+
+    def __init__(self):
+        self.scripts = []
+
+    async def __call__(self, state):
+        script = state["script_draft"]["script"]
+        self.scripts.append({
+            "hook": dict(script["hook"]),
+            "beats": [dict(b) for b in script["chapters"][0]["beats"]],
+            "narration": script["chapters"][0]["narration"],
+        })
+        issues = [] if len(self.scripts) > 1 else [
+            {"beat_id": "hook", "severity": "critical", "issue_type": "semantic_distortion", "description": "훅 왜곡"},
+            {"beat_id": "b2", "severity": "critical", "issue_type": "semantic_distortion", "description": "수치 왜곡"},
+        ]
+        return {"verifier_output": {"verification_report": {"issues": issues}}}
+
+
+class _FakeChatOpenAI:
+    """재작성 프롬프트의 Beat ID에 따라 잘못된 인용번호가 붙은 Beat를 돌려줌"""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def with_structured_output(self, schema):
+        return self
+
+    async def ainvoke(self, messages):
+        if "- ID: hook" in messages[1].content:
+            return writer.Beat(beat_id="hook", purpose="Hook/Intro", line="새 훅③", fact_references=["f1"])
+        return writer.Beat(beat_id="b2", purpose="evidence", line="고친 문장①", fact_references=["f2"])
+
+
+@pytest.mark.asyncio
+async def test_rewrite_round_fixes_citations_and_rebuilds_narration(monkeypatch):
+    verifier = _FakeVerifier()
+    monkeypatch.setattr(graph, "intent_node", _node({"intent_analysis": {}}))
+    monkeypatch.setattr(graph, "planner_node", _node({"content_brief": {}}))
+    monkeypatch.setattr(graph, "news_research_node", _node({}))
+    monkeypatch.setattr(graph, "article_analyzer_node", _node({"news_data": {"structured_facts": _FACTS}}))
+    monkeypatch.setattr(graph, "yt_fetcher_node", _node({"youtube_data": {}}))
+    monkeypatch.setattr(graph, "competitor_anal_node", _node({"competitor_data": {}}))
+    monkeypatch.setattr(graph, "insight_builder_node", _node({"insight_pack": {}}))
+    monkeypatch.setattr(graph, "writer_node", _writer_node)
+    monkeypatch.setattr(graph, "verifier_node", verifier)
+    monkeypatch.setattr(writer, "ChatOpenAI", _FakeChatOpenAI)
+
+    app = graph.create_script_gen_graph()
+    final = await app.ainvoke({"topic": "테스트 주제", "channel_profile": {}})
+
+    # verifier → writer_rewrite → verifier 1라운드 후 종료
+    assert len(verifier.scripts) == 2
+    assert final["verifier_retry_count"] == 1
+
+    rechecked = verifier.scripts[1]
+    assert rechecked["hook"] == {"text": "새 훅①", "fact_references": ["f1"]}
+    assert rechecked["beats"][0]["line"] == "첫 문장①"
+    assert rechecked["beats"][1]["line"] == "고친 문장②"
+    assert rechecked["narration"] == "첫 문장①\n고친 문장②"
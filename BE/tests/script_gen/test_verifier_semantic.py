@@ -0,0 +1,143 @@
+"""
+Verifier Phase 3 배치 의미 대조 테스트 (LLM은 가짜 구조화 출력으로 대체)
+"""
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from src.script_gen.nodes import verifier
+from src.script_gen.schemas.verifier import BeatVerification, FactReference
+
+_FACTS = {
+    "f1": {"id": "f1", "content": "가" * 40},
+    "f2": {"id": "f2", "content": "나" * 40},
+    "f3": {"id": "f3", "content": "다" * 40},
+}
+
+
+def _beat(beat_id, *fact_ids, text=None):
+    return BeatVerification(
+        beat_id=beat_id,
+        beat_text=text or f"{beat_id} 문장",
+        fact_references=[
+            FactReference(fact_id=fid, fact_content="", category="Fact", confidence=1.0)
+            for fid in fact_ids
+        ],
+        verified=True,
+    )
+
+
+class _FakeLLM:
+    """schema별로 응답을 돌려주는 ChatOpenAI 대체. batch는 결과 객체 또는 예외."""
+
+    def __init__(self, batch, distorted=()):
+        self.batch = batch
+        self.distorted = set(distorted)
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        return self
+
+    def with_structured_output(self, schema):
+        fake = self
+
+        class _Structured:
+            async def ainvoke(self, messages):
+                fake.calls.append(schema.__name__)
+                if schema is verifier._BatchSemanticResult:
+                    if isinstance(fake.batch, Exception):
+                        raise fake.batch
+                    return fake.batch
+                beat_id = messages[1].content.split("\n")[1].split(" ")[0]
+                return verifier._SemanticCheckResult(
+                    is_distorted=beat_id in fake.distorted, distortion_type="확대", explanation="단일 판정"
+                )
+
+        return _Structured()
+
+
+def _verdict(beat_id, distorted):
+    return verifier._BeatSemanticVerdict(
+        beat_id=beat_id, is_distorted=distorted, distortion_type="날조" if distorted else None,
+        explanation="배치 판정",
+    )
+
+
+class TestPackSemanticBatches:
+
+    @pytest.fixture(autouse=True)
+    def _char_tokens(self, monkeypatch):
+        monkeypatch.setattr(verifier, "count_tokens", len)
+
+    def test_respects_token_budget_and_counts_shared_facts_once(self, monkeypatch):
+        # Beat 비용 = 문장 5자 + 새 팩트 40자
+        monkeypatch.setattr(verifier, "SEMANTIC_BATCH_TOKEN_BUDGET", 100)
+        beats = [_beat("b1", "f1"), _beat("b2", "f1"), _beat("b3", "f2"), _beat("b4", "f3")]
+
+        batches = verifier._pack_semantic_batches(beats, _FACTS)
+
+        # b1(45) + b2(5, f1 공유) + b3(45) = 95 → b4는 다음 배치
+        assert [[bv.beat_id for bv in b] for b in batches] == [["b1", "b2", "b3"], ["b4"]]
+
+    def test_max_beats_and_duplicate_ids_split_batches(self, monkeypatch):
+        monkeypatch.setattr(verifier, "SEMANTIC_BATCH_MAX_BEATS", 2)
+        beats = [_beat("b1", "f1"), _beat("b2", "f1"), _beat("b3", "f1"), _beat("b3", "f2")]
+
+        batches = verifier._pack_semantic_batches(beats, _FACTS)
+
+        assert [[bv.beat_id for bv in b] for b in batches] == [["b1", "b2"], ["b3"], ["b3"]]
+
+    def test_oversized_beat_gets_its_own_batch(self, monkeypatch):
+        monkeypatch.setattr(verifier, "SEMANTIC_BATCH_TOKEN_BUDGET", 30)
+        beats = [_beat("b1", "f1"), _beat("b2", "f2")]
+
+        batches = verifier._pack_semantic_batches(beats, _FACTS)
+
+        assert [len(b) for b in batches] == [1, 1]
+
+
+class TestCheckBatchSemantic:
+
+    @pytest.mark.asyncio
+    async def test_maps_verdicts_back_by_beat_id(self, monkeypatch):
+        # 응답 순서가 입력과 달라도 beat_id로 매핑
+        fake = _FakeLLM(verifier._BatchSemanticResult(verdicts=[_verdict("b2", True), _verdict("b1", False)]))
+        monkeypatch.setattr(verifier, "ChatOpenAI", fake)
+        b1, b2 = _beat("b1", "f1"), _beat("b2", "f2")
+
+        stats = await verifier._check_batch_semantic([b1, b2], _FACTS)
+
+        assert fake.calls == ["_BatchSemanticResult"]
+        assert stats["calls"] == 1 and stats["fallback_beats"] == 0
+        assert b1.verified and not b1.issues
+        assert not b2.verified
+        assert b2.issues[0].issue_type == "semantic_distortion"
+        assert b2.issues[0].description.startswith("[날조]")
+
+    @pytest.mark.asyncio
+    async def test_missing_verdict_is_rechecked_alone(self, monkeypatch):
+        fake = _FakeLLM(
+            verifier._BatchSemanticResult(verdicts=[_verdict("b1", False), _verdict("unknown", True)]),
+            distorted={"b2"},
+        )
+        monkeypatch.setattr(verifier, "ChatOpenAI", fake)
+        b1, b2 = _beat("b1", "f1"), _beat("b2", "f2")
+
+        stats = await verifier._check_batch_semantic([b1, b2], _FACTS)
+
+        assert fake.calls == ["_BatchSemanticResult", "_SemanticCheckResult"]
+        assert stats["calls"] == 2 and stats["fallback_beats"] == 1
+        assert not b1.issues
+        assert b2.issues[0].description == "[확대] 단일 판정"
+
+    @pytest.mark.asyncio
+    async def test_malformed_batch_output_falls_back_per_beat(self, monkeypatch):
+        fake = _FakeLLM(ValueError("structured output parse error"), distorted={"b1"})
+        monkeypatch.setattr(verifier, "ChatOpenAI", fake)
+        beats = [_beat("b1", "f1"), _beat("b2", "f2"), _beat("b3", "f3")]
+
+        stats = await verifier._check_batch_semantic(beats, _FACTS)
+
+        assert fake.calls.count("_SemanticCheckResult") == 3
+        assert stats["calls"] == 4 and stats["fallback_beats"] == 3
+        assert [bool(bv.issues) for bv in beats] == [True, False, False]
@@ -0,0 +1,87 @@
+"""
+WriterContext 골든 테스트
+
+golden/writer_context.json은 WriterContext 도입 전 빌더(_build_writer_context / _build_fact_marker_map,
+87a6caf 이전)로 아래 고정 입력을 렌더링한 결과입니다. 프롬프트가 바이트 단위로 같아야 합니다.
+"""
+import json
+import os
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from src.script_gen.nodes.writer import WriterContext
+
+CHANNEL = {
+    "name": "머니 해설", "target_audience": "2030 직장인", "persona_summary": "경제 뉴스를 쉽게 풀어주는 채널",
+    "content_style": "데이터 기반 해설", "differentiator": "숫자로 시작하는 훅", "audience_needs": "내 지갑에 미치는 영향",
+    "average_duration": "12분", "tone_manner": "친근한 설명체",
+    "tone_samples": ["이게 핵심이거든요", "생각보다 크잖아요", "여기서 중요한 건데요", "자 그러면 볼까요", "그렇죠?", "여섯 번째는 잘림"],
+    "success_formula": "훅 → 배경 → 숫자 → 전망", "hit_patterns": ["숫자로 시작", "반전 제시"],
+    "low_patterns": ["나열식 뉴스 요약"], "content_structures": {"해설": "훅 → 배경 → 분석", "리뷰": "문제 → 비교"},
+}
+INSIGHT = {
+    "positioning": {"thesis": "금리 인하는 대출자에게 생각보다 늦게 온다"},
+    "hook_plan": {"hook_type": "shock_stat"},
+    "story_structure": {"chapters": [
+        {"title": "무엇이 바뀌었나", "goal": "결정 요약"},
+        {"title": "내 대출은?", "goal": "영향 설명"},
+        {"title": "앞으로", "goal": "전망"},
+    ]},
+}
+FACTS = [
+    {"id": "f1", "content": "한국은행이 기준금리를 0.25%p 인하해 연 3.25%가 됐다.", "source_index": 2, "source_name": "매일경제"},
+    {"id": "f2", "content": "시중은행 변동금리 대출의 70%가 코픽스에 연동된다. " * 3, "source_index": 0, "source_name": "한국경제"},
+    {"id": "f3", "content": "코픽스는 한 달 뒤에 반영된다.", "source_indices": [2, 0], "source_name": "매일경제"},
+    {"id": "f4", "content": "가계부채는 1,900조 원을 넘었다.", "source_index": 0, "source_name": "한국경제"},
+    {"id": "f5", "content": "출처 정보가 없는 팩트", "source_name": ""},
+    {"content": "ID 없는 팩트", "source_index": 5, "source_name": "연합뉴스"},
+    {"id": "f6", "content": "미 연준도 동결 기조를 이어갔다.", "source_index": 5, "source_name": "연합뉴스"},
+]
+OPINIONS = [
+    "[매일경제] 김OO 교수: 인하 효과는 하반기에 나타날 것",
+    "[한국경제 칼럼] 이OO 이코노미스트: 가계부채가 변수",
+    "[블룸버그] 해외 시각: 추가 인하 가능성",
+    "출처 표기 없는 의견",
+]
+FILTERS = [None, {"f1", "f3"}, {"f2", "f6"}, set(), {"f5", "없는_ID"}]
+SUMMARY = ['"한국은행이 기준금리를 0.25%p 인하해 연 3.25%가 됐다." (Ch1에서 사용됨)']
+USED = [({"f4", "f2"}, 1), ({"f6", "f1", "f3"}, 2), ({"없는_ID"}, 3)]
+
+with open(os.path.join(os.path.dirname(__file__), "golden", "writer_context.json"), encoding="utf-8") as f:
+    GOLDEN = json.load(f)
+
+
+@pytest.fixture(scope="module")
+def ctx():
+    return WriterContext(CHANNEL, INSIGHT, FACTS, OPINIONS)
+
+
+def test_fact_marker_map(ctx):
+    assert ctx.fact_marker_map == GOLDEN["fact_marker_map"]
+
+
+def test_base_is_full_fact_context(ctx):
+    assert ctx.base == GOLDEN["contexts"][0]
+    assert ctx.for_chapter() == GOLDEN["contexts"][0]
+
+
+@pytest.mark.parametrize("i", range(1, len(FILTERS)))
+def test_for_chapter_filters_facts(ctx, i):
+    assert ctx.for_chapter(filter_fact_ids=FILTERS[i]) == GOLDEN["contexts"][i]
+
+
+def test_for_chapter_with_used_summary(ctx):
+    rendered = ctx.for_chapter(filter_fact_ids={"f2", "f4"}, used_facts_summary=SUMMARY)
+    assert rendered == GOLDEN["context_with_summary"]
+
+
+def test_minimal_inputs():
+    assert WriterContext({}, {}, [], []).base == GOLDEN["minimal_context"]
+
+
+@pytest.mark.parametrize("i", range(len(USED)))
+def test_used_summary_in_fact_order(ctx, i):
+    fact_ids, chapter_index = USED[i]
+    assert ctx.used_summary(fact_ids, chapter_index) == GOLDEN["used_summary"][i]
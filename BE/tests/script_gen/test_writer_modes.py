@@ -0,0 +1,204 @@
+"""
+Writer 병렬/순차 모드 테스트 (Intro/Chapter/Outro 생성과 경계 다듬기 LLM은 가짜로 대체)
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from src.script_gen.nodes import writer
+
+_FACTS = [
+    {"id": "f1", "content": "첫 팩트", "source_index": 0, "source_name": "A일보"},
+    {"id": "f2", "content": "둘째 팩트", "source_index": 1, "source_name": "B뉴스"},
+    {"id": "f3", "content": "셋째 팩트", "source_index": 1, "source_name": "B뉴스"},
+]
+
+_STATE = {
+    "topic_request_id": "tr_1",
+    "channel_profile": {},
+    "news_data": {"structured_facts": _FACTS},
+    "insight_pack": {
+        "positioning": {"thesis": "테스트"},
+        "story_structure": {"chapters": [
+            {"title": "1장", "required_facts": ["f1", "f2"]},
+            {"title": "2장", "required_facts": ["f2", "f3"]},
+        ]},
+    },
+}
+
+
+class _FakeWriterLLM:
+    """Intro/Chapter/Outro 생성 함수 대체. 호출 순서와 챕터별 배정 팩트를 기록"""
+
+    def __init__(self, fail_chapter=None, outro_delay=0.0):
+        self.calls = []
+        self.required = {}
+        self.fail_chapter = fail_chapter
+        self.outro_delay = outro_delay
+        self.outro_cancelled = False
+
+    async def intro(self, context_str):
+        self.calls.append("intro")
+        return writer.Hook(text="훅", fact_references=[])
+
+    async def outro(self, context_str):
+        self.calls.append("outro")
+        delay, self.outro_delay = self.outro_delay, 0.0  # 첫 호출만 지연
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.outro_cancelled = True
+            raise
+        return writer.Closing(text="마무리", cta="구독")
+
+    async def chapter(self, context_str, chapter_plan, chapter_index, previous_openings=None,
+                      must_include_facts=None, progress=None):
+        self.calls.append(f"ch{chapter_index}")
+        if chapter_index == self.fail_chapter:
+            self.fail_chapter = None  # 한 번만 실패
+            raise RuntimeError("chapter failed")
+        return writer.Chapter(
+            chapter_id=str(chapter_index),
+            title=chapter_plan["title"],
+            beats=[
+                writer.Beat(beat_id=f"b{chapter_index}_{j}", purpose="evidence", line=f"{fid} 문장",
+                            fact_references=[fid])
+                for j, fid in enumerate(sorted(self.required[chapter_index]), 1)
+            ],
+        )
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    llm = _FakeWriterLLM()
+    smoothed = []
+
+    async def smooth(chapters, channel_profile):
+        smoothed.append([ch.chapter_id for ch in chapters])
+
+    original_write_chapter = writer._write_chapter
+
+    async def write_chapter(context_str, chapter_plan, chapter_index, required_ids, **kwargs):
+        llm.required[chapter_index] = set(required_ids)
+        return await original_write_chapter(context_str, chapter_plan, chapter_index, required_ids, **kwargs)
+
+    monkeypatch.setattr(writer, "WRITER_STREAM", False)
+    monkeypatch.setattr(writer, "_generate_intro", llm.intro)
+    monkeypatch.setattr(writer, "_generate_outro", llm.outro)
+    monkeypatch.setattr(writer, "_generate_chapter", llm.chapter)
+    monkeypatch.setattr(writer, "_write_chapter", write_chapter)
+    monkeypatch.setattr(writer, "_smooth_transitions", smooth)
+    llm.smoothed = smoothed
+    return llm
+
+
+def _chapter_refs(draft):
+    return [
+        sorted({ref for beat in ch["beats"] for ref in beat["fact_references"]})
+        for ch in draft["script"]["chapters"]
+    ]
+
+
+class TestWriterModes:
+
+    @pytest.mark.asyncio
+    async def test_parallel_dedupes_facts_and_smooths_boundaries(self, fake):
+        out = await writer.writer_node({**_STATE, "writer_mode": "parallel"})
+
+        draft = out["script_draft"]
+        timing = draft["metadata"]["writer_timing"]
+        assert timing["mode"] == "parallel" and "fallback_from" not in timing
+        # f2는 처음 배정된 1장에만 남음
+        assert _chapter_refs(draft) == [["f1", "f2"], ["f3"]]
+        assert fake.smoothed == [["1", "2"]]
+
+    @pytest.mark.asyncio
+    async def test_sequential_removes_cited_facts_from_later_chapters(self, fake):
+        out = await writer.writer_node({**_STATE, "writer_mode": "sequential"})
+
+        draft = out["script_draft"]
+        assert draft["metadata"]["writer_timing"]["mode"] == "sequential"
+        assert fake.calls == ["intro", "ch1", "ch2", "outro"]
+        assert _chapter_refs(draft) == [["f1", "f2"], ["f3"]]
+        assert fake.smoothed == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_mode_uses_parallel(self, fake):
+        out = await writer.writer_node({**_STATE, "writer_mode": "turbo"})
+
+        assert out["script_draft"]["metadata"]["writer_timing"]["mode"] == "parallel"
+
+    @pytest.mark.asyncio
+    async def test_parallel_failure_cancels_pending_and_falls_back(self, fake):
+        fake.fail_chapter = 2
+        fake.outro_delay = 10  # 실패 시점에 아직 진행 중인 호출
+
+        out = await asyncio.wait_for(writer.writer_node({**_STATE, "writer_mode": "parallel"}), timeout=5)
+
+        timing = out["script_draft"]["metadata"]["writer_timing"]
+        assert timing["mode"] == "sequential" and timing["fallback_from"] == "parallel"
+        assert fake.outro_cancelled
+        # 순차 폴백: Intro → 1장 → 2장 → Outro를 처음부터 다시 생성
+        assert fake.calls[-4:] == ["intro", "ch1", "ch2", "outro"]
+
+
+def test_dedupe_chapter_facts_keeps_first_assignment():
+    assigned = [{"f1", "f2"}, {"f2", "f3"}, {"f1", "f3", "f4"}, set()]
+
+    assert writer._dedupe_chapter_facts(assigned) == [{"f1", "f2"}, {"f3"}, {"f4"}, set()]
+    # 입력은 바꾸지 않음
+    assert assigned[1] == {"f2", "f3"}
+
+
+class TestSmoothTransitions:
+
+    @staticmethod
+    def _chapters():
+        return [
+            writer.Chapter(chapter_id=str(i), title=f"{i}장", beats=[
+                writer.Beat(beat_id=f"b{i}", purpose="narrative", line=line),
+            ])
+            for i, line in enumerate(["앞 챕터 끝입니다.", "금리는 3.5%로 올랐습니다①", "두 번째 전환입니다."], 1)
+        ]
+
+    @staticmethod
+    def _fake_llm(monkeypatch, transitions):
+        class _LLM:
+            def __init__(self, **kwargs):
+                pass
+
+            def with_structured_output(self, schema):
+                return self
+
+            async def ainvoke(self, messages):
+                return writer.TransitionPass(transitions=transitions)
+
+        monkeypatch.setattr(writer, "ChatOpenAI", _LLM)
+
+    @pytest.mark.asyncio
+    async def test_rejects_rewrites_that_change_locked_tokens(self, monkeypatch):
+        self._fake_llm(monkeypatch, [
+            writer.Transition(chapter_id="2", line="그런데 금리는 4.0%로 올랐습니다①"),   # 수치 변경
+            writer.Transition(chapter_id="3", line="이어서 두 번째 전환입니다."),
+        ])
+        chapters = self._chapters()
+
+        await writer._smooth_transitions(chapters, {})
+
+        assert chapters[1].beats[0].line == "금리는 3.5%로 올랐습니다①"
+        assert chapters[2].beats[0].line == "이어서 두 번째 전환입니다."
+
+    @pytest.mark.asyncio
+    async def test_rejects_changed_citation_marker(self, monkeypatch):
+        self._fake_llm(monkeypatch, [writer.Transition(chapter_id="2", line="그런데 금리는 3.5%로 올랐습니다②")])
+        chapters = self._chapters()
+
+        await writer._smooth_transitions(chapters, {})
+
+        assert chapters[1].beats[0].line == "금리는 3.5%로 올랐습니다①"
+
+    def test_locked_tokens_ignore_wording(self):
+        assert writer._locked_tokens("그런데 금리는 3.5%로① 올랐죠") == writer._locked_tokens("금리는 3.5%로 올랐습니다①")
+        assert writer._locked_tokens("1,200명") != writer._locked_tokens("1,300명")
@@ -0,0 +1,128 @@
+"""
+Writer 챕터 스트리밍 경로 vs 일반(ainvoke) 경로 동등성 테스트 (LLM은 가짜 함수 호출 청크로 대체)
+"""
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+pytest.importorskip("langchain_openai")
+
+from src.script_gen.nodes import writer
+
+_CHAPTER = {
+    "chapter_id": "1",
+    "title": "금리 {인하}의 \"진짜\" 의미",
+    "narration": None,
+    "beats": [
+        {
+            "beat_id": "b1", "purpose": "evidence",
+            "line": "기준금리가 0.25%p 내려갔습니다① {괄호}와 [대괄호]도 있죠.",
+            "fact_references": ["f1"], "claims": [], "broll_ideas": [],
+            "on_screen_cues": [{"type": "chart", "caption": "금리 추이 {2024~2025}", "timing": ""}],
+        },
+        {"beat_id": "b2", "purpose": "narrative", "line": "그럼 대출 이자는요?",
+         "fact_references": [], "claims": [], "broll_ideas": [], "on_screen_cues": []},
+        {"beat_id": "b3", "purpose": "transition", "line": "다음으로 넘어가 볼게요.",
+         "fact_references": [], "claims": [], "broll_ideas": [], "on_screen_cues": []},
+    ],
+}
+
+
+def _chunks(text, seed=7):
+    rng = random.Random(seed)
+    i = 0
+    while i < len(text):
+        n = rng.randint(1, 12)
+        yield text[i:i + n]
+        i += n
+
+
+class _FakeChatOpenAI:
+    """bind_tools 인자를 기록하고, 같은 함수 호출 인자를 한 번에(ainvoke) 또는 청크로(astream) 돌려줌"""
+
+    bound = []
+    payload = _CHAPTER
+
+    def __init__(self, **kwargs):
+        pass
+
+    def bind_tools(self, tools, **kwargs):
+        _FakeChatOpenAI.bound.append((tools, kwargs))
+        return self
+
+    async def ainvoke(self, messages):
+        return SimpleNamespace(tool_calls=[{"name": "Chapter", "args": json.loads(json.dumps(self.payload))}])
+
+    async def astream(self, messages):
+        for piece in _chunks(json.dumps(self.payload, ensure_ascii=False)):
+            yield SimpleNamespace(tool_call_chunks=[{"index": 0, "args": piece}])
+
+
+async def _no_sleep(_):
+    return None
+
+
+@pytest.fixture
+def events(monkeypatch):
+    recorded = []
+
+    async def dispatch(name, data):
+        recorded.append((name, data))
+
+    _FakeChatOpenAI.bound = []
+    _FakeChatOpenAI.payload = _CHAPTER
+    monkeypatch.setattr(writer, "ChatOpenAI", _FakeChatOpenAI)
+    monkeypatch.setattr(writer, "adispatch_custom_event", dispatch)
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_streamed_chapter_matches_non_streamed(events):
+    plan = {"title": "금리", "goal": "설명", "key_points": [], "required_facts": ["f1"]}
+
+    plain = await writer._generate_chapter("CTX", plan, 1)
+    assert events == []
+
+    progress = writer.BeatProgress(total_chapters=2, started=0.0)
+    streamed = await writer._generate_chapter("CTX", plan, 1, progress=progress.chapter(1))
+
+    assert streamed.model_dump() == plain.model_dump()
+    assert events == [
+        ("writer_progress", {
+            "chapter": 1, "total_chapters": 2, "beat_id": beat.beat_id,
+            "chapter_beats": n, "total_beats": n,
+        })
+        for n, beat in enumerate(plain.beats, 1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_both_paths_bind_strict_chapter_tool(events):
+    plan = {"title": "금리", "required_facts": []}
+
+    await writer._generate_chapter("CTX", plan, 1)
+    await writer._generate_chapter("CTX", plan, 1, progress=writer.BeatProgress(1, 0.0).chapter(1))
+
+    assert len(_FakeChatOpenAI.bound) == 2
+    for tools, kwargs in _FakeChatOpenAI.bound:
+        assert tools == [writer._CHAPTER_TOOL]
+        assert tools[0]["function"]["name"] == "Chapter"
+        assert tools[0]["function"]["strict"] is True
+        assert kwargs["tool_choice"] == "Chapter"
+
+
+@pytest.mark.asyncio
+async def test_invalid_args_fail_validation_on_both_paths(events, monkeypatch):
+    monkeypatch.setattr(writer.asyncio, "sleep", _no_sleep)
+    # Beat.purpose 누락 → 두 경로 모두 Chapter 검증에서 실패 (3회 시도 후 예외)
+    bad = {"chapter_id": "1", "title": "제목", "beats": [{"beat_id": "b1", "line": "목적 누락"}]}
+    _FakeChatOpenAI.payload = bad
+    plan = {"title": "금리", "required_facts": []}
+
+    with pytest.raises(ValidationError):
+        await writer._generate_chapter("CTX", plan, 1)
+    with pytest.raises(ValidationError):
+        await writer._generate_chapter("CTX", plan, 1, progress=writer.BeatProgress(1, 0.0).chapter(1))
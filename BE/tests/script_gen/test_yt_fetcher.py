@@ -0,0 +1,109 @@
+"""
+YT Fetcher 저장 영상 우선 검색 테스트 (전문 검색 / YouTube 검색은 가짜로 대체)
+"""
+import uuid
+
+import pytest
+
+from src.script_gen.nodes import yt_fetcher
+
+_USER_ID = str(uuid.uuid4())
+_STATE = {
+    "topic": "기준금리 인하가 내 대출에 미치는 영향",
+    "user_id": _USER_ID,
+    "content_brief": {"search_queries": ["기준금리 인하", "대출 이자"]},
+    "channel_profile": {"topic_context": {"search_keywords": ["기준금리", " "]}},
+}
+
+
+def _match(video_id):
+    return {
+        "video_id": video_id, "title": f"{video_id} 제목", "channel_title": None, "view_count": None,
+        "source": "caption", "score": 1.0, "snippet": "",
+    }
+
+
+class _Session:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    calls = {"search_any": [], "youtube": []}
+    stored = {"matches": [], "error": None}
+
+    async def search_any(db, queries, user_id, limit=10):
+        calls["search_any"].append((queries, user_id, limit))
+        if stored["error"]:
+            raise stored["error"]
+        return stored["matches"]
+
+    def search_youtube(queries, max_results=5):
+        calls["youtube"].append(list(queries))
+        return [{"video_id": "yt1", "title": "유튜브"}, {"video_id": "s1", "title": "중복"}]
+
+    monkeypatch.setattr(yt_fetcher, "AsyncSessionLocal", _Session)
+    monkeypatch.setattr(yt_fetcher.TranscriptSearchService, "search_any", staticmethod(search_any))
+    monkeypatch.setattr(yt_fetcher, "_search_youtube_videos", search_youtube)
+    monkeypatch.setattr(yt_fetcher, "_search_related_videos_for_display", lambda keywords, topic="": [])
+    monkeypatch.setattr(yt_fetcher, "YT_STORED_MIN_HITS", 3)
+    return calls, stored
+
+
+@pytest.mark.asyncio
+async def test_enough_stored_hits_skip_youtube_search(fetcher):
+    calls, stored = fetcher
+    stored["matches"] = [_match("s1"), _match("s2"), _match("s3")]
+
+    out = await yt_fetcher.yt_fetcher_node(dict(_STATE))
+
+    data = out["youtube_data"]
+    assert calls["youtube"] == []
+    assert [v["video_id"] for v in data["videos"]] == ["s1", "s2", "s3"]
+    assert data["videos"][0]["channel_title"] == "" and data["videos"][0]["view_count"] == 0
+    assert data["stored_video_count"] == 3
+    queries, user_id, limit = calls["search_any"][0]
+    assert queries == ["기준금리", "기준금리 인하", "대출 이자"]
+    assert user_id == uuid.UUID(_USER_ID) and limit == yt_fetcher.STORED_SEARCH_LIMIT
+
+
+@pytest.mark.asyncio
+async def test_few_stored_hits_shrink_youtube_search(fetcher):
+    calls, stored = fetcher
+    stored["matches"] = [_match("s1")]
+
+    out = await yt_fetcher.yt_fetcher_node(dict(_STATE))
+
+    assert calls["youtube"] == [["기준금리 인하"]]
+    # 저장 영상 우선, YouTube 결과 중 중복은 제외
+    assert [v["video_id"] for v in out["youtube_data"]["videos"]] == ["s1", "yt1"]
+
+
+@pytest.mark.asyncio
+async def test_no_stored_hits_run_full_youtube_search(fetcher):
+    calls, _ = fetcher
+
+    out = await yt_fetcher.yt_fetcher_node(dict(_STATE))
+
+    assert calls["youtube"] == [["기준금리 인하", "대출 이자"]]
+    assert [v["video_id"] for v in out["youtube_data"]["videos"]] == ["yt1", "s1"]
+    assert out["youtube_data"]["stored_video_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stored_search_failure_falls_back_to_youtube(fetcher):
+    calls, stored = fetcher
+    stored["error"] = RuntimeError("db down")
+
+    out = await yt_fetcher.yt_fetcher_node(dict(_STATE))
+
+    assert calls["youtube"] == [["기준금리 인하", "대출 이자"]]
+    assert out["youtube_data"]["stored_video_count"] == 0
+
+
+def test_stored_search_queries_fall_back_to_topic():
+    assert yt_fetcher._stored_search_queries({"topic": "환율 급등"}) == ["환율 급등"]
@@ -0,0 +1,218 @@
+"""
+AnalyticsRollupService 테스트
+
+- 원본 행 → 롤업 값 계산 (compute_expected_rollups)
+- 갱신 SQL 실행 순서 / savepoint 실패 처리
+- 로컬 Postgres가 있으면 (TEST_DATABASE_URL) 실제 갱신 결과와 정합성 검사
+"""
+import os
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.models.channel_video import YTChannelVideo
+from app.models.youtube_channel import YTAudienceDaily, YTChannelStatsDaily, YTGeoDaily
+from app.services.analytics_rollup_service import (
+    PERIODS,
+    AnalyticsRollupService,
+    compute_expected_rollups,
+)
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+_SCHEMA = "analytics_rollup_test"
+_AS_OF = date(2026, 3, 31)
+
+
+def _stats(days_ago, views, subs):
+    return YTChannelStatsDaily(
+        channel_id="UC_test", date=_AS_OF - timedelta(days=days_ago),
+        view_count=views, subscriber_count=subs,
+    )
+
+
+def _video(video_id, days_ago, duration):
+    published = datetime.combine(_AS_OF - timedelta(days=days_ago), datetime.min.time(), timezone.utc)
+    return YTChannelVideo(
+        channel_id="UC_test", video_id=video_id, title=video_id,
+        published_at=published + timedelta(hours=12), duration_seconds=duration,
+    )
+
+
+def _raw_rows():
+    stats = [_stats(100, 1000, 10), _stats(20, 5000, 40), _stats(6, 8000, 55), _stats(0, 9000, 60)]
+    videos = [_video("old", 200, 600), _video("mid", 50, 300), _video("new", 3, 120), _video("draft", 0, None)]
+    videos[-1].published_at = None
+    audience = [
+        YTAudienceDaily(channel_id="UC_test", date=_AS_OF - timedelta(days=1),
+                        age_group="age25-34", gender="male", viewer_percentage=90.0),
+        YTAudienceDaily(channel_id="UC_test", date=_AS_OF,
+                        age_group="age25-34", gender="male", viewer_percentage=60.0),
+        YTAudienceDaily(channel_id="UC_test", date=_AS_OF,
+                        age_group="age18-24", gender="female", viewer_percentage=40.0),
+    ]
+    geo = [
+        YTGeoDaily(channel_id="UC_test", date=_AS_OF, country="US", views=100),
+        YTGeoDaily(channel_id="UC_test", date=_AS_OF, country="KR", views=300),
+        YTGeoDaily(channel_id="UC_test", date=_AS_OF, country="JP", views=100),
+        YTGeoDaily(channel_id="UC_test", date=_AS_OF - timedelta(days=1), country="DE", views=999),
+    ]
+    return stats, videos, audience, geo
+
+
+class TestComputeExpectedRollups:
+    """원본 행 재집계 (정합성 검사 기준값)"""
+
+    def test_period_deltas_and_uploads(self):
+        stats, videos, audience, geo = _raw_rows()
+        expected = compute_expected_rollups(
+            stats, videos, audience, geo, period_ends={p: _AS_OF for p in PERIODS}
+        )
+
+        week = expected.periods["7d"]
+        assert week["views_gained"] == 1000  # 6일 전 8000 → 오늘 9000
+        assert week["subscribers_gained"] == 5
+        assert week["videos_published"] == 1 and week["total_duration_seconds"] == 120
+
+        quarter = expected.periods["90d"]
+        assert quarter["views_gained"] == 4000  # 100일 전 스냅샷은 창 밖
+        assert quarter["videos_published"] == 2
+
+        everything = expected.periods["all"]
+        assert everything["views_gained"] == 8000
+        assert everything["total_views"] == 9000 and everything["subscriber_count"] == 60
+        # 전체 기간은 게시일 없는 영상도 포함 (/me/status 기존 집계와 동일)
+        assert everything["videos_published"] == 4
+        assert everything["total_duration_seconds"] == 1020
+
+    def test_latest_report_only_and_geo_share(self):
+        stats, videos, audience, geo = _raw_rows()
+        expected = compute_expected_rollups(stats, videos, audience, geo, period_ends={})
+
+        assert expected.audience == {("age25-34", "male"): 60.0, ("age18-24", "female"): 40.0}
+        assert set(expected.geo) == {"KR", "US", "JP"}
+        assert expected.geo["KR"] == {"views": 300, "share": 60.0, "rank": 1}
+        # 조회수 동률은 국가 코드 순
+        assert expected.geo["JP"]["rank"] == 2 and expected.geo["US"]["rank"] == 3
+
+    def test_no_snapshots(self):
+        expected = compute_expected_rollups([], [], [], [], period_ends={"7d": _AS_OF})
+
+        assert expected.periods["7d"]["views_gained"] == 0
+        assert expected.periods["7d"]["total_views"] is None
+        assert expected.audience == {} and expected.geo == {}
+
+
+class _FakeSession:
+    def __init__(self, fail_on=None):
+        self.statements = []
+        self.fail_on = fail_on
+        self.rolled_back = False
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        try:
+            yield
+        except Exception:
+            self.rolled_back = True
+            raise
+
+    async def execute(self, stmt, params=None):
+        sql = str(stmt)
+        if self.fail_on and self.fail_on in sql:
+            raise RuntimeError("boom")
+        self.statements.append((sql, params))
+
+
+class TestRefreshChannel:
+    """채널 단위 롤업 갱신"""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_all_rollups_for_one_channel(self):
+        db = _FakeSession()
+
+        assert await AnalyticsRollupService.refresh_channel(db, "UC_test", as_of=_AS_OF)
+
+        sqls = [sql for sql, _ in db.statements]
+        assert "INSERT INTO yt_channel_period_rollups" in sqls[0]
+        assert "ON CONFLICT (channel_id, period) DO UPDATE" in sqls[0]
+        assert "DELETE FROM yt_channel_audience_rollups" in sqls[1]
+        assert "INSERT INTO yt_channel_audience_rollups" in sqls[2]
+        assert "DELETE FROM yt_channel_geo_rollups" in sqls[3]
+        assert "INSERT INTO yt_channel_geo_rollups" in sqls[4]
+        assert all(params == {"channel_id": "UC_test", "as_of": _AS_OF} for _, params in db.statements)
+
+    @pytest.mark.asyncio
+    async def test_failure_rolls_back_savepoint_only(self):
+        db = _FakeSession(fail_on="yt_channel_geo_rollups")
+
+        assert await AnalyticsRollupService.refresh_channel(db, "UC_test") is False
+        assert db.rolled_back
+
+
+@pytest_asyncio.fixture
+async def pg_db():
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from app.core.db import Base
+    from app.models import User, YouTubeChannel
+
+    engine = create_async_engine(
+        TEST_DATABASE_URL, connect_args={"server_settings": {"search_path": _SCHEMA}}
+    )
+    tables = [
+        Base.metadata.tables[name]
+        for name in (
+            "users", "youtube_channels", "yt_channel_stats_daily", "yt_channel_videos",
+            "yt_audience_daily", "yt_geo_daily", "yt_channel_period_rollups",
+            "yt_channel_audience_rollups", "yt_channel_geo_rollups",
+        )
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {_SCHEMA}"))
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=tables))
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        user = User(email="rollup@test.com")
+        session.add(user)
+        await session.flush()
+        session.add(YouTubeChannel(channel_id="UC_test", user_id=user.id, raw_channel_json={}))
+        await session.flush()
+        stats, videos, audience, geo = _raw_rows()
+        session.add_all([*stats, *videos, *audience, *geo])
+        await session.commit()
+
+        yield session
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+    await engine.dispose()
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL이 설정되지 않음 (로컬 Postgres 필요)")
+class TestRollupsAgainstPostgres:
+    """실제 갱신 결과 = 원본 행 재집계"""
+
+    @pytest.mark.asyncio
+    async def test_refresh_matches_raw_aggregates(self, pg_db):
+        assert await AnalyticsRollupService.refresh_channel(pg_db, "UC_test", as_of=_AS_OF)
+        await pg_db.commit()
+
+        assert await AnalyticsRollupService.check_consistency(pg_db, "UC_test") == []
+
+        periods = await AnalyticsRollupService.get_periods(pg_db, "UC_test")
+        assert periods["7d"].views_gained == 1000
+        top = await AnalyticsRollupService.get_top_countries(pg_db, "UC_test", limit=1)
+        assert [(r.country, r.share) for r in top] == [("KR", 60.0)]
+
+    @pytest.mark.asyncio
+    async def test_check_detects_stale_rollup(self, pg_db):
+        await AnalyticsRollupService.refresh_channel(pg_db, "UC_test", as_of=_AS_OF)
+        await pg_db.execute(text("UPDATE yt_channel_period_rollups SET views_gained = 0 WHERE period = '7d'"))
+        await pg_db.commit()
+
+        problems = await AnalyticsRollupService.check_consistency(pg_db, "UC_test")
+        assert any(p.startswith("7d.views_gained") for p in problems)
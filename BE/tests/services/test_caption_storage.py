@@ -0,0 +1,52 @@
+"""
+caption_storage (자막 저장 포맷) 테스트
+"""
+from app.models.caption import VideoCaption
+from app.services.caption_storage import (
+    apply_segments,
+    decode_segments,
+    encode_segments,
+    get_caption_text,
+)
+
+
+def _segments():
+    return {
+        "source": "transcript-api",
+        "tracks": [{
+            "language_code": "ko",
+            "language_name": "ko",
+            "is_auto_generated": True,
+            "cues": [
+                {"start": 0.0, "end": 2.5, "text": "안녕하세요"},
+                {"start": 2.5, "end": 5.0, "text": "반갑습니다"},
+            ],
+        }],
+        "no_captions": False,
+    }
+
+
+def test_encode_decode_roundtrip():
+    """압축 후 decode하면 원래 segments와 동일"""
+    encoded = encode_segments(_segments())
+
+    assert encoded["plain_text"] == "안녕하세요 반갑습니다"
+    assert encoded["char_count"] == len("안녕하세요 반갑습니다")
+    assert decode_segments(encoded["cues_zstd"]) == _segments()
+
+
+def test_apply_segments_clears_legacy_column():
+    """새 포맷 저장 시 segments_json은 비움"""
+    caption = VideoCaption(segments_json=_segments())
+
+    apply_segments(caption, _segments())
+
+    assert caption.segments_json is None
+    assert get_caption_text(caption) == "안녕하세요 반갑습니다"
+
+
+def test_get_caption_text_legacy_row():
+    """backfill 전 행은 segments_json에서 텍스트 조립"""
+    caption = VideoCaption(segments_json=_segments())
+
+    assert get_caption_text(caption) == "안녕하세요 반갑습니다"
@@ -0,0 +1,137 @@
+"""
+channel_video_service 일괄 upsert 테스트
+"""
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.channel_video import YTChannelVideo, YTVideoStats
+from app.services import channel_video_service
+from app.services.analytics_rollup_service import AnalyticsRollupService
+
+
+class _FakeSession:
+    """실행된 문을 기록하고, RETURNING 결과로 (모델, inserted) 행을 돌려주는 세션."""
+
+    def __init__(self, existing_video_ids=()):
+        self.statements = []
+        self.commits = 0
+        self.existing_video_ids = set(existing_video_ids)
+
+    async def execute(self, stmt, params=None, execution_options=None):
+        self.statements.append(stmt)
+        rows = stmt.compile().params
+        model = stmt.table
+        results = []
+        for key, value in rows.items():
+            if not key.startswith("video_id_m"):
+                continue
+            suffix = key[len("video_id_"):]
+            if model.name == YTChannelVideo.__tablename__:
+                obj = YTChannelVideo(id=rows[f"id_{suffix}"], video_id=value)
+                results.append((obj, value not in self.existing_video_ids))
+            else:
+                obj = YTVideoStats(id=rows[f"id_{suffix}"], video_id=value)
+                results.append((obj, True))
+        return results
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def fake_youtube(monkeypatch):
+    def install(count):
+        videos = [
+            {"video_id": f"v{i}", "title": f"영상 {i}", "description": "", "published_at": "2026-01-01T00:00:00Z"}
+            for i in range(count)
+        ]
+
+        async def playlist_id(channel_id, api_key):
+            return "UU_test"
+
+        async def playlist_videos(playlist_id, api_key, max_results=50):
+            return videos[:max_results]
+
+        async def details(video_ids, api_key):
+            return [
+                {"video_id": vid, "duration_seconds": 60, "tags": [], "view_count": 10, "like_count": 1, "comment_count": 0}
+                for vid in video_ids
+            ]
+
+        monkeypatch.setattr(channel_video_service.settings, "youtube_api_key", "test")
+        monkeypatch.setattr(channel_video_service, "get_channel_uploads_playlist_id", playlist_id)
+        monkeypatch.setattr(channel_video_service, "fetch_playlist_videos", playlist_videos)
+        monkeypatch.setattr(channel_video_service, "fetch_video_details", details)
+
+        async def refresh(db, channel_id, as_of=None):
+            refreshed.append(channel_id)
+            refreshed_as_of.append(as_of)
+            return True
+
+        monkeypatch.setattr(AnalyticsRollupService, "refresh_channel", staticmethod(refresh))
+        return refreshed
+
+    refreshed = []
+    refreshed_as_of = []
+    install.as_of = refreshed_as_of
+    return install
+
+
+class TestSyncChannelVideos:
+    """영상/통계 청크 단위 INSERT ... ON CONFLICT"""
+
+    @pytest.mark.asyncio
+    async def test_500_videos_use_bounded_statements(self, fake_youtube):
+        """영상 500개 동기화 = 영상 upsert 10문 + 통계 upsert 10문"""
+        refreshed = fake_youtube(500)
+        db = _FakeSession(existing_video_ids={"v0", "v1"})
+
+        saved = await channel_video_service.sync_channel_videos(db, "UC_test", max_results=500)
+
+        assert len(saved) == 500
+        assert len(db.statements) == 2 * (500 // channel_video_service.UPSERT_CHUNK_SIZE)
+        # 영상 / 통계 / 롤업 갱신 후 각 1회
+        assert db.commits == 3
+        assert refreshed == ["UC_test"]
+
+        sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT uq_channel_video DO UPDATE" in sql
+        assert "RETURNING" in sql and "(xmax = 0) AS inserted" in sql
+        # published_at은 최초 저장 값 유지
+        assert "published_at = excluded.published_at" not in sql
+
+        stats_sql = str(db.statements[-1].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT uq_video_stats_date DO UPDATE" in stats_sql
+
+    @pytest.mark.asyncio
+    async def test_duplicate_video_ids_are_collapsed(self, fake_youtube, monkeypatch):
+        """같은 video_id가 중복되면 한 번만 upsert (ON CONFLICT 중복 행 오류 방지)"""
+        fake_youtube(3)
+
+        async def duplicated(playlist_id, api_key, max_results=50):
+            return [
+                {"video_id": "v0", "title": "old", "description": ""},
+                {"video_id": "v0", "title": "new", "description": ""},
+            ]
+
+        monkeypatch.setattr(channel_video_service, "fetch_playlist_videos", duplicated)
+        db = _FakeSession()
+
+        saved = await channel_video_service.sync_channel_videos(db, "UC_test")
+
+        assert [v.video_id for v in saved] == ["v0"]
+        assert db.statements[0].compile().params["title_m0"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_stats_and_rollup_share_report_date(self, fake_youtube):
+        """통계 날짜와 롤업 기준일이 같은 report_date"""
+        fake_youtube(3)
+        db = _FakeSession()
+        report_date = date(2026, 3, 1)
+
+        await channel_video_service.sync_channel_videos(db, "UC_test", report_date=report_date)
+
+        assert db.statements[-1].compile().params["date_m0"] == report_date
+        assert fake_youtube.as_of == [report_date]
@@ -0,0 +1,109 @@
+"""
+CircuitBreaker 테스트 (Redis 장애 시 로컬 상태 경로)
+"""
+import time
+
+import pytest
+
+from app.services import circuit_breaker
+from app.services.circuit_breaker import (
+    CircuitBreaker,
+    CLOSED,
+    OPEN,
+    HALF_OPEN,
+    PERMIT_NORMAL,
+    PERMIT_PROBE,
+)
+
+
+async def _redis_unavailable():
+    raise ConnectionError("redis unavailable")
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    monkeypatch.setattr(circuit_breaker, "get_redis", _redis_unavailable)
+    return CircuitBreaker("test", cooldown_sec=60)
+
+
+def _expire_cooldown(breaker):
+    breaker._local_open_until = time.monotonic() - 1
+
+
+@pytest.mark.asyncio
+async def test_closed_allows_requests(breaker):
+    """closed 상태에서는 모든 요청 허용"""
+    assert await breaker.get_state() == CLOSED
+    assert await breaker.acquire() == PERMIT_NORMAL
+
+
+@pytest.mark.asyncio
+async def test_failure_opens_breaker(breaker):
+    """차단 보고 시 open → 요청 거부"""
+    await breaker.record_failure("ip blocked")
+
+    assert await breaker.get_state() == OPEN
+    assert await breaker.acquire() is None
+
+
+@pytest.mark.asyncio
+async def test_half_open_allows_single_probe(breaker):
+    """cooldown 만료 후 탐색 요청은 1건만 허용"""
+    await breaker.record_failure()
+    _expire_cooldown(breaker)
+
+    assert await breaker.get_state() == HALF_OPEN
+    assert await breaker.acquire() == PERMIT_PROBE
+    assert await breaker.acquire() is None
+
+
+@pytest.mark.asyncio
+async def test_probe_success_closes_breaker(breaker):
+    """탐색 요청 성공 시 closed 복구"""
+    await breaker.record_failure()
+    _expire_cooldown(breaker)
+    permit = await breaker.acquire()
+
+    await breaker.record_success(permit)
+
+    assert await breaker.get_state() == CLOSED
+    metrics = await breaker.get_metrics()
+    assert metrics["transitions"] == {
+        "closed->open": 1,
+        "open->half_open": 1,
+        "half_open->closed": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_probe_failure_reopens_breaker(breaker):
+    """탐색 요청이 다시 차단되면 open (cooldown 재시작)"""
+    await breaker.record_failure()
+    _expire_cooldown(breaker)
+    await breaker.acquire()
+
+    await breaker.record_failure()
+
+    assert await breaker.get_state() == OPEN
+    assert (await breaker.get_metrics())["transitions"]["half_open->open"] == 1
+
+
+@pytest.mark.asyncio
+async def test_release_frees_unreported_probe(breaker):
+    """결과 보고 없이 끝난 탐색 요청은 release로 probe만 풀림 (half_open 유지)"""
+    await breaker.record_failure()
+    _expire_cooldown(breaker)
+    permit = await breaker.acquire()
+
+    await breaker.release(permit)
+
+    assert await breaker.get_state() == HALF_OPEN
+    assert await breaker.acquire() == PERMIT_PROBE
+
+
+@pytest.mark.asyncio
+async def test_release_ignores_normal_permit(breaker):
+    """closed 상태의 일반 허가는 release해도 상태 변화 없음"""
+    await breaker.release(await breaker.acquire())
+
+    assert await breaker.get_state() == CLOSED
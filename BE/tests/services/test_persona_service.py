@@ -0,0 +1,218 @@
+"""
+페르소나 생성 병렬화 테스트
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import persona_llm_analyzer, persona_service
+
+
+class _FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestLoadChannelData:
+    """독립 DB 조회 동시 실행"""
+
+    @pytest.mark.asyncio
+    async def test_reads_run_concurrently_on_separate_sessions(self, monkeypatch):
+        """네 조회가 각각 다른 세션에서 동시에 실행되고, 실패한 조회는 기본값"""
+        sessions = []
+
+        def reader(value, fail=False):
+            async def read(session, channel_id):
+                sessions.append(session)
+                await asyncio.sleep(0.2)
+                if fail:
+                    raise RuntimeError("db error")
+                return value
+            return read
+
+        monkeypatch.setattr(persona_service, "AsyncSessionLocal", _FakeSession)
+        monkeypatch.setattr(persona_service, "_get_channel_videos_with_stats", reader(None, fail=True))
+        monkeypatch.setattr(persona_service, "_get_audience_data", reader(["audience"]))
+        monkeypatch.setattr(persona_service, "_get_geo_data", reader(["geo"]))
+        monkeypatch.setattr(persona_service, "_get_subscriber_count", reader(1234))
+
+        started = time.monotonic()
+        videos, audience, geo, subscribers = await persona_service._load_channel_data("UC_test")
+
+        assert time.monotonic() - started < 0.5  # 직렬이면 0.8초 이상
+        assert len({id(s) for s in sessions}) == 4
+        assert (videos, audience, geo, subscribers) == ([], ["audience"], ["geo"], 1234)
+
+    @pytest.mark.asyncio
+    async def test_timed_records_step_duration(self):
+        """_timed는 실패해도 소요 시간을 기록"""
+        timings = {}
+
+        async def fail():
+            await asyncio.sleep(0.05)
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await persona_service._timed(timings, "step", fail())
+
+        assert timings["step"] >= 0.05
+
+
+class _ChannelOnlyDB:
+    """generate_persona 1단계 채널 조회만 응답하는 가짜 세션"""
+
+    async def execute(self, stmt):
+        channel = SimpleNamespace(channel_id="UC_test", title="테스트 채널", user_id=None)
+        return SimpleNamespace(scalar_one_or_none=lambda: channel)
+
+
+class TestGeneratePersonaOverlap:
+    """자막 분석 백그라운드 작업 정리"""
+
+    @pytest.mark.asyncio
+    async def test_failed_channel_data_cancels_video_analysis(self, monkeypatch):
+        """2~3단계가 실패하면 진행 중인 자막 분석 작업을 취소하고 예외를 그대로 전파"""
+        video = {"started": False, "cancelled": False}
+
+        async def slow_video_analysis(db, channel_id, access_token, previous_snapshot=None):
+            video["started"] = True
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                video["cancelled"] = True
+                raise
+
+        async def broken_channel_data(channel_id):
+            await asyncio.sleep(0)
+            raise RuntimeError("analytics db down")
+
+        monkeypatch.setattr(persona_service, "_run_video_analysis", slow_video_analysis)
+        monkeypatch.setattr(persona_service, "_load_channel_data", broken_channel_data)
+
+        with pytest.raises(RuntimeError, match="analytics db down"):
+            await asyncio.wait_for(
+                persona_service.generate_persona(_ChannelOnlyDB(), "UC_test", force_full=True), timeout=5
+            )
+
+        assert video == {"started": True, "cancelled": True}
+
+
+class TestLLMInterpretations:
+    """LLM 해석 3종 동시 실행"""
+
+    @pytest.mark.asyncio
+    async def test_interpretations_run_concurrently(self, monkeypatch):
+        """세 해석을 동시에 실행하고, 실패한 해석만 None"""
+        async def titles(titles):
+            await asyncio.sleep(0.2)
+            return persona_llm_analyzer.TitleAnalysisResult(
+                content_topics=["AI"], title_patterns=[], title_style="정보형", interpretation=""
+            )
+
+        async def hit_vs_low(hit_videos, low_videos):
+            await asyncio.sleep(0.2)
+            raise RuntimeError("gemini error")
+
+        async def description(description, title):
+            await asyncio.sleep(0.2)
+            return None
+
+        monkeypatch.setattr(persona_llm_analyzer, "analyze_video_titles", titles)
+        monkeypatch.setattr(persona_llm_analyzer, "analyze_hit_vs_low", hit_vs_low)
+        monkeypatch.setattr(persona_llm_analyzer, "analyze_channel_description", description)
+
+        started = time.monotonic()
+        result = await persona_llm_analyzer.get_all_llm_interpretations(
+            titles=["제목"], hit_videos=[], low_videos=[], channel_description="설명"
+        )
+
+        assert time.monotonic() - started < 0.5  # 직렬이면 0.6초 이상
+        assert result["title_analysis"]["content_topics"] == ["AI"]
+        assert result["hit_vs_low"] is None
+        assert result["description_analysis"] is None
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+
+class TestGenerationTask:
+    """백그라운드 생성 작업 중복 방지 / 진행 상황 보고"""
+
+    @pytest.mark.asyncio
+    async def test_claim_deduplicates_per_user(self, monkeypatch):
+        """진행 중인 작업이 있으면 그 작업 ID를 반환하고, 해제 후에는 새로 점유"""
+        redis = _FakeRedis()
+
+        async def fake_get_redis():
+            return redis
+
+        monkeypatch.setattr(persona_service, "get_redis", fake_get_redis)
+
+        assert await persona_service.claim_generation_task("user", "task-1") == "task-1"
+        assert await persona_service.claim_generation_task("user", "task-2") == "task-1"
+        assert await persona_service.claim_generation_task("other", "task-3") == "task-3"
+
+        await persona_service.release_generation_task("user", "task-2")  # 점유자 아님 → 유지
+        assert await persona_service.claim_generation_task("user", "task-4") == "task-1"
+
+        await persona_service.release_generation_task("user", "task-1")
+        assert await persona_service.claim_generation_task("user", "task-5") == "task-5"
+
+    @pytest.mark.asyncio
+    async def test_claim_without_redis_does_not_block(self, monkeypatch):
+        """Redis 장애 시 중복 방지 없이 진행"""
+        async def broken_redis():
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(persona_service, "get_redis", broken_redis)
+
+        assert await persona_service.claim_generation_task("user", "task-1") == "task-1"
+        await persona_service.release_generation_task("user", "task-1")
+
+    @pytest.mark.asyncio
+    async def test_progress_includes_sync_step(self, monkeypatch):
+        """영상 동기화 후 generate_persona 단계 보고에 sync_videos가 완료로 포함"""
+        events = []
+
+        async def fake_sync(db, channel_id):
+            return []
+
+        async def fake_generate(db, channel_id, force_full=False, progress_callback=None):
+            progress_callback("channel_data", "분석 중", [])
+            progress_callback("save", "저장 중", ["channel_data", "video_analysis", "synthesis"])
+            return "persona"
+
+        monkeypatch.setattr(persona_service, "sync_channel_videos", fake_sync)
+        monkeypatch.setattr(persona_service, "generate_persona", fake_generate)
+
+        persona = await persona_service.run_persona_generation(
+            None, "UC_test", progress_callback=lambda *event: events.append(event)
+        )
+
+        assert persona == "persona"
+        assert [step for step, _, _ in events] == ["sync_videos", "channel_data", "save"]
+        assert events[0][2] == []
+        assert events[1][2] == ["sync_videos"]
+        assert events[2][2] == ["sync_videos", "channel_data", "video_analysis", "synthesis"]
+        assert [s["key"] for s in persona_service.PERSONA_STEPS] == [
+            "sync_videos", "channel_data", "video_analysis", "synthesis", "save",
+        ]
@@ -0,0 +1,120 @@
+"""
+RateLimitGate 테스트
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.services.rate_limit_gate import AdaptiveConcurrency, RateLimitGate, parse_retry_after
+
+
+class TestRateLimitGate:
+    """분당 요청/토큰 한도 게이트"""
+
+    @pytest.mark.asyncio
+    async def test_no_wait_within_budget(self):
+        """한도 안에서는 대기하지 않음"""
+        gate = RateLimitGate("test", requests_per_minute=3, window_sec=1.0)
+
+        waits = await asyncio.gather(*[gate.acquire() for _ in range(3)])
+
+        assert max(waits) < 0.05
+
+    @pytest.mark.asyncio
+    async def test_waits_when_requests_exhausted(self):
+        """요청 수 한도를 넘으면 window가 지날 때까지 대기"""
+        gate = RateLimitGate("test", requests_per_minute=2, window_sec=0.2)
+
+        waits = await asyncio.gather(*[gate.acquire() for _ in range(3)])
+
+        assert waits[0] < 0.05 and waits[1] < 0.05
+        assert waits[2] >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_waits_when_tokens_exhausted(self):
+        """토큰 한도를 넘으면 대기"""
+        gate = RateLimitGate("test", requests_per_minute=100, tokens_per_minute=100, window_sec=0.2)
+
+        first = await gate.acquire(80)
+        second = await gate.acquire(30)
+
+        assert first < 0.05
+        assert second >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_penalize_blocks_all_callers(self):
+        """429 Retry-After 동안 모든 호출 대기"""
+        gate = RateLimitGate("test", requests_per_minute=100)
+        gate.penalize(0.2)
+
+        started = time.monotonic()
+        await asyncio.gather(gate.acquire(), gate.acquire())
+
+        assert time.monotonic() - started >= 0.18
+
+
+
+class TestAdaptiveConcurrency:
+    """429에 맞춘 동시 실행 수 조절"""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """동시 실행 수가 한도를 넘지 않음"""
+        limiter = AdaptiveConcurrency("test", initial=2, maximum=2)
+        running = peak = 0
+
+        async def task():
+            nonlocal running, peak
+            await limiter.acquire()
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            await limiter.release(succeeded=True)
+
+        await asyncio.gather(*[task() for _ in range(6)])
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_increases_after_successes(self):
+        """한도만큼 성공하면 1씩 증가, maximum에서 멈춤"""
+        limiter = AdaptiveConcurrency("test", initial=1, maximum=3)
+
+        for _ in range(10):
+            await limiter.acquire()
+            await limiter.release(succeeded=True)
+
+        assert limiter.limit == 3
+        assert limiter.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_throttle_halves_once_per_congestion(self):
+        """같은 혼잡의 429는 한 번만 절반으로 줄이고, Retry-After 동안 대기"""
+        limiter = AdaptiveConcurrency("test", initial=4, maximum=4)
+        slots = [await limiter.acquire() for _ in range(4)]
+
+        for acquired_at in slots:
+            limiter.throttle(acquired_at, 0.2)
+            await limiter.release()
+
+        assert limiter.limit == 2
+        assert limiter.throttled == 4
+
+        started = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - started >= 0.18
+
+class TestParseRetryAfter:
+    """Retry-After 헤더 해석"""
+
+    def test_seconds(self):
+        assert parse_retry_after("12") == 12.0
+
+    def test_http_date_in_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
@@ -0,0 +1,168 @@
+"""
+ScriptListService keyset 페이지네이션 테스트
+"""
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import script_list_service
+from app.services.script_list_service import (
+    InvalidCursorError,
+    ScriptListService,
+    build_history_query,
+    build_page_query,
+    decode_cursor,
+    encode_cursor,
+)
+
+USER_ID = uuid.uuid4()
+
+
+def _rows(count):
+    base = datetime(2026, 1, 1)
+    rows = []
+    for i in range(count):
+        topic = SimpleNamespace(id=uuid.uuid4(), created_at=base - timedelta(minutes=i))
+        rows.append((SimpleNamespace(id=uuid.uuid4(), topic_request_id=topic.id), topic))
+    return rows
+
+
+class _Result:
+    def __init__(self, rows=None, scalar=None):
+        self.rows = rows
+        self._scalar = scalar
+
+    def all(self):
+        return self.rows
+
+    def scalar(self):
+        return self._scalar
+
+
+class _FakeSession:
+    def __init__(self, rows=None, count=0):
+        self.rows = rows or []
+        self.count = count
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        if self.rows is not None and "count(" not in str(stmt):
+            limit = stmt.compile().params.get("param_1")
+            return _Result(rows=self.rows[:limit])
+        return _Result(scalar=self.count)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = str(value)
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+
+class TestCursor:
+    """불투명 커서 인코딩"""
+
+    def test_round_trip(self):
+        key = (datetime(2026, 3, 1, 12, 30, 15, 123456), uuid.uuid4(), uuid.uuid4())
+        cursor = encode_cursor(*key)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == key
+
+    @pytest.mark.parametrize("cursor", ["garbage", "e30", encode_cursor(datetime(2026, 1, 1), uuid.uuid4(), uuid.uuid4())[:-4]])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+
+class TestListPage:
+    """keyset 페이지 조회"""
+
+    def test_query_seeks_from_cursor_without_offset(self):
+        cursor = (datetime(2026, 1, 1), uuid.uuid4(), uuid.uuid4())
+        sql = str(build_page_query(USER_ID, 8, cursor).compile(dialect=postgresql.dialect()))
+
+        assert "OFFSET" not in sql
+        assert "(topic_requests.created_at, topic_requests.id) <= (" in sql
+        assert "ORDER BY topic_requests.created_at DESC, topic_requests.id DESC, script_drafts.id DESC" in sql
+        assert "LIMIT" in sql
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_points_at_last_row(self):
+        rows = _rows(9)
+        db = _FakeSession(rows=rows)
+
+        page, next_cursor = await ScriptListService.list_page(db, USER_ID, 8)
+
+        assert len(page) == 8
+        draft, topic = rows[7]
+        assert decode_cursor(next_cursor) == (topic.created_at, topic.id, draft.id)
+        assert db.statements[0].compile().params["param_1"] == 9  # 다음 페이지 확인용 1개
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self):
+        db = _FakeSession(rows=_rows(3))
+
+        page, next_cursor = await ScriptListService.list_page(db, USER_ID, 8)
+
+        assert len(page) == 3 and next_cursor is None
+
+
+class TestHistoryQuery:
+    """이력 요약 projection"""
+
+    def test_selects_only_summary_keys(self):
+        sql = str(build_history_query(USER_ID, 10).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        ))
+
+        assert "verified_scripts.final_script_json ->> 'hook'" in sql
+        assert "jsonb_array_length(verified_scripts.source_map_json -> 'references')" in sql
+        # 실패한 실행의 JSON null은 has_script=false
+        assert "jsonb_typeof(verified_scripts.final_script_json) = 'object' AS has_script" in sql
+        # JSONB 컬럼 전체는 SELECT 목록에 없음
+        select_list = sql.split("FROM")[0]
+        for column in ("final_script_json,", "source_map_json,", "final_text", "changes_json", "verification_report_json"):
+            assert column not in select_list
+
+
+class TestCount:
+    """전체 개수 캐시"""
+
+    @pytest.mark.asyncio
+    async def test_count_cached_until_invalidated(self, monkeypatch):
+        redis = _FakeRedis()
+
+        async def fake_get_redis():
+            return redis
+
+        monkeypatch.setattr(script_list_service, "get_redis", fake_get_redis)
+        db = _FakeSession(rows=None, count=42)
+
+        assert await ScriptListService.count(db, USER_ID) == 42
+        db.count = 43
+        assert await ScriptListService.count(db, USER_ID) == 42
+        assert len(db.statements) == 1
+
+        await ScriptListService.invalidate_count(USER_ID)
+        assert await ScriptListService.count(db, USER_ID) == 43
+
+    @pytest.mark.asyncio
+    async def test_count_without_redis(self, monkeypatch):
+        async def broken_redis():
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(script_list_service, "get_redis", broken_redis)
+
+        assert await ScriptListService.count(_FakeSession(rows=None, count=5), USER_ID) == 5
@@ -0,0 +1,181 @@
+"""
+SubtitleService 테스트
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.services import circuit_breaker
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.subtitle_service import SubtitleService, YouTubeIPBlockedError
+
+
+def _tracks(*texts):
+    return [{"cues": [{"start": i, "end": i + 1, "text": t} for i, t in enumerate(texts)]}]
+
+
+class TestBuildCaptionText:
+    """자막 텍스트 조립 테스트"""
+
+    def test_joins_cues_with_space(self):
+        """cue 텍스트를 공백으로 이어붙이고 빈 cue는 건너뜀"""
+        tracks = _tracks(" 안녕하세요 ", "", "반갑습니다")
+
+        assert SubtitleService.build_caption_text(tracks) == "안녕하세요 반갑습니다"
+
+    def test_matches_legacy_concatenation(self):
+        """기존 += 방식과 동일한 결과"""
+        tracks = _tracks(*[f"문장{i}" for i in range(500)])
+        legacy = " ".join(f"문장{i}" for i in range(500))
+
+        assert SubtitleService.build_caption_text(tracks) == legacy
+
+    def test_empty_tracks(self):
+        """자막이 없으면 빈 문자열"""
+        assert SubtitleService.build_caption_text([]) == ""
+
+
+def _success(video_id, languages):
+    return {
+        "video_id": video_id,
+        "status": "success",
+        "source": "transcript-api",
+        "tracks": _tracks("자막"),
+        "no_captions": False,
+        "error": None,
+    }
+
+
+async def _redis_unavailable():
+    raise ConnectionError("redis unavailable")
+
+
+@pytest.fixture
+def fast_subtitles(monkeypatch):
+    """자막 기능 활성화 + 요청 간격 제거"""
+    from app.services import subtitle_service
+
+    monkeypatch.setattr(subtitle_service.settings, "youtube_subtitle_enabled", True)
+    monkeypatch.setattr(SubtitleService, "_MIN_INTERVAL", 0.0)
+    monkeypatch.setattr(SubtitleService, "_next_slot", 0.0)
+    monkeypatch.setattr(SubtitleService, "_strategy_stats", {})
+    monkeypatch.setattr(
+        subtitle_service, "_transcript_breaker", CircuitBreaker("test_transcript", cooldown_sec=60)
+    )
+    monkeypatch.setattr(circuit_breaker, "get_redis", _redis_unavailable)
+
+
+class TestFetchSubtitlesConcurrency:
+    """자막 동시 fetch 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_runs_videos_concurrently_and_keeps_order(self, fast_subtitles, monkeypatch):
+        """영상들이 동시에 처리되고 결과는 입력 순서를 유지"""
+        def slow_success(video_id, languages):
+            time.sleep(0.2)
+            return _success(video_id, languages)
+
+        monkeypatch.setattr(SubtitleService, "_fetch_with_transcript_api", slow_success)
+
+        started = time.monotonic()
+        results = await SubtitleService.fetch_subtitles(["a", "b", "c"], ["ko"])
+        elapsed = time.monotonic() - started
+
+        assert [r["video_id"] for r in results] == ["a", "b", "c"]
+        assert all(r["status"] == "success" for r in results)
+        assert elapsed < 0.5  # 직렬이면 0.6초 이상
+        assert "transcript-api" in results[0]["timings"]
+        assert SubtitleService.get_strategy_stats()["transcript-api"]["success_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_per_video_timeout(self, fast_subtitles, monkeypatch):
+        """제한 시간을 넘긴 영상만 실패 처리"""
+        def maybe_hang(video_id, languages):
+            if video_id == "slow":
+                time.sleep(0.5)
+            return _success(video_id, languages)
+
+        monkeypatch.setattr(SubtitleService, "_fetch_with_transcript_api", maybe_hang)
+        monkeypatch.setattr(SubtitleService, "_PER_VIDEO_TIMEOUT", 0.2)
+
+        results = await SubtitleService.fetch_subtitles(["slow", "fast"], ["ko"])
+
+        assert results[0]["status"] == "failed"
+        assert results[0]["source"] == "timeout"
+        assert results[1]["status"] == "success"
+
+    @pytest.mark.asyncio
+    async def test_throttle_spaces_request_starts(self, monkeypatch):
+        """동시 호출에서도 요청 시작 간격을 전역으로 유지"""
+        monkeypatch.setattr(SubtitleService, "_MIN_INTERVAL", 0.1)
+        monkeypatch.setattr(SubtitleService, "_next_slot", 0.0)
+
+        starts = []
+
+        async def acquire():
+            await SubtitleService._throttle()
+            starts.append(time.monotonic())
+
+        await asyncio.gather(*[acquire() for _ in range(3)])
+
+        starts.sort()
+        assert starts[1] - starts[0] >= 0.09
+        assert starts[2] - starts[1] >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_ip_block_opens_breaker(self, fast_subtitles, monkeypatch):
+        """IP 차단 감지 시 브레이커가 열리고 이후 요청은 스킵"""
+        from app.services import subtitle_service
+
+        def blocked(video_id, languages):
+            raise YouTubeIPBlockedError("blocking requests from your ip")
+
+        monkeypatch.setattr(SubtitleService, "_fetch_with_transcript_api", blocked)
+
+        with pytest.raises(YouTubeIPBlockedError):
+            await SubtitleService.fetch_subtitles(["a"], ["ko"])
+
+        assert await subtitle_service.is_ip_blocked()
+        results = await SubtitleService.fetch_subtitles(["b"], ["ko"])
+        assert results[0]["source"] == "ip-blocked"
+
+    @staticmethod
+    async def _half_open():
+        from app.services import subtitle_service
+
+        breaker = subtitle_service._transcript_breaker
+        await breaker.record_failure()
+        breaker._local_open_until = time.monotonic() - 1
+        return breaker
+
+    @pytest.mark.asyncio
+    async def test_timed_out_probe_releases_permit(self, fast_subtitles, monkeypatch):
+        """탐색 요청이 타임아웃으로 취소돼도 probe가 풀려 다음 요청이 다시 탐색"""
+        def hang(video_id, languages):
+            time.sleep(0.3)
+            return _success(video_id, languages)
+
+        monkeypatch.setattr(SubtitleService, "_fetch_with_transcript_api", hang)
+        monkeypatch.setattr(SubtitleService, "_PER_VIDEO_TIMEOUT", 0.1)
+        breaker = await self._half_open()
+
+        results = await SubtitleService.fetch_subtitles(["a"], ["ko"])
+
+        assert results[0]["source"] == "timeout"
+        assert await breaker.acquire() == circuit_breaker.PERMIT_PROBE
+
+    @pytest.mark.asyncio
+    async def test_unrelated_error_releases_probe(self, fast_subtitles, monkeypatch):
+        """IP 차단이 아닌 예외로 끝난 탐색 요청도 probe를 반납"""
+        async def broken(video_id, languages, timings):
+            raise RuntimeError("parser error")
+
+        monkeypatch.setattr(SubtitleService, "_fetch_one_unguarded", broken)
+        breaker = await self._half_open()
+
+        results = await SubtitleService.fetch_subtitles(["a"], ["ko"])
+
+        assert results[0]["status"] == "failed"
+        assert await breaker.get_state() == circuit_breaker.HALF_OPEN
+        assert await breaker.acquire() == circuit_breaker.PERMIT_PROBE
@@ -0,0 +1,232 @@
+"""
+video_analyzer 배치 분석 테스트
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services import video_analyzer
+from app.services.video_analyzer import (
+    BatchAnalysisOutput,
+    VideoAnalysisResult,
+    VideoForAnalysis,
+    analyze_videos_batch,
+)
+
+
+def _video(video_id, reason):
+    return VideoForAnalysis(
+        id=video_id, youtube_video_id=f"yt_{video_id}", title=video_id,
+        view_count=100, like_count=10, comment_count=1, duration_seconds=60,
+        days_since_upload=3, selection_reason=reason,
+    )
+
+
+def _result(video_id):
+    return VideoAnalysisResult(
+        video_id=video_id, video_type="정보형", content_structure="", tone_manner="",
+        key_topics=[], summary="", strengths=[], weaknesses=[], performance_insight="",
+        viewer_reactions=[], viewer_needs=[], performance_reason="",
+    )
+
+
+class TestAnalyzeVideosBatch:
+    """hit/low/latest 배치 동시 분석"""
+
+    @pytest.mark.asyncio
+    async def test_batches_run_concurrently_and_failure_is_isolated(self, monkeypatch):
+        """세 배치를 동시에 실행하고, 실패한 배치만 빠짐"""
+        async def fake_analyze(batch, api_key, batch_type="latest", comments_map=None):
+            await asyncio.sleep(0.2)
+            if batch_type == "low":
+                raise RuntimeError("boom")
+            return BatchAnalysisOutput(
+                results=[_result(v.id) for v, _ in batch],
+                patterns=[f"{batch_type} 패턴"],
+                tone_candidates=[f"{batch_type} 말투"],
+                retries=1 if batch_type == "hit" else 0,
+            )
+
+        monkeypatch.setattr(video_analyzer.settings, "gemini_api_key", "test-key")
+        monkeypatch.setattr(video_analyzer, "_analyze_batch_with_llm", fake_analyze)
+
+        videos = [
+            (_video("h1", "hit"), "자막"),
+            (_video("l1", "low"), "자막"),
+            (_video("n1", "latest"), "자막"),
+        ]
+
+        started = time.monotonic()
+        results, hit, low, latest, tones, stats = await analyze_videos_batch(videos)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.5  # 직렬이면 0.6초 이상
+        assert [r.video_id for r in results] == ["h1", "n1"]
+        assert hit == ["hit 패턴"] and low == [] and latest == ["latest 패턴"]
+        assert tones == ["hit 말투", "latest 말투"]
+
+        by_type = {s["batch_type"]: s for s in stats}
+        assert by_type["hit"]["status"] == "success"
+        assert by_type["hit"]["retries"] == 1
+        assert by_type["hit"]["elapsed_sec"] >= 0.2
+        assert by_type["low"]["status"] == "failed"
+
+
+def _comment_item(text, likes):
+    return {"snippet": {"topLevelComment": {"snippet": {"textDisplay": text, "likeCount": likes}}}}
+
+
+class TestFetchTranscriptsAndComments:
+    """자막/댓글 동시 추출"""
+
+    @pytest.mark.asyncio
+    async def test_comments_fetched_concurrently_with_per_item_errors(self, monkeypatch):
+        """댓글을 동시에 가져오고 실패는 영상별 error로 기록"""
+        async def handler(request):
+            await asyncio.sleep(0.1)
+            video_id = request.url.params["videoId"]
+            if video_id == "yt_disabled":
+                return httpx.Response(403)
+            if video_id == "yt_broken":
+                return httpx.Response(500)
+            return httpx.Response(200, json={"items": [_comment_item("좋아요", 1), _comment_item("최고", 5)]})
+
+        monkeypatch.setattr(video_analyzer.settings, "youtube_api_key", "test-key")
+        videos = [_video(v, "hit") for v in ("ok1", "ok2", "disabled", "broken")]
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            started = time.monotonic()
+            results = await video_analyzer.get_comments_for_videos(videos, client=client)
+            elapsed = time.monotonic() - started
+
+        assert elapsed < 0.3  # 직렬이면 0.4초 이상
+        assert [c["text"] for c in results["ok1"].value] == ["최고", "좋아요"]
+        assert results["disabled"].value == [] and results["disabled"].error is None
+        assert results["broken"].value is None
+        assert "500" in results["broken"].error
+
+    @pytest.mark.asyncio
+    async def test_transcripts_via_captions_api(self, monkeypatch):
+        """Captions API 자막을 공유 클라이언트로 가져오고 자막 없는 영상은 사유 기록"""
+        async def handler(request):
+            path = request.url.path
+            if path.endswith("/captions"):
+                if request.url.params["videoId"] == "yt_none":
+                    return httpx.Response(404)
+                return httpx.Response(200, json={"items": [{"id": "cap1", "snippet": {"language": "ko"}}]})
+            return httpx.Response(200, text="1\n00:00:00,000 --> 00:00:01,000\n안녕하세요\n")
+
+        videos = [_video("has", "hit"), _video("none", "hit")]
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            results = await video_analyzer.get_transcripts_for_videos(
+                videos, access_token="token", client=client
+            )
+
+        assert "안녕하세요" in results["has"].value
+        assert results["none"].value is None
+        assert results["none"].error == "no_subtitle"
+
+    @pytest.mark.asyncio
+    async def test_transcripts_and_comments_run_in_parallel(self, monkeypatch):
+        """자막과 댓글 추출이 서로 겹쳐서 실행"""
+        async def slow_transcripts(videos, access_token=None, client=None, semaphore=None):
+            await asyncio.sleep(0.2)
+            return {v.id: video_analyzer.FetchResult(value="자막") for v in videos}
+
+        async def slow_comments(videos, max_per_video=10, client=None, semaphore=None):
+            await asyncio.sleep(0.2)
+            return {v.id: video_analyzer.FetchResult(value=[]) for v in videos}
+
+        monkeypatch.setattr(video_analyzer, "get_transcripts_for_videos", slow_transcripts)
+        monkeypatch.setattr(video_analyzer, "get_comments_for_videos", slow_comments)
+
+        started = time.monotonic()
+        transcripts, comments = await video_analyzer.fetch_transcripts_and_comments([_video("a", "hit")])
+
+        assert time.monotonic() - started < 0.35
+        assert transcripts["a"].value == "자막"
+        assert comments["a"].value == []
+
+
+def _snapshot_entry(video, **overrides):
+    entry = {
+        "youtube_video_id": video.youtube_video_id, "reason": video.selection_reason,
+        "view_count": video.view_count, "like_count": video.like_count,
+        "comment_count": video.comment_count,
+    }
+    entry.update(overrides)
+    return entry
+
+
+class TestIncrementalReanalysis:
+    """이전 스냅샷 기준 증분 재분석"""
+
+    def test_is_materially_changed(self):
+        """신규 / 그룹 변경 / 통계 큰 변화만 재분석 대상"""
+        video = _video("a", "hit")  # view_count=100, comment_count=1
+
+        assert video_analyzer.is_materially_changed(video, None)
+        assert video_analyzer.is_materially_changed(video, _snapshot_entry(video, reason="low"))
+        assert video_analyzer.is_materially_changed(video, _snapshot_entry(video, view_count=0))
+        # 작은 변화 (절대 변화량 최소 기준 미만)는 무시
+        assert not video_analyzer.is_materially_changed(video, _snapshot_entry(video, view_count=60))
+        assert not video_analyzer.is_materially_changed(video, _snapshot_entry(video))
+
+    @pytest.mark.asyncio
+    async def test_only_changed_videos_are_reanalyzed(self, monkeypatch):
+        """변경 영상만 추출/분석하고, 변경 없는 그룹은 이전 패턴 재사용"""
+        videos = [_video("h1", "hit"), _video("h2", "hit"), _video("l1", "low"), _video("n1", "latest")]
+        snapshot = {
+            "videos": {v.id: _snapshot_entry(v) for v in videos[:3]},  # n1은 신규 영상
+            "patterns": {"hit": ["이전 hit"], "low": ["이전 low"], "latest": ["이전 latest"]},
+            "tone_candidates": ["이전 말투"],
+        }
+        calls = {}
+
+        async def fake_select(db, channel_id):
+            return videos
+
+        async def fake_load(db, channel_id, unchanged):
+            return {v.id: _result(v.id) for v in unchanged}
+
+        async def fake_fetch(to_analyze, access_token=None, max_comments_per_video=10):
+            calls["fetched"] = [v.id for v in to_analyze]
+            return (
+                {v.id: video_analyzer.FetchResult(value="자막") for v in to_analyze},
+                {v.id: video_analyzer.FetchResult(value=[]) for v in to_analyze},
+            )
+
+        async def fake_batch(videos_with_transcripts, comments_map=None):
+            calls["analyzed"] = [v.id for v, _ in videos_with_transcripts]
+            return [_result("n1")], [], [], ["새 latest"], ["새 말투"], []
+
+        async def fake_compare(**kwargs):
+            calls["compare"] = kwargs
+            return {}
+
+        async def fake_save(db, channel_id, videos, results, transcripts):
+            calls["saved"] = [r.video_id for r in results]
+
+        monkeypatch.setattr(video_analyzer, "select_videos_for_analysis", fake_select)
+        monkeypatch.setattr(video_analyzer, "_load_reusable_analyses", fake_load)
+        monkeypatch.setattr(video_analyzer, "fetch_transcripts_and_comments", fake_fetch)
+        monkeypatch.setattr(video_analyzer, "analyze_videos_batch", fake_batch)
+        monkeypatch.setattr(video_analyzer, "analyze_hit_vs_low_comparison", fake_compare)
+        monkeypatch.setattr(video_analyzer, "save_analysis_results", fake_save)
+
+        summary = await video_analyzer.analyze_channel_videos(
+            db=None, channel_id="UC_test", min_videos_required=4, previous_snapshot=snapshot
+        )
+
+        assert calls["fetched"] == calls["analyzed"] == calls["saved"] == ["n1"]
+        assert calls["compare"]["hit_patterns"] == ["이전 hit"]
+        assert calls["compare"]["latest_patterns"] == ["새 latest", "이전 latest"]
+        assert calls["compare"]["tone_candidates"] == ["새 말투", "이전 말투"]
+        assert summary.video_types == {"정보형": 100}
+        assert summary.reuse_stats == {
+            "mode": "incremental", "reused_videos": 3, "analyzed_videos": 1, "llm_calls_saved": 2,
+        }
+        assert set(summary.source_snapshot["videos"]) == {"h1", "h2", "l1", "n1"}
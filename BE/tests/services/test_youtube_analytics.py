@@ -0,0 +1,156 @@
+"""
+YouTube Analytics 보고서 일괄 upsert / 공용 HTTP 클라이언트 테스트
+"""
+import asyncio
+import logging
+import threading
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import youtube_service
+from app.services.youtube_service import YouTubeService
+
+
+class _FakeSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+
+
+def _patch_report(monkeypatch, headers, rows):
+    async def fake_report(access_token, channel_id, dimensions, metrics, report_date):
+        return {"columnHeaders": [{"name": h} for h in headers], "rows": rows}
+
+    monkeypatch.setattr(YouTubeService, "_fetch_analytics_report", staticmethod(fake_report))
+
+
+class TestAnalyticsBulkUpsert:
+    """보고서 전체를 테이블당 한 문으로 저장"""
+
+    @pytest.mark.asyncio
+    async def test_geo_report_is_one_statement(self, monkeypatch):
+        """국가 250개 + 중복 행 → INSERT ... ON CONFLICT 1문, 중복은 마지막 값"""
+        rows = [[f"C{i:03d}", i, i * 1.5] for i in range(250)] + [["C000", 999, 1.0]]
+        _patch_report(monkeypatch, ["country", "views", "estimatedMinutesWatched"], rows)
+        db = _FakeSession()
+
+        await YouTubeService._record_geo(db, "UC_test", "token", date(2026, 10, 19))
+
+        assert len(db.statements) == 1
+        compiled = db.statements[0].compile(dialect=postgresql.dialect())
+        assert "ON CONFLICT ON CONSTRAINT uq_geo_channel_date_country DO UPDATE" in str(compiled)
+        countries = [v for k, v in compiled.params.items() if k.startswith("country_m")]
+        assert len(countries) == 250
+        assert compiled.params["views_m0"] == 999
+
+    @pytest.mark.asyncio
+    async def test_audience_report_is_one_statement(self, monkeypatch):
+        """연령×성별 행을 한 문으로 저장"""
+        rows = [[age, gender, 10.0] for age in ("age18-24", "age25-34") for gender in ("male", "female")]
+        _patch_report(monkeypatch, ["ageGroup", "gender", "viewerPercentage"], rows)
+        db = _FakeSession()
+
+        await YouTubeService._record_audience(db, "UC_test", "token", date(2026, 10, 19))
+
+        assert len(db.statements) == 1
+        sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT uq_audience_channel_date_age_gender DO UPDATE" in sql
+
+    @pytest.mark.asyncio
+    async def test_empty_report_issues_no_statement(self, monkeypatch):
+        """행이 없으면 DB 호출 없음"""
+        _patch_report(monkeypatch, ["country"], [])
+        db = _FakeSession()
+
+        await YouTubeService._record_geo(db, "UC_test", "token", date(2026, 10, 19))
+
+        assert db.statements == []
+
+
+class TestHttpClient:
+    """앱 수명 동안 재사용하는 httpx 클라이언트"""
+
+    def test_client_reused_within_loop_and_recreated_per_loop(self, monkeypatch):
+        """같은 루프에서는 같은 클라이언트, 루프가 바뀌면 (Celery task) 새 클라이언트"""
+        monkeypatch.setattr(youtube_service, "_http_client", None)
+        monkeypatch.setattr(youtube_service, "_http_client_loop", None)
+
+        async def get_twice():
+            return youtube_service.get_http_client(), youtube_service.get_http_client()
+
+        first, second = asyncio.run(get_twice())
+        third, _ = asyncio.run(get_twice())
+
+        assert first is second
+        assert third is not first
+
+        asyncio.run(youtube_service.close_http_client())
+        assert youtube_service._http_client is None
+
+    def test_stale_client_on_stopped_loop_is_logged(self, monkeypatch, caplog):
+        """닫히지 않은 채 루프가 끝난 클라이언트를 교체하면 경고"""
+        monkeypatch.setattr(youtube_service, "_http_client", None)
+        monkeypatch.setattr(youtube_service, "_http_client_loop", None)
+
+        async def get():
+            return youtube_service.get_http_client()
+
+        asyncio.run(get())
+        with caplog.at_level(logging.WARNING, logger=youtube_service.__name__):
+            asyncio.run(get())
+
+        assert "close_http_client" in caplog.text
+        asyncio.run(youtube_service.close_http_client())
+
+    def test_stale_client_on_running_loop_is_closed_there(self, monkeypatch):
+        """이전 루프가 다른 스레드에서 아직 돌고 있으면 그 루프에서 닫음"""
+        monkeypatch.setattr(youtube_service, "_http_client", None)
+        monkeypatch.setattr(youtube_service, "_http_client_loop", None)
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        try:
+            async def get():
+                return youtube_service.get_http_client()
+
+            stale = asyncio.run_coroutine_threadsafe(get(), other).result(timeout=5)
+            fresh = asyncio.run(get())
+
+            assert fresh is not stale
+            # 종료 예약 처리 대기
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other).result(timeout=5)
+            assert stale.is_closed
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join(timeout=5)
+            other.close()
+            asyncio.run(youtube_service.close_http_client())
+
+
+class TestFetchVideoCaptions:
+    """Captions API 요청별 타임아웃 (공용 클라이언트 기본값 15초와 무관)"""
+
+    @pytest.mark.asyncio
+    async def test_download_uses_caption_timeout_on_shared_client(self, monkeypatch):
+        requests = []
+
+        class _Client:
+            async def get(self, url, params=None, headers=None, timeout=None):
+                requests.append((url.rsplit("/", 1)[-1], timeout))
+                if url.endswith("/captions"):
+                    body = {"items": [{"id": "cap1", "snippet": {"language": "ko", "trackKind": "standard"}}]}
+                    return SimpleNamespace(status_code=200, json=lambda: body, raise_for_status=lambda: None)
+                return SimpleNamespace(status_code=200, text="1\n00:00:00,000 --> 00:00:01,000\n안녕하세요\n")
+
+        monkeypatch.setattr(youtube_service, "get_http_client", lambda: _Client())
+
+        result = await YouTubeService.fetch_video_captions("vid1", "token")
+
+        assert result["status"] == "success"
+        assert requests == [("captions", 15.0), ("cap1", youtube_service.CAPTION_TIMEOUT)]
+        assert youtube_service.CAPTION_TIMEOUT == 30.0
@@ -1,5 +1,12 @@
 import { api } from '../client';
-import type { PersonaResponse, PersonaGenerateResponse, PersonaUpdateRequest, ManualPersonaRequest } from '../types';
+import type {
+    PersonaResponse,
+    PersonaGenerateResponse,
+    PersonaGenerateProgress,
+    PersonaGenerateTaskResponse,
+    PersonaUpdateRequest,
+    ManualPersonaRequest,
+} from '../types';
 
 // 내 페르소나 조회
 export const getMyPersona = async (): Promise<PersonaResponse> => {
@@ -7,12 +14,82 @@ export const getMyPersona = async (): Promise<PersonaResponse> => {
     return response.data;
 };
 
-// 페르소나 생성 (채널 분석)
-export const generatePersona = async (): Promise<PersonaGenerateResponse> => {
-    const response = await api.post('/personas/generate');
+// 페르소나 생성 작업 상태 조회
+export const checkPersonaGenerateStatus = async (taskId: string): Promise<PersonaGenerateTaskResponse> => {
+    const response = await api.get(`/personas/generate/status/${taskId}`);
     return response.data;
 };
 
+const PERSONA_POLL_INTERVAL_MS = 3000;
+const PERSONA_POLL_TIMEOUT_MS = 10 * 60 * 1000;  // 이 시간 안에 끝나지 않으면 실패 처리 (서버 작업은 계속 진행)
+const PERSONA_POLL_MAX_ERRORS = 3;               // 상태 조회가 연속으로 이만큼 실패하면 중단
+
+// 페르소나 생성 실패 (작업 실패 / 제한 시간 초과) — message는 화면에 그대로 표시
+export class PersonaGenerateError extends Error {
+    constructor(message: string) {
+        super(message);
+        this.name = 'PersonaGenerateError';
+    }
+}
+
+// 페르소나 생성 (채널 분석) — 백그라운드 작업 등록 후 완료될 때까지 폴링
+// 이미 진행 중인 작업이 있으면 서버가 같은 task_id를 돌려주므로 그 작업을 기다림
+// PERSONA_POLL_TIMEOUT_MS가 지나거나 상태 조회가 연속 실패하면 폴링을 멈추고 reject
+export const generatePersona = async (
+    onProgress?: (progress: PersonaGenerateProgress) => void,
+): Promise<PersonaGenerateResponse> => {
+    const response = await api.post('/personas/generate');
+    const { task_id: taskId }: PersonaGenerateTaskResponse = response.data;
+    const deadline = Date.now() + PERSONA_POLL_TIMEOUT_MS;
+
+    return new Promise((resolve, reject) => {
+        let settled = false;
+        let consecutiveErrors = 0;
+
+        const finish = (settle: () => void) => {
+            if (settled) return;
+            settled = true;
+            clearInterval(interval);
+            settle();
+        };
+
+        const interval = setInterval(async () => {
+            if (settled) return;
+            if (Date.now() > deadline) {
+                finish(() => reject(new PersonaGenerateError(
+                    '채널 분석이 예상보다 오래 걸리고 있습니다. 잠시 후 다시 시도해주세요.'
+                )));
+                return;
+            }
+
+            try {
+                const statusData = await checkPersonaGenerateStatus(taskId);
+                consecutiveErrors = 0;
+
+                if (statusData.status === 'PROGRESS' && statusData.progress && onProgress && !settled) {
+                    onProgress(statusData.progress);
+                }
+
+                if (statusData.status === 'SUCCESS' && statusData.result) {
+                    const result = statusData.result;
+                    finish(() => result.success
+                        ? resolve(result)
+                        : reject(new PersonaGenerateError(result.message || '페르소나 생성에 실패했습니다.')));
+                } else if (statusData.status === 'FAILURE') {
+                    finish(() => reject(new PersonaGenerateError(
+                        statusData.result?.message || '페르소나 생성에 실패했습니다.'
+                    )));
+                }
+            } catch (error) {
+                consecutiveErrors += 1;
+                if (consecutiveErrors >= PERSONA_POLL_MAX_ERRORS) {
+                    finish(() => reject(error));
+                }
+            }
+        }, PERSONA_POLL_INTERVAL_MS);
+    });
+};
+
 // 수동 온보딩 페르소나 생성 (Branch B)
 export const generateManualPersona = async (data: ManualPersonaRequest): Promise<PersonaGenerateResponse> => {
     const response = await api.post('/personas/generate-from-manual', data);
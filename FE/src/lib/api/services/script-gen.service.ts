@@ -142,12 +142,24 @@ export const pollScriptGenResult = async (
     });
 };
 
-// 스크립트 생성 이력 조회 (새로고침 후 결과 복원)
-export interface ScriptHistoryItem {
+// 스크립트 생성 이력 조회 (요약 — 본문/참고자료는 getScriptById로 조회)
+export interface ScriptHistorySummary {
     topic_request_id: string;
     topic_title: string;
     status: string;
     created_at: string | null;
+    verified_at: string | null;
+    has_script: boolean;
+    hook_preview: string | null;
+    chapter_count: number;
+    reference_count: number;
+}
+
+// 스크립트 결과 전체 (getScriptById)
+export interface ScriptHistoryItem {
+    topic_request_id: string;
+    topic_title: string;
+    status: string;
     script: GeneratedScript | null;
     references: ReferenceArticle[] | null;
     competitor_videos: any[] | null;
@@ -155,7 +167,7 @@ export interface ScriptHistoryItem {
     related_videos?: RelatedVideo[] | null;
 }
 
-export const getScriptHistory = async (limit: number = 10): Promise<ScriptHistoryItem[]> => {
+export const getScriptHistory = async (limit: number = 10): Promise<ScriptHistorySummary[]> => {
     const response = await api.get(`/script-gen/scripts/history?limit=${limit}`);
     return response.data.results || [];
 };
@@ -177,23 +189,31 @@ export interface ScriptListItem {
     is_completed: boolean;
 }
 
-// 페이지네이션 정보 타입
+// 페이지네이션 정보 타입 (total_count / total_pages는 includeTotal 요청 시에만 채워짐)
 export interface PaginationInfo {
-    page: number;
     page_size: number;
-    total_count: number;
-    total_pages: number;
+    has_more: boolean;
+    total_count: number | null;
+    total_pages: number | null;
 }
 
 // 스크립트 목록 응답 타입
 export interface ScriptListResponse {
     success: boolean;
     scripts: ScriptListItem[];
+    next_cursor: string | null;
     pagination: PaginationInfo;
 }
 
-// 스크립트 목록 조회 (페이지네이션)
-export const getScriptList = async (page: number = 1, pageSize: number = 8): Promise<ScriptListResponse> => {
-    const response = await api.get(`/script-gen/scripts/list?page=${page}&page_size=${pageSize}`);
+// 스크립트 목록 조회 (커서 페이지네이션: 다음 페이지는 이전 응답의 next_cursor 전달)
+export const getScriptList = async (
+    cursor: string | null = null,
+    pageSize: number = 8,
+    includeTotal: boolean = false,
+): Promise<ScriptListResponse> => {
+    const params = new URLSearchParams({ page_size: String(pageSize) });
+    if (cursor) params.set("cursor", cursor);
+    if (includeTotal) params.set("include_total", "true");
+    const response = await api.get(`/script-gen/scripts/list?${params.toString()}`);
     return response.data;
 };
@@ -58,6 +58,24 @@ export interface PersonaGenerateResponse {
     persona?: PersonaResponse;
 }
 
+// 페르소나 생성 진행 상황 (PROGRESS 상태)
+export interface PersonaGenerateProgress {
+    current_step: string;
+    message: string;
+    completed_steps: string[];
+    total_steps: number;
+    steps: { key: string; label: string; emoji: string }[];
+}
+
+// 페르소나 생성 작업 상태 (백그라운드 작업)
+export interface PersonaGenerateTaskResponse {
+    task_id: string;
+    status: 'PENDING' | 'STARTED' | 'PROGRESS' | 'SUCCESS' | 'FAILURE';
+    deduplicated: boolean;
+    progress?: PersonaGenerateProgress;
+    result?: PersonaGenerateResponse;
+}
+
 // 수동 온보딩 페르소나 생성 요청
 export interface ManualPersonaRequest {
     categories: string[];
@@ -3,9 +3,10 @@
 import { useState, useEffect, useRef, useCallback } from "react"
 import { useNavigate } from "react-router-dom"
 import { Loader2 } from "lucide-react"
+import { Button } from "../../components/ui/button"
 
 // API
-import { generatePersona, generateManualPersona, getMyPersona } from "../../lib/api/services"
+import { generatePersona, generateManualPersona, getMyPersona, PersonaGenerateError } from "../../lib/api/services"
 import { getChannelStatus } from "../../lib/api/services"
 import { generateTrendTopics, getTopics } from "../../lib/api/services"
 import type { PersonaResponse, ManualPersonaRequest, TopicResponse } from "../../lib/api/types"
@@ -25,6 +26,7 @@ type OnboardingPhase =
   | "checking"                // 공통: 채널 상태 확인 중
   | "loading-analysis"        // Branch A: 채널 분석 로딩
   | "analysis-result"         // Branch A: 분석 결과 화면
+  | "analysis-error"          // Branch A: 분석 실패 (재시도 / 수동 입력 선택)
   | "step-category"           // Branch B: 1단계
   | "step-audience"           // Branch B: 2단계
   | "step-benchmark"          // Branch B: 3단계
@@ -100,6 +102,7 @@ export default function OnboardingPage() {
     apiDoneRef.current = false
     animDoneRef.current = false
     nextPhaseRef.current = "analysis-result"
+    setError(null)
     setApiStep(0)
 
     const runAnalysis = async () => {
@@ -114,12 +117,16 @@ export default function OnboardingPage() {
         setApiStep(3)
       } catch (err: any) {
         console.error("Branch A 분석 실패:", err)
-        setError(err.response?.data?.detail || "채널 분석 중 오류가 발생했습니다.")
+        setError(
+          err.response?.data?.detail
+            || (err instanceof PersonaGenerateError ? err.message : "채널 분석 중 오류가 발생했습니다.")
+        )
+        nextPhaseRef.current = "analysis-error"
       } finally {
         setApiStep(3)
         apiDoneRef.current = true
         if (animDoneRef.current) {
-          setPhase("analysis-result")
+          setPhase(nextPhaseRef.current === "analysis-error" ? "analysis-error" : "analysis-result")
         }
       }
     }
@@ -231,6 +238,10 @@ export default function OnboardingPage() {
     navigate("/explore")
   }
 
+  // ─── Branch A: 분석 실패 → 재시도 또는 수동 입력 ─────────
+  const handleAnalysisRetry = () => setPhase("loading-analysis")
+  const handleAnalysisManual = () => setPhase("step-category")
+
   // ─── Branch B: 4단계 핸들러 ────────────────────────────
   const handleCategoryNext = (categories: string[]) => {
     setManualInput((prev) => ({ ...prev, categories }))
@@ -340,6 +351,20 @@ export default function OnboardingPage() {
         />
       )}
 
+      {/* Branch A: 분석 실패 */}
+      {phase === "analysis-error" && (
+        <div className="min-h-screen flex items-center justify-center p-4">
+          <div className="flex flex-col items-center gap-4 text-center">
+            <p className="text-base font-medium text-foreground">채널 분석을 완료하지 못했어요</p>
+            <p className="text-sm text-muted-foreground">{error}</p>
+            <div className="flex gap-2">
+              <Button variant="outline" onClick={handleAnalysisManual}>직접 입력하기</Button>
+              <Button onClick={handleAnalysisRetry}>다시 시도</Button>
+            </div>
+          </div>
+        </div>
+      )}
+
       {/* Branch B: 수동 4단계 */}
       {isManualStep && (
         <div className="min-h-screen bg-background flex items-center justify-center p-4">
@@ -3,12 +3,15 @@ import { useNavigate } from "react-router-dom"
 import { Plus, FileText, Loader2, ChevronLeft, ChevronRight } from "lucide-react"
 import { Button } from "../../components/ui/button"
 import { ScriptCard } from "./components/script-card"
-import { getScriptList, type ScriptListItem, type PaginationInfo } from "../../lib/api/services"
+import { getScriptList, type ScriptListItem } from "../../lib/api/services"
 
 export default function ScriptListPage() {
   const navigate = useNavigate()
   const [scripts, setScripts] = useState<ScriptListItem[]>([])
-  const [pagination, setPagination] = useState<PaginationInfo | null>(null)
+  // cursors[i] = i+1 페이지 요청 커서 (1페이지는 null)
+  const [cursors, setCursors] = useState<(string | null)[]>([null])
+  const [hasMore, setHasMore] = useState(false)
+  const [totalPages, setTotalPages] = useState<number | null>(null)
   const [currentPage, setCurrentPage] = useState(1)
   const [isLoading, setIsLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
@@ -21,9 +24,17 @@ export default function ScriptListPage() {
       try {
         setIsLoading(true)
         setError(null)
-        const response = await getScriptList(currentPage, PAGE_SIZE)
+        // 전체 페이지 수는 첫 페이지에서만 요청 (서버에서 캐시)
+        const response = await getScriptList(cursors[currentPage - 1] ?? null, PAGE_SIZE, currentPage === 1)
         setScripts(response.scripts)
-        setPagination(response.pagination)
+        setHasMore(response.pagination.has_more)
+        if (response.pagination.total_pages !== null) {
+          setTotalPages(response.pagination.total_pages)
+        }
+        if (response.next_cursor) {
+          const nextCursor = response.next_cursor
+          setCursors((prev) => [...prev.slice(0, currentPage), nextCursor])
+        }
       } catch (err: any) {
         console.error("스크립트 목록 조회 실패:", err)
         setError("스크립트 목록을 불러오는데 실패했습니다.")
@@ -74,7 +85,7 @@ export default function ScriptListPage() {
             </Button>
 
             {/* 페이지네이션 */}
-            {pagination && pagination.total_pages > 1 && (
+            {(currentPage > 1 || hasMore) && (
               <div className="flex items-center gap-2">
                 <Button
                   variant="outline"
@@ -86,13 +97,13 @@ export default function ScriptListPage() {
                   <ChevronLeft className="w-4 h-4" />
                 </Button>
                 <span className="text-sm text-muted-foreground px-2">
-                  {currentPage} / {pagination.total_pages}
+                  {currentPage} / {totalPages ?? "-"}
                 </span>
                 <Button
                   variant="outline"
                   size="sm"
                   onClick={() => handlePageChange(currentPage + 1)}
-                  disabled={currentPage >= pagination.total_pages}
+                  disabled={!hasMore}
                   className="h-8 w-8 p-0"
                 >
                   <ChevronRight className="w-4 h-4" />
@@ -114,7 +125,7 @@ export default function ScriptListPage() {
         {!isLoading && error && (
           <div className="flex flex-col items-center justify-center py-16 text-center">
             <p className="text-muted-foreground mb-4">{error}</p>
-            <Button variant="outline" onClick={() => setCurrentPage(1)}>
+            <Button variant="outline" onClick={() => { setCursors([null]); setCurrentPage(1) }}>
               다시 시도
             </Button>
           </div>
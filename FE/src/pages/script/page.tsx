@@ -110,8 +110,8 @@ function ScriptPageContent() {
           }
         } else {
           const history = await getScriptHistory(1)
-          if (history.length > 0) {
-            const latest = history[0]
+          if (history.length > 0 && history[0].has_script) {
+            const latest = await getScriptById(history[0].topic_request_id)
             if (latest.script) {
               setScriptData(latest.script)
               setReferences(latest.references || [])